@@ -0,0 +1,526 @@
+"""deterministic local json-rpc node for benchmarks
+
+serves synthetic chain data so that benchmarks do not depend on a remote node
+- blocks have fixed block times and one transaction per log
+- every contract emits `logs_per_block` Transfer logs in every block
+- traces contain one call per transaction
+- eth_call returns a uint256 derived from the call, and multicall aggregate
+  calls return the results of each of their subcalls
+
+all data is a pure function of the node config, so repeated runs see
+identical responses. latency is added to every http request, and rate limits
+respond with status 429 once the per-second call budget is exhausted
+
+run as a script to serve a node from a separate process:
+    python mock_node.py --config '{"latency": 0.01}'
+"""
+
+from __future__ import annotations
+
+import hashlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from aiohttp import web
+    from typing_extensions import TypedDict
+
+    class MockNodeConfig(TypedDict):
+        chain_id: int
+        latest_block: int
+        genesis_timestamp: int
+        block_time: int
+        logs_per_block: int
+        max_logs_block_range: int
+        latency: float
+        rate_limit: float | None
+        multicall_address: str
+
+    class MockNodeState(TypedDict):
+        config: MockNodeConfig
+        tokens: float
+        last_refill: float
+        n_requests: int
+        n_calls: int
+        n_rate_limited: int
+
+
+default_mock_node_config: MockNodeConfig = {
+    'chain_id': 1,
+    'latest_block': 1_000_000,
+    'genesis_timestamp': 1_600_000_000,
+    'block_time': 12,
+    'logs_per_block': 4,
+    'max_logs_block_range': 10_000,
+    'latency': 0.0,
+    'rate_limit': None,
+    'multicall_address': '0xeefba1e63905ef1d7acba5a8513c70307c1ce441',
+}
+
+# keccak('Transfer(address,address,uint256)')
+transfer_event_hash = (
+    '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+)
+
+# selector of maker multicall aggregate((address,bytes)[])
+aggregate_selector = '0x252dba42'
+
+default_log_address = '0x' + hashlib.sha256(b'token').hexdigest()[:40]
+
+_zero_hash = '0x' + '0' * 64
+
+
+def create_mock_node_config(
+    config: typing.Mapping[str, typing.Any] | None = None,
+) -> MockNodeConfig:
+    """create mock node config, filling defaults for missing keys"""
+    full_config = dict(default_mock_node_config)
+    if config is not None:
+        for key in config.keys():
+            if key not in default_mock_node_config:
+                raise Exception('unknown mock node config key: ' + str(key))
+        full_config.update(config)
+    return full_config  # type: ignore
+
+
+#
+# # synthetic data
+#
+
+
+def _hash(*parts: typing.Any) -> str:
+    return '0x' + hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def _address(*parts: typing.Any) -> str:
+    return _hash(*parts)[:42]
+
+
+def _pad_address(address: str) -> str:
+    return '0x' + '0' * 24 + address[2:]
+
+
+def get_block_timestamp(number: int, config: MockNodeConfig) -> int:
+    """get timestamp of synthetic block"""
+    return config['genesis_timestamp'] + number * config['block_time']
+
+
+def get_block(
+    number: int,
+    config: MockNodeConfig,
+    *,
+    full_transactions: bool = False,
+) -> dict[str, typing.Any] | None:
+    """get synthetic block in rpc format"""
+
+    if number < 0 or number > config['latest_block']:
+        return None
+
+    block_hash = _hash('block', number)
+    transactions: list[typing.Any]
+    if full_transactions:
+        transactions = [
+            get_transaction(number, index, config)
+            for index in range(config['logs_per_block'])
+        ]
+    else:
+        transactions = [
+            _hash('transaction', number, index)
+            for index in range(config['logs_per_block'])
+        ]
+
+    return {
+        'baseFeePerGas': hex(10**9 + number % 10**9),
+        'difficulty': '0x0',
+        'extraData': '0x',
+        'gasLimit': hex(30_000_000),
+        'gasUsed': hex(21_000 * config['logs_per_block']),
+        'hash': block_hash,
+        'logsBloom': '0x' + '0' * 512,
+        'miner': _address('miner', number % 16),
+        'mixHash': _hash('mix', number),
+        'nonce': '0x0000000000000000',
+        'number': hex(number),
+        'parentHash': _hash('block', number - 1) if number > 0 else _zero_hash,
+        'receiptsRoot': _hash('receipts', number),
+        'sha3Uncles': _hash('uncles', number),
+        'size': hex(1000 + 100 * config['logs_per_block']),
+        'stateRoot': _hash('state', number),
+        'timestamp': hex(get_block_timestamp(number, config)),
+        'totalDifficulty': '0x0',
+        'transactions': transactions,
+        'transactionsRoot': _hash('transactions', number),
+        'uncles': [],
+    }
+
+
+def get_transaction(
+    block_number: int,
+    index: int,
+    config: MockNodeConfig,
+) -> dict[str, typing.Any]:
+    """get synthetic transaction in rpc format"""
+    return {
+        'blockHash': _hash('block', block_number),
+        'blockNumber': hex(block_number),
+        'chainId': hex(config['chain_id']),
+        'from': _address('sender', block_number, index),
+        'gas': hex(100_000),
+        'gasPrice': hex(10**9),
+        'hash': _hash('transaction', block_number, index),
+        'input': '0xa9059cbb',
+        'nonce': hex(block_number),
+        'r': _hash('r', block_number, index),
+        's': _hash('s', block_number, index),
+        'to': default_log_address,
+        'transactionIndex': hex(index),
+        'type': '0x0',
+        'v': '0x25',
+        'value': '0x0',
+    }
+
+
+def get_logs(
+    log_filter: typing.Mapping[str, typing.Any],
+    config: MockNodeConfig,
+) -> list[dict[str, typing.Any]]:
+    """get synthetic Transfer logs matching filter in rpc format"""
+
+    start_block = _parse_block_tag(log_filter.get('fromBlock'), config)
+    end_block = _parse_block_tag(log_filter.get('toBlock'), config)
+    end_block = min(end_block, config['latest_block'])
+    if end_block - start_block + 1 > config['max_logs_block_range']:
+        raise _RpcError(-32005, 'query exceeds max block range')
+
+    addresses = log_filter.get('address')
+    if addresses is None:
+        addresses = [default_log_address]
+    elif isinstance(addresses, str):
+        addresses = [addresses]
+
+    # each topic filter is None, a topic, or a list of topics
+    topic_filters: list[typing.Any] = list(log_filter.get('topics') or [])
+    for t, topic_filter in enumerate(topic_filters):
+        if isinstance(topic_filter, str):
+            topic_filters[t] = [topic_filter.lower()]
+        elif topic_filter is not None:
+            topic_filters[t] = [topic.lower() for topic in topic_filter]
+    if len(topic_filters) > 3:
+        return []
+    if len(topic_filters) > 0 and topic_filters[0] is not None:
+        if transfer_event_hash not in topic_filters[0]:
+            return []
+
+    logs = []
+    for block_number in range(start_block, end_block + 1):
+        block_hash = _hash('block', block_number)
+        for a, address in enumerate(addresses):
+            address = address.lower()
+            for index in range(config['logs_per_block']):
+                log_index = a * config['logs_per_block'] + index
+                topics = [
+                    transfer_event_hash,
+                    _pad_address(_address('sender', block_number, index)),
+                    _pad_address(_address('receiver', index % 64)),
+                ]
+                if any(
+                    topic_filter is not None and topic not in topic_filter
+                    for topic, topic_filter in zip(topics, topic_filters)
+                ):
+                    continue
+                amount = int(_hash('amount', block_number, index), 16) % 10**24
+                logs.append(
+                    {
+                        'address': address,
+                        'blockHash': block_hash,
+                        'blockNumber': hex(block_number),
+                        'data': '0x' + format(amount, '064x'),
+                        'logIndex': hex(log_index),
+                        'removed': False,
+                        'topics': topics,
+                        'transactionHash': _hash(
+                            'transaction', block_number, index
+                        ),
+                        'transactionIndex': hex(index),
+                    }
+                )
+    return logs
+
+
+def get_block_traces(
+    number: int,
+    config: MockNodeConfig,
+) -> list[dict[str, typing.Any]]:
+    """get synthetic call traces of block in rpc format"""
+
+    if number < 0 or number > config['latest_block']:
+        raise _RpcError(-32000, 'block not found')
+    return [
+        {
+            'action': {
+                'callType': 'call',
+                'from': _address('sender', number, index),
+                'gas': hex(100_000),
+                'input': '0xa9059cbb',
+                'to': default_log_address,
+                'value': '0x0',
+            },
+            'blockHash': _hash('block', number),
+            'blockNumber': number,
+            'result': {'gasUsed': hex(21_000), 'output': '0x'},
+            'subtraces': 0,
+            'traceAddress': [],
+            'transactionHash': _hash('transaction', number, index),
+            'transactionPosition': index,
+            'type': 'call',
+        }
+        for index in range(config['logs_per_block'])
+    ]
+
+
+def get_call_result(
+    call: typing.Mapping[str, typing.Any],
+    block_number: int,
+    config: MockNodeConfig,
+) -> str:
+    """get result of eth_call as prefix hex"""
+
+    from ctc.evm import abi_utils
+
+    to_address = call.get('to', '').lower()
+    data = call.get('data', call.get('input', '0x')).lower()
+
+    if (
+        to_address == config['multicall_address']
+        and data.startswith(aggregate_selector)
+    ):
+        subcalls = abi_utils.abi_decode(
+            bytes.fromhex(data[10:]), ['(address,bytes)[]']
+        )[0]
+        outputs = [
+            bytes.fromhex(
+                _get_word_result(target.lower(), '0x' + subdata.hex())[2:]
+            )
+            for target, subdata in subcalls
+        ]
+        encoded = abi_utils.abi_encode(
+            (block_number, outputs), ['uint256', 'bytes[]']
+        )
+        return '0x' + encoded.hex()
+
+    return _get_word_result(to_address, data)
+
+
+def _get_word_result(to_address: str, data: str) -> str:
+    value = int(_hash('call', to_address, data), 16) % 10**24
+    return '0x' + format(value, '064x')
+
+
+#
+# # request handling
+#
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _parse_block_tag(tag: typing.Any, config: MockNodeConfig) -> int:
+    if tag is None or tag in ('latest', 'pending', 'safe', 'finalized'):
+        return config['latest_block']
+    elif tag == 'earliest':
+        return 0
+    elif isinstance(tag, int):
+        return tag
+    elif isinstance(tag, str) and tag.startswith('0x'):
+        return int(tag, 16)
+    else:
+        raise _RpcError(-32602, 'invalid block tag: ' + str(tag))
+
+
+def handle_rpc_call(
+    call: typing.Mapping[str, typing.Any],
+    config: MockNodeConfig,
+) -> dict[str, typing.Any]:
+    """compute response to single json-rpc call"""
+
+    method = call.get('method')
+    params = call.get('params') or []
+    result: typing.Any
+    try:
+        if method == 'eth_chainId':
+            result = hex(config['chain_id'])
+        elif method == 'net_version':
+            result = str(config['chain_id'])
+        elif method == 'eth_blockNumber':
+            result = hex(config['latest_block'])
+        elif method == 'eth_getBlockByNumber':
+            number = _parse_block_tag(params[0], config)
+            full_transactions = len(params) > 1 and bool(params[1])
+            result = get_block(
+                number, config, full_transactions=full_transactions
+            )
+        elif method == 'eth_getLogs':
+            result = get_logs(params[0], config)
+        elif method == 'trace_block':
+            number = _parse_block_tag(params[0], config)
+            result = get_block_traces(number, config)
+        elif method == 'eth_call':
+            block_tag = params[1] if len(params) > 1 else 'latest'
+            block_number = _parse_block_tag(block_tag, config)
+            result = get_call_result(params[0], block_number, config)
+        else:
+            raise _RpcError(-32601, 'method not found: ' + str(method))
+    except _RpcError as e:
+        return {
+            'jsonrpc': '2.0',
+            'id': call.get('id'),
+            'error': {'code': e.code, 'message': e.message},
+        }
+    return {'jsonrpc': '2.0', 'id': call.get('id'), 'result': result}
+
+
+def _consume_rate_limit(state: MockNodeState, n_calls: int) -> bool:
+    import time
+
+    rate_limit = state['config']['rate_limit']
+    if rate_limit is None:
+        return True
+    now = time.monotonic()
+    state['tokens'] = min(
+        rate_limit,
+        state['tokens'] + (now - state['last_refill']) * rate_limit,
+    )
+    state['last_refill'] = now
+    if state['tokens'] < n_calls:
+        return False
+    state['tokens'] -= n_calls
+    return True
+
+
+def create_mock_node_app(
+    config: typing.Mapping[str, typing.Any] | None = None,
+) -> web.Application:
+    """create aiohttp application serving mock node"""
+
+    import asyncio
+    import time
+
+    import orjson
+    from aiohttp import web
+
+    full_config = create_mock_node_config(config)
+    rate_limit = full_config['rate_limit']
+    state: MockNodeState = {
+        'config': full_config,
+        'tokens': rate_limit if rate_limit is not None else 0.0,
+        'last_refill': time.monotonic(),
+        'n_requests': 0,
+        'n_calls': 0,
+        'n_rate_limited': 0,
+    }
+
+    async def async_handle_request(request: web.Request) -> web.Response:
+        if full_config['latency'] > 0:
+            await asyncio.sleep(full_config['latency'])
+        payload = orjson.loads(await request.read())
+        n_calls = len(payload) if isinstance(payload, list) else 1
+        state['n_requests'] += 1
+        if not _consume_rate_limit(state, n_calls):
+            state['n_rate_limited'] += 1
+            return web.Response(status=429, text='rate limited')
+        state['n_calls'] += n_calls
+        if isinstance(payload, list):
+            response: typing.Any = [
+                handle_rpc_call(call, full_config) for call in payload
+            ]
+        else:
+            response = handle_rpc_call(payload, full_config)
+        return web.Response(
+            body=orjson.dumps(response), content_type='application/json'
+        )
+
+    async def async_handle_stats(request: web.Request) -> web.Response:
+        stats = {
+            key: value for key, value in state.items() if key.startswith('n_')
+        }
+        return web.json_response(stats)
+
+    app = web.Application(client_max_size=2**30)
+    app.router.add_post('/', async_handle_request)
+    app.router.add_get('/stats', async_handle_stats)
+    return app
+
+
+async def async_start_mock_node(
+    config: typing.Mapping[str, typing.Any] | None = None,
+    *,
+    host: str = '127.0.0.1',
+    port: int = 0,
+) -> tuple[web.AppRunner, str]:
+    """start mock node within current event loop, returning runner and url"""
+
+    from aiohttp import web
+
+    runner = web.AppRunner(create_mock_node_app(config), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    return runner, 'http://' + host + ':' + str(port)
+
+
+def start_mock_node_process(
+    config: typing.Mapping[str, typing.Any] | None = None,
+) -> tuple[typing.Any, str]:
+    """start mock node in a separate process, returning process and url
+
+    serving from a separate process keeps node cpu time out of measurements
+    """
+
+    import json
+    import subprocess
+    import sys
+
+    process = subprocess.Popen(
+        [sys.executable, __file__, '--config', json.dumps(config or {})],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+    url = process.stdout.readline().strip()
+    if not url.startswith('http'):
+        process.kill()
+        raise Exception('mock node failed to start')
+    return process, url
+
+
+async def _async_serve_forever(
+    config: typing.Mapping[str, typing.Any],
+    port: int,
+) -> None:
+    import asyncio
+
+    runner, url = await async_start_mock_node(config, port=port)
+    print(url, flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    import argparse
+    import asyncio
+    import json
+
+    parser = argparse.ArgumentParser(description='serve mock json-rpc node')
+    parser.add_argument('--config', default='{}', help='json node config')
+    parser.add_argument('--port', type=int, default=0, help='port to serve')
+    args = parser.parse_args()
+    try:
+        asyncio.run(_async_serve_forever(json.loads(args.config), args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,356 @@
+"""run benchmark scenarios against a local mock json-rpc node
+
+results are appended to a json lines file, one record per scenario, so that
+results of successive runs can be compared to track regressions
+
+usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --scenarios async_get_events
+    python benchmarks/run_benchmarks.py --latency 0.02 --rate-limit 500
+    python benchmarks/run_benchmarks.py --baseline old.jsonl --output new.jsonl
+"""
+
+from __future__ import annotations
+
+import typing
+
+import mock_node
+import scenarios
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class BenchmarkResult(TypedDict):
+        scenario: str
+        scale: float
+        n_repeats: int
+        n_items: int
+        durations: list[float]
+        min_duration: float
+        median_duration: float
+        items_per_second: float
+        n_rpc_requests: int
+        n_rpc_calls: int
+        n_rpc_retries: int
+        rpc_response_bytes: int
+        mock_node_config: mock_node.MockNodeConfig
+        ctc_version: str
+        git_commit: str | None
+        python_version: str
+        timestamp: float
+
+
+async def async_run_scenario(
+    name: str,
+    *,
+    url: str,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+    n_repeats: int = 3,
+) -> BenchmarkResult:
+    """run scenario repeatedly, each time with a new http session"""
+
+    import statistics
+    import sys
+    import time
+
+    import ctc
+    from ctc import rpc
+
+    scenario = scenarios.scenarios[name]
+    durations = []
+    n_items = 0
+    telemetry = []
+    for r in range(n_repeats):
+        context = _create_context(url=url, node_config=node_config)
+        rpc.reset_rpc_telemetry()
+        try:
+            sample = await scenario(
+                context=context, node_config=node_config, scale=scale
+            )
+        finally:
+            await rpc.async_close_http_session()
+        durations.append(sample['duration'])
+        n_items = sample['n_items']
+        telemetry.append(rpc.get_rpc_telemetry())
+    merged = rpc.merge_rpc_telemetry(telemetry)
+
+    median_duration = statistics.median(durations)
+    if median_duration > 0:
+        items_per_second = n_items / median_duration
+    else:
+        items_per_second = float('inf')
+    return {
+        'scenario': name,
+        'scale': scale,
+        'n_repeats': n_repeats,
+        'n_items': n_items,
+        'durations': durations,
+        'min_duration': min(durations),
+        'median_duration': median_duration,
+        'items_per_second': items_per_second,
+        'n_rpc_requests': _get_mean_count(merged, 'n_requests', n_repeats),
+        'n_rpc_calls': _get_mean_count(merged, 'n_calls', n_repeats),
+        'n_rpc_retries': _get_mean_count(merged, 'n_retries', n_repeats),
+        'rpc_response_bytes': _get_mean_count(
+            merged, 'response_bytes', n_repeats
+        ),
+        'mock_node_config': node_config,
+        'ctc_version': ctc.__version__,
+        'git_commit': _get_git_commit(),
+        'python_version': sys.version.split()[0],
+        'timestamp': time.time(),
+    }
+
+
+def _get_mean_count(
+    telemetry: typing.Sequence[typing.Any],
+    field: str,
+    n_repeats: int,
+) -> int:
+    return sum(entry[field] for entry in telemetry) // n_repeats
+
+
+def _create_context(
+    *,
+    url: str,
+    node_config: mock_node.MockNodeConfig,
+) -> typing.Any:
+    return {
+        'provider': {
+            'url': url,
+            'name': 'mock_node',
+            'network': node_config['chain_id'],
+            'validate_chain_id': False,
+        },
+        'cache': False,
+    }
+
+
+def _get_git_commit() -> str | None:
+    import os
+    import subprocess
+
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except Exception:
+        return None
+    return output.strip()
+
+
+async def async_run_benchmarks(
+    scenario_names: typing.Sequence[str] | None = None,
+    *,
+    node_config: typing.Mapping[str, typing.Any] | None = None,
+    scale: float = 1,
+    n_repeats: int = 3,
+    in_process: bool = False,
+) -> list[BenchmarkResult]:
+    """run benchmark scenarios against a freshly started mock node"""
+
+    if scenario_names is None:
+        scenario_names = list(scenarios.scenarios.keys())
+    for name in scenario_names:
+        if name not in scenarios.scenarios:
+            raise Exception('unknown scenario: ' + str(name))
+    full_config = mock_node.create_mock_node_config(node_config)
+
+    if in_process:
+        runner, url = await mock_node.async_start_mock_node(full_config)
+    else:
+        process, url = mock_node.start_mock_node_process(full_config)
+    try:
+        results = []
+        for name in scenario_names:
+            result = await async_run_scenario(
+                name,
+                url=url,
+                node_config=full_config,
+                scale=scale,
+                n_repeats=n_repeats,
+            )
+            results.append(result)
+    finally:
+        if in_process:
+            await runner.cleanup()
+        else:
+            process.terminate()
+            process.wait()
+    return results
+
+
+#
+# # results
+#
+
+
+def save_results(results: typing.Sequence[BenchmarkResult], path: str) -> None:
+    """append benchmark results to json lines file"""
+
+    import json
+
+    with open(path, 'a') as f:
+        for result in results:
+            f.write(json.dumps(result) + '\n')
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    """load benchmark results from json lines file"""
+
+    import json
+
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip() != '']
+
+
+def compare_results(
+    results: typing.Sequence[BenchmarkResult],
+    baseline: typing.Sequence[BenchmarkResult],
+    *,
+    tolerance: float = 0.2,
+) -> list[str]:
+    """return names of scenarios slower than baseline beyond tolerance
+
+    the latest baseline record of each scenario and scale is used
+    """
+
+    latest = {
+        (result['scenario'], result['scale']): result for result in baseline
+    }
+    regressions = []
+    for result in results:
+        previous = latest.get((result['scenario'], result['scale']))
+        if previous is None:
+            continue
+        ratio = result['median_duration'] / previous['median_duration']
+        if ratio > 1 + tolerance:
+            regressions.append(result['scenario'])
+    return regressions
+
+
+def print_results(
+    results: typing.Sequence[BenchmarkResult],
+    baseline: typing.Sequence[BenchmarkResult] | None = None,
+) -> None:
+    """print table of benchmark results"""
+
+    import toolstr
+
+    latest = {}
+    if baseline is not None:
+        latest = {
+            (result['scenario'], result['scale']): result
+            for result in baseline
+        }
+
+    rows = []
+    for result in results:
+        row: list[typing.Any] = [
+            result['scenario'],
+            result['n_items'],
+            result['median_duration'],
+            result['items_per_second'],
+            result['n_rpc_requests'],
+        ]
+        if baseline is not None:
+            previous = latest.get((result['scenario'], result['scale']))
+            if previous is None:
+                row.append(None)
+            else:
+                row.append(
+                    result['median_duration'] / previous['median_duration']
+                )
+        rows.append(row)
+    labels = ['scenario', 'items', 'median s', 'items/s', 'requests']
+    if baseline is not None:
+        labels.append('vs baseline')
+    toolstr.print_table(rows, labels=labels)
+
+
+def main() -> int:
+    import argparse
+    import asyncio
+    import json
+
+    parser = argparse.ArgumentParser(
+        description='run benchmarks against a local mock json-rpc node'
+    )
+    parser.add_argument(
+        '--scenarios',
+        nargs='+',
+        choices=list(scenarios.scenarios.keys()),
+        help='scenarios to run, default all',
+    )
+    parser.add_argument(
+        '--scale', type=float, default=1, help='multiplier of work per run'
+    )
+    parser.add_argument(
+        '--repeats', type=int, default=3, help='number of runs per scenario'
+    )
+    parser.add_argument(
+        '--latency', type=float, default=0, help='node latency in seconds'
+    )
+    parser.add_argument(
+        '--rate-limit', type=float, help='node rate limit in calls per second'
+    )
+    parser.add_argument(
+        '--node-config', default='{}', help='json of other node config'
+    )
+    parser.add_argument(
+        '--in-process', action='store_true', help='serve node in this process'
+    )
+    parser.add_argument(
+        '--output',
+        default='benchmark_results.jsonl',
+        help='json lines file to append results to',
+    )
+    parser.add_argument('--baseline', help='json lines file of prior results')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='relative slowdown versus baseline counted as regression',
+    )
+    args = parser.parse_args()
+
+    node_config = json.loads(args.node_config)
+    node_config['latency'] = args.latency
+    node_config['rate_limit'] = args.rate_limit
+
+    results = asyncio.run(
+        async_run_benchmarks(
+            args.scenarios,
+            node_config=node_config,
+            scale=args.scale,
+            n_repeats=args.repeats,
+            in_process=args.in_process,
+        )
+    )
+    save_results(results, args.output)
+
+    baseline = None
+    if args.baseline is not None:
+        baseline = load_results(args.baseline)
+    print_results(results, baseline)
+    print()
+    print('results appended to', args.output)
+
+    if baseline is not None:
+        regressions = compare_results(
+            results, baseline, tolerance=args.tolerance
+        )
+        if len(regressions) > 0:
+            print('regressions:', ', '.join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""benchmark scenarios of hot paths
+
+each scenario performs its own setup and times only the hot path, returning
+the elapsed time and the number of items processed. `scale` multiplies the
+amount of work done by each scenario
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+
+import mock_node
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    from ctc import spec
+
+    class ScenarioSample(TypedDict):
+        duration: float
+        n_items: int
+
+    Scenario = typing.Callable[
+        ..., typing.Coroutine[typing.Any, typing.Any, ScenarioSample]
+    ]
+
+
+transfer_event_abi: spec.EventABI = {
+    'anonymous': False,
+    'inputs': [
+        {'indexed': True, 'name': 'from', 'type': 'address'},
+        {'indexed': True, 'name': 'to', 'type': 'address'},
+        {'indexed': False, 'name': 'amount', 'type': 'uint256'},
+    ],
+    'name': 'Transfer',
+    'type': 'event',
+}
+
+balance_of_abi: spec.FunctionABI = {
+    'inputs': [{'name': 'account', 'type': 'address'}],
+    'name': 'balanceOf',
+    'outputs': [{'name': '', 'type': 'uint256'}],
+    'stateMutability': 'view',
+    'type': 'function',
+}
+
+holder = '0x' + '11' * 20
+
+
+def _get_start_block(
+    n_blocks: int,
+    node_config: mock_node.MockNodeConfig,
+) -> int:
+    return node_config['latest_block'] - n_blocks + 1
+
+
+async def async_benchmark_get_events(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """fetch and decode Transfer events of a contract"""
+
+    from ctc import evm
+
+    n_blocks = int(10_000 * scale)
+    start = time.perf_counter()
+    events = await evm.async_get_events(
+        mock_node.default_log_address,
+        event_abi=transfer_event_abi,
+        start_block=_get_start_block(n_blocks, node_config),
+        end_block=node_config['latest_block'],
+        context=context,
+        verbose=False,
+    )
+    duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(events)}
+
+
+async def async_benchmark_get_blocks(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """fetch blocks by number"""
+
+    from ctc import evm
+
+    n_blocks = int(2_000 * scale)
+    start_block = _get_start_block(n_blocks, node_config)
+    blocks = list(range(start_block, node_config['latest_block'] + 1))
+    start = time.perf_counter()
+    result = await evm.async_get_blocks(blocks, context=context)
+    duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(result)}
+
+
+async def async_benchmark_get_blocks_of_timestamps(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """search for blocks of timestamps"""
+
+    from ctc import evm
+
+    n_timestamps = max(int(20 * scale), 1)
+    latest_timestamp = mock_node.get_block_timestamp(
+        node_config['latest_block'], node_config
+    )
+    timestamps = [
+        latest_timestamp - 7919 * (i + 1) * node_config['block_time']
+        for i in range(n_timestamps)
+    ]
+    start = time.perf_counter()
+    result = await evm.async_get_blocks_of_timestamps(
+        timestamps, context=context
+    )
+    duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(result)}
+
+
+async def async_benchmark_decode_events_dataframe(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """decode dataframe of raw Transfer events"""
+
+    from ctc import evm
+
+    n_blocks = int(10_000 * scale)
+    raw_events = await evm.async_get_events(
+        mock_node.default_log_address,
+        event_abi=transfer_event_abi,
+        start_block=_get_start_block(n_blocks, node_config),
+        end_block=node_config['latest_block'],
+        context=context,
+        verbose=False,
+        decode=False,
+    )
+    start = time.perf_counter()
+    decoded = await evm.async_decode_events_dataframe(
+        raw_events, [transfer_event_abi], context=context
+    )
+    duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(decoded)}
+
+
+async def async_benchmark_upsert_events(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """insert encoded events into a fresh sqlite db"""
+
+    import os
+    import tempfile
+
+    import toolsql
+    from ctc import db
+    from ctc import rpc
+
+    n_blocks = int(2_000 * scale)
+    raw_logs = await rpc.async_eth_get_logs(
+        address=mock_node.default_log_address,
+        topics=[mock_node.transfer_event_hash],
+        start_block=_get_start_block(n_blocks, node_config),
+        end_block=node_config['latest_block'],
+        context=context,
+    )
+    encoded_events = [
+        log[:5] + log[5] + ((None,) * (4 - len(log[5]))) + (log[6],)
+        for log in raw_logs
+    ]
+
+    db_config: toolsql.DBConfig = {
+        'dbms': 'sqlite',
+        'path': os.path.join(tempfile.mkdtemp(), 'benchmark.db'),
+    }
+    db_schema = db.get_prepared_schema(schema_name='events', context=context)
+    toolsql.create_db(
+        db_config=db_config,
+        db_schema=db_schema,
+        if_not_exists=True,
+        confirm=True,
+    )
+    async with toolsql.async_connect(db_config) as conn:
+        start = time.perf_counter()
+        await db.async_upsert_events(
+            encoded_events=encoded_events,
+            conn=conn,
+            context=context,
+        )
+        duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(encoded_events)}
+
+
+async def async_benchmark_multicall(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """aggregate balanceOf calls through the multicall contract"""
+
+    from ctc.protocols import multicall_utils
+
+    n_calls = int(1_000 * scale)
+    calls = [
+        (mock_node._address('token', i), balance_of_abi, [holder])
+        for i in range(n_calls)
+    ]
+    start = time.perf_counter()
+    result = await multicall_utils.async_multicall(calls, context=context)
+    duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(result)}
+
+
+async def async_benchmark_batch_eth_call(
+    *,
+    context: spec.Context,
+    node_config: mock_node.MockNodeConfig,
+    scale: float = 1,
+) -> ScenarioSample:
+    """batch balanceOf eth_calls across contracts"""
+
+    from ctc import rpc
+
+    n_calls = int(1_000 * scale)
+    to_addresses = [mock_node._address('token', i) for i in range(n_calls)]
+    start = time.perf_counter()
+    result = await rpc.async_batch_eth_call(
+        to_addresses=to_addresses,
+        function_abi=balance_of_abi,
+        function_parameters=[holder],
+        context=context,
+    )
+    duration = time.perf_counter() - start
+    return {'duration': duration, 'n_items': len(result)}
+
+
+scenarios: typing.Mapping[str, Scenario] = {
+    'async_get_events': async_benchmark_get_events,
+    'async_get_blocks': async_benchmark_get_blocks,
+    'async_get_blocks_of_timestamps': async_benchmark_get_blocks_of_timestamps,
+    'async_decode_events_dataframe': async_benchmark_decode_events_dataframe,
+    'async_upsert_events': async_benchmark_upsert_events,
+    'async_multicall': async_benchmark_multicall,
+    'async_batch_eth_call': async_benchmark_batch_eth_call,
+}
@@ -1,24 +1,51 @@
 """ctc is a tool for collecting and processing historical EVM data"""
 
-from .evm import *
+from __future__ import annotations
 
+import typing
 
-__version__ = '0.3.9'
-
-
-def _clean_package_imports() -> None:
-    """remove deep nested modules from ctc namespace"""
+# attributes of ctc.evm and subpackages are loaded upon first access
+if typing.TYPE_CHECKING:
+    from .evm import *
 
-    import sys
-
-    ctc = sys.modules['ctc']
-    moduletype = type(ctc)
-    delattr(ctc, 'annotations')
-    for key, value in tuple(vars(ctc).items()):
-        if isinstance(value, moduletype):
-            name = value.__name__
-            if not name.startswith('ctc') or name.count('.') > 1:
-                delattr(ctc, key)
 
+__version__ = '0.3.9'
 
-_clean_package_imports()
+_subpackages = (
+    'cli',
+    'config',
+    'datasets',
+    'db',
+    'defi',
+    'evm',
+    'protocols',
+    'rpc',
+    'spec',
+    'toolbox',
+)
+
+if not typing.TYPE_CHECKING:
+
+    def __getattr__(name: str) -> typing.Any:
+        """load subpackage or attribute of ctc.evm upon first access"""
+        import importlib
+
+        if name in _subpackages:
+            return importlib.import_module(__name__ + '.' + name)
+        evm = importlib.import_module(__name__ + '.evm')
+        if name not in evm._lazy_submodules:
+            raise AttributeError(
+                'module ' + repr(__name__) + ' has no attribute ' + repr(name)
+            )
+        value = getattr(evm, name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """list attributes, including those not yet loaded"""
+        import importlib
+
+        evm = importlib.import_module(__name__ + '.evm')
+        return sorted(
+            set(globals()) | set(_subpackages) | set(evm._lazy_submodules)
+        )
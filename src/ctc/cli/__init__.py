@@ -1,3 +1,58 @@
-from .cli_run import *
-from .cli_utils import print_bullet
-from .cli_utils import get_cli_styles
+from __future__ import annotations
+
+import typing
+
+# attributes are loaded from their submodules upon first access, so that
+# commands forwarded to the cli daemon do not import toolcli
+if typing.TYPE_CHECKING:
+    from .cli_run import *
+    from .cli_utils import print_bullet
+    from .cli_utils import get_cli_styles
+
+else:
+
+    _lazy_exports = {
+        'cli_run': (
+            'cd_dir_getter',
+            'cd_dir_help',
+            'command_index',
+            'command_index_by_category',
+            'description',
+            'get_cli_config',
+            'help_subcommand_categories',
+            'help_url_getter',
+            'run_cli',
+        ),
+        'cli_utils': (
+            'get_cli_styles',
+            'print_bullet',
+        ),
+    }
+
+    _lazy_submodules = {
+        name: submodule
+        for submodule, names in _lazy_exports.items()
+        for name in names
+    }
+
+    def __getattr__(name: str) -> typing.Any:
+        """load attribute from its submodule upon first access"""
+        import importlib
+
+        if name in _lazy_exports:
+            return importlib.import_module(__name__ + '.' + name)
+        submodule = _lazy_submodules.get(name)
+        if submodule is None:
+            raise AttributeError(
+                'module ' + repr(__name__) + ' has no attribute ' + repr(name)
+            )
+        module = importlib.import_module(__name__ + '.' + submodule)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """list attributes, including those not yet loaded"""
+        return sorted(
+            set(globals()) | set(_lazy_exports) | set(_lazy_submodules)
+        )
@@ -0,0 +1,412 @@
+"""serve cli commands from a persistent local daemon
+
+the daemon listens on a unix socket and executes forwarded commands within a
+single long-lived process, so that imports, config, http sessions, abi and
+metadata caches, and db connections stay warm across invocations
+
+the daemon is opt-in:
+- start daemon with `ctc daemon`
+- set CTC_USE_DAEMON=1 to forward `ctc` invocations to the daemon
+- commands are run locally if the daemon is unreachable
+- interactive commands are always run locally
+
+each request and response is a single line of json
+"""
+
+from __future__ import annotations
+
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    import asyncio
+
+    import toolcli
+    from typing_extensions import TypedDict
+
+    class DaemonRequest(TypedDict, total=False):
+        action: str
+        command: typing.Sequence[str]
+        cwd: str
+        columns: int | None
+        environment: typing.Mapping[str, str | None]
+
+    class DaemonResponse(TypedDict, total=False):
+        stdout: str
+        stderr: str
+        exit_code: int
+        run_locally: bool
+
+    class DaemonState(TypedDict):
+        lock: asyncio.Lock
+        stop: asyncio.Event
+        config_mtime: float | None
+        n_commands: int
+
+
+# command sequences that need a terminal, modify the daemon itself, or
+# dispatch to other commands using their own event loop
+local_command_sequences: typing.Sequence[typing.Tuple[str, ...]] = [
+    (),
+    ('cd',),
+    ('config', 'edit'),
+    ('daemon',),
+    ('daemon', 'stop'),
+    ('db', 'login'),
+    ('log',),
+    ('setup',),
+]
+
+# environment variables that select config, provider, network, and cache,
+# forwarded so that commands use the values of the invoking shell
+forwarded_env_vars: typing.Sequence[str] = [
+    'CTC_CONFIG_PATH',
+    'CTC_PROVIDER',
+    'CTC_NETWORK',
+    'CTC_CACHE',
+    'ETH_RPC_URL',
+    'ETH_RPC_CHAIN_ID',
+]
+
+
+def get_daemon_socket_path() -> str:
+    """get path of cli daemon socket, set by CTC_DAEMON_SOCKET if given
+
+    by default the socket is placed in a per-user runtime directory, either
+    $XDG_RUNTIME_DIR/ctc or a ctc-<uid> directory in the temp directory
+    """
+
+    socket_path = os.environ.get('CTC_DAEMON_SOCKET')
+    if socket_path is not None and socket_path != '':
+        return socket_path
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir is not None and runtime_dir != '':
+        socket_dir = os.path.join(runtime_dir, 'ctc')
+    else:
+        import tempfile
+
+        if hasattr(os, 'getuid'):
+            dirname = 'ctc-' + str(os.getuid())
+        else:
+            dirname = 'ctc'
+        socket_dir = os.path.join(tempfile.gettempdir(), dirname)
+    return os.path.join(socket_dir, 'daemon.sock')
+
+
+def _is_owned_by_user(path: str) -> bool:
+    if not hasattr(os, 'getuid'):
+        return True
+    return os.stat(path).st_uid == os.getuid()
+
+
+def _create_socket_dir(socket_dir: str) -> None:
+    """create private directory of daemon socket, or verify existing one"""
+
+    import stat
+
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    if not _is_owned_by_user(socket_dir):
+        raise Exception('daemon socket directory owned by another user')
+    if stat.S_IMODE(os.stat(socket_dir).st_mode) & 0o077:
+        os.chmod(socket_dir, 0o700)
+
+
+def is_daemon_enabled() -> bool:
+    """return whether cli should forward commands to daemon"""
+    return os.environ.get('CTC_USE_DAEMON', '') not in ('', '0', 'false')
+
+
+#
+# # client
+#
+
+
+def forward_command(
+    raw_command: typing.Sequence[str],
+    *,
+    socket_path: str | None = None,
+) -> int | None:
+    """forward cli command to daemon, printing its output
+
+    returns exit code of command, or None if command should be run locally
+    """
+
+    import sys
+
+    if '--debug' in raw_command:
+        return None
+
+    try:
+        columns: int | None = os.get_terminal_size().columns
+    except OSError:
+        columns = None
+    request: DaemonRequest = {
+        'action': 'run',
+        'command': list(raw_command),
+        'cwd': os.getcwd(),
+        'columns': columns,
+        'environment': {
+            name: os.environ.get(name) for name in forwarded_env_vars
+        },
+    }
+    response = send_daemon_request(request, socket_path=socket_path)
+    if response is None or response.get('run_locally'):
+        return None
+
+    sys.stdout.write(response['stdout'])
+    sys.stdout.flush()
+    sys.stderr.write(response['stderr'])
+    sys.stderr.flush()
+    return response['exit_code']
+
+
+def send_daemon_request(
+    request: DaemonRequest,
+    *,
+    socket_path: str | None = None,
+) -> DaemonResponse | None:
+    """send request to cli daemon, returning None if daemon is unreachable"""
+
+    import json
+    import socket
+
+    if socket_path is None:
+        socket_path = get_daemon_socket_path()
+
+    chunks = []
+    try:
+        # do not send commands to a socket created by another user
+        if not _is_owned_by_user(socket_path):
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode() + b'\n')
+            client.shutdown(socket.SHUT_WR)
+            while True:
+                chunk = client.recv(65536)
+                if len(chunk) == 0:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    if len(chunks) == 0:
+        return None
+    response: DaemonResponse = json.loads(b''.join(chunks))
+    return response
+
+
+def stop_daemon(*, socket_path: str | None = None) -> bool:
+    """stop cli daemon, returning whether a daemon was running"""
+    response = send_daemon_request({'action': 'stop'}, socket_path=socket_path)
+    return response is not None
+
+
+#
+# # server
+#
+
+
+async def async_run_daemon(*, socket_path: str | None = None) -> None:
+    """run cli daemon until stopped"""
+
+    import asyncio
+    import functools
+
+    from ctc import rpc
+
+    if socket_path is None:
+        socket_path = get_daemon_socket_path()
+    if send_daemon_request({'action': 'ping'}, socket_path=socket_path):
+        raise Exception('daemon already running at ' + socket_path)
+    socket_dir = os.path.dirname(socket_path)
+    if socket_dir != '':
+        _create_socket_dir(socket_dir)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    state: DaemonState = {
+        'lock': asyncio.Lock(),
+        'stop': asyncio.Event(),
+        'config_mtime': _get_config_mtime(),
+        'n_commands': 0,
+    }
+    handler = functools.partial(_async_handle_connection, state=state)
+    server = await asyncio.start_unix_server(handler, path=socket_path)
+    os.chmod(socket_path, 0o600)
+    try:
+        async with server:
+            await state['stop'].wait()
+    finally:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        await rpc.async_close_http_session()
+
+
+async def _async_handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    *,
+    state: DaemonState,
+) -> None:
+    import json
+
+    try:
+        request: DaemonRequest = json.loads(await reader.readline())
+        action = request.get('action')
+        response: DaemonResponse
+        if action == 'run':
+            async with state['lock']:
+                response = await _async_run_command(request, state=state)
+        elif action == 'ping':
+            response = {'exit_code': 0}
+        elif action == 'stop':
+            response = {'exit_code': 0}
+            state['stop'].set()
+        else:
+            raise Exception('unknown action: ' + str(action))
+    except Exception as e:
+        response = {'stdout': '', 'stderr': str(e) + '\n', 'exit_code': 1}
+    writer.write(json.dumps(response).encode() + b'\n')
+    await writer.drain()
+    writer.close()
+
+
+async def _async_run_command(
+    request: DaemonRequest,
+    *,
+    state: DaemonState,
+) -> DaemonResponse:
+    import contextlib
+    import io
+
+    import toolcli
+    from toolcli.command_utils import parsing
+
+    from ctc import config
+    from . import cli_run
+
+    # reload config if config file has changed
+    config_mtime = _get_config_mtime()
+    if config_mtime != state['config_mtime']:
+        config.reset_config_cache()
+        state['config_mtime'] = config_mtime
+
+    raw_command = list(request['command'])
+    cli_config = toolcli.spec.create_config(cli_run.get_cli_config())
+    parse_spec = parsing.create_parse_spec(
+        raw_command=raw_command,
+        command_index=cli_run.command_index,
+        command_sequence=None,
+        command_spec=None,
+        config=cli_config,
+    )
+    if parse_spec['command_sequence'] in local_command_sequences:
+        return {'run_locally': True}
+
+    # process-wide state is swapped for the duration of the command
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    previous_cwd = os.getcwd()
+    previous_columns = os.environ.get('COLUMNS')
+    environment = {
+        name: value
+        for name, value in request.get('environment', {}).items()
+        if name in forwarded_env_vars and os.environ.get(name) != value
+    }
+    previous_environment = {name: os.environ.get(name) for name in environment}
+    try:
+        os.chdir(request['cwd'])
+        if request.get('columns') is not None:
+            os.environ['COLUMNS'] = str(request['columns'])
+        if len(environment) > 0:
+            _set_environment(environment)
+            config.reset_config_cache()
+        with contextlib.redirect_stdout(stdout):
+            with contextlib.redirect_stderr(stderr):
+                exit_code = await _async_execute_parsed_command(
+                    raw_command, parse_spec=parse_spec
+                )
+    finally:
+        os.chdir(previous_cwd)
+        if previous_columns is None:
+            os.environ.pop('COLUMNS', None)
+        else:
+            os.environ['COLUMNS'] = previous_columns
+        if len(environment) > 0:
+            _set_environment(previous_environment)
+            config.reset_config_cache()
+    state['n_commands'] += 1
+
+    return {
+        'stdout': stdout.getvalue(),
+        'stderr': stderr.getvalue(),
+        'exit_code': exit_code,
+    }
+
+
+def _set_environment(environment: typing.Mapping[str, str | None]) -> None:
+    for name, value in environment.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+async def _async_execute_parsed_command(
+    raw_command: typing.Sequence[str],
+    *,
+    parse_spec: toolcli.ParseSpec,
+) -> int:
+    """execute command within daemon event loop, mirroring toolcli.run_cli
+
+    http sessions are left open so that later commands can reuse them
+    """
+
+    import inspect
+
+    from toolcli.command_utils import execution
+    from toolcli.command_utils import parsing
+
+    try:
+        args = parsing.parse_raw_command(
+            raw_command=list(raw_command), parse_spec=parse_spec
+        )
+        function_args = parsing.get_function_args(parse_spec, args)
+        function = execution.resolve_function(parse_spec['command_spec']['f'])
+        if inspect.iscoroutinefunction(function):
+            await function(**function_args)
+        else:
+            # sync commands may start their own event loop with asyncio.run,
+            # which cannot be nested within the daemon's running loop
+            import asyncio
+            import functools
+
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, functools.partial(function, **function_args)
+            )
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            return e.code
+        elif e.code is None:
+            return 0
+        else:
+            return 1
+    except Exception as e:
+        if len(e.args) == 0:
+            print('unknown error, use --debug to debug')
+        else:
+            print(e.args[0])
+        return 1
+    return 0
+
+
+def _get_config_mtime() -> float | None:
+    from ctc import config
+
+    try:
+        path = config.get_config_path(raise_if_dne=False)
+        return os.path.getmtime(path)
+    except Exception:
+        return None
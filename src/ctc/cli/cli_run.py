@@ -4,16 +4,11 @@ import os
 import typing
 
 if typing.TYPE_CHECKING:
+    import toolcli
     import toolsql
 
     import mypy_extensions
 
-import toolcli
-
-import ctc
-import ctc.config
-from . import cli_utils
-
 
 command_index_by_category: dict[str, toolcli.CommandIndex] = {
     'admin': {
@@ -24,6 +19,8 @@ command_index_by_category: dict[str, toolcli.CommandIndex] = {
         ('config',): 'ctc.cli.commands.admin.config_command',
         ('config', 'edit'): 'ctc.cli.commands.admin.config.edit_command',
         ('config', 'path'): 'ctc.cli.commands.admin.config.path_command',
+        ('daemon',): 'ctc.cli.commands.admin.daemon_command',
+        ('daemon', 'stop'): 'ctc.cli.commands.admin.daemon.stop_command',
         ('db',): 'ctc.cli.commands.admin.db.status_command',
         (
             'db',
@@ -57,6 +54,7 @@ command_index_by_category: dict[str, toolcli.CommandIndex] = {
     'data': {
         ('abi',): 'ctc.cli.commands.data.abi_command',
         ('abi', 'diff'): 'ctc.cli.commands.data.abi_diff_command',
+        ('abi', 'registry'): 'ctc.cli.commands.data.abi_registry_command',
         ('address',): 'ctc.cli.commands.data.address_command',
         ('address', 'txs'): 'ctc.cli.commands.data.address_txs_command',
         ('bytecode',): 'ctc.cli.commands.data.bytecode_command',
@@ -292,7 +290,33 @@ def run_cli(
     **toolcli_kwargs: typing.Any,
 ) -> None:
 
+    # forward command to cli daemon if enabled, see ctc.cli.cli_daemon
+    if raw_command is None and len(toolcli_kwargs) == 0:
+        import sys
+        from . import cli_daemon
+
+        if cli_daemon.is_daemon_enabled():
+            exit_code = cli_daemon.forward_command(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+    import toolcli
+
+    toolcli_kwargs = dict({'config': get_cli_config()}, **toolcli_kwargs)
+
+    toolcli.run_cli(
+        raw_command=raw_command,
+        command_index=command_index,
+        **toolcli_kwargs,
+    )
+
+
+def get_cli_config() -> toolcli.CLIConfig:
+    """get toolcli config of ctc cli"""
+
     import tempfile
+    import ctc
+    from . import cli_utils
 
     help_cache_dir = os.path.join(tempfile.gettempdir(), 'ctc', 'help_cache')
 
@@ -311,7 +335,7 @@ def run_cli(
 
     styles = cli_utils.get_cli_styles()
 
-    config: toolcli.CLIConfig = {
+    return {
         #
         # metadata
         'base_command': 'ctc',
@@ -330,12 +354,3 @@ def run_cli(
         'include_standard_subcommands': True,
         'include_debug_arg': True,
     }
-
-    toolcli_kwargs = dict({'config': config}, **toolcli_kwargs)
-
-    toolcli.run_cli(
-        raw_command=raw_command,
-        command_index=command_index,
-        **toolcli_kwargs,
-    )
-
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import toolcli
+
+from ctc.cli import cli_daemon
+
+
+def get_command_spec() -> toolcli.CommandSpec:
+    return {
+        'f': stop_command,
+        'help': 'stop ctc daemon',
+        'args': [
+            {
+                'name': '--socket',
+                'help': 'path of unix socket, default set by CTC_DAEMON_SOCKET',
+            },
+        ],
+        'examples': {'': {'description': 'stop daemon', 'runnable': False}},
+    }
+
+
+def stop_command(socket: str | None) -> None:
+    if cli_daemon.stop_daemon(socket_path=socket):
+        print('stopped ctc daemon')
+    else:
+        print('ctc daemon is not running')
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import toolcli
+
+from ctc.cli import cli_daemon
+
+
+def get_command_spec() -> toolcli.CommandSpec:
+    return {
+        'f': async_daemon_command,
+        'help': (
+            'run daemon that serves ctc commands from a warm process\n\n'
+            'set CTC_USE_DAEMON=1 to forward ctc commands to the daemon'
+        ),
+        'args': [
+            {
+                'name': '--socket',
+                'help': 'path of unix socket, default set by CTC_DAEMON_SOCKET',
+            },
+        ],
+        'examples': {
+            '': {'description': 'run daemon', 'runnable': False},
+        },
+    }
+
+
+async def async_daemon_command(socket: str | None) -> None:
+    if socket is None:
+        socket = cli_daemon.get_daemon_socket_path()
+    print('serving ctc commands on', socket)
+    await cli_daemon.async_run_daemon(socket_path=socket)
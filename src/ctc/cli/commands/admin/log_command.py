@@ -19,12 +19,31 @@ def get_command_spec() -> toolcli.CommandSpec:
     return {
         'f': log_command,
         'help': 'display logs',
-        'args': [],
-        'examples': {'': {'description': 'tail logs', 'runnable': False}},
+        'args': [
+            {
+                'name': '--summary',
+                'help': 'summarize rpc request telemetry instead of tailing',
+                'action': 'store_true',
+            },
+        ],
+        'examples': {
+            '': {'description': 'tail logs', 'runnable': False},
+            '--summary': {'description': 'summarize rpc requests'},
+        },
     }
 
 
-def log_command() -> None:
+def log_command(summary: bool) -> None:
+    if summary:
+        from ctc import rpc
+
+        telemetry = rpc.load_rpc_telemetry()
+        if len(telemetry) == 0:
+            print('no rpc telemetry recorded, enable rpc logging in config')
+        else:
+            rpc.print_rpc_telemetry_summary(telemetry)
+        return
+
     rpc_requests_log_path = config.get_rpc_requests_log_path()
     print('watching log file:', rpc_requests_log_path)
     try:
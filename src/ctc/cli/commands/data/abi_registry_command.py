@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import typing
+
+from ctc import evm
+
+if typing.TYPE_CHECKING:
+    import toolcli
+
+
+def get_command_spec() -> toolcli.CommandSpec:
+    return {
+        'f': async_abi_registry_command,
+        'help': (
+            'build offline registry of function and event abis\n\n'
+            'compiled from cached contract abis and local 4byte datasets'
+        ),
+        'args': [
+            {
+                'name': '--path',
+                'help': 'directory of registry, default in ctc data dir',
+            },
+            {
+                'name': '--no-contracts',
+                'help': 'omit abis of cached contracts',
+                'action': 'store_true',
+            },
+            {
+                'name': '--no-4byte',
+                'help': 'omit signatures of local 4byte datasets',
+                'action': 'store_true',
+                'dest': 'no_fourbyte',
+            },
+        ],
+        'examples': {
+            '': {
+                'description': 'build registry in default location',
+                'runnable': False,
+            },
+            '--no-4byte': {
+                'description': 'only include abis of cached contracts',
+                'runnable': False,
+            },
+        },
+    }
+
+
+async def async_abi_registry_command(
+    *,
+    path: str | None,
+    no_contracts: bool,
+    no_fourbyte: bool,
+) -> None:
+    if path is None:
+        path = evm.get_abi_registry_path()
+    print('Building abi registry...')
+    await evm.async_build_abi_registry(
+        path=path,
+        include_contract_abis=not no_contracts,
+        include_fourbyte=not no_fourbyte,
+    )
+    print('abi registry written to ' + path)
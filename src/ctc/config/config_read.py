@@ -134,5 +134,8 @@ def get_config_version_tuple(
 
 
 def reset_config_cache() -> None:
+    from .context_utils import context_resolution
+
     get_config.cache_clear()
+    context_resolution.clear_resolved_contexts()
 
@@ -158,7 +158,10 @@ def validate_provider(
         raise Exception('provider is not a dict')
 
     provider_keys = set(spec.provider_keys)
-    if set(provider.keys()) != provider_keys:
+    optional_keys = set(spec.optional_provider_keys)
+    if not provider_keys <= set(provider.keys()) <= (
+        provider_keys | optional_keys
+    ):
         raise spec.ConfigInvalid(
             'provider should have keys: '
             + str(provider_keys)
@@ -193,6 +196,33 @@ def validate_provider(
             'http provider url must start with "http://" or "https://"'
         )
 
+    rate_limit = provider.get('rate_limit')
+    if rate_limit is not None:
+        validate_provider_rate_limit(rate_limit)
+
+
+def validate_provider_rate_limit(rate_limit: typing.Any) -> None:
+    if not isinstance(rate_limit, dict):
+        raise spec.ConfigInvalid('provider rate_limit must be a dict')
+    credits_per_second = rate_limit.get('credits_per_second')
+    if not isinstance(credits_per_second, (int, float)):
+        raise spec.ConfigInvalid('rate_limit must specify credits_per_second')
+    if credits_per_second <= 0:
+        raise spec.ConfigInvalid('credits_per_second must be positive')
+    burst_credits = rate_limit.get('burst_credits')
+    if burst_credits is not None and not isinstance(
+        burst_credits, (int, float)
+    ):
+        raise spec.ConfigInvalid('burst_credits must be a number')
+    method_credits = rate_limit.get('method_credits', {})
+    if not isinstance(method_credits, dict) or not all(
+        isinstance(value, (int, float)) for value in method_credits.values()
+    ):
+        raise spec.ConfigInvalid('method_credits must be a dict of numbers')
+    default_credits = rate_limit.get('default_credits', 1)
+    if not isinstance(default_credits, (int, float)):
+        raise spec.ConfigInvalid('default_credits must be a number')
+
 
 def validate_default_network(
     value: typing.Any, config: typing.Mapping[typing.Any, typing.Any]
@@ -167,6 +167,12 @@ def get_rpc_requests_log_path() -> str:
     return os.path.join(log_dir, 'rpc_requests.log')
 
 
+def get_rpc_telemetry_path() -> str:
+    log_dir = get_log_dir()
+    os.makedirs(log_dir, exist_ok=True)
+    return os.path.join(log_dir, 'rpc_telemetry.json')
+
+
 def get_sql_queries_log_path() -> str:
     log_dir = get_log_dir()
     os.makedirs(log_dir, exist_ok=True)
@@ -1,4 +1,5 @@
 from .context_caches import *
 from .context_crud import *
+from .context_resolution import *
 from .context_sources import *
 from .context_validate import *
@@ -7,7 +7,7 @@ if typing.TYPE_CHECKING:
 
 from ctc import spec
 from .. import config_values
-from . import context_sources
+from . import context_resolution
 
 
 def get_context_db_config(
@@ -65,24 +65,36 @@ def _get_context_cache_settings(
 ) -> tuple[str | None, bool, bool]:
     """get settings (backend, read, write) of schema for a given context"""
 
+    # use settings memoized in resolved context
+    resolved = context_resolution.resolve_context(context)
+    settings = context_resolution._get_resolved_cache_settings(
+        resolved, schema_name
+    )
+    if settings is not None:
+        return settings
+
     from ctc import config
 
     # get chain id if schema is network-related
     if schema_name in spec.network_schema_names:
-        chain_id = context_sources.get_context_chain_id(context)
+        chain_id = resolved.chain_id
     else:
         chain_id = None
 
     # assemble rules from context and config
     config_rules = config.get_context_cache_rules()
-    context_rules = _extract_context_cache_rules(context=context)
+    context_rules = resolved.cache_rules
     rules = [rule for rl in [context_rules, config_rules] for rule in rl]
 
-    return _resolve_context_cache_rules(
+    settings = _resolve_context_cache_rules(
         rules=rules,
         chain_id=chain_id,
         schema_name=schema_name,
     )
+    context_resolution._set_resolved_cache_settings(
+        resolved, schema_name, settings=settings
+    )
+    return settings
 
 
 def _extract_context_cache_rules(
@@ -99,6 +111,8 @@ def _extract_context_cache_rules(
     if context_cache is None:
         if isinstance(context, dict):
             context_cache = context.get('cache')
+        elif isinstance(context, context_resolution.ResolvedContext):
+            return context.cache_rules
         else:
             return []
 
@@ -0,0 +1,186 @@
+"""resolve contexts once into immutable, hashable resolved contexts
+
+resolving a context determines its chain_id, provider, and cache rules.
+resolved contexts memoize the cache settings of each schema, and can be
+passed anywhere that a context is accepted to skip resolution entirely.
+
+resolutions are invalidated whenever the config cache is reset
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+from . import context_validate
+
+if typing.TYPE_CHECKING:
+    _CacheSettings = typing.Tuple[typing.Union[str, None], bool, bool]
+
+
+class ResolvedContext:
+    """context resolved into its chain_id, provider, and cache rules
+
+    create using config.resolve_context(), do not instantiate directly
+    """
+
+    __slots__ = (
+        'source',
+        'chain_id',
+        'provider',
+        'cache_rules',
+        'config_generation',
+        '_cache_settings',
+        '_key',
+    )
+
+    source: spec.Context
+    chain_id: spec.ChainId
+    provider: spec.Provider | None
+    cache_rules: typing.Sequence[spec.ContextCacheRule]
+    config_generation: int
+    _cache_settings: typing.MutableMapping[str, _CacheSettings]
+    _key: str
+
+    def __init__(
+        self,
+        *,
+        source: spec.Context,
+        chain_id: spec.ChainId,
+        provider: spec.Provider | None,
+        cache_rules: typing.Sequence[spec.ContextCacheRule],
+        config_generation: int,
+    ) -> None:
+        import json
+
+        key = json.dumps(
+            [chain_id, provider, cache_rules, config_generation],
+            sort_keys=True,
+            default=str,
+        )
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'chain_id', chain_id)
+        object.__setattr__(self, 'provider', provider)
+        object.__setattr__(self, 'cache_rules', tuple(cache_rules))
+        object.__setattr__(self, 'config_generation', config_generation)
+        object.__setattr__(self, '_cache_settings', {})
+        object.__setattr__(self, '_key', key)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError('ResolvedContext is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('ResolvedContext is immutable')
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, ResolvedContext) and self._key == other._key
+
+    def __repr__(self) -> str:
+        if self.provider is not None:
+            provider_name = self.provider.get('name') or self.provider['url']
+        else:
+            provider_name = None
+        return (
+            'ResolvedContext(chain_id='
+            + str(self.chain_id)
+            + ', provider='
+            + repr(provider_name)
+            + ')'
+        )
+
+
+# resolutions of scalar contexts are keyed by value, of dict contexts by id
+_config_generation = [0]
+_resolved_scalar_contexts: typing.MutableMapping[
+    typing.Tuple[type, typing.Any], ResolvedContext
+] = {}
+_resolved_dict_contexts: typing.MutableMapping[
+    int, typing.Tuple[typing.Any, ResolvedContext]
+] = {}
+_max_resolved_dict_contexts = 1024
+
+
+def resolve_context(context: spec.Context) -> ResolvedContext:
+    """resolve context into an immutable, hashable resolved context
+
+    resolved contexts can be passed anywhere that a context is accepted
+    """
+
+    if isinstance(context, ResolvedContext):
+        if context.config_generation == _config_generation[0]:
+            return context
+        context = context.source
+
+    # check for previous resolution
+    if isinstance(context, dict):
+        entry = _resolved_dict_contexts.get(id(context))
+        if entry is not None and entry[0] == context:
+            return entry[1]
+    else:
+        scalar_key = (type(context), context)
+        resolved = _resolved_scalar_contexts.get(scalar_key)
+        if resolved is not None:
+            return resolved
+
+    # resolve context
+    import copy
+    from . import context_caches
+    from . import context_sources
+
+    context_validate._validate_context(context)
+    source = copy.deepcopy(context)
+    chain_id, provider = context_sources._get_context_chain_id_and_provider(
+        context=source
+    )
+    if provider is None:
+        from ctc import rpc
+
+        try:
+            provider = rpc.find_provider(network=chain_id)
+        except LookupError:
+            pass
+    resolved = ResolvedContext(
+        source=source,
+        chain_id=chain_id,
+        provider=provider,
+        cache_rules=context_caches._extract_context_cache_rules(
+            context=source
+        ),
+        config_generation=_config_generation[0],
+    )
+
+    # store resolution, keeping a copy of dict contexts to detect mutations
+    if isinstance(context, dict):
+        if len(_resolved_dict_contexts) >= _max_resolved_dict_contexts:
+            _resolved_dict_contexts.clear()
+        _resolved_dict_contexts[id(context)] = (source, resolved)
+    else:
+        _resolved_scalar_contexts[(type(context), context)] = resolved
+
+    return resolved
+
+
+def _get_resolved_cache_settings(
+    resolved: ResolvedContext,
+    schema_name: spec.SchemaName,
+) -> _CacheSettings | None:
+    return resolved._cache_settings.get(schema_name)
+
+
+def _set_resolved_cache_settings(
+    resolved: ResolvedContext,
+    schema_name: spec.SchemaName,
+    *,
+    settings: _CacheSettings,
+) -> None:
+    resolved._cache_settings[schema_name] = settings
+
+
+def clear_resolved_contexts() -> None:
+    """clear resolved contexts, invalidating any existing resolutions"""
+    _config_generation[0] += 1
+    _resolved_scalar_contexts.clear()
+    _resolved_dict_contexts.clear()
@@ -4,15 +4,13 @@ from ctc import evm
 from ctc import spec
 
 from .. import config_values
-from . import context_validate
+from . import context_resolution
 
 
 def get_context_chain_id(context: spec.Context) -> spec.ChainId:
     """get chain_id of a given context"""
 
-    context_validate._validate_context(context)
-    chain_id, provider = _get_context_chain_id_and_provider(context=context)
-    return chain_id
+    return context_resolution.resolve_context(context).chain_id
 
 
 def get_context_network_name(context: spec.Context) -> str:
@@ -24,9 +22,7 @@ def get_context_network_name(context: spec.Context) -> str:
 def get_context_provider(context: spec.Context) -> spec.Provider | None:
     """get provider of a given context"""
 
-    context_validate._validate_context(context)
-    chain_id, provider = get_context_chain_id_and_provider(context=context)
-    return provider
+    return context_resolution.resolve_context(context).provider
 
 
 def get_context_chain_id_and_provider(
@@ -34,19 +30,8 @@ def get_context_chain_id_and_provider(
 ) -> tuple[spec.ChainId, spec.Provider | None]:
     """get chain_id and provider of a given context"""
 
-    from ctc import rpc
-
-    context_validate._validate_context(context)
-    chain_id, provider = _get_context_chain_id_and_provider(context=context)
-
-    if provider is not None:
-        return chain_id, provider
-    else:
-        try:
-            provider = rpc.find_provider(network=chain_id)
-        except LookupError:
-            pass
-        return chain_id, provider
+    resolved = context_resolution.resolve_context(context)
+    return resolved.chain_id, resolved.provider
 
 
 def _get_context_chain_id_and_provider(
@@ -55,7 +40,11 @@ def _get_context_chain_id_and_provider(
 
     from ctc import rpc
 
-    if context is None:
+    if isinstance(context, context_resolution.ResolvedContext):
+        # case: context is already resolved
+        return context.chain_id, context.provider
+
+    elif context is None:
         # case: no context provided
         return config_values.get_default_network(), None
 
@@ -20,10 +20,12 @@ def get_active_schemas() -> typing.Mapping[spec.SchemaName, bool]:
         'dex_pools': True,
         'erc20_metadata': True,
         'events': True,
+        'metric_bars': True,
         'transactions': True,
         # 'erc20_state': False,
         '4byte': True,
         'chainlink': True,
+        'uniswap_v2': True,
         'schema_versions': True,
     }
 
@@ -117,11 +117,24 @@ def create_missing_tables(
 
     # create each schema for each used network
     for schema_network, schema_name in schemas_to_create:
-        initialize_schema(
+        schema_version = version_utils.get_schema_version(
             schema_name=schema_name,
             context=dict(network=schema_network),
             conn=conn,
         )
+        if schema_version is None:
+            initialize_schema(
+                schema_name=schema_name,
+                context=dict(network=schema_network),
+                conn=conn,
+            )
+        else:
+            # schema was initialized before some of its tables were added
+            create_schema_tables(
+                schema_name=schema_name,
+                context=dict(network=schema_network),
+                conn=conn,
+            )
 
     print()
     print('All tables created')
@@ -141,9 +154,6 @@ def initialize_schema(
 ) -> None:
     """initialize schema by creating its table and other objects"""
 
-    network_schema_names = schema_utils.get_network_schema_names()
-    prepared_schema = schema_name in network_schema_names
-
     # check that schema versions are being tracked
     if not version_utils.is_schema_versions_initialized(conn=conn):
         if schema_name != 'schema_versions':
@@ -158,8 +168,27 @@ def initialize_schema(
         if schema_version is not None:
             raise Exception('schema already initialized')
 
+    create_schema_tables(schema_name=schema_name, context=context, conn=conn)
+
+    version_utils.set_schema_version(
+        schema_name=schema_name,
+        context=context,
+        conn=conn,
+    )
+
+
+def create_schema_tables(
+    schema_name: spec.SchemaName,
+    *,
+    context: spec.Context,
+    conn: toolsql.Connection,
+) -> None:
+    """create any tables of schema that do not already exist"""
+
+    network_schema_names = schema_utils.get_network_schema_names()
+
     # load schema data
-    if prepared_schema:
+    if schema_name in network_schema_names:
         schema = schema_utils.get_prepared_schema(
             schema_name=schema_name,
             context=context,
@@ -176,12 +205,6 @@ def initialize_schema(
             confirm=True,
         )
 
-    version_utils.set_schema_version(
-        schema_name=schema_name,
-        context=context,
-        conn=conn,
-    )
-
 
 def drop_schema(
     schema_name: str,
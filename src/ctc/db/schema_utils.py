@@ -61,6 +61,8 @@ def get_raw_schema(schema_name: str) -> toolsql.DBSchema:
         schema = schemas.erc20_metadata_schema
     elif schema_name == 'events':
         schema = schemas.events_schema
+    elif schema_name == 'metric_bars':
+        schema = schemas.metric_bars_schema
     # elif schema_name == 'erc20_state':
     #     schema = schemas.erc20_state_schema
     elif schema_name == 'schema_versions':
@@ -82,6 +84,10 @@ def get_raw_schema(schema_name: str) -> toolsql.DBSchema:
         from ctc.protocols.coingecko_utils import coingecko_db
 
         schema = coingecko_db.coingecko_schema
+    elif schema_name == 'uniswap_v2':
+        from ctc.protocols.uniswap_v2_utils import uniswap_v2_db
+
+        schema = uniswap_v2_db.uniswap_v2_schema
     else:
         raise Exception('unknown schema: ' + str(schema_name))
 
@@ -6,6 +6,7 @@ from .contract_creation_blocks import *
 from .dex_pools import *
 from .erc20_metadata import *
 from .events import *
+from .metric_bars import *
 from .schema_versions import *
 from .transactions import *
 
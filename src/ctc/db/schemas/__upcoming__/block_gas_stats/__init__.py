@@ -1 +0,0 @@
-from .block_gas_stats_schema_defs import *
@@ -1,3 +1,4 @@
+from .block_gas_intake import *
 from .block_gas_queries import *
 from .block_gas_schema_defs import *
 from .block_gas_statements import *
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import typing
+
+import toolsql
+
+from ctc import config
+from ctc import evm
+from ctc import spec
+
+from ... import management
+from . import block_gas_statements
+
+if typing.TYPE_CHECKING:
+    from .block_gas_statements import BlockGasStatsRow
+
+
+async def async_intake_blocks_gas_stats(
+    blocks_gas_stats: typing.Sequence[BlockGasStatsRow],
+    *,
+    latest_block: int | None = None,
+    context: spec.Context = None,
+) -> None:
+    """intake gas stats of confirmed blocks into block_gas schema
+
+    also stores median gas prices into the block_gas table
+    """
+
+    if len(blocks_gas_stats) == 0:
+        return
+
+    # filter unconfirmed blocks
+    if latest_block is None:
+        latest_block = await evm.async_get_latest_block_number(context=context)
+    required_confirmations = management.get_required_confirmations(
+        context=context
+    )
+    latest_allowed_block = latest_block - required_confirmations
+    confirmed = [
+        row
+        for row in blocks_gas_stats
+        if row['block_number'] <= latest_allowed_block
+    ]
+    if len(confirmed) == 0:
+        return
+
+    medians: list[block_gas_statements.BlockGasRow] = [
+        {
+            'block_number': row['block_number'],
+            'timestamp': row['timestamp'],
+            'median_gas_fee': row['median_gas_price'],
+        }
+        for row in confirmed
+    ]
+
+    db_config = config.get_context_db_config(
+        schema_name='block_gas',
+        context=context,
+    )
+    async with toolsql.async_connect(db_config) as conn:
+        await block_gas_statements.async_upsert_blocks_gas_stats(
+            blocks_gas_stats=confirmed,
+            conn=conn,
+            context=context,
+        )
+        await block_gas_statements.async_upsert_median_blocks_gas_fees(
+            block_gas_data=medians,
+            conn=conn,
+            context=context,
+        )
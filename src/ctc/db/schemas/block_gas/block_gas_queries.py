@@ -13,3 +13,8 @@ async_query_median_blocks_gas_fees = query_utils.wrap_selector_with_connection(
     block_gas_statements.async_select_median_blocks_gas_fees,
     'block_gas',
 )
+
+async_query_blocks_gas_stats = query_utils.wrap_selector_with_connection(
+    block_gas_statements.async_select_blocks_gas_stats,
+    'block_gas',
+)
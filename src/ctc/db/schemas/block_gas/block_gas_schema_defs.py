@@ -23,5 +23,23 @@ block_gas_schema: toolsql.DBSchemaShorthand = {
                 },
             ],
         },
+        'block_gas_stats': {
+            'columns': [
+                {'name': 'block_number', 'type': 'Integer', 'primary': True},
+                {'name': 'timestamp', 'type': 'Integer', 'index': True},
+                {'name': 'base_fee', 'type': 'Float', 'nullable': True},
+                {'name': 'min_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'p5_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'p25_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'median_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'p75_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'p95_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'max_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'mean_gas_price', 'type': 'Float', 'nullable': True},
+                {'name': 'gas_used', 'type': 'Integer'},
+                {'name': 'gas_limit', 'type': 'Integer'},
+                {'name': 'n_transactions', 'type': 'Integer'},
+            ],
+        },
     },
 }
@@ -15,6 +15,22 @@ if typing.TYPE_CHECKING:
         median_gas_fee: int | float | None
         timestamp: int
 
+    class BlockGasStatsRow(TypedDict):
+        block_number: int
+        timestamp: int
+        base_fee: int | float | None
+        min_gas_price: int | float | None
+        p5_gas_price: int | float | None
+        p25_gas_price: int | float | None
+        median_gas_price: int | float | None
+        p75_gas_price: int | float | None
+        p95_gas_price: int | float | None
+        max_gas_price: int | float | None
+        mean_gas_price: int | float | None
+        gas_used: int
+        gas_limit: int
+        n_transactions: int
+
 
 async def async_upsert_median_block_gas_fee(
     block_number: int,
@@ -125,3 +141,82 @@ async def async_delete_blocks_gasses(
         table=table,
         where_in={'block_number': block_numbers},
     )
+
+
+#
+# # gas stats
+#
+
+
+async def async_upsert_blocks_gas_stats(
+    blocks_gas_stats: typing.Sequence[BlockGasStatsRow],
+    *,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(blocks_gas_stats) == 0:
+        return
+
+    table = schema_utils.get_table_schema('block_gas_stats', context=context)
+
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=blocks_gas_stats,
+        upsert=True,
+    )
+
+
+async def async_select_blocks_gas_stats(
+    *,
+    block_numbers: typing.Sequence[int] | None = None,
+    start_block: int | None = None,
+    end_block: int | None = None,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> typing.Sequence[BlockGasStatsRow] | None:
+
+    table = schema_utils.get_table_schema('block_gas_stats', context=context)
+
+    if block_numbers is not None:
+        results: typing.Sequence[BlockGasStatsRow] = await toolsql.async_select(  # type: ignore
+            conn=conn,
+            table=table,
+            where_in={'block_number': block_numbers},
+            order_by='block_number',
+        )
+    else:
+        if start_block is not None:
+            where_gte = {'block_number': start_block}
+        else:
+            where_gte = None
+        if end_block is not None:
+            where_lte = {'block_number': end_block}
+        else:
+            where_lte = None
+        results = await toolsql.async_select(  # type: ignore
+            conn=conn,
+            table=table,
+            where_gte=where_gte,
+            where_lte=where_lte,
+            order_by='block_number',
+        )
+
+    return results
+
+
+async def async_delete_blocks_gas_stats(
+    block_numbers: typing.Sequence[int],
+    *,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    table = schema_utils.get_table_schema('block_gas_stats', context=context)
+
+    await toolsql.async_delete(
+        conn=conn,
+        table=table,
+        where_in={'block_number': block_numbers},
+    )
@@ -93,8 +93,6 @@ async def async_intake_blocks(
         and blocks_db_transactions is None
         and rpc_blocks is not None
     ):
-        import asyncio
-
         blocks_rpc_transactions: typing.Sequence[spec.RPCTransaction] = [
             tx  # type: ignore
             for rpc_block in rpc_blocks
@@ -103,13 +101,12 @@ async def async_intake_blocks(
             and len(rpc_block['transactions']) > 0
             and isinstance(rpc_block['transactions'][0], dict)
         ]
-        coroutines = [
-            evm.async_convert_rpc_transaction_to_db_transaction(
-                transaction=tx, context=context
+        blocks_db_transactions = (
+            await evm.async_convert_rpc_transactions_to_db_transactions(
+                blocks_rpc_transactions,
+                context=context,
             )
-            for tx in blocks_rpc_transactions
-        ]
-        blocks_db_transactions = await asyncio.gather(*coroutines)
+        )
 
     # insert into database
     if intake_blocks or intake_transactions:
@@ -52,3 +52,44 @@ async def async_intake_dex_pools(
             conn=conn,
             context=context,
         )
+
+
+async def async_intake_factories_dex_pools(
+    *,
+    factories_dex_pools: typing.Mapping[
+        spec.Address, typing.Sequence[spec.DexPool]
+    ],
+    last_scanned_block: int,
+    context: spec.Context = None,
+) -> None:
+    """intake dex pools of multiple factories into database at once
+
+    - each factory should be provided with the complete set of dex pools that
+        have been created since its previous last_scanned_block
+    - every factory is marked as scanned through last_scanned_block
+    """
+
+    all_dex_pools: typing.MutableSequence[spec.DexPool] = []
+    for factory, dex_pools in factories_dex_pools.items():
+        for dex_pool in dex_pools:
+            if dex_pool['factory'].lower() != factory.lower():
+                raise Exception('dex pool listed under wrong factory')
+        all_dex_pools.extend(dex_pools)
+
+    db_config = config.get_context_db_config(
+        schema_name='dex_pools',
+        context=context,
+    )
+    async with toolsql.async_connect(db_config) as conn:
+        await dex_pools_statements.async_upsert_dex_pools(
+            dex_pools=all_dex_pools,
+            conn=conn,
+            context=context,
+        )
+        for factory in factories_dex_pools.keys():
+            await dex_pools_statements.async_upsert_dex_pool_factory_query(
+                factory=factory,
+                last_scanned_block=last_scanned_block,
+                conn=conn,
+                context=context,
+            )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import typing
 
 import toolsql
@@ -47,11 +46,23 @@ async def async_upsert_erc20s_metadata(
     context: spec.Context,
     conn: toolsql.AsyncConnection,
 ) -> None:
-    coroutines = [
-        async_upsert_erc20_metadata(conn=conn, context=context, **metadata)
-        for metadata in erc20s_metadata
-    ]
-    await asyncio.gather(*coroutines)
+
+    # group rows by their non-null columns, so that upserts keep stored values
+    rows_by_columns: dict[tuple[str, ...], list[dict[str, typing.Any]]] = {}
+    for metadata in erc20s_metadata:
+        row = {k: v for k, v in metadata.items() if v is not None}
+        row['address'] = metadata['address'].lower()
+        rows_by_columns.setdefault(tuple(sorted(row.keys())), []).append(row)
+
+    # insert each group of rows in bulk
+    table = schema_utils.get_table_schema('erc20_metadata', context=context)
+    for rows in rows_by_columns.values():
+        await toolsql.async_insert(
+            conn=conn,
+            table=table,
+            rows=rows,
+            upsert=True,
+        )
 
 
 async def async_select_erc20_metadata(
@@ -88,13 +99,22 @@ async def async_select_erc20_metadata(
 
 
 async def async_select_erc20s_metadata(
-    addresses: typing.Sequence[spec.Address],
+    addresses: typing.Sequence[spec.Address] | None = None,
     *,
     context: spec.Context | None = None,
     conn: toolsql.AsyncConnection,
 ) -> typing.Sequence[spec.ERC20Metadata | None] | None:
 
     table = schema_utils.get_table_schema('erc20_metadata', context=context)
+
+    # select all rows if addresses not specified
+    if addresses is None:
+        all_results: typing.Sequence[spec.ERC20Metadata] = await toolsql.async_select(  # type: ignore
+            conn=conn,
+            table=table,
+        )
+        return all_results
+
     results: typing.Sequence[spec.ERC20Metadata] = await toolsql.async_select(  # type: ignore
         conn=conn,
         table=table,
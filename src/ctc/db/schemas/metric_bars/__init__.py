@@ -0,0 +1,4 @@
+from .metric_bars_intake import *
+from .metric_bars_queries import *
+from .metric_bars_schema_defs import *
+from .metric_bars_statements import *
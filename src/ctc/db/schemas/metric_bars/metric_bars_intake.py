@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import typing
+
+import toolsql
+
+from ctc import config
+from ctc import spec
+from . import metric_bars_statements
+
+if typing.TYPE_CHECKING:
+    from .metric_bars_statements import MetricBarRow
+    from .metric_bars_statements import MetricFeedCursorRow
+
+
+async def async_intake_metric_bars(
+    *,
+    metric_bars: typing.Sequence[MetricBarRow],
+    metric_feed_cursors: typing.Sequence[MetricFeedCursorRow],
+    context: spec.Context = None,
+) -> None:
+    """intake aggregated bars of metric feeds into metric_bars schema
+
+    cursors record the last sample of each feed, so that aggregation can be
+    resumed from stored bars without recomputation
+    """
+
+    if len(metric_bars) == 0 and len(metric_feed_cursors) == 0:
+        return
+
+    db_config = config.get_context_db_config(
+        schema_name='metric_bars',
+        context=context,
+    )
+    async with toolsql.async_connect(db_config) as conn:
+        await metric_bars_statements.async_upsert_metric_bars(
+            metric_bars=metric_bars,
+            conn=conn,
+            context=context,
+        )
+        await metric_bars_statements.async_upsert_metric_feed_cursors(
+            metric_feed_cursors=metric_feed_cursors,
+            conn=conn,
+            context=context,
+        )
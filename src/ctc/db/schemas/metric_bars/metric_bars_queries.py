@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from ... import query_utils
+from . import metric_bars_statements
+
+
+async_query_metric_bars = query_utils.wrap_selector_with_connection(
+    metric_bars_statements.async_select_metric_bars,
+    'metric_bars',
+)
+
+async_query_last_metric_bar = query_utils.wrap_selector_with_connection(
+    metric_bars_statements.async_select_last_metric_bar,
+    'metric_bars',
+)
+
+async_query_metric_feed_cursor = query_utils.wrap_selector_with_connection(
+    metric_bars_statements.async_select_metric_feed_cursor,
+    'metric_bars',
+)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import toolsql
+
+
+metric_bars_schema: toolsql.DBSchemaShorthand = {
+    'tables': {
+        'metric_bars': {
+            'columns': [
+                {'name': 'feed', 'type': 'Text', 'primary': True},
+                {'name': 'bin_size', 'type': 'Integer', 'primary': True},
+                {'name': 'bin', 'type': 'Integer', 'primary': True},
+                {'name': 'open', 'type': 'Float', 'nullable': True},
+                {'name': 'high', 'type': 'Float', 'nullable': True},
+                {'name': 'low', 'type': 'Float', 'nullable': True},
+                {'name': 'close', 'type': 'Float', 'nullable': True},
+                {'name': 'count', 'type': 'Integer'},
+                {'name': 'volume', 'type': 'Float'},
+                {'name': 'twap', 'type': 'Float', 'nullable': True},
+                {'name': 'twap_area', 'type': 'Float'},
+                {'name': 'twap_duration', 'type': 'Float'},
+            ],
+        },
+        'metric_feed_cursors': {
+            'columns': [
+                {'name': 'feed', 'type': 'Text', 'primary': True},
+                {'name': 'last_timestamp', 'type': 'Integer'},
+                {'name': 'last_value', 'type': 'Float'},
+            ],
+        },
+    },
+}
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import typing
+
+import toolsql
+
+from ctc import spec
+from ... import schema_utils
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class MetricBarRow(TypedDict):
+        feed: str
+        bin_size: int
+        bin: int
+        open: float | None
+        high: float | None
+        low: float | None
+        close: float | None
+        count: int
+        volume: float
+        twap: float | None
+        twap_area: float
+        twap_duration: float
+
+    class MetricFeedCursorRow(TypedDict):
+        feed: str
+        last_timestamp: int
+        last_value: float
+
+
+async def async_upsert_metric_bars(
+    *,
+    metric_bars: typing.Sequence[MetricBarRow],
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(metric_bars) == 0:
+        return
+
+    table = schema_utils.get_table_schema('metric_bars', context=context)
+
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=metric_bars,
+        upsert=True,
+    )
+
+
+async def async_upsert_metric_feed_cursors(
+    *,
+    metric_feed_cursors: typing.Sequence[MetricFeedCursorRow],
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(metric_feed_cursors) == 0:
+        return
+
+    table = schema_utils.get_table_schema(
+        'metric_feed_cursors', context=context
+    )
+
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=metric_feed_cursors,
+        upsert=True,
+    )
+
+
+async def async_select_metric_bars(
+    feed: str,
+    *,
+    bin_size: int,
+    start_bin: int | None = None,
+    end_bin: int | None = None,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> typing.Sequence[MetricBarRow] | None:
+
+    table = schema_utils.get_table_schema('metric_bars', context=context)
+
+    if start_bin is not None:
+        where_gte = {'bin': start_bin}
+    else:
+        where_gte = None
+    if end_bin is not None:
+        where_lte = {'bin': end_bin}
+    else:
+        where_lte = None
+
+    results: typing.Sequence[MetricBarRow] = await toolsql.async_select(  # type: ignore
+        conn=conn,
+        table=table,
+        where_equals={'feed': feed, 'bin_size': bin_size},
+        where_gte=where_gte,
+        where_lte=where_lte,
+        order_by='bin',
+    )
+    return results
+
+
+async def async_select_last_metric_bar(
+    feed: str,
+    *,
+    bin_size: int,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> MetricBarRow | None:
+
+    table = schema_utils.get_table_schema('metric_bars', context=context)
+
+    result: MetricBarRow | None = await toolsql.async_select(  # type: ignore
+        conn=conn,
+        table=table,
+        where_equals={'feed': feed, 'bin_size': bin_size},
+        order_by={'column': 'bin', 'desc': True},
+        limit=1,
+        output_format='single_dict_or_none',
+    )
+    return result
+
+
+async def async_select_metric_feed_cursor(
+    feed: str,
+    *,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> MetricFeedCursorRow | None:
+
+    table = schema_utils.get_table_schema(
+        'metric_feed_cursors', context=context
+    )
+
+    result: MetricFeedCursorRow | None = await toolsql.async_select(  # type: ignore
+        conn=conn,
+        table=table,
+        where_equals={'feed': feed},
+        output_format='single_dict_or_none',
+    )
+    return result
+
+
+async def async_delete_metric_bars(
+    feed: str,
+    *,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    bars_table = schema_utils.get_table_schema('metric_bars', context=context)
+    cursors_table = schema_utils.get_table_schema(
+        'metric_feed_cursors', context=context
+    )
+
+    await toolsql.async_delete(
+        conn=conn,
+        table=bars_table,
+        where_equals={'feed': feed},
+    )
+    await toolsql.async_delete(
+        conn=conn,
+        table=cursors_table,
+        where_equals={'feed': feed},
+    )
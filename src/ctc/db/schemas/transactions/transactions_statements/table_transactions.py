@@ -106,7 +106,10 @@ async def async_select_transactions(
     if transactions is None:
         return None
 
-    result = {tx['hash']: tx for tx in transactions}
+    result = {
+        tx['hash']: evm.convert_db_transaction_fields_to_int(tx)  # type: ignore
+        for tx in transactions
+    }
 
     return [result.get(tx_hash) for tx_hash in hashes]
 
@@ -6,6 +6,9 @@ import typing
 if typing.TYPE_CHECKING:
     from typing_extensions import TypedDict, NotRequired
 
+    import numpy as np
+    import numpy.typing as npt
+
     class Trade(TypedDict):
         x_bought: int | float
         x_sold: int | float
@@ -46,3 +49,17 @@ if typing.TYPE_CHECKING:
         y_fees: int | float
         trade_results: Trade
 
+
+    class TradeGrid(TypedDict):
+        x_bought: npt.NDArray[np.float64]
+        x_sold: npt.NDArray[np.float64]
+        y_bought: npt.NDArray[np.float64]
+        y_sold: npt.NDArray[np.float64]
+        fee_rate: float
+        new_x_reserves: npt.NDArray[np.float64]
+        new_y_reserves: npt.NDArray[np.float64]
+        x_per_y_start: npt.NDArray[np.float64]
+        mean_x_per_y: npt.NDArray[np.float64]
+        x_per_y_end: npt.NDArray[np.float64]
+        mean_slippage_x_per_y: npt.NDArray[np.float64]
+        end_slippage_x_per_y: npt.NDArray[np.float64]
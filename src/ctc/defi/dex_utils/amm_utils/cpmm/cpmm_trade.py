@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import decimal
+import typing
 
 from . import cpmm_spec
 
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
 
 def trade(
     x_reserves: int | float,
@@ -244,7 +248,7 @@ def compute_y_bought_when_x_sold(
     """compute amount of y bought when selling x_sold amount of x"""
     if fee_rate is None:
         fee_rate = 0.003
-    if x_sold < 0:
+    if _any_negative(x_sold):
         raise Exception('x_sold must be non-negative')
     alpha = x_sold / x_reserves
     gamma = 1 - fee_rate
@@ -262,10 +266,120 @@ def compute_x_sold_when_y_bought(
     """compute amount of x that must be sold to buy y_bought amount of y"""
     if fee_rate is None:
         fee_rate = 0.003
-    if y_bought < 0:
+    if _any_negative(y_bought):
         raise Exception('y_bought must be non-negative')
     beta = y_bought / y_reserves
     gamma = 1 - fee_rate
     x_sold = beta / (1 - beta) / gamma * x_reserves
     return x_sold
 
+
+def _any_negative(value: typing.Any) -> bool:
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return value < 0
+    else:
+        import numpy as np
+
+        return bool(np.any(np.asarray(value) < 0))
+
+
+def trade_grid(
+    x_reserves: npt.ArrayLike,
+    y_reserves: npt.ArrayLike,
+    *,
+    x_sold: npt.ArrayLike | None = None,
+    x_bought: npt.ArrayLike | None = None,
+    y_sold: npt.ArrayLike | None = None,
+    y_bought: npt.ArrayLike | None = None,
+    fee_rate: float | None = None,
+) -> cpmm_spec.TradeGrid:
+    """perform every trade size of a grid against every pool state
+
+    ## Input Requirements
+    - x_reserves and y_reserves are 1d arrays of pool states
+    - must specify exactly one of x_sold, x_bought, y_sold, or y_bought as a
+      1d array of non-negative trade sizes
+
+    ## Output
+    - each output is a 2d array with a row per pool state and a column per
+      trade size, using the sign conventions of trade()
+    - trades that buy at least the full reserves of a token are nan
+    """
+
+    import numpy as np
+
+    if fee_rate is None:
+        fee_rate = 0.003
+    sizes = [x_sold, x_bought, y_sold, y_bought]
+    if sum(size is not None for size in sizes) != 1:
+        raise Exception('must specify only one input value')
+
+    # computations broadcast over rows of states and columns of sizes
+    x: typing.Any = np.asarray(x_reserves, dtype=float)[:, np.newaxis]
+    y: typing.Any = np.asarray(y_reserves, dtype=float)[:, np.newaxis]
+    if x.shape != y.shape:
+        raise Exception('x_reserves and y_reserves must have same shape')
+    kwargs: typing.Any = {'x_reserves': x, 'y_reserves': y}
+    reverse_kwargs: typing.Any = {'x_reserves': y, 'y_reserves': x}
+    x_sold_grid: typing.Any
+    x_bought_grid: typing.Any
+    y_sold_grid: typing.Any
+    y_bought_grid: typing.Any
+    x_delta: typing.Any
+    y_delta: typing.Any
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if x_sold is not None:
+            x_sold_grid = np.asarray(x_sold, dtype=float)[np.newaxis, :]
+            y_bought_grid = compute_y_bought_when_x_sold(
+                x_sold=x_sold_grid, fee_rate=fee_rate, **kwargs
+            )
+            x_delta = np.broadcast_to(x_sold_grid, y_bought_grid.shape)
+            y_delta = -y_bought_grid
+        elif y_sold is not None:
+            y_sold_grid = np.asarray(y_sold, dtype=float)[np.newaxis, :]
+            x_bought_grid = compute_y_bought_when_x_sold(
+                x_sold=y_sold_grid, fee_rate=fee_rate, **reverse_kwargs
+            )
+            x_delta = -x_bought_grid
+            y_delta = np.broadcast_to(y_sold_grid, x_bought_grid.shape)
+        elif x_bought is not None:
+            x_bought_grid = np.asarray(x_bought, dtype=float)[np.newaxis, :]
+            y_sold_grid = compute_x_sold_when_y_bought(
+                y_bought=x_bought_grid, fee_rate=fee_rate, **reverse_kwargs
+            )
+            y_sold_grid[x_bought_grid >= x] = np.nan
+            x_delta = np.broadcast_to(-x_bought_grid, y_sold_grid.shape)
+            y_delta = y_sold_grid
+        elif y_bought is not None:
+            y_bought_grid = np.asarray(y_bought, dtype=float)[np.newaxis, :]
+            x_sold_grid = compute_x_sold_when_y_bought(
+                y_bought=y_bought_grid, fee_rate=fee_rate, **kwargs
+            )
+            x_sold_grid[y_bought_grid >= y] = np.nan
+            x_delta = x_sold_grid
+            y_delta = np.broadcast_to(-y_bought_grid, x_sold_grid.shape)
+        else:
+            raise Exception('could not compute output')
+
+        x_delta = np.where(np.isnan(y_delta), np.nan, x_delta)
+        new_x_reserves = x + x_delta
+        new_y_reserves = y + y_delta
+        x_per_y_start = np.broadcast_to(x / y, x_delta.shape)
+        mean_x_per_y = np.where(x_delta == 0, x_per_y_start, -x_delta / y_delta)
+        x_per_y_end = new_x_reserves / new_y_reserves
+
+    return {
+        'x_sold': x_delta,
+        'x_bought': -x_delta,
+        'y_sold': y_delta,
+        'y_bought': -y_delta,
+        'fee_rate': fee_rate,
+        'new_x_reserves': new_x_reserves,
+        'new_y_reserves': new_y_reserves,
+        'x_per_y_start': x_per_y_start,
+        'mean_x_per_y': mean_x_per_y,
+        'x_per_y_end': x_per_y_end,
+        'mean_slippage_x_per_y': mean_x_per_y / x_per_y_start - 1,
+        'end_slippage_x_per_y': x_per_y_end / x_per_y_start - 1,
+    }
@@ -1,7 +1,26 @@
 from __future__ import annotations
 
+import typing
+
 from ctc import spec
 
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    import numpy as np
+    import numpy.typing as npt
+
+    class StableswapTradeGrid(TypedDict):
+        amount_in: npt.NDArray[np.float64]
+        amount_out: npt.NDArray[np.float64]
+        fees: npt.NDArray[np.float64]
+        new_balances: npt.NDArray[np.float64]
+        price_start: npt.NDArray[np.float64]
+        mean_price: npt.NDArray[np.float64]
+        price_end: npt.NDArray[np.float64]
+        mean_slippage: npt.NDArray[np.float64]
+        end_slippage: npt.NDArray[np.float64]
+
 
 def get_stableswap_price(
     x: spec.Number, y: spec.Number, *, A: spec.Number
@@ -10,3 +29,186 @@ def get_stableswap_price(
     numerator = 1 + 2 * A * (x ** 2) * y / ((k / 2) ** 3)
     denominator = 1 + 2 * A * x * (y ** 2) / ((k / 2) ** 3)
     return float(y / x * numerator / denominator)
+
+
+#
+# # vectorized invariant
+#
+# balances are arrays whose last axis indexes coins, other axes are batched
+# A is the amplification coefficient of the whitepaper, so Ann = A * n ** n
+#
+
+
+def compute_stableswap_d(
+    balances: npt.ArrayLike,
+    *,
+    A: spec.Number,
+    max_iterations: int = 255,
+    rtol: float = 1e-12,
+) -> npt.NDArray[np.float64]:
+    """solve stableswap invariant D of each set of balances, using newton"""
+
+    import numpy as np
+
+    balances = np.asarray(balances, dtype=float)
+    n_coins = balances.shape[-1]
+    Ann = A * n_coins**n_coins
+    S = balances.sum(axis=-1)
+    D = S.copy()
+    for iteration in range(max_iterations):
+        D_P = D.copy()
+        for coin in range(n_coins):
+            D_P = D_P * D / (balances[..., coin] * n_coins)
+        D_prev = D
+        D = (
+            (Ann * S + D_P * n_coins)
+            * D
+            / ((Ann - 1) * D + (n_coins + 1) * D_P)
+        )
+        if np.all(np.abs(D - D_prev) <= rtol * D):
+            break
+    else:
+        raise Exception('stableswap invariant did not converge')
+    return D  # type: ignore
+
+
+def compute_stableswap_y(
+    balances: npt.ArrayLike,
+    *,
+    j: int,
+    D: npt.ArrayLike,
+    A: spec.Number,
+    max_iterations: int = 255,
+    rtol: float = 1e-12,
+) -> npt.NDArray[np.float64]:
+    """solve balance of coin j that satisfies invariant D given others"""
+
+    import numpy as np
+
+    balances = np.asarray(balances, dtype=float)
+    D = np.asarray(D, dtype=float)
+    n_coins = balances.shape[-1]
+    Ann = A * n_coins**n_coins
+
+    c = D.copy()
+    S = np.zeros(balances.shape[:-1])
+    for coin in range(n_coins):
+        if coin != j:
+            S = S + balances[..., coin]
+            c = c * D / (balances[..., coin] * n_coins)
+    c = c * D / (Ann * n_coins)
+    b = S + D / Ann
+
+    y = D.copy()
+    for iteration in range(max_iterations):
+        y_prev = y
+        y = (y * y + c) / (2 * y + b - D)
+        if np.all(np.abs(y - y_prev) <= rtol * D):
+            break
+    else:
+        raise Exception('stableswap balance did not converge')
+    return y
+
+
+def get_stableswap_prices(
+    balances: npt.ArrayLike,
+    *,
+    i: int,
+    j: int,
+    A: spec.Number,
+    D: npt.ArrayLike | None = None,
+) -> npt.NDArray[np.float64]:
+    """get marginal price of coin i in units of coin j, before fees"""
+
+    import numpy as np
+
+    balances = np.asarray(balances, dtype=float)
+    if D is None:
+        D = compute_stableswap_d(balances, A=A)
+    D = np.asarray(D, dtype=float)
+    n_coins = balances.shape[-1]
+    Ann = A * n_coins**n_coins
+
+    # ratio of partial derivatives of invariant with respect to balances
+    term = D ** (n_coins + 1) / (n_coins**n_coins * np.prod(balances, axis=-1))
+    numerator = Ann + term / balances[..., i]
+    denominator = Ann + term / balances[..., j]
+    return numerator / denominator  # type: ignore
+
+
+def stableswap_trade_grid(
+    balances: npt.ArrayLike,
+    *,
+    i: int,
+    j: int,
+    amounts_in: npt.ArrayLike,
+    A: spec.Number,
+    fee_rate: float | None = None,
+) -> StableswapTradeGrid:
+    """sell every amount of coin i for coin j against every pool state
+
+    ## Input Requirements
+    - balances is a 2d array with a row per pool state and a column per coin
+    - amounts_in is a 1d array of amounts of coin i sold
+
+    ## Output
+    - each output is a 2d array with a row per pool state and a column per
+      trade size, new_balances has an additional axis of coins
+    - prices are amounts of coin j per coin i
+    - fees are taken from the output amount, as in curve pools
+    """
+
+    import numpy as np
+
+    if fee_rate is None:
+        fee_rate = 0.0004
+
+    balances = np.asarray(balances, dtype=float)
+    amounts = np.asarray(amounts_in, dtype=float)
+    if balances.ndim != 2 or amounts.ndim != 1:
+        raise Exception('balances must be 2d and amounts_in must be 1d')
+    n_states, n_coins = balances.shape
+    n_sizes = len(amounts)
+
+    # compute balance of coin j after adding each amount of coin i
+    D = compute_stableswap_d(balances, A=A)
+    grid_balances = np.repeat(balances[:, np.newaxis, :], n_sizes, axis=1)
+    grid_balances[:, :, i] += amounts[np.newaxis, :]
+    grid_D = np.broadcast_to(D[:, np.newaxis], (n_states, n_sizes))
+    new_y = compute_stableswap_y(grid_balances, j=j, D=grid_D, A=A)
+
+    # take fees from output
+    dy = balances[:, j, np.newaxis] - new_y
+    dy[:, amounts == 0] = 0
+    fees = dy * fee_rate
+    amount_out = dy - fees
+    new_balances = grid_balances
+    new_balances[:, :, j] = new_y + fees
+
+    # compute prices and slippage
+    price_start = np.broadcast_to(
+        get_stableswap_prices(balances, i=i, j=j, A=A, D=D)[:, np.newaxis]
+        * (1 - fee_rate),
+        (n_states, n_sizes),
+    )
+    price_end = (1 - fee_rate) * get_stableswap_prices(
+        new_balances, i=i, j=j, A=A
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_price = np.where(
+            amounts[np.newaxis, :] == 0,
+            price_start,
+            amount_out / amounts[np.newaxis, :],
+        )
+
+    return {
+        'amount_in': np.broadcast_to(amounts, (n_states, n_sizes)),
+        'amount_out': amount_out,
+        'fees': fees,
+        'new_balances': new_balances,
+        'price_start': price_start,
+        'mean_price': mean_price,
+        'price_end': price_end,
+        'mean_slippage': mean_price / price_start - 1,
+        'end_slippage': price_end / price_start - 1,
+    }
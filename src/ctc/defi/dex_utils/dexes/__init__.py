@@ -1,5 +1,9 @@
 from .dex_class import DEX
 from .dex_class_utils import *
 from .dex_directory import *
+from .dex_log_scans import *
+from .dex_pool_discovery import *
+from .dex_pool_index import *
+from .dex_trade_processing import *
 from .dex_functions import *
 from .dex_implementations import *
@@ -9,6 +9,7 @@ from ctc import spec
 if typing.TYPE_CHECKING:
     from typing_extensions import Literal
 
+    import polars as pl
     import tooltime
 
 
@@ -21,10 +22,15 @@ class DEX:
         - Functions in dex_utils will call the appropriate DEX methods
 
     Subclasses should implement the following methods:
-    - async_get_new_pools()
+    - async_get_new_pools(), or if factories announce pools with an event,
+      _async_get_pool_creation_event_abi() and _async_decode_new_pools()
     - _async_get_pool_assets_from_node()
     - _async_get_pool_raw_trades()
 
+    If pools emit one event per trade, subclasses should also implement
+    _async_get_swap_event_abi() and _get_raw_trade_exprs(), so that trades of
+    many pools can be fetched with shared log scans
+
     Subclasses should specify the following properties:
     - _pool_factories
     """
@@ -54,7 +60,54 @@ class DEX:
         end_time: tooltime.Timestamp | None = None,
         context: spec.Context = None,
     ) -> typing.Sequence[spec.DexPool]:
-        raise NotImplementedError(cls.__name__ + '.async_get_new_pools')
+        event_abi = await cls._async_get_pool_creation_event_abi(
+            context=context
+        )
+        if event_abi is None:
+            raise NotImplementedError(cls.__name__ + '.async_get_new_pools')
+
+        events = await evm.async_get_events(
+            factory,
+            event_abi=event_abi,
+            verbose=False,
+            start_block=start_block,
+            end_block=end_block,
+            start_time=start_time,
+            end_time=end_time,
+            context=context,
+        )
+        return await cls._async_decode_new_pools(
+            events,
+            factory=factory,
+            start_block=start_block,
+            end_block=end_block,
+            context=context,
+        )
+
+    @classmethod
+    async def _async_get_pool_creation_event_abi(
+        cls,
+        *,
+        context: spec.Context = None,
+    ) -> spec.EventABI | None:
+        """get event abi that factories emit when creating a pool
+
+        return None if pools are not discoverable from factory events
+        """
+        return None
+
+    @classmethod
+    async def _async_decode_new_pools(
+        cls,
+        events: spec.DataFrame,
+        *,
+        factory: spec.Address,
+        start_block: spec.BlockNumberReference | None,
+        end_block: spec.BlockNumberReference | None,
+        context: spec.Context = None,
+    ) -> typing.Sequence[spec.DexPool]:
+        """convert decoded pool creation events of factory into dex pools"""
+        raise NotImplementedError(cls.__name__ + '._async_decode_new_pools')
 
     @classmethod
     async def _async_get_pool_assets_from_node(
@@ -81,6 +134,28 @@ class DEX:
     ) -> spec.RawDexTrades:
         raise NotImplementedError(cls.__name__ + '.async_get_pool_trades')
 
+    @classmethod
+    async def _async_get_swap_event_abi(
+        cls,
+        *,
+        context: spec.Context = None,
+    ) -> spec.EventABI | None:
+        """get event abi that pools emit for each trade
+
+        return None if trades of pools cannot be scanned from a single event
+        """
+        return None
+
+    @classmethod
+    def _get_raw_trade_exprs(cls, swaps: spec.DataFrame) -> list[pl.Expr]:
+        """get expressions converting decoded swap events into raw trades
+
+        - integer event args are decoded as floats
+        - expressions should produce recipient, sold_id, bought_id,
+          sold_amount, and bought_amount columns
+        """
+        raise NotImplementedError(cls.__name__ + '._get_raw_trade_exprs')
+
     #
     # # dex metadata
     #
@@ -198,11 +273,23 @@ class DEX:
         end_block: spec.BlockNumberReference | None = None,
         context: spec.Context = None,
     ) -> typing.Sequence[spec.DexPool]:
-        """return pools"""
+        """return pools
+
+        pools are looked up in the process-level dex pool index
+        """
 
-        from ctc import db
+        from . import dex_pool_index
 
-        pools = await db.async_query_dex_pools(
+        if start_block is not None:
+            start_block = await evm.async_block_number_to_int(
+                start_block, context=context
+            )
+        if end_block is not None:
+            end_block = await evm.async_block_number_to_int(
+                end_block, context=context
+            )
+
+        return await dex_pool_index.async_get_indexed_dex_pools(
             factory=factory,
             factories=factories,
             assets=assets,
@@ -210,10 +297,6 @@ class DEX:
             end_block=end_block,
             context=context,
         )
-        if pools is None:
-            pools = []
-
-        return pools
 
     #
     # # multiple pool updates
@@ -227,72 +310,29 @@ class DEX:
         factories: typing.Sequence[spec.Address] | None = None,
         context: spec.Context = None,
     ) -> typing.Sequence[spec.DexPool]:
-        """update latest pools of factory"""
+        """update latest pools of factory
 
-        from ctc import db
+        all factories are scanned together, see dex_pool_discovery
+        """
 
-        # if not factory or factories specified, use all
-        if factories is None and factory is None:
-            factories = cls.get_pool_factories(context=context)
+        from . import dex_pool_discovery
 
-        # if using multiple factories, call function separately for each
-        if factories is not None:
-            coroutines = []
-            for factory in factories:
-                coroutine = cls.async_update_pools(
-                    factory=factory,
-                    context=context,
-                )
-                coroutines.append(coroutine)
-            results = await asyncio.gather(*coroutines)
-            return [dex_pool for result in results for dex_pool in result]
-
-        if factory is None:
-            raise Exception('factory should be specified')
+        # if not factory or factories specified, use all
+        if factories is None:
+            if factory is not None:
+                factories = [factory]
+            else:
+                factories = cls.get_pool_factories(context=context)
 
-        # get new pools
-        last_scanned_block = (
-            await db.async_query_dex_pool_factory_last_scanned_block(
-                factory=factory,
-                context=context,
-            )
+        new_pools = await dex_pool_discovery.async_update_dex_pools(
+            {cls: factories},
+            context=context,
         )
-        if last_scanned_block is None:
-            from ctc.toolbox import search_utils
-
-            try:
-                creation_block = await evm.async_get_contract_creation_block(
-                    factory,
-                    context=context,
-                )
-                if creation_block is None:
-                    raise Exception(
-                        'could not determine factory creation block'
-                    )
-                last_scanned_block = creation_block - 1
-            except search_utils.NoMatchFound:
-                last_scanned_block = -1
-
-        latest_block = await evm.async_get_latest_block_number(context=context)
-
-        if last_scanned_block + 1 <= latest_block:
-            new_pools = await cls.async_get_new_pools(
-                factory=factory,
-                start_block=last_scanned_block + 1,
-                end_block=latest_block,
-                context=context,
-            )
-            await db.async_intake_dex_pools(
-                factory=factory,
-                dex_pools=new_pools,
-                last_scanned_block=latest_block,
-                context=context,
-            )
-
-        else:
-            new_pools = []
-
-        return new_pools
+        return [
+            dex_pool
+            for factory in factories
+            for dex_pool in new_pools.get(factory.lower(), [])
+        ]
 
     #
     # # single pool metadata
@@ -417,6 +457,33 @@ class DEX:
         if len(blocks) == 0:
             raise NotImplementedError('must specify blocks')
 
+        # sample erc20 balances directly if balance functions not overridden
+        if (
+            cls.async_get_pool_balance.__func__  # type: ignore
+            is DEX.async_get_pool_balance.__func__  # type: ignore
+            and cls.async_get_pool_balances.__func__  # type: ignore
+            is DEX.async_get_pool_balances.__func__  # type: ignore
+        ):
+            pool_tokens = await cls.async_get_pool_assets(
+                pool=pool, context=context
+            )
+            balances = await asyncio.gather(
+                *[
+                    evm.async_get_erc20_balance_by_block(
+                        wallet=pool,
+                        token=token,
+                        blocks=blocks,
+                        normalize=normalize,
+                        context=context,
+                    )
+                    for token in pool_tokens
+                ]
+            )
+            return {
+                token: list(token_balances)
+                for token, token_balances in zip(pool_tokens, balances)
+            }
+
         coroutines = [
             cls.async_get_pool_balances(
                 pool=pool,
@@ -438,6 +505,135 @@ class DEX:
 
         return balances_by_block
 
+    #
+    # # multiple pool swaps functions
+    #
+
+    @classmethod
+    async def _async_get_pools_raw_trades(
+        cls,
+        pools: typing.Sequence[spec.Address],
+        *,
+        start_block: spec.BlockNumberReference | None = None,
+        end_block: spec.BlockNumberReference | None = None,
+        start_time: tooltime.Timestamp | None = None,
+        end_time: tooltime.Timestamp | None = None,
+        include_timestamps: bool = False,
+        max_addresses_per_request: int = 1000,
+        max_blocks_per_request: int = 2000,
+        context: spec.Context = None,
+    ) -> typing.Mapping[spec.Address, spec.RawDexTrades]:
+        """get raw trades of many pools using shared log scans
+
+        - swap logs of all pools are requested together for each block range,
+          filtered by address list, or by event hash alone when there are
+          more than max_addresses_per_request pools
+        - logs are decoded once with a shared schema and partitioned by pool
+        - amounts are floats
+        - DEXes without a swap event abi fall back to one query per pool
+        """
+
+        import polars as pl
+        from . import dex_log_scans
+
+        event_abi = await cls._async_get_swap_event_abi(context=context)
+        if event_abi is None:
+            results = await asyncio.gather(
+                *[
+                    cls._async_get_pool_raw_trades(
+                        pool,
+                        start_block=start_block,
+                        end_block=end_block,
+                        start_time=start_time,
+                        end_time=end_time,
+                        include_timestamps=include_timestamps,
+                        context=context,
+                    )
+                    for pool in pools
+                ]
+            )
+            return dict(zip(pools, results))
+
+        # scan from earliest pool creation if no start is given
+        if start_block is None and start_time is None:
+            creation_blocks = await evm.async_get_contracts_creation_blocks(
+                pools,
+                context=context,
+            )
+            start_block = min(
+                (block if block is not None else 0)
+                for block in creation_blocks
+            )
+        start_block, end_block = await evm.async_resolve_block_range(
+            start_block=start_block,
+            end_block=end_block,
+            start_time=start_time,
+            end_time=end_time,
+            allow_none=False,
+            to_int=True,
+            end_none_means='latest',
+            context=context,
+        )
+
+        # fetch and decode swaps of all pools together
+        event_hash = evm.get_event_hash(event_abi)
+        events = await dex_log_scans.async_scan_contract_logs(
+            {pool: event_hash for pool in pools},
+            start_blocks={pool: start_block for pool in pools},
+            end_block=end_block,
+            filter_addresses=(len(pools) <= max_addresses_per_request),
+            max_blocks_per_request=max_blocks_per_request,
+            context=context,
+        )
+        decoded = await evm.async_decode_events_dataframe(
+            events,
+            event_abis=[event_abi],
+            integer_output_format=float,
+            context=context,
+        )
+        swaps = events.with_columns(decoded)
+        trades = swaps.select(
+            [
+                pl.col('contract_address'),
+                pl.col('block_number'),
+                pl.col('transaction_hash'),
+                *cls._get_raw_trade_exprs(swaps),
+            ]
+        )
+        if include_timestamps:
+            block_numbers = trades['block_number'].unique().sort()
+            timestamps = await evm.async_get_block_timestamps(
+                block_numbers.to_list(),
+                context=context,
+            )
+            block_timestamps = pl.DataFrame(
+                {
+                    'block_number': block_numbers,
+                    'timestamp': pl.Series(timestamps, dtype=pl.Int64),
+                }
+            )
+            trades = trades.join(
+                block_timestamps, on='block_number', how='left'
+            )
+
+        # partition trades by pool
+        partitions = dex_log_scans.partition_contract_events(trades, pools)
+        pools_trades = {}
+        for pool, pool_trades in partitions.items():
+            raw_trades: spec.RawDexTrades = {
+                'block_number': pool_trades['block_number'],
+                'transaction_hash': pool_trades['transaction_hash'],
+                'recipient': pool_trades['recipient'],
+                'sold_id': pool_trades['sold_id'],
+                'bought_id': pool_trades['bought_id'],
+                'sold_amount': pool_trades['sold_amount'],
+                'bought_amount': pool_trades['bought_amount'],
+            }
+            if include_timestamps:
+                raw_trades['timestamp'] = pool_trades['timestamp']
+            pools_trades[pool] = raw_trades
+        return pools_trades
+
     #
     # # single pool swaps functions
     #
@@ -461,15 +657,10 @@ class DEX:
         context: spec.Context = None,
     ) -> spec.DataFrame:
         import polars as pl
+        from . import dex_trade_processing
 
         # queue relevant label data
-        if label == 'symbol':
-            symbols_coroutine = cls.async_get_pool_asset_symbols(
-                pool=pool,
-                context=context,
-            )
-            symbols_task = asyncio.create_task(symbols_coroutine)
-        if normalize or label == 'address':
+        if normalize or label != 'index':
             assets_coroutine = cls.async_get_pool_assets(
                 pool=pool,
                 context=context,
@@ -493,53 +684,33 @@ class DEX:
             if 'recipient' in output and output['recipient'] is None:
                 del output['recipient']
 
-        if normalize or label == 'address':
-            assets = await assets_task
-
-        # normalize
-        if normalize:
-            # test for metapools
-            if max(output['sold_id']) >= len(assets) or max(
-                output['bought_id']
-            ) >= len(assets):
-                raise NotImplementedError(
-                    'normalize not implemented for metapools'
-                )
+        df = pl.DataFrame(output)
 
-            decimals = await evm.async_get_erc20s_decimals(
-                assets,
+        # normalize and relabel using table of pool assets
+        if normalize or label != 'index':
+            assets = await assets_task
+            get_asset_table = dex_trade_processing.async_get_pools_asset_table
+            asset_table = await get_asset_table(
+                {pool: assets},
+                include_decimals=normalize,
+                include_symbols=(label == 'symbol'),
                 context=context,
             )
-
-            sold_decimals = output['sold_id'].apply(lambda i: decimals[i])
-            bought_decimals = output['bought_id'].apply(lambda i: decimals[i])
-            output['sold_amount'] /= 10**sold_decimals
-            output['bought_amount'] /= 10**bought_decimals
-
-        # replace labels
-        if label in ['symbol', 'address']:
-            if label == 'symbol':
-                new_ids = await symbols_task
-            elif label == 'address':
-                new_ids = assets
-            else:
-                raise Exception('unknown label format: ' + str(label))
-
-            output['bought_id'] = output['bought_id'].apply(
-                lambda i: new_ids[i]
+            df = df.with_columns(pl.lit(pool).alias('pool'))
+            df = dex_trade_processing.process_trades(
+                df,
+                asset_table,
+                normalize=normalize,
+                label=label,
             )
-            output['sold_id'] = output['sold_id'].apply(lambda i: new_ids[i])
-
-        df = pl.DataFrame(output)
+            df = df.drop('pool')
 
         if include_prices:
             prices = cls.compute_trade_prices(df, normalized=normalize)
-            for key, value in prices.items():
-                df = df.with_columns(pl.Series(key, value))
+            df = df.with_columns(list(prices.values()))
         if include_volumes:
             volumes = cls.compute_trade_volumes(df)
-            for key, value in volumes.items():
-                df = df.with_columns(pl.Series(key, value))
+            df = df.with_columns(list(volumes.values()))
 
         return df
 
@@ -547,21 +718,10 @@ class DEX:
     def compute_trade_volumes(
         cls, df: spec.DataFrame
     ) -> typing.Mapping[str, spec.Series]:
-        df['sold_amount']
-
-        all_ids = sorted(
-            set(df['sold_id'].unique()) | set(df['bought_id'].unique())
-        )
-
-        volumes = {}
-        for asset_id in all_ids:
-            volumes['volume__' + str(asset_id)] = (
-                df['sold_id'] == asset_id
-            ) * df['sold_amount'] + (df['bought_id'] == asset_id) * df[
-                'bought_amount'
-            ]
+        from . import dex_trade_processing
 
-        return volumes
+        volumes = df.select(dex_trade_processing.get_trade_volume_exprs(df))
+        return {column: volumes[column] for column in volumes.columns}
 
     @classmethod
     def compute_trade_prices(
@@ -569,61 +729,13 @@ class DEX:
         df: spec.DataFrame,
         normalized: bool,
     ) -> typing.Mapping[str, spec.Series]:
-        import polars as pl
+        from . import dex_trade_processing
 
         if not normalized:
             raise Exception('including prices requires normalize=True')
 
-        all_ids = sorted(
-            set(df['sold_id'].unique()) | set(df['bought_id'].unique())
-        )
-        prices: typing.MutableMapping[str, spec.Series] = {}
-
-        # pre-compute quantities
-        sold_amount = df['sold_amount'].apply(float)
-        bought_amount = df['bought_amount'].apply(float)
-        sold_per_bought = sold_amount / bought_amount
-        bought_per_sold = bought_amount / sold_amount
-        sold_masks = {}
-        bought_masks = {}
-        for asset_id in all_ids:
-            sold_masks[asset_id] = df['sold_id'] == asset_id
-            bought_masks[asset_id] = df['bought_id'] == asset_id
-
-        # compute combinations
-        for lhs_id in all_ids:
-            for rhs_id in all_ids:
-                if lhs_id == rhs_id:
-                    continue
-
-                key = 'price__' + str(lhs_id) + '__per__' + str(rhs_id)
-
-                sold_lhs_mask = sold_masks[lhs_id]
-                sold_rhs_mask = sold_masks[rhs_id]
-                bought_lhs_mask = bought_masks[lhs_id]
-                bought_rhs_mask = bought_masks[rhs_id]
-
-                values = (
-                    sold_lhs_mask.cast(int)
-                    * bought_rhs_mask.cast(int)
-                    * sold_per_bought
-                    + bought_lhs_mask.cast(int)
-                    * sold_rhs_mask.cast(int)
-                    * bought_per_sold
-                )
-                df = df.with_columns(
-                    pl.Series(key, values)
-                )
-                if len(all_ids) > 2:
-                    combined_mask = (
-                        sold_lhs_mask * bought_rhs_mask
-                        + bought_lhs_mask * sold_rhs_mask
-                    )
-                    df[key][~combined_mask] = float('nan')
-
-                prices[key] = values
-
-        return prices
+        prices = df.select(dex_trade_processing.get_trade_price_exprs(df))
+        return {column: prices[column] for column in prices.columns}
 
     # should combine adds and removes into single function?
     # @classmethod
@@ -670,21 +782,20 @@ def _filter_pools(
     start_block: int | None = None,
     end_block: int | None = None,
 ) -> typing.Sequence[spec.DexPool]:
+    from . import dex_pool_index
+
+    if assets is not None:
+        asset_set = set(asset.lower() for asset in assets)
+
     filtered = []
 
     # filter the new pools according to input arguments
     for pool in pools:
         # check asset filter
-        include = True
         if assets is not None:
-            keys = ['asset0', 'asset1', 'asset2', 'asset3']
-            for asset in assets:
-                asset = asset.lower()
-                include = any(pool[key] == asset for key in keys)  # type: ignore
-                if not include:
-                    break
-        if not include:
-            continue
+            pool_assets = dex_pool_index._get_pool_assets(pool)
+            if not asset_set.issubset(pool_assets):
+                continue
 
         # check block range
         if start_block is not None and (
@@ -700,4 +811,3 @@ def _filter_pools(
         filtered.append(pool)
 
     return filtered
-
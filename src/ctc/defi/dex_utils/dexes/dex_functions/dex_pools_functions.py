@@ -57,21 +57,30 @@ async def async_get_pools(
 async def async_update_all_dexes(
     context: spec.Context = None,
 ) -> typing.Mapping[str, typing.Mapping[str, typing.Any]]:
-    """update local DEX database with latest on-chain entries"""
+    """update local DEX database with latest on-chain entries
 
-    import asyncio
+    factories of all DEXes are scanned together using shared log queries
+    """
 
-    all_dexes = dex_class_utils.get_all_dex_classes()
-
-    coroutines = []
-    for dex in all_dexes.values():
-        coroutine = dex.async_update_pools(context=context)
-        coroutines.append(coroutine)
+    from .. import dex_pool_discovery
 
-    results = await asyncio.gather(*coroutines)
+    all_dexes = dex_class_utils.get_all_dex_classes()
+    dex_factories = {
+        dex: dex.get_pool_factories(context=context)
+        for dex in all_dexes.values()
+    }
+    new_pools = await dex_pool_discovery.async_update_dex_pools(
+        dex_factories,
+        context=context,
+    )
 
     updates = {}
-    for dex_name, result in zip(all_dexes.keys(), results):
-        updates[dex_name] = {'new_pools': result}
+    for dex_name, dex in all_dexes.items():
+        dex_new_pools = [
+            dex_pool
+            for factory in dex_factories[dex]
+            for dex_pool in new_pools[factory.lower()]
+        ]
+        updates[dex_name] = {'new_pools': dex_new_pools}
 
     return updates
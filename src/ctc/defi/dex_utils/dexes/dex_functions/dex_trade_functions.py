@@ -52,3 +52,102 @@ async def async_get_pool_trades(
         include_prices=include_prices,
         include_volumes=include_volumes,
     )
+
+
+async def async_get_pools_trades(
+    pools: typing.Sequence[spec.Address],
+    *,
+    dex: typing.Type[dex_class.DEX] | str | None = None,
+    factory: spec.Address | None = None,
+    normalize: bool = False,
+    start_block: spec.BlockNumberReference | None = None,
+    end_block: spec.BlockNumberReference | None = None,
+    start_time: tooltime.Timestamp | None = None,
+    end_time: tooltime.Timestamp | None = None,
+    label: Literal['index', 'symbol', 'address'] = 'index',
+    include_timestamps: bool = False,
+    include_prices: bool = False,
+    context: spec.Context = None,
+) -> spec.DataFrame:
+    """get trades of many DEX pools as a single long-format frame
+
+    - output has a pool column and is sorted by block number
+    - swaps of all pools of each DEX are fetched with shared log scans, so
+      cost scales with block range rather than with number of pools
+    - amounts are floats, see dex_trade_processing.concat_pool_trades()
+    - if include_prices, adds sold_per_bought and bought_per_sold columns
+    """
+
+    import asyncio
+    from .. import dex_trade_processing
+
+    dexes = await asyncio.gather(
+        *[
+            dex_class_utils.async_get_dex_class(
+                dex=dex,
+                factory=factory,
+                pool=pool,
+                context=context,
+            )
+            for pool in pools
+        ]
+    )
+
+    # queue relevant label data
+    if normalize or label != 'index':
+        assets_task = asyncio.gather(
+            *[
+                pool_dex.async_get_pool_assets(pool=pool, context=context)
+                for pool, pool_dex in zip(pools, dexes)
+            ]
+        )
+
+    # fetch trades of pools of each DEX with shared log scans
+    dex_pools: typing.MutableMapping[
+        typing.Type[dex_class.DEX], typing.MutableSequence[spec.Address]
+    ] = {}
+    for pool, pool_dex in zip(pools, dexes):
+        dex_pools.setdefault(pool_dex, []).append(pool)
+    results = await asyncio.gather(
+        *[
+            pool_dex._async_get_pools_raw_trades(
+                dex_pool_list,
+                start_block=start_block,
+                end_block=end_block,
+                start_time=start_time,
+                end_time=end_time,
+                include_timestamps=include_timestamps,
+                context=context,
+            )
+            for pool_dex, dex_pool_list in dex_pools.items()
+        ]
+    )
+    pools_trades = {}
+    for result in results:
+        pools_trades.update(result)
+    df = dex_trade_processing.concat_pool_trades(
+        {pool: pools_trades[pool] for pool in pools}
+    )
+
+    # normalize and relabel using table of pool assets
+    if normalize or label != 'index':
+        pools_assets = await assets_task
+        asset_table = await dex_trade_processing.async_get_pools_asset_table(
+            dict(zip(pools, pools_assets)),
+            include_decimals=normalize,
+            include_symbols=(label == 'symbol'),
+            context=context,
+        )
+        df = dex_trade_processing.process_trades(
+            df,
+            asset_table,
+            normalize=normalize,
+            label=label,
+        )
+
+    if include_prices:
+        df = df.with_columns(
+            dex_trade_processing.get_long_trade_price_exprs(df)
+        )
+
+    return df
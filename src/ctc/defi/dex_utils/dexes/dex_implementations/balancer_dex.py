@@ -17,27 +17,24 @@ class BalancerDEX(dex_class.DEX):
     _pool_factories = {1: ['0xba12222222228d8ba445958a75a0704d566bf2c8']}
 
     @classmethod
-    async def async_get_new_pools(
+    async def _async_get_pool_creation_event_abi(
         cls,
         *,
+        context: spec.Context = None,
+    ) -> spec.EventABI:
+        return balancer_utils.vault_event_abis['PoolRegistered']
+
+    @classmethod
+    async def _async_decode_new_pools(
+        cls,
+        events: spec.DataFrame,
+        *,
         factory: spec.Address,
-        start_block: spec.BlockNumberReference | None = None,
-        end_block: spec.BlockNumberReference | None = None,
-        start_time: tooltime.Timestamp | None = None,
-        end_time: tooltime.Timestamp | None = None,
+        start_block: spec.BlockNumberReference | None,
+        end_block: spec.BlockNumberReference | None,
         context: spec.Context = None,
     ) -> typing.Sequence[spec.DexPool]:
 
-        balancer_pools = await evm.async_get_events(
-            factory,
-            event_abi=balancer_utils.vault_event_abis['PoolRegistered'],
-            verbose=False,
-            start_block=start_block,
-            end_block=end_block,
-            start_time=start_time,
-            end_time=end_time,
-            context=context,
-        )
         token_registrations = (
             await balancer_utils.async_get_token_registrations(
                 factory=factory,
@@ -48,7 +45,7 @@ class BalancerDEX(dex_class.DEX):
         )
 
         dex_pools = []
-        for row in balancer_pools.iter_rows(named=True):
+        for row in events.iter_rows(named=True):
 
             block = int(row['block_number'])
 
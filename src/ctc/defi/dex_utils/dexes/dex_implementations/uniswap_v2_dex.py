@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing
 
 if typing.TYPE_CHECKING:
+    import polars as pl
     import tooltime
 
 from ctc import evm
@@ -18,29 +19,25 @@ class UniswapV2DEX(dex_class.DEX):
     _pool_factories = {1: [uniswap_v2_utils.uniswap_v2_factory]}
 
     @classmethod
-    async def async_get_new_pools(
+    async def _async_get_pool_creation_event_abi(
         cls,
         *,
+        context: spec.Context = None,
+    ) -> spec.EventABI:
+        return uniswap_v2_utils.factory_event_abis['PairCreated']
+
+    @classmethod
+    async def _async_decode_new_pools(
+        cls,
+        events: spec.DataFrame,
+        *,
         factory: spec.Address,
-        start_block: spec.BlockNumberReference | None = None,
-        end_block: spec.BlockNumberReference | None = None,
-        start_time: tooltime.Timestamp | None = None,
-        end_time: tooltime.Timestamp | None = None,
+        start_block: spec.BlockNumberReference | None,
+        end_block: spec.BlockNumberReference | None,
         context: spec.Context = None,
     ) -> typing.Sequence[spec.DexPool]:
-        df = await evm.async_get_events(
-            factory,
-            event_abi=uniswap_v2_utils.factory_event_abis['PairCreated'],
-            verbose=False,
-            start_block=start_block,
-            end_block=end_block,
-            start_time=start_time,
-            end_time=end_time,
-            context=context,
-        )
-
         dex_pools = []
-        for row in df.to_dicts():
+        for row in events.to_dicts():
             dex_pool: spec.DexPool = {
                 'address': row['arg__pair'],
                 'factory': factory,
@@ -109,23 +106,12 @@ class UniswapV2DEX(dex_class.DEX):
             integer_output_format=float,
         )
 
-        df = trades.select(
-            (pl.when(pl.col('arg__amount0Out') > 0).then(1).otherwise(0)).alias(
-                'sold_id'
-            ),
-            (pl.col('arg__amount0In') + pl.col('arg__amount1In')).alias(
-                'sold_amount'
-            ),
-            (pl.col('arg__amount0Out') + pl.col('arg__amount1Out')).alias(
-                'bought_amount'
-            ),
-        )
-        df = df.with_columns((1 - pl.col('sold_id')).alias('bought_id'))
+        df = trades.select(cls._get_raw_trade_exprs(trades))
 
         output: spec.RawDexTrades = {
             'block_number': trades['block_number'],
             'transaction_hash': trades['transaction_hash'],
-            'recipient': trades['arg__to'],
+            'recipient': df['recipient'],
             'sold_id': df['sold_id'],
             'bought_id': df['bought_id'],
             'sold_amount': df['sold_amount'],
@@ -137,3 +123,27 @@ class UniswapV2DEX(dex_class.DEX):
 
         return output
 
+    @classmethod
+    async def _async_get_swap_event_abi(
+        cls,
+        *,
+        context: spec.Context = None,
+    ) -> spec.EventABI:
+        return uniswap_v2_utils.pool_event_abis['Swap']
+
+    @classmethod
+    def _get_raw_trade_exprs(cls, swaps: spec.DataFrame) -> list[pl.Expr]:
+        import polars as pl
+
+        sold_id = pl.when(pl.col('arg__amount0Out') > 0).then(1).otherwise(0)
+        return [
+            pl.col('arg__to').alias('recipient'),
+            sold_id.alias('sold_id'),
+            (1 - sold_id).alias('bought_id'),
+            (pl.col('arg__amount0In') + pl.col('arg__amount1In')).alias(
+                'sold_amount'
+            ),
+            (pl.col('arg__amount0Out') + pl.col('arg__amount1Out')).alias(
+                'bought_amount'
+            ),
+        ]
@@ -9,6 +9,7 @@ from .. import dex_class
 from . import uniswap_v2_dex
 
 if typing.TYPE_CHECKING:
+    import polars as pl
     import tooltime
 
 
@@ -18,32 +19,27 @@ class UniswapV3DEX(dex_class.DEX):
     _pool_factories = {1: ['0x1f98431c8ad98523631ae4a59f267346ea31f984']}
 
     @classmethod
-    async def async_get_new_pools(
+    async def _async_get_pool_creation_event_abi(
         cls,
         *,
-        factory: spec.Address,
-        start_block: spec.BlockNumberReference | None = None,
-        end_block: spec.BlockNumberReference | None = None,
-        start_time: tooltime.Timestamp | None = None,
-        end_time: tooltime.Timestamp | None = None,
         context: spec.Context = None,
-    ) -> typing.Sequence[spec.DexPool]:
-
+    ) -> spec.EventABI:
         from ctc.protocols import uniswap_v3_utils
 
-        df = await evm.async_get_events(
-            factory,
-            event_abi=uniswap_v3_utils.factory_event_abis['PoolCreated'],
-            verbose=False,
-            start_block=start_block,
-            end_block=end_block,
-            start_time=start_time,
-            end_time=end_time,
-            context=context,
-        )
+        return uniswap_v3_utils.factory_event_abis['PoolCreated']
 
+    @classmethod
+    async def _async_decode_new_pools(
+        cls,
+        events: spec.DataFrame,
+        *,
+        factory: spec.Address,
+        start_block: spec.BlockNumberReference | None,
+        end_block: spec.BlockNumberReference | None,
+        context: spec.Context = None,
+    ) -> typing.Sequence[spec.DexPool]:
         dex_pools = []
-        for row in df.to_dicts():
+        for row in events.to_dicts():
             dex_pool: spec.DexPool = {
                 'address': row['arg__pool'],
                 'factory': factory,
@@ -126,3 +122,35 @@ class UniswapV3DEX(dex_class.DEX):
         }
 
         return output
+
+    @classmethod
+    async def _async_get_swap_event_abi(
+        cls,
+        *,
+        context: spec.Context = None,
+    ) -> spec.EventABI:
+        from ctc.protocols import uniswap_v3_utils
+
+        return await uniswap_v3_utils.async_get_event_abi('Swap', 'pool')
+
+    @classmethod
+    def _get_raw_trade_exprs(cls, swaps: spec.DataFrame) -> list[pl.Expr]:
+        import polars as pl
+
+        # positive amount0 means that the pool received token0
+        amount0 = pl.col('arg__amount0')
+        amount1 = pl.col('arg__amount1')
+        sold_token0 = amount0 > 0
+        return [
+            pl.col('arg__recipient').alias('recipient'),
+            pl.when(sold_token0).then(0).otherwise(1).alias('sold_id'),
+            pl.when(sold_token0).then(1).otherwise(0).alias('bought_id'),
+            pl.when(sold_token0)
+            .then(amount0)
+            .otherwise(amount1)
+            .alias('sold_amount'),
+            pl.when(sold_token0)
+            .then(-1 * amount1)
+            .otherwise(-1 * amount0)
+            .alias('bought_amount'),
+        ]
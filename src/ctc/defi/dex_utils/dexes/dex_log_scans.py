@@ -0,0 +1,132 @@
+"""scan logs of many contracts with shared eth_getLogs requests
+
+logs of all contracts are requested together over common block ranges, either
+with an address-list filter, or by event hash alone and filtered locally. the
+number of requests therefore scales with the block range rather than with the
+number of contracts
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+
+async def async_scan_contract_logs(
+    event_hashes: typing.Mapping[spec.Address, str],
+    *,
+    start_blocks: typing.Mapping[spec.Address, int],
+    end_block: int,
+    filter_addresses: bool = True,
+    max_blocks_per_request: int = 2000,
+    context: spec.Context = None,
+) -> spec.DataFrame:
+    """get encoded events of many contracts using shared log scans
+
+    - event_hashes maps each contract to the event hash to collect
+    - block ranges are split at each contract's start block, so that each
+      range is requested once for every contract whose scan has begun
+    - if not filter_addresses, requests filter only by event hash, and logs
+      of other contracts are discarded locally
+    - output is formatted like events read from the events cache, with a
+      lowercase contract_address column, sorted by block and log index
+    """
+
+    import asyncio
+    import polars as pl
+    from ctc import rpc
+    from ctc.evm.event_utils import event_query_utils
+    from ctc.toolbox import pl_utils
+    from ctc.toolbox import range_utils
+
+    event_hashes = {
+        contract.lower(): event_hash.lower()
+        for contract, event_hash in event_hashes.items()
+    }
+    start_blocks = {
+        contract.lower(): start_block
+        for contract, start_block in start_blocks.items()
+    }
+
+    # build shared requests over common block ranges
+    boundaries = sorted(
+        set(start_blocks[contract] for contract in event_hashes)
+    )
+    coroutines = []
+    for b, range_start in enumerate(boundaries):
+        if b + 1 < len(boundaries):
+            range_end = boundaries[b + 1] - 1
+        else:
+            range_end = end_block
+        if range_start > range_end:
+            continue
+        active = sorted(
+            contract
+            for contract in event_hashes.keys()
+            if start_blocks[contract] <= range_start
+        )
+        topic0 = sorted(set(event_hashes[contract] for contract in active))
+        if filter_addresses:
+            address: typing.Sequence[spec.Address] | None = active
+        else:
+            address = None
+        for request_start, request_end in range_utils.range_to_chunks(
+            start=range_start,
+            end=range_end,
+            chunk_size=max_blocks_per_request,
+        ):
+            coroutine = rpc.async_eth_get_logs(
+                address=address,
+                topics=[topic0],
+                start_block=request_start,
+                end_block=request_end,
+                context=context,
+            )
+            coroutines.append(coroutine)
+    results = await asyncio.gather(*coroutines)
+
+    # discard logs of other contracts, other events, or before scan start
+    encoded_events = []
+    for result in results:
+        for log in result:
+            contract = log[4].lower()
+            topics = log[5]
+            if (
+                contract in event_hashes
+                and len(topics) > 0
+                and topics[0].lower() == event_hashes[contract]
+                and log[0] >= start_blocks[contract]
+            ):
+                encoded_events.append(
+                    log[:4]
+                    + (contract,)
+                    + topics
+                    + ((None,) * (4 - len(topics)))
+                    + (log[6],)
+                )
+
+    # package events like those read from the events cache
+    columns = event_query_utils.get_event_df_columns(binary_format='prefix_hex')
+    df = pl.DataFrame(encoded_events, schema=columns, orient='row')
+    df = df.sort(['block_number', 'log_index'])
+    return pl_utils.prefix_hex_columns_to_binary(
+        df=df,
+        columns=['topic1', 'topic2', 'topic3', 'unindexed'],
+    )
+
+
+def partition_contract_events(
+    events: spec.DataFrame,
+    contracts: typing.Sequence[spec.Address],
+) -> typing.Mapping[spec.Address, spec.DataFrame]:
+    """partition events by contract, including empty frames of contracts"""
+
+    import polars as pl
+
+    partitions = events.partition_by('contract_address', as_dict=True)
+    empty = events.filter(pl.lit(False))
+    return {
+        contract: partitions.get(contract.lower(), empty)
+        for contract in contracts
+    }
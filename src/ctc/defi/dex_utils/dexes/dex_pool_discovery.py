@@ -0,0 +1,437 @@
+"""discover new pools of many DEX factories with shared log scans
+
+factories that announce pools with an event are scanned together: their
+addresses and event hashes are merged into the same eth_getLogs requests over
+common block ranges, and the resulting logs are decoded and dispatched to the
+DEX class of each factory. other factories fall back to async_get_new_pools()
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import evm
+from ctc import spec
+
+from . import dex_class
+from . import dex_log_scans
+from . import dex_pool_index
+
+if typing.TYPE_CHECKING:
+    import asyncio
+
+    from typing_extensions import TypedDict
+
+    DexFactories = typing.Mapping[
+        typing.Type[dex_class.DEX], typing.Sequence[spec.Address]
+    ]
+
+    class PoolRefresher(TypedDict):
+        task: asyncio.Task[None] | None
+        refreshed_block: int | None
+        error: BaseException | None
+
+
+_pool_refreshers: typing.MutableMapping[int, PoolRefresher] = {}
+
+# seconds to wait before retrying a failed refresh
+_refresh_retry_interval = 1.0
+
+
+def get_all_dex_factories(*, context: spec.Context = None) -> DexFactories:
+    """get pool factories of every DEX on the context's network"""
+
+    from . import dex_class_utils
+
+    dex_factories: typing.MutableMapping[
+        typing.Type[dex_class.DEX], typing.Sequence[spec.Address]
+    ] = {}
+    for dex in dex_class_utils.get_all_dex_classes().values():
+        dex_factories[dex] = dex.get_pool_factories(context=context)
+    return dex_factories
+
+
+async def async_update_dex_pools(
+    dex_factories: DexFactories | None = None,
+    *,
+    start_blocks: typing.Mapping[spec.Address, int] | None = None,
+    end_block: int | None = None,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, typing.Sequence[spec.DexPool]]:
+    """scan factories for pools created since they were last scanned
+
+    - dex_factories maps DEX classes to factories, default is all factories
+    - start_blocks maps factories to their first unscanned block, default is
+      read from the dex_pools db, or is the creation block of the factory
+    - scans through end_block, default is the latest block
+    - returns mapping from factory to its new pools
+    """
+
+    from ctc import config
+
+    if dex_factories is None:
+        dex_factories = get_all_dex_factories(context=context)
+    factories = [
+        factory.lower()
+        for dex_factory_list in dex_factories.values()
+        for factory in dex_factory_list
+    ]
+
+    if end_block is None:
+        end_block = await evm.async_get_latest_block_number(context=context)
+    if start_blocks is None:
+        start_blocks = await _async_get_scan_start_blocks(
+            factories, context=context
+        )
+    start_blocks = {
+        factory.lower(): start_block
+        for factory, start_block in start_blocks.items()
+        if start_block <= end_block
+    }
+    if len(start_blocks) == 0:
+        return {factory: [] for factory in factories}
+
+    new_pools = await async_scan_new_pools(
+        dex_factories,
+        start_blocks=start_blocks,
+        end_block=end_block,
+        context=context,
+    )
+
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='dex_pools', context=context
+    )
+    if write_cache:
+        from ctc import db
+
+        await db.async_intake_factories_dex_pools(
+            factories_dex_pools=new_pools,
+            last_scanned_block=end_block,
+            context=context,
+        )
+        dex_pool_index.update_dex_pool_index(
+            [
+                dex_pool
+                for dex_pools in new_pools.values()
+                for dex_pool in dex_pools
+            ],
+            context=context,
+        )
+
+    return {factory: new_pools.get(factory, []) for factory in factories}
+
+
+async def _async_get_scan_start_blocks(
+    factories: typing.Sequence[spec.Address],
+    *,
+    context: spec.Context,
+) -> typing.Mapping[spec.Address, int]:
+    """get first unscanned block of each factory"""
+
+    import asyncio
+    from ctc import config
+
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='dex_pools', context=context
+    )
+    if read_cache:
+        from ctc import db
+
+        last_scanned_blocks = await asyncio.gather(
+            *[
+                db.async_query_dex_pool_factory_last_scanned_block(
+                    factory=factory.lower(),
+                    context=context,
+                )
+                for factory in factories
+            ]
+        )
+    else:
+        last_scanned_blocks = [None] * len(factories)
+
+    # fall back to creation block of factories that have never been scanned
+    unscanned = [
+        factory
+        for factory, last_scanned_block in zip(factories, last_scanned_blocks)
+        if last_scanned_block is None
+    ]
+    creation_blocks = await asyncio.gather(
+        *[
+            _async_get_factory_creation_block(factory, context=context)
+            for factory in unscanned
+        ]
+    )
+    creation_blocks_by_factory = dict(zip(unscanned, creation_blocks))
+
+    start_blocks = {}
+    for factory, last_scanned_block in zip(factories, last_scanned_blocks):
+        if last_scanned_block is not None:
+            start_blocks[factory.lower()] = last_scanned_block + 1
+        else:
+            start_blocks[factory.lower()] = creation_blocks_by_factory[factory]
+    return start_blocks
+
+
+async def _async_get_factory_creation_block(
+    factory: spec.Address,
+    *,
+    context: spec.Context,
+) -> int:
+    from ctc.toolbox import search_utils
+
+    try:
+        creation_block = await evm.async_get_contract_creation_block(
+            factory,
+            context=context,
+        )
+    except search_utils.NoMatchFound:
+        return 0
+    if creation_block is None:
+        raise Exception('could not determine factory creation block')
+    return creation_block
+
+
+async def async_scan_new_pools(
+    dex_factories: DexFactories,
+    *,
+    start_blocks: typing.Mapping[spec.Address, int],
+    end_block: int,
+    context: spec.Context = None,
+    max_blocks_per_request: int = 2000,
+) -> typing.Mapping[spec.Address, typing.Sequence[spec.DexPool]]:
+    """get pools created by each factory from its start block to end_block
+
+    - only factories listed in start_blocks are scanned
+    - factories announcing pools with events share eth_getLogs requests
+    - returns mapping from factory to its new pools
+    """
+
+    import asyncio
+
+    start_blocks = {
+        factory.lower(): start_block
+        for factory, start_block in start_blocks.items()
+    }
+
+    # separate factories that can share log scans from the rest
+    event_abis = await asyncio.gather(
+        *[
+            dex._async_get_pool_creation_event_abi(context=context)
+            for dex in dex_factories.keys()
+        ]
+    )
+    log_factories: typing.MutableMapping[
+        spec.Address, tuple[typing.Type[dex_class.DEX], spec.EventABI]
+    ] = {}
+    other_factories = []
+    for (dex, factories), event_abi in zip(dex_factories.items(), event_abis):
+        for factory in factories:
+            factory = factory.lower()
+            if factory not in start_blocks:
+                continue
+            elif event_abi is not None:
+                log_factories[factory] = (dex, event_abi)
+            else:
+                other_factories.append((dex, factory))
+
+    # scan logs of all log-based factories together
+    other_coroutines = [
+        dex.async_get_new_pools(
+            factory=factory,
+            start_block=start_blocks[factory],
+            end_block=end_block,
+            context=context,
+        )
+        for dex, factory in other_factories
+    ]
+    events, *other_results = await asyncio.gather(
+        dex_log_scans.async_scan_contract_logs(
+            {
+                factory: evm.get_event_hash(event_abi)
+                for factory, (dex, event_abi) in log_factories.items()
+            },
+            start_blocks=start_blocks,
+            end_block=end_block,
+            max_blocks_per_request=max_blocks_per_request,
+            context=context,
+        ),
+        *other_coroutines,
+    )
+
+    # dispatch decoding to the DEX of each factory
+    events_by_factory = dex_log_scans.partition_contract_events(
+        events, list(log_factories.keys())
+    )
+    decode_coroutines = []
+    for factory, (dex, event_abi) in log_factories.items():
+        coroutine = _async_decode_factory_events(
+            events_by_factory[factory],
+            dex=dex,
+            event_abi=event_abi,
+            factory=factory,
+            start_block=start_blocks[factory],
+            end_block=end_block,
+            context=context,
+        )
+        decode_coroutines.append(coroutine)
+    decoded_results = await asyncio.gather(*decode_coroutines)
+
+    new_pools: typing.MutableMapping[
+        spec.Address, typing.Sequence[spec.DexPool]
+    ] = {}
+    for factory, result in zip(log_factories.keys(), decoded_results):
+        new_pools[factory] = result
+    for (dex, factory), result in zip(other_factories, other_results):
+        new_pools[factory] = result
+    return new_pools
+
+
+async def _async_decode_factory_events(
+    events: spec.DataFrame,
+    *,
+    dex: typing.Type[dex_class.DEX],
+    event_abi: spec.EventABI,
+    factory: spec.Address,
+    start_block: int,
+    end_block: int,
+    context: spec.Context,
+) -> typing.Sequence[spec.DexPool]:
+    """decode pool creation events of factory and convert to dex pools"""
+
+    decoded = await evm.async_decode_events_dataframe(
+        events,
+        event_abis=[event_abi],
+        context=context,
+    )
+    events = events.with_columns(decoded)
+    events = events.drop(['topic1', 'topic2', 'topic3', 'unindexed'])
+    return await dex._async_decode_new_pools(
+        events,
+        factory=factory,
+        start_block=start_block,
+        end_block=end_block,
+        context=context,
+    )
+
+
+#
+# # background refresh
+#
+
+
+async def async_start_pool_refresh(
+    dex_factories: DexFactories | None = None,
+    *,
+    context: spec.Context = None,
+) -> None:
+    """start background task that keeps dex pools updated near chain tip
+
+    - scans all factories once, then again after each new block
+    - new blocks are observed through the provider's head tracker
+    - does nothing if a refresh is already running for the network
+    """
+
+    import asyncio
+    from ctc import config
+
+    network = config.get_context_chain_id(context)
+    refresher = _pool_refreshers.get(network)
+    if refresher is not None:
+        task = refresher['task']
+        if task is not None and not task.done():
+            return
+
+    new_refresher: PoolRefresher = {
+        'task': None,
+        'refreshed_block': None,
+        'error': None,
+    }
+    _pool_refreshers[network] = new_refresher
+    new_refresher['task'] = asyncio.create_task(
+        _async_run_pool_refresh(
+            new_refresher,
+            dex_factories=dex_factories,
+            context=context,
+        )
+    )
+
+
+async def async_stop_pool_refresh(*, context: spec.Context = None) -> None:
+    """stop background refresh of dex pools if it is running"""
+
+    import asyncio
+    from ctc import config
+
+    network = config.get_context_chain_id(context)
+    refresher = _pool_refreshers.pop(network, None)
+    if refresher is None:
+        return
+    task = refresher['task']
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+def get_pool_refresh_block(*, context: spec.Context = None) -> int | None:
+    """get block through which background refresh has scanned dex pools
+
+    returns None if no refresh is running or no scan has finished
+    """
+
+    from ctc import config
+
+    refresher = _pool_refreshers.get(config.get_context_chain_id(context))
+    if refresher is None:
+        return None
+    return refresher['refreshed_block']
+
+
+async def _async_run_pool_refresh(
+    refresher: PoolRefresher,
+    *,
+    dex_factories: DexFactories | None,
+    context: spec.Context,
+) -> None:
+    import asyncio
+
+    if dex_factories is None:
+        dex_factories = get_all_dex_factories(context=context)
+
+    # after the first scan, watermarks are tracked in memory
+    start_blocks = None
+    block_number = None
+    while True:
+        try:
+            if block_number is None:
+                end_block = await evm.async_get_latest_block_number(
+                    context=context
+                )
+            else:
+                head = await evm.async_wait_for_next_block(
+                    block_number, context=context
+                )
+                end_block = head.block_number
+            await async_update_dex_pools(
+                dex_factories,
+                start_blocks=start_blocks,
+                end_block=end_block,
+                context=context,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # keep refreshing, a later scan resumes from the last watermark
+            refresher['error'] = e
+            await asyncio.sleep(_refresh_retry_interval)
+        else:
+            block_number = end_block
+            refresher['refreshed_block'] = block_number
+            refresher['error'] = None
+            start_blocks = {
+                factory.lower(): block_number + 1
+                for factories in dex_factories.values()
+                for factory in factories
+            }
@@ -0,0 +1,290 @@
+"""process-level adjacency index of dex pools
+
+- the index of each network is built upon first use by bulk loading the
+  dex_pools db table, which is where the index is persisted
+- indices are keyed by network and by the dex_pools cache settings of the
+  context, so contexts using different dbs do not share an index
+- pools written by async_update_dex_pools() are added incrementally to every
+  index that reads the db they were written to
+- maps each asset to its pools, each pair of assets to the pools that trade
+  them, and each asset to the assets it trades against
+- supports enumerating multi-hop paths between assets for routing
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class DexPoolIndex(TypedDict):
+        pools: dict[spec.Address, spec.DexPool]
+        asset_pools: dict[spec.Address, set[spec.Address]]
+        pair_pools: dict[tuple[spec.Address, spec.Address], set[spec.Address]]
+        neighbors: dict[spec.Address, set[spec.Address]]
+
+    class DexPoolPath(TypedDict):
+        assets: typing.Sequence[spec.Address]
+        hop_pools: typing.Sequence[typing.Sequence[spec.Address]]
+
+    # (chain_id, cache backend, whether cache is read)
+    DexPoolIndexKey = tuple[spec.ChainId, typing.Union[str, None], bool]
+
+
+_dex_pool_indices: dict[DexPoolIndexKey, DexPoolIndex] = {}
+
+
+def _get_dex_pool_index_key(context: spec.Context) -> DexPoolIndexKey:
+    from ctc import config
+
+    chain_id = config.get_context_chain_id(context)
+    backend = config.get_context_cache_backend(
+        schema_name='dex_pools', context=context
+    )
+    read_cache, _write_cache = config.get_context_cache_read_write(
+        schema_name='dex_pools', context=context
+    )
+    return (chain_id, backend, read_cache)
+
+
+def _create_dex_pool_index() -> DexPoolIndex:
+    return {'pools': {}, 'asset_pools': {}, 'pair_pools': {}, 'neighbors': {}}
+
+
+def _get_pool_assets(dex_pool: spec.DexPool) -> list[spec.Address]:
+    assets = []
+    for key in ('asset0', 'asset1', 'asset2', 'asset3'):
+        asset = dex_pool.get(key)
+        if asset is not None:
+            assets.append(asset.lower())  # type: ignore
+    additional_data: typing.Mapping[str, typing.Any] | None = dex_pool.get(
+        'additional_data'
+    )
+    if additional_data is not None:
+        for additional_asset in additional_data.get('additional_assets', []):
+            if additional_asset is not None:
+                assets.append(additional_asset.lower())
+    return assets
+
+
+def _add_to_index(
+    index: DexPoolIndex, dex_pools: typing.Iterable[spec.DexPool]
+) -> None:
+    pools = index['pools']
+    asset_pools = index['asset_pools']
+    pair_pools = index['pair_pools']
+    neighbors = index['neighbors']
+    for dex_pool in dex_pools:
+        address = dex_pool['address'].lower()
+        if address in pools:
+            continue
+        pools[address] = dex_pool
+        assets = _get_pool_assets(dex_pool)
+        for a, asset in enumerate(assets):
+            asset_pools.setdefault(asset, set()).add(address)
+            for other_asset in assets[a + 1 :]:
+                if other_asset == asset:
+                    continue
+                if asset < other_asset:
+                    pair = (asset, other_asset)
+                else:
+                    pair = (other_asset, asset)
+                pair_pools.setdefault(pair, set()).add(address)
+                neighbors.setdefault(asset, set()).add(other_asset)
+                neighbors.setdefault(other_asset, set()).add(asset)
+
+
+async def async_load_dex_pool_index(
+    *,
+    context: spec.Context = None,
+) -> DexPoolIndex:
+    """bulk load dex pools from db into the index of the context"""
+
+    from ctc import db
+
+    key = _get_dex_pool_index_key(context)
+    index = _create_dex_pool_index()
+    _chain_id, _backend, read_cache = key
+    if read_cache:
+        stored = await db.async_query_dex_pools(context=context)
+        if stored is not None:
+            _add_to_index(index, stored)
+
+    # pools added by concurrent updates are kept
+    previous = _dex_pool_indices.get(key)
+    if previous is not None:
+        _add_to_index(index, previous['pools'].values())
+    _dex_pool_indices[key] = index
+    return index
+
+
+def reset_dex_pool_index() -> None:
+    """reset process-level index of dex pools"""
+    _dex_pool_indices.clear()
+
+
+def update_dex_pool_index(
+    dex_pools: typing.Iterable[spec.DexPool],
+    *,
+    context: spec.Context = None,
+) -> None:
+    """add dex pools written to db to loaded indices that read that db
+
+    the index of the writing context is updated even if it does not read db
+    """
+
+    dex_pools = list(dex_pools)
+    key = _get_dex_pool_index_key(context)
+    chain_id, backend, _read_cache = key
+    for index_key, index in _dex_pool_indices.items():
+        if index_key == key or index_key == (chain_id, backend, True):
+            _add_to_index(index, dex_pools)
+
+
+async def _async_get_dex_pool_index(context: spec.Context) -> DexPoolIndex:
+    index = _dex_pool_indices.get(_get_dex_pool_index_key(context))
+    if index is None:
+        index = await async_load_dex_pool_index(context=context)
+    return index
+
+
+async def async_get_indexed_dex_pools(
+    *,
+    assets: typing.Sequence[spec.Address] | None = None,
+    factory: spec.Address | None = None,
+    factories: typing.Sequence[spec.Address] | None = None,
+    start_block: int | None = None,
+    end_block: int | None = None,
+    context: spec.Context = None,
+) -> typing.Sequence[spec.DexPool]:
+    """get pools containing all given assets using the index
+
+    pools are further filtered by factory and by creation block range
+    """
+
+    index = await _async_get_dex_pool_index(context)
+
+    # select candidate pools using the smallest applicable index entry
+    if assets is None or len(assets) == 0:
+        candidates: typing.Iterable[spec.Address] = index['pools'].keys()
+    else:
+        lower_assets = sorted(set(asset.lower() for asset in assets))
+        if len(lower_assets) == 1:
+            candidates = index['asset_pools'].get(lower_assets[0], set())
+        else:
+            candidates = set.intersection(
+                *[
+                    index['pair_pools'].get(
+                        (lower_assets[0], other_asset), set()
+                    )
+                    for other_asset in lower_assets[1:]
+                ]
+            )
+
+    if factory is not None:
+        factories = [factory]
+    if factories is not None:
+        factory_set = set(factory.lower() for factory in factories)
+
+    pools = []
+    for address in candidates:
+        dex_pool = index['pools'][address]
+        if (
+            factories is not None
+            and dex_pool['factory'].lower() not in factory_set
+        ):
+            continue
+        creation_block = dex_pool['creation_block']
+        if start_block is not None and (
+            creation_block is None or creation_block < start_block
+        ):
+            continue
+        if end_block is not None and (
+            creation_block is None or creation_block > end_block
+        ):
+            continue
+        pools.append(dex_pool)
+
+    pools.sort(key=lambda dex_pool: dex_pool['address'])
+    return pools
+
+
+async def async_get_dex_pool_paths(
+    asset_in: spec.Address,
+    asset_out: spec.Address,
+    *,
+    max_hops: int = 2,
+    context: spec.Context = None,
+) -> typing.Sequence[DexPoolPath]:
+    """enumerate paths of pools that trade asset_in into asset_out
+
+    - each path visits each asset at most once and uses at most max_hops pools
+    - each hop lists all pools that trade the hop's pair of assets
+    - paths are ordered by number of hops
+    """
+
+    index = await _async_get_dex_pool_index(context)
+    asset_paths = _find_asset_paths(
+        index['neighbors'],
+        asset_in.lower(),
+        asset_out=asset_out.lower(),
+        max_hops=max_hops,
+    )
+
+    paths: list[DexPoolPath] = []
+    for assets in asset_paths:
+        hop_pools = []
+        for asset, next_asset in zip(assets[:-1], assets[1:]):
+            if asset < next_asset:
+                pair = (asset, next_asset)
+            else:
+                pair = (next_asset, asset)
+            hop_pools.append(sorted(index['pair_pools'][pair]))
+        paths.append({'assets': assets, 'hop_pools': hop_pools})
+    return paths
+
+
+def _find_asset_paths(
+    neighbors: typing.Mapping[spec.Address, typing.Set[spec.Address]],
+    asset_in: spec.Address,
+    *,
+    asset_out: spec.Address,
+    max_hops: int,
+) -> list[list[spec.Address]]:
+    """find simple paths of assets, pruned by distance to asset_out"""
+
+    if asset_in == asset_out or max_hops < 1:
+        return []
+
+    # distances to asset_out, up to the largest distance usable by a path
+    distances = {asset_out: 0}
+    frontier = [asset_out]
+    for distance in range(1, max_hops):
+        next_frontier = []
+        for asset in frontier:
+            for neighbor in neighbors.get(asset, ()):
+                if neighbor not in distances:
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    # depth first search, only stepping to assets that can still reach out
+    paths = []
+    stack = [[asset_in]]
+    while len(stack) > 0:
+        path = stack.pop()
+        hops_left = max_hops - (len(path) - 1)
+        for neighbor in sorted(neighbors.get(path[-1], ())):
+            if neighbor == asset_out:
+                paths.append(path + [neighbor])
+            elif (
+                neighbor not in path
+                and distances.get(neighbor, max_hops) < hops_left
+            ):
+                stack.append(path + [neighbor])
+
+    paths.sort(key=lambda path: (len(path), path))
+    return paths
@@ -0,0 +1,321 @@
+"""columnar post-processing of dex trades
+
+trades of any number of pools are processed together as one long-format frame
+with a pool column. asset metadata is provided as a table with one row per
+(pool, asset_id), so that normalization and labeling are joins rather than
+per-row lookups, and prices and volumes are computed as polars expressions
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import evm
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Literal
+
+    import polars as pl
+
+    TradeLabel = Literal['index', 'symbol', 'address']
+
+
+async def async_get_pools_asset_table(
+    pools_assets: typing.Mapping[spec.Address, typing.Sequence[spec.Address]],
+    *,
+    include_decimals: bool = True,
+    include_symbols: bool = False,
+    context: spec.Context = None,
+) -> spec.DataFrame:
+    """create table of assets of pools, one row per (pool, asset_id)
+
+    metadata of all unique assets is fetched with one bulk call per field
+    """
+
+    import asyncio
+    import polars as pl
+
+    unique_assets = sorted(
+        set(
+            asset.lower()
+            for assets in pools_assets.values()
+            for asset in assets
+        )
+    )
+    decimals_task = None
+    symbols_task = None
+    if include_decimals:
+        decimals_task = asyncio.create_task(
+            evm.async_get_erc20s_decimals(unique_assets, context=context)
+        )
+    if include_symbols:
+        symbols_task = asyncio.create_task(
+            evm.async_get_erc20s_symbols(unique_assets, context=context)
+        )
+    decimals_of_assets: typing.Mapping[spec.Address, int] = {}
+    symbols_of_assets: typing.Mapping[spec.Address, str] = {}
+    if decimals_task is not None:
+        decimals_of_assets = dict(zip(unique_assets, await decimals_task))
+    if symbols_task is not None:
+        symbols_of_assets = dict(zip(unique_assets, await symbols_task))
+
+    rows = []
+    for pool, assets in pools_assets.items():
+        for asset_id, asset in enumerate(assets):
+            asset = asset.lower()
+            rows.append(
+                {
+                    'pool': pool.lower(),
+                    'asset_id': asset_id,
+                    'address': asset,
+                    'decimals': decimals_of_assets.get(asset),
+                    'symbol': symbols_of_assets.get(asset),
+                }
+            )
+    schema = {
+        'pool': pl.Utf8,
+        'asset_id': pl.Int64,
+        'address': pl.Utf8,
+        'decimals': pl.Int64,
+        'symbol': pl.Utf8,
+    }
+    return pl.DataFrame(rows, schema=schema)
+
+
+def concat_pool_trades(
+    pools_trades: typing.Mapping[spec.Address, spec.RawDexTrades],
+) -> spec.DataFrame:
+    """combine raw trades of pools into one long-format frame
+
+    - adds a pool column, and drops fields that are missing for any pool
+    - amounts are converted to floats so that pools of all DEXes can be
+      combined, ids are converted to Int64
+    """
+
+    import polars as pl
+
+    frames = []
+    for pool, raw_trades in pools_trades.items():
+        output = {
+            key: value
+            for key, value in raw_trades.items()
+            if value is not None
+        }
+        df = pl.DataFrame(output)
+        df = df.with_columns(
+            pl.lit(pool.lower()).alias('pool'),
+            pl.col('sold_id').cast(pl.Int64),
+            pl.col('bought_id').cast(pl.Int64),
+            _get_float_expr(df, 'sold_amount').alias('sold_amount'),
+            _get_float_expr(df, 'bought_amount').alias('bought_amount'),
+        )
+        frames.append(df)
+
+    if len(frames) == 0:
+        return pl.DataFrame(
+            schema={
+                'pool': pl.Utf8,
+                'block_number': pl.Int64,
+                'transaction_hash': pl.Utf8,
+                'sold_id': pl.Int64,
+                'bought_id': pl.Int64,
+                'sold_amount': pl.Float64,
+                'bought_amount': pl.Float64,
+            }
+        )
+
+    # keep columns shared by all pools
+    columns = [
+        column
+        for column in frames[0].columns
+        if all(column in frame.columns for frame in frames)
+    ]
+    columns = ['pool'] + [column for column in columns if column != 'pool']
+    df = pl.concat([frame.select(columns) for frame in frames])
+    return df.sort('block_number')
+
+
+def process_trades(
+    trades: spec.DataFrame,
+    asset_table: spec.DataFrame | None = None,
+    *,
+    normalize: bool = True,
+    label: TradeLabel = 'index',
+) -> spec.DataFrame:
+    """normalize amounts and relabel asset ids of trades of many pools
+
+    - trades should have columns pool, sold_id, bought_id, sold_amount,
+      and bought_amount, where ids are indices of assets within each pool
+    - asset_table should be created by async_get_pools_asset_table()
+    - normalized amounts are floats
+    """
+
+    import polars as pl
+
+    if not normalize and label == 'index':
+        return trades
+    if asset_table is None:
+        raise Exception('asset_table required to normalize or relabel trades')
+
+    if label == 'index':
+        label_column = 'asset_id'
+    elif label == 'symbol':
+        label_column = 'symbol'
+    elif label == 'address':
+        label_column = 'address'
+    else:
+        raise Exception('unknown label format: ' + str(label))
+
+    columns = list(trades.columns)
+    trades = trades.with_columns(
+        pl.col('pool').str.to_lowercase().alias('__pool'),
+        pl.col('sold_id').cast(pl.Int64),
+        pl.col('bought_id').cast(pl.Int64),
+    )
+    asset_table = asset_table.with_columns(
+        pl.col('pool').str.to_lowercase().alias('__pool')
+    )
+
+    # join asset metadata of sold and bought assets
+    for side in ['sold', 'bought']:
+        side_table = asset_table.select(
+            pl.col('__pool'),
+            pl.col('asset_id').alias(side + '_id'),
+            pl.col('decimals').alias('__' + side + '_decimals'),
+            pl.col(label_column).alias('__' + side + '_label'),
+        )
+        trades = trades.join(
+            side_table, on=['__pool', side + '_id'], how='left'
+        )
+
+    # normalize
+    if normalize:
+        missing = trades.select(
+            pl.col('__sold_decimals').is_null().any()
+            | pl.col('__bought_decimals').is_null().any()
+        ).item()
+        if missing:
+            raise NotImplementedError('normalize not implemented for metapools')
+        trades = trades.with_columns(
+            [
+                (
+                    _get_float_expr(trades, side + '_amount')
+                    / pl.lit(10.0).pow(pl.col('__' + side + '_decimals'))
+                ).alias(side + '_amount')
+                for side in ['sold', 'bought']
+            ]
+        )
+
+    # relabel
+    if label != 'index':
+        trades = trades.with_columns(
+            pl.col('__sold_label').alias('sold_id'),
+            pl.col('__bought_label').alias('bought_id'),
+        )
+
+    return trades.select(columns)
+
+
+def _get_float_expr(df: spec.DataFrame, column: str) -> pl.Expr:
+    """get float expression of column, which may hold python ints"""
+
+    import polars as pl
+
+    if df[column].dtype == pl.Object:
+        return pl.col(column).apply(float, return_dtype=pl.Float64)
+    else:
+        return pl.col(column).cast(pl.Float64)
+
+
+def _get_trade_ids(df: spec.DataFrame) -> list[typing.Any]:
+    return sorted(set(df['sold_id'].unique()) | set(df['bought_id'].unique()))
+
+
+def get_trade_price_exprs(
+    df: spec.DataFrame,
+    *,
+    ids: typing.Sequence[typing.Any] | None = None,
+) -> list[pl.Expr]:
+    """get expressions of price of each asset in units of each other asset
+
+    - columns are named price__{lhs}__per__{rhs}
+    - trades that do not exchange lhs for rhs have a price of NaN
+    """
+
+    import polars as pl
+
+    if ids is None:
+        ids = _get_trade_ids(df)
+    sold_per_bought = _get_float_expr(df, 'sold_amount') / _get_float_expr(
+        df, 'bought_amount'
+    )
+    bought_per_sold = _get_float_expr(df, 'bought_amount') / _get_float_expr(
+        df, 'sold_amount'
+    )
+
+    exprs = []
+    for lhs_id in ids:
+        for rhs_id in ids:
+            if lhs_id == rhs_id:
+                continue
+            key = 'price__' + str(lhs_id) + '__per__' + str(rhs_id)
+            expr = (
+                pl.when(
+                    (pl.col('sold_id') == lhs_id)
+                    & (pl.col('bought_id') == rhs_id)
+                )
+                .then(sold_per_bought)
+                .when(
+                    (pl.col('bought_id') == lhs_id)
+                    & (pl.col('sold_id') == rhs_id)
+                )
+                .then(bought_per_sold)
+                .otherwise(float('nan'))
+                .alias(key)
+            )
+            exprs.append(expr)
+    return exprs
+
+
+def get_trade_volume_exprs(
+    df: spec.DataFrame,
+    *,
+    ids: typing.Sequence[typing.Any] | None = None,
+) -> list[pl.Expr]:
+    """get expressions of volume of each asset, named volume__{id}"""
+
+    import polars as pl
+
+    if ids is None:
+        ids = _get_trade_ids(df)
+    sold_amount = _get_float_expr(df, 'sold_amount')
+    bought_amount = _get_float_expr(df, 'bought_amount')
+
+    exprs = []
+    for asset_id in ids:
+        expr = (
+            pl.when(pl.col('sold_id') == asset_id)
+            .then(sold_amount)
+            .otherwise(0.0)
+            + pl.when(pl.col('bought_id') == asset_id)
+            .then(bought_amount)
+            .otherwise(0.0)
+        ).alias('volume__' + str(asset_id))
+        exprs.append(expr)
+    return exprs
+
+
+def get_long_trade_price_exprs(df: spec.DataFrame) -> list[pl.Expr]:
+    """get expressions of prices of trades in long format
+
+    - sold_per_bought is amount of sold asset per unit of bought asset
+    - bought_per_sold is amount of bought asset per unit of sold asset
+    """
+
+    sold_amount = _get_float_expr(df, 'sold_amount')
+    bought_amount = _get_float_expr(df, 'bought_amount')
+    return [
+        (sold_amount / bought_amount).alias('sold_per_bought'),
+        (bought_amount / sold_amount).alias('bought_per_sold'),
+    ]
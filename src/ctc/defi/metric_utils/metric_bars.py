@@ -0,0 +1,459 @@
+"""incremental aggregation of metric feeds into OHLCV and TWAP bars
+
+- an aggregator holds bars of many feeds, each at several bin sizes
+- samples of a feed, such as dex trade prices or chainlink answers, are
+  appended in time order, and only the bins that they touch are updated
+- each bar stores the integral of the feed's step function over the bar, so
+  that time-weighted averages continue exactly across appends
+- bars are persisted in the metric_bars db schema, from which aggregation can
+  be resumed and dashboards can read precomputed bars
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class MetricFeedState(TypedDict):
+        last_timestamp: int | None
+        last_value: float | None
+        bars: dict[int, spec.DataFrame]
+        unsaved_from: dict[int, int | None]
+
+    class MetricAggregator(TypedDict):
+        bin_sizes: tuple[int, ...]
+        feeds: dict[str, MetricFeedState]
+
+
+def _get_bar_schema() -> typing.Mapping[str, typing.Any]:
+    import polars as pl
+
+    return {
+        'bin': pl.Int64,
+        'open': pl.Float64,
+        'high': pl.Float64,
+        'low': pl.Float64,
+        'close': pl.Float64,
+        'count': pl.Int64,
+        'volume': pl.Float64,
+        'twap_area': pl.Float64,
+        'twap_duration': pl.Float64,
+    }
+
+
+def create_metric_aggregator(
+    bin_sizes: typing.Sequence[int],
+) -> MetricAggregator:
+    """create aggregator that maintains bars of the given bin sizes"""
+
+    if len(bin_sizes) == 0:
+        raise Exception('must specify at least one bin size')
+    return {'bin_sizes': tuple(sorted(set(bin_sizes))), 'feeds': {}}
+
+
+def _get_feed_state(
+    aggregator: MetricAggregator, feed: str
+) -> MetricFeedState:
+    import polars as pl
+
+    state = aggregator['feeds'].get(feed)
+    if state is None:
+        schema = _get_bar_schema()
+        state = {
+            'last_timestamp': None,
+            'last_value': None,
+            'bars': {
+                bin_size: pl.DataFrame(schema=schema)
+                for bin_size in aggregator['bin_sizes']
+            },
+            'unsaved_from': {
+                bin_size: None for bin_size in aggregator['bin_sizes']
+            },
+        }
+        aggregator['feeds'][feed] = state
+    return state
+
+
+def append_metric_values(
+    aggregator: MetricAggregator,
+    feed: str,
+    *,
+    timestamps: typing.Sequence[int] | spec.Series | spec.NumpyArray,
+    values: typing.Sequence[spec.Number] | spec.Series | spec.NumpyArray,
+    volumes: typing.Sequence[spec.Number]
+    | spec.Series
+    | spec.NumpyArray
+    | None = None,
+) -> None:
+    """append samples of a feed, updating only the bins that they touch
+
+    - samples must be sorted by timestamp
+    - samples must not precede the last sample previously appended to feed
+    - the feed's value is held until its next sample when time-weighting
+    """
+
+    import numpy as np
+
+    timestamps_array = np.asarray(timestamps, dtype=np.int64)
+    values_array = np.asarray(values, dtype=np.float64)
+    if volumes is not None:
+        volumes_array = np.asarray(volumes, dtype=np.float64)
+    else:
+        volumes_array = np.zeros(len(values_array))
+    if len(timestamps_array) != len(values_array) or len(
+        timestamps_array
+    ) != len(volumes_array):
+        raise Exception('timestamps, values, and volumes must have same length')
+    if len(timestamps_array) == 0:
+        return
+    if np.any(np.diff(timestamps_array) < 0):
+        raise Exception('samples must be sorted by timestamp')
+
+    state = _get_feed_state(aggregator, feed)
+    last_timestamp = state['last_timestamp']
+    if last_timestamp is not None and timestamps_array[0] < last_timestamp:
+        raise Exception('samples precede last sample of feed ' + str(feed))
+
+    for bin_size in aggregator['bin_sizes']:
+        new_bars = _compute_bars(
+            timestamps_array,
+            values_array,
+            volumes=volumes_array,
+            bin_size=bin_size,
+            carry_timestamp=last_timestamp,
+            carry_value=state['last_value'],
+        )
+        state['bars'][bin_size] = _merge_bars(
+            state['bars'][bin_size], new_bars
+        )
+        first_bin = new_bars['bin'][0]
+        unsaved_from = state['unsaved_from'][bin_size]
+        if unsaved_from is None or first_bin < unsaved_from:
+            state['unsaved_from'][bin_size] = first_bin
+
+    state['last_timestamp'] = int(timestamps_array[-1])
+    state['last_value'] = float(values_array[-1])
+
+
+def _compute_bars(
+    timestamps: spec.NumpyArray,
+    values: spec.NumpyArray,
+    *,
+    volumes: spec.NumpyArray,
+    bin_size: int,
+    carry_timestamp: int | None,
+    carry_value: float | None,
+) -> spec.DataFrame:
+    """compute bars of new samples, including time held by carried sample"""
+
+    import numpy as np
+    import polars as pl
+
+    schema = _get_bar_schema()
+
+    # ohlcv of bins containing samples
+    samples = pl.DataFrame(
+        {
+            'bin': (timestamps // bin_size) * bin_size,
+            'value': values,
+            'volume': volumes,
+        }
+    )
+    ohlcv = samples.groupby('bin', maintain_order=True).agg(
+        [
+            pl.col('value').first().alias('open'),
+            pl.col('value').max().alias('high'),
+            pl.col('value').min().alias('low'),
+            pl.col('value').last().alias('close'),
+            pl.col('value').count().cast(pl.Int64).alias('count'),
+            pl.col('volume').sum().alias('volume'),
+        ]
+    )
+
+    # integrate step function over each bin between first and last sample
+    if carry_timestamp is not None and carry_value is not None:
+        times = np.concatenate([[carry_timestamp], timestamps])
+        levels = np.concatenate([[carry_value], values])
+    else:
+        times = timestamps
+        levels = values
+    first_bin = (times[0] // bin_size) * bin_size
+    last_bin = (times[-1] // bin_size) * bin_size
+    twap_bins = np.arange(first_bin, last_bin + bin_size, bin_size)
+    segment_areas = levels[:-1] * np.diff(times)
+    cumulative = np.concatenate([[0.0], np.cumsum(segment_areas)])
+    lower = np.clip(twap_bins, times[0], times[-1])
+    upper = np.clip(twap_bins + bin_size, times[0], times[-1])
+    lower_index = np.searchsorted(times, lower, side='right') - 1
+    upper_index = np.searchsorted(times, upper, side='right') - 1
+    twap_area = (
+        cumulative[upper_index]
+        + levels[upper_index] * (upper - times[upper_index])
+        - cumulative[lower_index]
+        - levels[lower_index] * (lower - times[lower_index])
+    )
+    twap = pl.DataFrame(
+        {
+            'bin': twap_bins.astype(np.int64),
+            'twap_area': twap_area.astype(np.float64),
+            'twap_duration': (upper - lower).astype(np.float64),
+        }
+    )
+
+    bars = ohlcv.join(twap, on='bin', how='outer').sort('bin')
+    bars = bars.with_columns(
+        pl.col('count').fill_null(0),
+        pl.col('volume').fill_null(0.0),
+        pl.col('twap_area').fill_null(0.0),
+        pl.col('twap_duration').fill_null(0.0),
+    )
+    return bars.select(
+        [pl.col(name).cast(dtype) for name, dtype in schema.items()]
+    )
+
+
+def _merge_bars(
+    bars: spec.DataFrame, new_bars: spec.DataFrame
+) -> spec.DataFrame:
+    """merge time-ordered new bars into bars, which share at most one bin"""
+
+    import polars as pl
+
+    if len(bars) == 0:
+        return new_bars
+    if len(new_bars) == 0:
+        return bars
+    if bars['bin'][-1] != new_bars['bin'][0]:
+        return pl.concat([bars, new_bars], rechunk=False)
+
+    old = bars.row(-1, named=True)
+    new = new_bars.row(0, named=True)
+    if old['count'] == 0:
+        merged = dict(old, open=new['open'], high=new['high'], low=new['low'])
+    elif new['count'] == 0:
+        merged = dict(old)
+    else:
+        merged = dict(
+            old,
+            high=max(old['high'], new['high']),
+            low=min(old['low'], new['low']),
+        )
+    if new['count'] > 0:
+        merged['close'] = new['close']
+    for key in ['count', 'volume', 'twap_area', 'twap_duration']:
+        merged[key] = old[key] + new[key]
+    merged_bar = pl.DataFrame([merged], schema=_get_bar_schema())
+
+    return pl.concat(
+        [bars.slice(0, len(bars) - 1), merged_bar, new_bars.slice(1)],
+        rechunk=False,
+    )
+
+
+def finalize_metric_bars(bars: spec.DataFrame) -> spec.DataFrame:
+    """compute twap of bars and fill bars without samples
+
+    bars without samples open and close at the previous close
+    """
+
+    import polars as pl
+
+    previous_close = pl.col('close').forward_fill()
+    return bars.with_columns(
+        pl.col('open').fill_null(previous_close),
+        previous_close.alias('close'),
+        pl.when(pl.col('twap_duration') > 0)
+        .then(pl.col('twap_area') / pl.col('twap_duration'))
+        .otherwise(None)
+        .alias('twap'),
+    )
+
+
+def get_metric_bars(
+    aggregator: MetricAggregator,
+    feed: str,
+    *,
+    bin_size: int,
+    start_time: int | None = None,
+    end_time: int | None = None,
+) -> spec.DataFrame:
+    """get bars of feed held by aggregator
+
+    output columns are bin, open, high, low, close, count, volume, and twap
+    """
+
+    import polars as pl
+
+    if bin_size not in aggregator['bin_sizes']:
+        raise Exception('aggregator does not track bin size ' + str(bin_size))
+    state = _get_feed_state(aggregator, feed)
+    bars = finalize_metric_bars(state['bars'][bin_size])
+    if start_time is not None:
+        bars = bars.filter(pl.col('bin') + bin_size > start_time)
+    if end_time is not None:
+        bars = bars.filter(pl.col('bin') <= end_time)
+    return bars.drop(['twap_area', 'twap_duration'])
+
+
+#
+# # persistence
+#
+
+
+async def async_save_metric_aggregator(
+    aggregator: MetricAggregator,
+    *,
+    context: spec.Context = None,
+) -> None:
+    """save bars changed since the last save and cursors of feeds to db"""
+
+    import polars as pl
+    from ctc import config
+    from ctc import db
+
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='metric_bars', context=context
+    )
+    if not write_cache:
+        return
+
+    metric_bars = []
+    metric_feed_cursors = []
+    for feed, state in aggregator['feeds'].items():
+        last_timestamp = state['last_timestamp']
+        last_value = state['last_value']
+        if last_timestamp is None or last_value is None:
+            continue
+        for bin_size, bars in state['bars'].items():
+            unsaved_from = state['unsaved_from'][bin_size]
+            if unsaved_from is None:
+                continue
+            changed = finalize_metric_bars(bars).filter(
+                pl.col('bin') >= unsaved_from
+            )
+            changed = changed.with_columns(
+                pl.lit(feed).alias('feed'),
+                pl.lit(bin_size).alias('bin_size'),
+            )
+            metric_bars.extend(changed.to_dicts())
+        metric_feed_cursors.append(
+            {
+                'feed': feed,
+                'last_timestamp': last_timestamp,
+                'last_value': last_value,
+            }
+        )
+
+    await db.async_intake_metric_bars(
+        metric_bars=metric_bars,  # type: ignore
+        metric_feed_cursors=metric_feed_cursors,  # type: ignore
+        context=context,
+    )
+    for state in aggregator['feeds'].values():
+        for bin_size in state['unsaved_from'].keys():
+            state['unsaved_from'][bin_size] = None
+
+
+async def async_load_metric_aggregator(
+    feeds: typing.Sequence[str],
+    *,
+    bin_sizes: typing.Sequence[int],
+    start_time: int | None = None,
+    context: spec.Context = None,
+) -> MetricAggregator:
+    """load stored bars and cursors of feeds to resume aggregation
+
+    if start_time is given, only bars from start_time onward are loaded
+    """
+
+    import asyncio
+    import polars as pl
+    from ctc import config
+    from ctc import db
+
+    aggregator = create_metric_aggregator(bin_sizes)
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='metric_bars', context=context
+    )
+    if not read_cache:
+        return aggregator
+
+    cursors = await asyncio.gather(
+        *[
+            db.async_query_metric_feed_cursor(feed=feed, context=context)
+            for feed in feeds
+        ]
+    )
+    for feed, cursor in zip(feeds, cursors):
+        if cursor is None:
+            continue
+        state = _get_feed_state(aggregator, feed)
+        state['last_timestamp'] = cursor['last_timestamp']
+        state['last_value'] = cursor['last_value']
+        for bin_size in aggregator['bin_sizes']:
+            if start_time is not None:
+                start_bin = (start_time // bin_size) * bin_size
+                start_bin = min(
+                    start_bin, (cursor['last_timestamp'] // bin_size) * bin_size
+                )
+            else:
+                start_bin = None
+            rows = await db.async_query_metric_bars(
+                feed=feed,
+                bin_size=bin_size,
+                start_bin=start_bin,
+                context=context,
+            )
+            if rows is not None and len(rows) > 0:
+                schema = _get_bar_schema()
+                bar_rows = [
+                    {name: row[name] for name in schema}  # type: ignore
+                    for row in rows
+                ]
+                state['bars'][bin_size] = pl.DataFrame(bar_rows, schema=schema)
+
+    return aggregator
+
+
+async def async_get_stored_metric_bars(
+    feed: str,
+    *,
+    bin_size: int,
+    start_time: int | None = None,
+    end_time: int | None = None,
+    context: spec.Context = None,
+) -> spec.DataFrame | None:
+    """get precomputed bars of feed from db, or None if not stored
+
+    output columns are bin, open, high, low, close, count, volume, and twap
+    """
+
+    import polars as pl
+    from ctc import db
+
+    if start_time is not None:
+        start_bin: int | None = (start_time // bin_size) * bin_size
+    else:
+        start_bin = None
+    rows = await db.async_query_metric_bars(
+        feed=feed,
+        bin_size=bin_size,
+        start_bin=start_bin,
+        end_bin=end_time,
+        context=context,
+    )
+    if rows is None:
+        return None
+
+    schema = dict(_get_bar_schema())
+    del schema['twap_area']
+    del schema['twap_duration']
+    schema['twap'] = pl.Float64
+    return pl.DataFrame(
+        [{name: row[name] for name in schema} for row in rows],  # type: ignore
+        schema=schema,
+    )
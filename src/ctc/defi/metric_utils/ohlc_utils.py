@@ -47,20 +47,19 @@ def compute_ohlc(
         columns.append(pl.col('volume').sum().alias('volume'))
     df = df_raw.groupby('bin').agg(columns)
 
-    # fill in missing bins
-    all_bins = np.arange(
-        bins[0], bins[-1] + bin_size, bin_size
-    )
-    n_to_add = len(all_bins) - len(df)
-    if n_to_add > 0:
-        last_close = df['close'][-1]
-        row = [last_close, None, None, last_close, 0]
-        if volumes is not None:
-            row.append(0)
-        missing_rows = pl.DataFrame(row * n_to_add, schema=df.schema)
-        df = pl.concat([df, missing_rows])
-
-    df = df.sort('bin')
+    # fill in missing bins, which open and close at the previous close
+    all_bins = pl.DataFrame(
+        {'bin': np.arange(bins[0], bins[-1] + bin_size, bin_size)}
+    ).with_columns(pl.col('bin').cast(df['bin'].dtype))
+    df = all_bins.join(df, on='bin', how='left').sort('bin')
+    previous_close = pl.col('close').forward_fill()
+    fills = [
+        pl.col('open').fill_null(previous_close),
+        previous_close.alias('close'),
+        pl.col('count').fill_null(0),
+    ]
+    if volumes is not None:
+        fills.append(pl.col('volume').fill_null(0))
+    df = df.with_columns(fills)
 
     return df
-
@@ -26,16 +26,17 @@ def filter_twap(
     twap_times = timestamps_array[output_mask]
 
     # compute twap values
-    # cannot use efficient numpy operation because filter size is variable
-    # (because block times are variable)
-    raw_values_array: spec.NumpyArray = np.array(raw_values)
-    twap_values = []
-    for twap_time in twap_times:
-        lower_bound = twap_time - filter_seconds < timestamps_array
-        upper_bound = timestamps_array <= twap_time
-        block_mask = lower_bound * upper_bound
-        twap_value = raw_values_array[block_mask].mean()
-        twap_values.append(twap_value)
+    # filter size is variable (because block times are variable), so each
+    # window is located with searchsorted and averaged using cumulative sums
+    raw_values_array: spec.NumpyArray = np.array(raw_values, dtype=float)
+    cumulative = np.concatenate([[0.0], np.cumsum(raw_values_array)])
+    window_starts = np.searchsorted(
+        timestamps_array, twap_times - filter_seconds, side='right'
+    )
+    window_ends = np.searchsorted(timestamps_array, twap_times, side='right')
+    twap_values = (cumulative[window_ends] - cumulative[window_starts]) / (
+        window_ends - window_starts
+    )
 
     # format as Series
     return pl.DataFrame({'timestamp': twap_times, 'value': twap_values})
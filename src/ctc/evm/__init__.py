@@ -1,14 +1,387 @@
-from .abi_utils import *
-from .address_utils import *
-from .binary_utils import *
-from .block_utils import *
-from .contract_utils import *
-from .erc20_utils import *
-from .erc721_utils import *
-from .erc4626_utils import *
-from .eth_utils import *
-from .event_utils import *
-from .network_utils import *
-from .transaction_utils import *
-from .trace_utils import *
+from __future__ import annotations
 
+import typing
+
+# attributes are loaded from their submodules upon first access
+if typing.TYPE_CHECKING:
+    from .abi_utils import *
+    from .address_utils import *
+    from .binary_utils import *
+    from .block_utils import *
+    from .contract_utils import *
+    from .erc20_utils import *
+    from .erc721_utils import *
+    from .erc4626_utils import *
+    from .eth_utils import *
+    from .event_utils import *
+    from .network_utils import *
+    from .transaction_utils import *
+    from .trace_utils import *
+
+else:
+
+    _lazy_exports = {
+        'abi_utils': (
+            'abi_decode',
+            'abi_encode',
+            'abi_encode_packed',
+            'async_build_abi_registry',
+            'async_decode_events_dataframe',
+            'async_decompile_function_abis',
+            'async_get_contract_abi',
+            'async_get_contracts_abis',
+            'async_get_event_abi',
+            'async_get_function_abi',
+            'async_parse_function_str_abi',
+            'batch_encode_call_data',
+            'clear_compiled_abi_cache',
+            'combine_contract_abis',
+            'compile_event_abi',
+            'compile_function_abi',
+            'contract_abi_to_dataframe',
+            'decode_call_data',
+            'decode_event_topics',
+            'decode_event_unindexed_data',
+            'decode_function_named_parameters',
+            'decode_function_output',
+            'decode_function_parameters',
+            'encode_call_data',
+            'encode_function_parameters',
+            'event_signature_to_abi',
+            'extract_bytecode_function_selectors',
+            'function_signature_to_abi',
+            'get_abi_decoder',
+            'get_abi_encoder',
+            'get_abi_registry_path',
+            'get_contract_abi_by_selectors',
+            'get_contract_abi_diff',
+            'get_event_abi',
+            'get_event_abi_candidates',
+            'get_event_abis',
+            'get_event_hash',
+            'get_event_indexed_names',
+            'get_event_indexed_types',
+            'get_event_schema',
+            'get_event_signature',
+            'get_event_unindexed_names',
+            'get_event_unindexed_types',
+            'get_function_abi',
+            'get_function_abi_candidates',
+            'get_function_abis',
+            'get_function_output_names',
+            'get_function_output_types',
+            'get_function_parameter_names',
+            'get_function_parameter_types',
+            'get_function_selector',
+            'get_function_selector_type',
+            'get_function_signature',
+            'get_registry_event_abi',
+            'get_registry_function_abi',
+            'get_signature_hash',
+            'is_function_read_only',
+            'is_function_selector',
+            'is_function_signature',
+            'load_abi_registry',
+            'normalize_event',
+            'print_contract_abi',
+            'print_contract_abi_diff',
+            'print_contract_abi_events',
+            'print_contract_abi_functions',
+            'sync_get_function_abi',
+        ),
+        'address_utils': (
+            'async_get_address_transaction_counts_by_block',
+            'async_get_transactions_from_address',
+            'async_print_address_summary',
+            'async_resolve_address',
+            'async_resolve_address_by_block',
+            'async_resolve_addresses',
+            'get_address_checksum',
+            'is_address_str',
+        ),
+        'binary_utils': (
+            'binarize_fields',
+            'binary_convert',
+            'binary_to_text',
+            'get_binary_format',
+            'get_binary_n_bytes',
+            'get_domain_separator',
+            'get_signature_network_id',
+            'hash_eip712_struct',
+            'keccak',
+            'keccak_text',
+            'pack_signature_vrs',
+            'private_key_to_address',
+            'private_key_to_public_key',
+            'public_key_to_address',
+            'public_key_tuple_to_hex',
+            'recover_signer_address',
+            'recover_signer_public_key',
+            'rlp_decode',
+            'rlp_encode',
+            'sign_data_message',
+            'sign_eip712_struct',
+            'sign_message_hash',
+            'sign_text_message',
+            'text_to_binary',
+            'to_binary',
+            'to_hex',
+            'unpack_signature_vrs',
+            'verify_eip712_signature',
+            'verify_signature',
+        ),
+        'block_utils': (
+            'BlockHead',
+            'async_block_number_to_int',
+            'async_block_numbers_to_int',
+            'async_block_reference_to_int',
+            'async_block_references_to_int',
+            'async_compute_block_days',
+            'async_compute_block_eth_prices',
+            'async_compute_block_hours',
+            'async_compute_block_minutes',
+            'async_compute_block_months',
+            'async_compute_block_time_bins',
+            'async_compute_block_weeks',
+            'async_compute_block_years',
+            'async_get_block',
+            'async_get_block_gas_stats',
+            'async_get_block_intervals',
+            'async_get_block_number_and_time',
+            'async_get_block_of_timestamp',
+            'async_get_block_timestamp',
+            'async_get_block_timestamps',
+            'async_get_blocks',
+            'async_get_blocks_gas_stats',
+            'async_get_blocks_of_timestamps',
+            'async_get_gas_stats_by_block',
+            'async_get_latest_block_number',
+            'async_get_median_block_gas_fee',
+            'async_get_median_blocks_gas_fees',
+            'async_predict_block_timestamp',
+            'async_predict_block_timestamps',
+            'async_predict_timestamp_block',
+            'async_predict_timestamp_blocks',
+            'async_print_block_summary',
+            'async_resolve_block_range',
+            'async_start_head_tracker',
+            'async_stop_head_tracker',
+            'async_wait_for_next_block',
+            'compute_block_time_bins',
+            'compute_blocks_gas_stats',
+            'compute_transactions_gas_stats',
+            'compute_transactions_median_gas_fee',
+            'convert_rpc_block_to_db_block',
+            'encode_block_number',
+            'get_tracked_head',
+            'hash_block',
+            'raw_block_number_to_int',
+            'raw_block_numbers_to_ints',
+            'serialize_block',
+            'standardize_block_number',
+            'standardize_block_numbers',
+            'sync_get_latest_block_number',
+        ),
+        'contract_utils': (
+            'async_are_contract_addresses',
+            'async_get_contract_creation_block',
+            'async_get_contract_creation_transaction',
+            'async_get_contract_deployer',
+            'async_get_contracts_creation_blocks',
+            'async_get_proxy_implementation',
+            'async_get_proxy_metadata',
+            'async_is_contract_address',
+            'get_created_address',
+        ),
+        'erc20_utils': (
+            'async_erc20_eth_call',
+            'async_erc20_eth_call_by_block',
+            'async_erc20s_eth_calls',
+            'async_get_default_erc20_tokens',
+            'async_get_erc20_address',
+            'async_get_erc20_allowance',
+            'async_get_erc20_allowance_by_block',
+            'async_get_erc20_allowances_of_owners',
+            'async_get_erc20_allowances_of_spenders',
+            'async_get_erc20_balance',
+            'async_get_erc20_balance_by_block',
+            'async_get_erc20_balance_ledger',
+            'async_get_erc20_balances_from_transfers',
+            'async_get_erc20_balances_of_addresses',
+            'async_get_erc20_decimals',
+            'async_get_erc20_decimals_by_block',
+            'async_get_erc20_metadata',
+            'async_get_erc20_name',
+            'async_get_erc20_name_by_block',
+            'async_get_erc20_symbol',
+            'async_get_erc20_symbol_by_block',
+            'async_get_erc20_total_supply',
+            'async_get_erc20_total_supply_by_block',
+            'async_get_erc20_transfers',
+            'async_get_erc20s_allowances',
+            'async_get_erc20s_balances',
+            'async_get_erc20s_decimals',
+            'async_get_erc20s_names',
+            'async_get_erc20s_symbols',
+            'async_get_erc20s_total_supplies',
+            'async_is_erc20',
+            'async_load_erc20_metadata_cache',
+            'async_normalize_erc20_quantities',
+            'async_normalize_erc20_quantities_by_block',
+            'async_normalize_erc20_quantity',
+            'async_normalize_erc20s_quantities',
+            'async_print_erc20_summary',
+            'create_erc20_balance_ledger',
+            'erc20_event_abis',
+            'erc20_function_abis',
+            'get_erc20_balance_by_block_from_ledger',
+            'get_erc20_balance_from_ledger',
+            'get_erc20_balances_from_ledger',
+            'reset_erc20_metadata_cache',
+            'update_erc20_balance_ledger',
+        ),
+        'erc721_utils': (
+            'async_get_erc721_approvals',
+            'async_get_erc721_approvals_for_all',
+            'async_get_erc721_approved',
+            'async_get_erc721_approved_for_all',
+            'async_get_erc721_balance',
+            'async_get_erc721_owner',
+            'async_get_erc721_owners',
+            'async_get_erc721_total_supply',
+            'async_get_erc721_transfers',
+            'async_is_erc721',
+            'erc721_collections',
+            'erc721_event_abis',
+            'erc721_function_abis',
+        ),
+        'erc4626_utils': (
+            'async_convert_to_erc4626_assets',
+            'async_convert_to_erc4626_assets_by_block',
+            'async_convert_to_erc4626_shares',
+            'async_convert_to_erc4626_shares_by_block',
+            'async_convert_to_erc4626s_assets',
+            'async_convert_to_erc4626s_shares',
+            'async_get_erc4626_asset',
+            'async_get_erc4626_deposits',
+            'async_get_erc4626_max_deposit',
+            'async_get_erc4626_max_deposit_by_block',
+            'async_get_erc4626_max_mint',
+            'async_get_erc4626_max_mint_by_block',
+            'async_get_erc4626_max_redeem',
+            'async_get_erc4626_max_redeem_by_block',
+            'async_get_erc4626_max_withdraw',
+            'async_get_erc4626_max_withdraw_by_block',
+            'async_get_erc4626_total_assets',
+            'async_get_erc4626_total_assets_by_block',
+            'async_get_erc4626_withdraws',
+            'async_get_erc4626s_assets',
+            'async_get_erc4626s_max_deposits',
+            'async_get_erc4626s_max_mints',
+            'async_get_erc4626s_max_redeems',
+            'async_get_erc4626s_max_withdraws',
+            'async_get_erc4626s_total_assets',
+            'async_normalize_erc4626_assets',
+            'async_normalize_erc4626_shares',
+            'async_normalize_erc4626s_assets',
+            'async_normalize_erc4626s_shares',
+            'async_preview_erc4626_deposit',
+            'async_preview_erc4626_deposit_by_block',
+            'async_preview_erc4626_mint',
+            'async_preview_erc4626_mint_by_block',
+            'async_preview_erc4626_redeem',
+            'async_preview_erc4626_redeem_by_block',
+            'async_preview_erc4626_withdraw',
+            'async_preview_erc4626_withdraw_by_block',
+            'async_preview_erc4626s_deposits',
+            'async_preview_erc4626s_mints',
+            'async_preview_erc4626s_redeems',
+            'async_preview_erc4626s_withdraws',
+            'erc4626_event_abis',
+            'erc4626_function_abis',
+        ),
+        'eth_utils': (
+            'async_get_eth_balance',
+            'async_get_eth_balance_by_block',
+            'async_get_eth_balance_of_addresses',
+        ),
+        'event_utils': (
+            'async_get_event_timestamps',
+            'async_get_events',
+        ),
+        'network_utils': (
+            'get_network_block_explorer',
+            'get_network_chain_id',
+            'get_network_metadata',
+            'get_network_name',
+            'get_networks',
+        ),
+        'transaction_utils': (
+            'async_convert_rpc_transaction_to_db_transaction',
+            'async_convert_rpc_transactions_to_db_transactions',
+            'async_get_block_transactions',
+            'async_get_blocks_receipts',
+            'async_get_blocks_transactions',
+            'async_get_transaction',
+            'async_get_transaction_count',
+            'async_get_transaction_logs',
+            'async_get_transactions',
+            'async_get_transactions_logs',
+            'async_print_transaction_summary',
+            'convert_db_transaction_fields_to_int',
+            'convert_db_transaction_fields_to_text',
+            'convert_rpc_transaction_to_db_transaction',
+            'convert_rpc_transactions_to_db_transactions',
+            'get_transaction_type',
+            'get_transaction_type_keys',
+            'get_transaction_type_name',
+            'hash_signed_transaction',
+            'hash_unsigned_transaction',
+            'is_transaction_signed',
+            'recover_transaction_sender',
+            'serialize_signed_transaction',
+            'serialize_unsigned_transaction',
+            'sign_transaction',
+            'verify_transaction_signature',
+        ),
+        'trace_utils': (
+            'async_get_block_trace',
+            'async_get_blocks_trace',
+            'async_get_transaction_state_diff',
+            'async_get_transaction_trace',
+            'async_get_transaction_vm_trace',
+            'async_print_transaction_balance_diffs',
+            'async_print_transaction_storage_diffs',
+            'async_trace_contract_creations',
+            'async_trace_native_transfers',
+            'async_trace_slot_stats',
+        ),
+    }
+
+    _lazy_submodules = {
+        name: submodule
+        for submodule, names in _lazy_exports.items()
+        for name in names
+    }
+
+    def __getattr__(name: str) -> typing.Any:
+        """load attribute from its submodule upon first access"""
+        import importlib
+
+        if name in _lazy_exports:
+            return importlib.import_module(__name__ + '.' + name)
+        submodule = _lazy_submodules.get(name)
+        if submodule is None:
+            raise AttributeError(
+                'module ' + repr(__name__) + ' has no attribute ' + repr(name)
+            )
+        module = importlib.import_module(__name__ + '.' + submodule)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """list attributes, including those not yet loaded"""
+        return sorted(
+            set(globals()) | set(_lazy_exports) | set(_lazy_submodules)
+        )
@@ -1,4 +1,6 @@
 from .abi_coding_utils import *
+from .abi_registry import *
 from .contract_abi_utils import *
 from .function_abi_utils import *
 from .event_abi_utils import *
+from .abi_compilation import *
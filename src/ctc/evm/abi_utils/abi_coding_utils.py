@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import functools
 import typing
 
 from ctc import spec
 from .. import binary_utils
 
+if typing.TYPE_CHECKING:
+    ABIDecoder = typing.Callable[[bytes], typing.Any]
+    _WordDecoder = typing.Callable[[bytes], typing.Any]
+
+
+_abi_coder_cache_size = 4096
+
 
 def abi_decode(
     data: spec.GenericBinaryData,
@@ -34,7 +42,7 @@ def abi_decode(
     # decode data
     if isinstance(types, str):
         try:
-            return eth_abi_lite.decode_single(types, data)
+            return get_abi_decoder(types)(data)
         except eth_abi_lite.exceptions.DecodingError as e:
             # handle improperly encoded data
             if types == 'string':
@@ -46,7 +54,153 @@ def abi_decode(
     else:
         if len(data) < 64:
             data = b'\x00' * (64 - len(data)) + data
-        return eth_abi_lite.decode_abi(types, data)
+        return get_abi_decoder(tuple(types))(data)
+
+
+@functools.lru_cache(maxsize=_abi_coder_cache_size)
+def get_abi_decoder(
+    types: spec.ABIDatatypeStr | typing.Tuple[spec.ABIDatatypeStr, ...],
+) -> ABIDecoder:
+    """get compiled decoder of an ABI type or of a sequence of ABI types
+
+    decoders of tuples of static value types slice fixed 32 byte offsets
+    directly, falling back to eth_abi_lite only when data is malformed
+    """
+
+    from eth_abi_lite.decoding import ContextFramesBytesIO
+
+    # eth_abi_lite decoder is resolved on first use so that invalid types
+    # only raise when data is decoded
+    def decode(data: bytes) -> typing.Any:
+        if not isinstance(data, bytes):
+            raise TypeError(
+                'data must be of bytes type, got ' + str(type(data))
+            )
+        stream = ContextFramesBytesIO(data)  # type: ignore
+        return _get_base_decoder(types)(stream)
+
+    # build fast decoder for static value types
+    if isinstance(types, str):
+        if types.startswith('(') and types.endswith(')'):
+            word_types: typing.Sequence[str] | None = types[1:-1].split(',')
+        else:
+            word_decoder = _get_word_decoder(types)
+            if word_decoder is None:
+                return decode
+            single_decoder = word_decoder
+
+            def decode_single_static(data: bytes) -> typing.Any:
+                if len(data) < 32:
+                    return decode(data)
+                try:
+                    return single_decoder(data[:32])
+                except ValueError:
+                    return decode(data)
+
+            return decode_single_static
+    else:
+        word_types = types
+    if word_types is None or len(word_types) == 0:
+        return decode
+    word_decoders = [_get_word_decoder(item) for item in word_types]
+    if any(word_decoder is None for word_decoder in word_decoders):
+        return decode
+    static_decoders = typing.cast(typing.List['_WordDecoder'], word_decoders)
+    offsets = [32 * i for i in range(len(static_decoders))]
+    size = 32 * len(static_decoders)
+
+    def decode_static(data: bytes) -> typing.Any:
+        if len(data) < size:
+            return decode(data)
+        try:
+            return tuple(
+                word_decoder(data[offset : offset + 32])
+                for word_decoder, offset in zip(static_decoders, offsets)
+            )
+        except ValueError:
+            # let eth_abi_lite raise its usual error for malformed data
+            return decode(data)
+
+    return decode_static
+
+
+@functools.lru_cache(maxsize=_abi_coder_cache_size)
+def _get_base_decoder(
+    types: spec.ABIDatatypeStr | typing.Tuple[spec.ABIDatatypeStr, ...],
+) -> typing.Any:
+    import eth_abi_lite
+    from eth_abi_lite.decoding import TupleDecoder
+
+    registry = eth_abi_lite.registry.registry
+    if isinstance(types, str):
+        return registry.get_decoder(types)
+    else:
+        return TupleDecoder(  # type: ignore
+            decoders=[registry.get_decoder(item) for item in types]
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_word_decoder(abi_type: str) -> _WordDecoder | None:
+    """get decoder of a single 32 byte word, if type is a static value type
+
+    word decoders raise ValueError for words that are not properly padded
+    """
+
+    if abi_type == 'address':
+
+        def decode_address(word: bytes) -> str:
+            if word[:12] != b'\x00' * 12:
+                raise ValueError('invalid address padding')
+            return '0x' + word[12:].hex()
+
+        return decode_address
+
+    elif abi_type == 'bool':
+
+        def decode_bool(word: bytes) -> bool:
+            value = int.from_bytes(word, 'big')
+            if value > 1:
+                raise ValueError('invalid bool')
+            return value == 1
+
+        return decode_bool
+
+    elif abi_type.startswith('uint') and abi_type[4:].isdigit():
+        bound = 2 ** int(abi_type[4:])
+
+        def decode_uint(word: bytes) -> int:
+            value = int.from_bytes(word, 'big')
+            if value >= bound:
+                raise ValueError('invalid uint padding')
+            return value
+
+        return decode_uint
+
+    elif abi_type.startswith('int') and abi_type[3:].isdigit():
+        signed_bound = 2 ** (int(abi_type[3:]) - 1)
+
+        def decode_int(word: bytes) -> int:
+            value = int.from_bytes(word, 'big', signed=True)
+            if value >= signed_bound or value < -signed_bound:
+                raise ValueError('invalid int padding')
+            return value
+
+        return decode_int
+
+    elif abi_type.startswith('bytes') and abi_type[5:].isdigit():
+        n_bytes = int(abi_type[5:])
+        padding = b'\x00' * (32 - n_bytes)
+
+        def decode_bytes(word: bytes) -> bytes:
+            if word[n_bytes:] != padding:
+                raise ValueError('invalid bytes padding')
+            return word[:n_bytes]
+
+        return decode_bytes
+
+    else:
+        return None
 
 
 def abi_encode(
@@ -55,12 +209,40 @@ def abi_encode(
 ) -> bytes:
     """encode data in ABI format, similar to solidity's abi.encode()"""
 
+    if isinstance(types, str):
+        return get_abi_encoder(types)(data)
+    else:
+        return get_abi_encoder(tuple(types))(data)
+
+
+@functools.lru_cache(maxsize=_abi_coder_cache_size)
+def get_abi_encoder(
+    types: spec.ABIDatatypeStr | typing.Tuple[spec.ABIDatatypeStr, ...],
+) -> typing.Callable[[typing.Any], bytes]:
+    """get compiled encoder of an ABI type or of a sequence of ABI types"""
+
+    # eth_abi_lite encoder is resolved on first use so that invalid types
+    # only raise when data is encoded
+    def encode(data: typing.Any) -> bytes:
+        return _get_base_encoder(types)(data)  # type: ignore
+
+    return encode
+
+
+@functools.lru_cache(maxsize=_abi_coder_cache_size)
+def _get_base_encoder(
+    types: spec.ABIDatatypeStr | typing.Tuple[spec.ABIDatatypeStr, ...],
+) -> typing.Any:
     import eth_abi_lite
+    from eth_abi_lite.encoding import TupleEncoder
 
+    registry = eth_abi_lite.registry.registry
     if isinstance(types, str):
-        return eth_abi_lite.encode_single(types, data)
+        return registry.get_encoder(types)
     else:
-        return eth_abi_lite.encode_abi(types, data)
+        return TupleEncoder(  # type: ignore
+            encoders=[registry.get_encoder(item) for item in types]
+        )
 
 
 def abi_encode_packed(
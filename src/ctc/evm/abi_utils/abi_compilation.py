@@ -0,0 +1,196 @@
+"""compile function and event abis into cached codec objects
+
+compiling an abi resolves its signature, selector or topic, type strings,
+names, and decoders once. compiled abis are cached in an LRU keyed by the
+identity of the abi, and validated by equality so that mutated or recycled
+abi objects are recompiled.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import typing
+
+from ctc import spec
+from .. import binary_utils
+from . import abi_coding_utils
+from .event_abi_utils import event_abi_parsing
+from .function_abi_utils import function_abi_parsing
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    from .abi_coding_utils import ABIDecoder
+
+    class CompiledFunctionABI(TypedDict):
+        function_abi: spec.FunctionABI
+        signature: str
+        selector: str
+        input_types: typing.Sequence[spec.ABIDatumType]
+        input_names: typing.Sequence[str | None]
+        output_types: typing.Sequence[spec.ABIDatumType]
+        output_names: typing.Sequence[str | None]
+        input_decoder: ABIDecoder
+        input_encoder: typing.Callable[[typing.Any], bytes]
+        output_decoder: ABIDecoder
+
+    class CompiledEventABI(TypedDict):
+        event_abi: spec.EventABI
+        signature: str
+        event_hash: str
+        schema: spec.EventSchema
+        indexed_decoders: typing.Sequence[ABIDecoder | None]
+        unindexed_decoder: ABIDecoder | None
+        polars_dtypes: typing.Sequence[typing.Any] | None
+
+    _CompiledABI = typing.TypeVar(
+        '_CompiledABI', CompiledFunctionABI, CompiledEventABI
+    )
+
+
+_compiled_abi_cache_size = 4096
+_compiled_function_abis: collections.OrderedDict[
+    int, typing.Tuple[spec.FunctionABI, CompiledFunctionABI]
+] = collections.OrderedDict()
+_compiled_event_abis: collections.OrderedDict[
+    int, typing.Tuple[spec.EventABI, CompiledEventABI]
+] = collections.OrderedDict()
+
+
+@functools.lru_cache(maxsize=_compiled_abi_cache_size)
+def get_signature_hash(signature: str) -> str:
+    """get keccak hash of function or event signature, as prefix hex"""
+    return binary_utils.keccak_text(signature)
+
+
+def compile_function_abi(function_abi: spec.FunctionABI) -> CompiledFunctionABI:
+    """compile function abi into cached selector, types, and codecs"""
+
+    compiled = _get_cached_compilation(_compiled_function_abis, function_abi)
+    if compiled is not None:
+        return compiled
+
+    signature = function_abi_parsing.get_function_signature(function_abi)
+    input_types = function_abi_parsing.get_function_parameter_types(
+        function_abi
+    )
+    if 'outputs' in function_abi:
+        output_types = function_abi_parsing.get_function_output_types(
+            function_abi
+        )
+        output_names = function_abi_parsing.get_function_output_names(
+            function_abi
+        )
+    else:
+        output_types = []
+        output_names = []
+    new_compiled: CompiledFunctionABI = {
+        'function_abi': function_abi,
+        'signature': signature,
+        'selector': get_signature_hash(signature)[2:10],
+        'input_types': input_types,
+        'input_names': function_abi_parsing.get_function_parameter_names(
+            function_abi
+        ),
+        'output_types': output_types,
+        'output_names': output_names,
+        'input_decoder': abi_coding_utils.get_abi_decoder(tuple(input_types)),
+        'input_encoder': abi_coding_utils.get_abi_encoder(tuple(input_types)),
+        'output_decoder': abi_coding_utils.get_abi_decoder(
+            tuple(output_types)
+        ),
+    }
+    _set_cached_compilation(
+        _compiled_function_abis, function_abi, compiled=new_compiled
+    )
+    return new_compiled
+
+
+def compile_event_abi(event_abi: spec.EventABI) -> CompiledEventABI:
+    """compile event abi into cached event hash, schema, and decoders"""
+
+    compiled = _get_cached_compilation(_compiled_event_abis, event_abi)
+    if compiled is not None:
+        return compiled
+
+    signature = event_abi_parsing.get_event_signature(event_abi)
+    indexed_names = event_abi_parsing.get_event_indexed_names(event_abi)
+    indexed_types = event_abi_parsing.get_event_indexed_types(event_abi)
+    unindexed_names = event_abi_parsing.get_event_unindexed_names(event_abi)
+    unindexed_types = event_abi_parsing.get_event_unindexed_types(event_abi)
+
+    # reference types are not decoded from topics, only their hash is stored
+    indexed_decoders: list[ABIDecoder | None] = []
+    for indexed_type in indexed_types:
+        if (
+            indexed_type in ['bytes', 'string']
+            or indexed_type.endswith(']')
+            or indexed_type.endswith(')')
+        ):
+            indexed_decoders.append(None)
+        else:
+            indexed_decoders.append(
+                abi_coding_utils.get_abi_decoder(indexed_type)
+            )
+    if len(unindexed_types) > 0:
+        unindexed_decoder: ABIDecoder | None = (
+            abi_coding_utils.get_abi_decoder(tuple(unindexed_types))
+        )
+    else:
+        unindexed_decoder = None
+
+    new_compiled: CompiledEventABI = {
+        'event_abi': event_abi,
+        'signature': signature,
+        'event_hash': get_signature_hash(signature),
+        'schema': {
+            'indexed_names': indexed_names,
+            'indexed_types': indexed_types,
+            'unindexed_names': unindexed_names,
+            'unindexed_types': unindexed_types,
+            'names': indexed_names + unindexed_names,
+            'types': indexed_types + unindexed_types,
+        },
+        'indexed_decoders': indexed_decoders,
+        'unindexed_decoder': unindexed_decoder,
+        'polars_dtypes': None,
+    }
+    _set_cached_compilation(
+        _compiled_event_abis, event_abi, compiled=new_compiled
+    )
+    return new_compiled
+
+
+def _get_cached_compilation(
+    cache: collections.OrderedDict[int, typing.Tuple[typing.Any, _CompiledABI]],
+    abi: typing.Any,
+) -> _CompiledABI | None:
+    key = id(abi)
+    entry = cache.get(key)
+    if entry is None or entry[0] != abi:
+        return None
+    cache.move_to_end(key)
+    return entry[1]
+
+
+def _set_cached_compilation(
+    cache: collections.OrderedDict[int, typing.Tuple[typing.Any, _CompiledABI]],
+    abi: typing.Any,
+    *,
+    compiled: _CompiledABI,
+) -> None:
+    import copy
+
+    # store a copy of abi so that mutations of the original are detected
+    cache[id(abi)] = (copy.deepcopy(abi), compiled)
+    cache.move_to_end(id(abi))
+    while len(cache) > _compiled_abi_cache_size:
+        cache.popitem(last=False)
+
+
+def clear_compiled_abi_cache() -> None:
+    """clear caches of compiled function and event abis"""
+    _compiled_function_abis.clear()
+    _compiled_event_abis.clear()
+    get_signature_hash.cache_clear()
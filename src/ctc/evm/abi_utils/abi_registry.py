@@ -0,0 +1,366 @@
+"""offline registry mapping function selectors and event hashes to abis
+
+the registry is compiled from cached contract abis and the 4byte signature
+datasets into sorted key arrays and a blob of json entries, all of which are
+memory-mapped on load. each key maps to a list of candidate entries, either
+a full abi (from contract abis) or a text signature (from 4byte).
+
+build or rebuild the registry with `ctc abi registry` or with
+async_build_abi_registry(), after caching contract abis or building the
+local 4byte datasets with `ctc 4byte build`
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+from .. import binary_utils
+from .event_abi_utils import event_abi_parsing
+from .function_abi_utils import function_abi_parsing
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Literal
+    from typing_extensions import TypedDict
+
+    class ABIRegistryIndex(TypedDict):
+        keys: spec.NumpyArray
+        key_offsets: spec.NumpyArray
+        entry_offsets: spec.NumpyArray
+        entries: spec.NumpyArray
+
+    class ABIRegistry(TypedDict):
+        functions: ABIRegistryIndex
+        events: ABIRegistryIndex
+
+
+_abi_registries: typing.MutableMapping[str, ABIRegistry] = {}
+
+
+def get_abi_registry_path() -> str:
+    """get default directory of abi registry"""
+    import os
+    from ctc import config
+
+    return os.path.join(config.get_data_dir(), 'abi_registry')
+
+
+#
+# # building
+#
+
+
+async def async_build_abi_registry(
+    *,
+    path: str | None = None,
+    include_contract_abis: bool = True,
+    include_fourbyte: bool = True,
+    context: spec.Context = None,
+) -> None:
+    """build abi registry from cached contract abis and 4byte datasets"""
+
+    import json
+
+    functions: dict[str, dict[str, None]] = {}
+    events: dict[str, dict[str, None]] = {}
+
+    # full abis of cached contracts
+    if include_contract_abis:
+        from ctc import db
+
+        contract_abis = await db.async_query_contract_abis(context=context)
+        if contract_abis is not None:
+            for contract_abi in contract_abis.values():
+                for item in contract_abi:
+                    if item.get('type') == 'function':
+                        function_abi = typing.cast(spec.FunctionABI, item)
+                        key = function_abi_parsing.get_function_selector(
+                            function_abi
+                        )
+                        entry = json.dumps(function_abi, sort_keys=True)
+                        functions.setdefault(key, {})[entry] = None
+                    elif item.get('type') == 'event' and not item.get(
+                        'anonymous'
+                    ):
+                        event_abi = typing.cast(spec.EventABI, item)
+                        key = event_abi_parsing.get_event_hash(event_abi)
+                        entry = json.dumps(event_abi, sort_keys=True)
+                        events.setdefault(key, {})[entry] = None
+
+    # text signatures of 4byte datasets
+    if include_fourbyte:
+        from ctc.protocols import fourbyte_utils
+
+        try:
+            function_signatures = (
+                await fourbyte_utils.async_query_local_function_signatures(
+                    context=context
+                )
+            )
+        except Exception:
+            function_signatures = None
+        for signature in function_signatures or []:
+            key = signature['hex_signature'].lower()
+            entry = json.dumps(signature['text_signature'])
+            functions.setdefault(key, {})[entry] = None
+
+        try:
+            event_signatures = (
+                await fourbyte_utils.async_query_local_event_signatures(
+                    context=context
+                )
+            )
+        except Exception:
+            event_signatures = None
+        for signature in event_signatures or []:
+            key = signature['hex_signature'].lower()
+            entry = json.dumps(signature['text_signature'])
+            events.setdefault(key, {})[entry] = None
+
+    if path is None:
+        path = get_abi_registry_path()
+    _write_abi_registry_index(functions, path=path, datatype='functions')
+    _write_abi_registry_index(events, path=path, datatype='events')
+    _abi_registries.pop(path, None)
+
+
+def _write_abi_registry_index(
+    entries_by_key: typing.Mapping[str, typing.Mapping[str, None]],
+    *,
+    path: str,
+    datatype: Literal['functions', 'events'],
+) -> None:
+    import os
+    import numpy as np
+
+    if datatype == 'functions':
+        dtype = 'S4'
+    elif datatype == 'events':
+        dtype = 'S32'
+    else:
+        raise Exception('unknown datatype: ' + str(datatype))
+
+    binary_keys = {
+        binary_utils.binary_convert(key, 'binary'): key
+        for key in entries_by_key.keys()
+    }
+    sorted_keys = sorted(binary_keys.keys())
+    keys = np.array(sorted_keys, dtype=dtype)
+    key_offsets = [0]
+    entry_offsets = [0]
+    blob = bytearray()
+    for key in sorted_keys:
+        for entry in entries_by_key[binary_keys[key]]:
+            blob.extend(entry.encode())
+            entry_offsets.append(len(blob))
+        key_offsets.append(len(entry_offsets) - 1)
+
+    os.makedirs(path, exist_ok=True)
+    arrays = {
+        'keys': keys,
+        'key_offsets': np.array(key_offsets, dtype=np.int64),
+        'entry_offsets': np.array(entry_offsets, dtype=np.int64),
+        'entries': np.frombuffer(bytes(blob), dtype=np.uint8),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(path, datatype + '__' + name + '.npy'), array)
+
+
+#
+# # loading
+#
+
+
+def load_abi_registry(path: str | None = None) -> ABIRegistry | None:
+    """load memory-mapped abi registry, returning None if not built"""
+
+    import os
+    import numpy as np
+
+    if path is None:
+        path = get_abi_registry_path()
+    if path in _abi_registries:
+        return _abi_registries[path]
+
+    try:
+        registry: ABIRegistry = {
+            datatype: {  # type: ignore
+                name: np.load(
+                    os.path.join(path, datatype + '__' + name + '.npy'),
+                    mmap_mode='r',
+                )
+                for name in ['keys', 'key_offsets', 'entry_offsets', 'entries']
+            }
+            for datatype in ['functions', 'events']
+        }
+    except FileNotFoundError:
+        # not cached, so that a registry built later is picked up
+        return None
+    _abi_registries[path] = registry
+    return registry
+
+
+def _get_registry_entries(
+    index: ABIRegistryIndex,
+    key: bytes,
+) -> list[typing.Any]:
+    import json
+    import numpy as np
+
+    # numpy strips trailing null bytes of fixed width bytes when indexing
+    keys = index['keys']
+    position = int(np.searchsorted(keys, key))
+    if position >= len(keys) or keys[position] != key.rstrip(b'\x00'):
+        return []
+    start = index['key_offsets'][position]
+    end = index['key_offsets'][position + 1]
+    entry_offsets = index['entry_offsets']
+    entries = index['entries']
+    return [
+        json.loads(entries[entry_offsets[e] : entry_offsets[e + 1]].tobytes())
+        for e in range(start, end)
+    ]
+
+
+#
+# # queries
+#
+
+
+def get_function_abi_candidates(
+    function_selector: spec.FunctionSelector,
+    *,
+    path: str | None = None,
+) -> list[spec.FunctionABI]:
+    """get candidate function abis of selector from abi registry
+
+    candidates from contract abis are listed before those from 4byte, which
+    lack parameter names and outputs
+    """
+
+    registry = load_abi_registry(path)
+    if registry is None:
+        return []
+    key = binary_utils.binary_convert(function_selector, 'binary')
+    candidates = []
+    for entry in _get_registry_entries(registry['functions'], key):
+        if isinstance(entry, str):
+            candidates.append(
+                function_abi_parsing.function_signature_to_abi(entry)
+            )
+        else:
+            candidates.append(entry)
+    return candidates
+
+
+def get_event_abi_candidates(
+    event_hash: str,
+    *,
+    n_indexed: int | None = None,
+    path: str | None = None,
+) -> list[spec.EventABI]:
+    """get candidate event abis of event hash from abi registry
+
+    candidates from contract abis are listed before those from 4byte. 4byte
+    signatures do not specify which inputs are indexed, so if n_indexed is
+    given the first n_indexed inputs are marked as indexed, and otherwise
+    4byte candidates are omitted
+    """
+
+    registry = load_abi_registry(path)
+    if registry is None:
+        return []
+    key = binary_utils.binary_convert(event_hash, 'binary')
+    candidates = []
+    for entry in _get_registry_entries(registry['events'], key):
+        if isinstance(entry, str):
+            if n_indexed is not None:
+                candidates.append(
+                    event_abi_parsing.event_signature_to_abi(
+                        entry, n_indexed=n_indexed
+                    )
+                )
+        elif n_indexed is None or n_indexed == sum(
+            bool(arg.get('indexed')) for arg in entry['inputs']
+        ):
+            candidates.append(entry)
+    return candidates
+
+
+def get_registry_function_abi(
+    function_selector: spec.FunctionSelector,
+    *,
+    function_name: str | None = None,
+    path: str | None = None,
+) -> spec.FunctionABI | None:
+    """get full function abi of selector from abi registry if unambiguous
+
+    only abis from contract abis are considered, since 4byte signatures lack
+    outputs. returns None if candidates differ in signature or outputs
+    """
+
+    import json
+
+    registry = load_abi_registry(path)
+    if registry is None:
+        return None
+    key = binary_utils.binary_convert(function_selector, 'binary')
+    candidates: list[spec.FunctionABI] = [
+        entry
+        for entry in _get_registry_entries(registry['functions'], key)
+        if not isinstance(entry, str)
+        and (function_name is None or entry.get('name') == function_name)
+    ]
+    if len(candidates) == 0:
+        return None
+    variants = {
+        json.dumps(
+            [
+                function_abi_parsing.get_function_signature(candidate),
+                function_abi_parsing.get_function_output_types(candidate),
+            ]
+        )
+        for candidate in candidates
+    }
+    if len(variants) > 1:
+        return None
+    return candidates[0]
+
+
+def get_registry_event_abi(
+    event_hash: str,
+    *,
+    event_name: str | None = None,
+    n_indexed: int | None = None,
+    path: str | None = None,
+) -> spec.EventABI | None:
+    """get full event abi of event hash from abi registry if unambiguous
+
+    if n_indexed is given, candidates are filtered by their number of indexed
+    inputs and 4byte signatures are included, see get_event_abi_candidates().
+    returns None if candidates differ in which inputs are indexed
+    """
+
+    import json
+
+    candidates = [
+        candidate
+        for candidate in get_event_abi_candidates(
+            event_hash, n_indexed=n_indexed, path=path
+        )
+        if event_name is None or candidate.get('name') == event_name
+    ]
+    if len(candidates) == 0:
+        return None
+    variants = {
+        json.dumps(
+            [
+                event_abi_parsing.get_event_signature(candidate),
+                [bool(arg.get('indexed')) for arg in candidate['inputs']],
+            ]
+        )
+        for candidate in candidates
+    }
+    if len(variants) > 1:
+        return None
+    return candidates[0]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing
+
 from ctc import spec
 
 from ... import contract_utils
@@ -77,3 +79,49 @@ async def async_get_contract_abi(
 
     return abi
 
+
+async def async_get_contracts_abis(
+    contract_addresses: typing.Sequence[spec.Address],
+    *,
+    verbose: bool = True,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, spec.ContractABI]:
+    """retrieve abis of multiple contracts from local database or explorer
+
+    cached abis are loaded in a single query and missing abis are fetched
+    concurrently, addresses whose abi cannot be obtained are omitted
+    """
+    import asyncio
+    from ctc import config
+
+    unique_addresses = list(dict.fromkeys(contract_addresses))
+
+    # load from db
+    abis: dict[spec.Address, spec.ContractABI] = {}
+    read_cache, write_cache = config.get_context_cache_read_write(
+        context=context, schema_name='contract_abis'
+    )
+    if read_cache:
+        from ctc import db
+
+        db_abis = await db.async_query_contract_abis(
+            addresses=unique_addresses,
+            context=context,
+        )
+        if db_abis is not None:
+            abis.update(db_abis)
+
+    # load missing abis from block explorer
+    missing = [address for address in unique_addresses if address not in abis]
+    results = await asyncio.gather(
+        *[
+            async_get_contract_abi(address, verbose=verbose, context=context)
+            for address in missing
+        ],
+        return_exceptions=True,
+    )
+    for address, result in zip(missing, results):
+        if not isinstance(result, BaseException):
+            abis[address] = result
+
+    return abis
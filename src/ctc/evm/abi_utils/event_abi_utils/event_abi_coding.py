@@ -5,6 +5,7 @@ import typing
 from ctc import spec
 from ... import binary_utils
 from .. import abi_coding_utils
+from .. import abi_compilation
 from . import event_abi_parsing
 
 
@@ -58,7 +59,8 @@ def decode_event_topics(
     if indexed_types is None:
         if event_abi is None:
             raise Exception('must specify event_abi')
-        indexed_types = event_abi_parsing.get_event_indexed_types(event_abi)
+        compiled = abi_compilation.compile_event_abi(event_abi)
+        indexed_types = list(compiled['schema']['indexed_types'])
 
     # decode
     decoded_topics: list[str] = []
@@ -136,7 +138,8 @@ def decode_event_unindexed_data(
     if unindexed_types is None:
         if event_abi is None:
             raise Exception('must specify event_abi')
-        unindexed_types = event_abi_parsing.get_event_unindexed_types(event_abi)
+        compiled = abi_compilation.compile_event_abi(event_abi)
+        unindexed_types = list(compiled['schema']['unindexed_types'])
 
     # decode data
     data = binary_utils.to_binary(data)
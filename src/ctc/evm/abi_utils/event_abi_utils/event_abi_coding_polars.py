@@ -4,6 +4,8 @@ import typing
 
 from ctc import spec
 from .. import abi_coding_utils
+from .. import abi_compilation
+from .. import contract_abi_utils
 from . import event_abi_parsing
 from . import event_abi_queries
 
@@ -65,6 +67,14 @@ async def async_decode_events_dataframe(
         integer_output_format=integer_output_format,
     )
 
+    # gather compiled decoders of unindexed data
+    unindexed_decoders = {
+        event_hash: abi_compilation.compile_event_abi(event_abi)[
+            'unindexed_decoder'
+        ]
+        for event_hash, event_abi in event_abis.items()
+    }
+
     # create iterators for relevant columns
     n_decode_topics = max(
         len(event_schema['indexed_types'])
@@ -144,6 +154,11 @@ async def async_decode_events_dataframe(
                     convert_invalid_str_to_none=convert_invalid_str_to_none,
                 )
                 unindexed_decoded = [result]
+            elif isinstance(unindexed[e], bytes) and len(unindexed[e]) >= 64:
+                unindexed_decoder = unindexed_decoders[event_hash]
+                if unindexed_decoder is None:
+                    raise Exception('unindexed decoder not set')
+                unindexed_decoded = unindexed_decoder(unindexed[e])
             else:
                 unindexed_decoded = abi_coding_utils.abi_decode(
                     unindexed[e],
@@ -192,22 +207,30 @@ def _create_event_arg_schema(
 ]:
     """does not take binary_output_format into account, that happens later"""
 
-    # format event_abi's as dict
-    if not isinstance(event_abis, dict):
-        if isinstance(event_abis, (list, tuple)):
-            event_abis = {
-                event_abi_parsing.get_event_hash(event_abi): event_abi
-                for event_abi in event_abis
-            }
-        elif event_abis is None:
-            event_abis = {}
-        else:
-            raise Exception('unknown events format')
+    # compile event abi's
+    if isinstance(event_abis, dict):
+        compiled_abis = {
+            event_hash: abi_compilation.compile_event_abi(event_abi)
+            for event_hash, event_abi in event_abis.items()
+        }
+    elif isinstance(event_abis, (list, tuple)):
+        compiled_abis = {}
+        for event_abi in event_abis:
+            compiled = abi_compilation.compile_event_abi(event_abi)
+            compiled_abis[compiled['event_hash']] = compiled
+    elif event_abis is None:
+        compiled_abis = {}
+    else:
+        raise Exception('unknown events format')
+    event_abis = {
+        event_hash: compiled['event_abi']
+        for event_hash, compiled in compiled_abis.items()
+    }
 
     # get event schemas
     event_schemas: typing.Mapping[str, spec.EventSchema] = {
-        event_hash: event_abi_parsing.get_event_schema(event_abi)
-        for event_hash, event_abi in event_abis.items()
+        event_hash: compiled['schema']
+        for event_hash, compiled in compiled_abis.items()
     }
 
     # get column prefix
@@ -251,12 +274,31 @@ def _create_event_arg_schema(
             )
         else:
             used_column_prefix = column_prefix.format(event_hash=event_hash)
-        for abi_type, name in zip(event_schema['types'], event_schema['names']):
-            pl_type = _abi_type_to_polars_dtype(
-                abi_type=abi_type,
-                name=name,
-                integer_output_format=integer_output_format,
-            )
+        # default dtypes are cached in compiled abi
+        compiled = compiled_abis[event_hash]
+        if integer_output_format is None:
+            polars_dtypes = compiled['polars_dtypes']
+            if polars_dtypes is None:
+                polars_dtypes = [
+                    _abi_type_to_polars_dtype(abi_type=abi_type, name=name)
+                    for abi_type, name in zip(
+                        event_schema['types'], event_schema['names']
+                    )
+                ]
+                compiled['polars_dtypes'] = polars_dtypes
+            pl_types = polars_dtypes
+        else:
+            pl_types = [
+                _abi_type_to_polars_dtype(
+                    abi_type=abi_type,
+                    name=name,
+                    integer_output_format=integer_output_format,
+                )
+                for abi_type, name in zip(
+                    event_schema['types'], event_schema['names']
+                )
+            ]
+        for pl_type, name in zip(pl_types, event_schema['names']):
             name = used_column_prefix + name
             if name in used_names:
                 raise Exception('naming conflict ' + str(name))
@@ -279,7 +321,7 @@ async def _async_get_events_abis(
 
     # package input abi's
     if isinstance(event_abis, dict):
-        abis: typing.MutableMapping[str, spec.EventABI] = event_abis
+        abis: typing.MutableMapping[str, spec.EventABI] = dict(event_abis)
     elif event_abis is None:
         abis = {}
     elif isinstance(event_abis, list):
@@ -296,14 +338,37 @@ async def _async_get_events_abis(
     if len(missing_event_types) > 0:
         import asyncio
 
-        event_types = events.groupby('event_hash').agg(
-            pl.col('contract_address').unique()
+        # number of indexed inputs is the number of non-null topics
+        has_topics = [
+            pl.col(topic).is_not_null().first()
+            for topic in ['topic1', 'topic2', 'topic3']
+            if topic in events.columns
+        ]
+        event_types = (
+            events.filter(pl.col('event_hash').is_in(list(missing_event_types)))
+            .groupby('event_hash')
+            .agg(pl.col('contract_address').unique(), *has_topics)
+        )
+
+        # prefetch contract abis of candidate contracts concurrently
+        await contract_abi_utils.async_get_contracts_abis(
+            [
+                contract_addresses[0]
+                for event_hash, contract_addresses, *_ in event_types.rows()
+            ],
+            context=context,
         )
+
         coroutines = []
-        for event_hash, contract_addresses in event_types.rows():
+        for event_hash, contract_addresses, *topics in event_types.rows():
+            if len(topics) > 0:
+                n_indexed: int | None = sum(topics)
+            else:
+                n_indexed = None
             coroutine = event_abi_queries.async_get_event_abi(
                 event_hash=event_hash,
                 contract_addresses=contract_addresses,
+                n_indexed=n_indexed,
                 context=context,
             )
             coroutines.append(coroutine)
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 from ctc import spec
-from ... import binary_utils
 from .. import function_abi_utils
 
 
 def get_event_hash(event_data: spec.EventABI | str) -> str:
     """compute event hash from event signature or event abi"""
+    from .. import abi_compilation
+
     if isinstance(event_data, str):
-        signature = event_data
+        return abi_compilation.get_signature_hash(event_data)
     else:
-        signature = get_event_signature(event_abi=event_data)
-    return binary_utils.keccak_text(signature)
+        return abi_compilation.compile_event_abi(event_data)['event_hash']
 
 
 def get_event_signature(event_abi: spec.EventABI) -> str:
@@ -32,6 +32,36 @@ def get_event_signature(event_abi: spec.EventABI) -> str:
     return event_abi['name'] + '(' + inputs + ')'
 
 
+def event_signature_to_abi(
+    event_signature: str,
+    *,
+    n_indexed: int = 0,
+) -> spec.EventABI:
+    """return a partial ABI of event from just a signature
+
+    signatures do not specify which inputs are indexed, so the first n_indexed
+    inputs are marked as indexed. inputs are named arg0, arg1, ...
+    """
+    from ..function_abi_utils import function_abi_parsing
+
+    function_abi = function_abi_parsing.function_signature_to_abi(
+        event_signature
+    )
+    return {
+        'type': 'event',
+        'name': function_abi['name'],
+        'anonymous': False,
+        'inputs': [
+            {
+                'name': 'arg' + str(i),
+                'type': arg['type'],
+                'indexed': i < n_indexed,
+            }
+            for i, arg in enumerate(function_abi['inputs'])
+        ],
+    }
+
+
 def get_event_unindexed_types(
     event_abi: spec.EventABI,
 ) -> list[spec.ABIDatumType]:
@@ -65,16 +95,7 @@ def get_event_indexed_types(
 
 def get_event_schema(event_abi: spec.EventABI) -> spec.EventSchema:
     """return schema of types and names of event"""
-    indexed_names = get_event_indexed_names(event_abi)
-    indexed_types = get_event_indexed_types(event_abi)
-    unindexed_names = get_event_unindexed_names(event_abi)
-    unindexed_types = get_event_unindexed_types(event_abi)
-    return {
-        'indexed_names': indexed_names,
-        'indexed_types': indexed_types,
-        'unindexed_names': unindexed_names,
-        'unindexed_types': unindexed_types,
-        'names': indexed_names + unindexed_names,
-        'types': indexed_types + unindexed_types,
-    }
+    from .. import abi_compilation
+
+    return abi_compilation.compile_event_abi(event_abi)['schema']
 
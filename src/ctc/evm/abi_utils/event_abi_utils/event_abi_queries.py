@@ -52,9 +52,27 @@ async def async_get_event_abi(
     event_name: typing.Optional[str] = None,
     event_hash: typing.Optional[str] = None,
     event_abi: typing.Optional[spec.EventABI] = None,
+    n_indexed: int | None = None,
     context: spec.Context = None,
 ) -> spec.EventABI:
-    """get event ABI from local database or block explorer"""
+    """get event ABI from local database or block explorer
+
+    n_indexed is the number of indexed inputs of the event, used to select
+    among abi registry candidates when contract abis are unavailable
+    """
+
+    if event_abi is not None:
+        return event_abi
+
+    # check offline abi registry before fetching contract abi
+    if contract_abi is None and event_hash is not None:
+        from .. import abi_registry
+
+        registry_abi = abi_registry.get_registry_event_abi(
+            event_hash, event_name=event_name
+        )
+        if registry_abi is not None:
+            return registry_abi
 
     if contract_addresses is not None:
         for contract_address in contract_addresses:
@@ -65,11 +83,21 @@ async def async_get_event_abi(
                     event_name=event_name,
                     event_hash=event_hash,
                     event_abi=event_abi,
+                    n_indexed=n_indexed,
                     context=context,
                 )
             except Exception:
                 pass
         else:
+            # fall back to offline abi registry if it has a single match
+            if event_hash is not None:
+                from .. import abi_registry
+
+                registry_abi = abi_registry.get_registry_event_abi(
+                    event_hash, event_name=event_name, n_indexed=n_indexed
+                )
+                if registry_abi is not None:
+                    return registry_abi
             raise Exception('could not find event abi')
 
     # get contract abi
@@ -5,6 +5,7 @@ import typing
 from ctc import spec
 from ... import binary_utils
 from .. import abi_coding_utils
+from .. import abi_compilation
 from . import function_abi_parsing
 from . import function_abi_queries
 
@@ -51,6 +52,153 @@ def encode_call_data(
     return function_selector + encoded_parameters
 
 
+def batch_encode_call_data(
+    parameter_list: typing.Sequence[_Parameters],
+    *,
+    function_abi: spec.FunctionABI,
+) -> list[str]:
+    """encode call data of a function for each of many sets of parameters
+
+    if all inputs are static value types, call data is encoded one column of
+    parameters at a time, otherwise each call is encoded separately
+    """
+
+    compiled = abi_compilation.compile_function_abi(function_abi)
+    input_types = compiled['input_types']
+    column_encoders = [
+        _get_column_hex_encoder(input_type) for input_type in input_types
+    ]
+    if any(column_encoder is None for column_encoder in column_encoders):
+        return [
+            encode_call_data(parameters=parameters, function_abi=function_abi)
+            for parameters in parameter_list
+        ]
+
+    # convert parameter dicts to lists
+    if any(not isinstance(item, (list, tuple)) for item in parameter_list):
+        parameter_names = function_abi_parsing.get_function_parameter_names(
+            function_abi=function_abi,
+            require_names=True,
+        )
+        parameter_list = [
+            [parameters[name] for name in parameter_names]
+            if isinstance(parameters, typing.Mapping)
+            else parameters
+            for parameters in parameter_list
+        ]
+
+    n_inputs = len(input_types)
+    if any(len(parameters) != n_inputs for parameters in parameter_list):
+        raise Exception(
+            'improper number of arguments for function, cannot encode'
+        )
+
+    # encode each column of parameters then join columns into call data
+    prefix = '0x' + compiled['selector']
+    if n_inputs == 0:
+        return [prefix] * len(parameter_list)
+    columns = []
+    for i, column_encoder in enumerate(column_encoders):
+        column = [
+            parameters[i] for parameters in parameter_list  # type: ignore
+        ]
+        columns.append(column_encoder(column))  # type: ignore
+    if n_inputs == 1:
+        return [prefix + word for word in columns[0]]
+    else:
+        return [prefix + ''.join(words) for words in zip(*columns)]
+
+
+def _get_column_hex_encoder(
+    abi_type: spec.ABIDatumType,
+) -> typing.Callable[[typing.Sequence[typing.Any]], list[str]] | None:
+    """get encoder of a column of values into 32 byte hex words
+
+    returns None if type is not a static value type
+    """
+
+    if abi_type == 'address':
+        return _encode_address_column
+    elif abi_type == 'bool':
+        return _encode_bool_column
+    elif abi_type.startswith('uint') and abi_type[4:].isdigit():
+        bound = 2 ** int(abi_type[4:])
+
+        def encode_uint_column(
+            values: typing.Sequence[typing.Any],
+        ) -> list[str]:
+            if len(values) > 0 and (min(values) < 0 or max(values) >= bound):
+                raise Exception('value out of bounds for ' + abi_type)
+            return [format(value, '064x') for value in values]
+
+        return encode_uint_column
+
+    elif abi_type.startswith('int') and abi_type[3:].isdigit():
+        signed_bound = 2 ** (int(abi_type[3:]) - 1)
+        modulus = 2**256
+
+        def encode_int_column(
+            values: typing.Sequence[typing.Any],
+        ) -> list[str]:
+            if len(values) > 0 and (
+                min(values) < -signed_bound or max(values) >= signed_bound
+            ):
+                raise Exception('value out of bounds for ' + abi_type)
+            return [format(value % modulus, '064x') for value in values]
+
+        return encode_int_column
+
+    elif abi_type.startswith('bytes') and abi_type[5:].isdigit():
+        n_bytes = int(abi_type[5:])
+
+        def encode_bytes_column(
+            values: typing.Sequence[typing.Any],
+        ) -> list[str]:
+            words = [
+                binary_utils.to_hex(value, prefix=False)
+                for value in values
+            ]
+            if any(len(word) > 2 * n_bytes for word in words):
+                raise Exception('value too long for ' + abi_type)
+            return [word.ljust(64, '0') for word in words]
+
+        return encode_bytes_column
+
+    else:
+        return None
+
+
+def _encode_address_column(values: typing.Sequence[typing.Any]) -> list[str]:
+    words = [
+        '000000000000000000000000' + value[2:].lower()
+        if isinstance(value, str) and value.startswith('0x')
+        else '000000000000000000000000' + binary_utils.to_hex(value)[2:]
+        for value in values
+    ]
+
+    if any(len(word) != 64 for word in words):
+        raise Exception('invalid address length')
+
+    # validate hex digits of all addresses in a single pass
+    try:
+        bytes.fromhex(''.join(words))
+    except ValueError:
+        raise Exception('invalid address, must be hex')
+
+    return words
+
+
+def _encode_bool_column(values: typing.Sequence[typing.Any]) -> list[str]:
+    if any(not isinstance(value, bool) for value in values):
+        raise Exception('bool values must be of type bool')
+    return [
+        '0000000000000000000000000000000000000000000000000000000000000001'
+        if value
+        else '0000000000000000000000000000000000000000000000000000000000000000'
+        for value in values
+    ]
+
+
 def decode_call_data(
     call_data: spec.BinaryData,
     function_abi: typing.Optional[spec.FunctionABI] = None,
@@ -74,9 +222,8 @@ def decode_call_data(
 
     # decode parameters
     encoded_parameters = call_data_bytes[4:]
-    parameter_types = function_abi_parsing.get_function_parameter_types(
-        function_abi
-    )
+    compiled = abi_compilation.compile_function_abi(function_abi)
+    parameter_types = list(compiled['input_types'])
     decoded_parameters = decode_function_parameters(
         encoded_parameters, parameter_types
     )
@@ -122,10 +269,15 @@ def encode_function_parameters(
 
     # get parameter types
     if parameter_types is None:
-        parameter_types = function_abi_parsing.get_function_parameter_types(
-            function_signature=function_signature,
-            function_abi=function_abi,
-        )
+        if function_abi is not None:
+            compiled = abi_compilation.compile_function_abi(function_abi)
+            parameter_types = compiled['input_types']
+        else:
+            parameter_types = (
+                function_abi_parsing.get_function_parameter_types(
+                    function_signature=function_signature,
+                )
+            )
 
     # convert parameter dict to list
     if isinstance(parameters, typing.Mapping):
@@ -222,9 +374,8 @@ def decode_function_output(
     if output_types is None:
         if function_abi is None:
             raise Exception('must specify function_abi')
-        output_types = function_abi_parsing.get_function_output_types(
-            function_abi
-        )
+        compiled = abi_compilation.compile_function_abi(function_abi)
+        output_types = list(compiled['output_types'])
     output_types_str = '(' + ','.join(output_types) + ')'
 
     # decode
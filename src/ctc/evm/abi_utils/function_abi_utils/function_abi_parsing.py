@@ -3,7 +3,6 @@ from __future__ import annotations
 import typing
 
 from ctc import spec
-from ... import binary_utils
 from . import function_abi_queries
 
 
@@ -12,9 +11,9 @@ def function_signature_to_abi(function_signature: str) -> spec.FunctionABI:
 
     will be missing input parameter names and information about outputs
     """
-    function_name, tail = function_signature.split('(')
-    parameters, _ = tail.split(')')
-    parameter_types = parameters.split(',')
+    function_name, tail = function_signature.split('(', 1)
+    parameters = tail[: tail.rindex(')')]
+    parameter_types = _split_signature_types(parameters)
 
     return {
         'type': 'function',
@@ -26,6 +25,24 @@ def function_signature_to_abi(function_signature: str) -> spec.FunctionABI:
     }
 
 
+def _split_signature_types(parameters: str) -> list[str]:
+    """split comma-separated types of a signature, respecting tuple types"""
+    types = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(parameters):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            types.append(parameters[start:i])
+            start = i + 1
+    if parameters != '':
+        types.append(parameters[start:])
+    return types
+
+
 async def async_parse_function_str_abi(
     function: str,
     contract_address: spec.Address | None = None,
@@ -207,15 +224,14 @@ def get_function_selector(
     else:
         raise Exception('unknown funciton format: ' + str(type(function)))
 
+    from .. import abi_compilation
+
     if function_signature is None:
         if function_abi is None:
             raise Exception('must specify function_abi or function_signature')
-        function_signature = get_function_signature(function_abi)
+        return abi_compilation.compile_function_abi(function_abi)['selector']
 
-    full_hash = binary_utils.keccak(
-        function_signature.encode(), output_format='raw_hex'
-    )
-    return full_hash[:8]
+    return abi_compilation.get_signature_hash(function_signature)[2:10]
 
 
 def is_function_selector(selector: typing.Any) -> bool:
@@ -107,6 +107,26 @@ async def async_get_function_abi(
     if contract_abi is None:
         if contract_address is None:
             raise Exception('must specify contract_abi or contract_address')
+
+        # check offline abi registry before fetching contract abi
+        if function_selector is not None:
+            from .. import abi_registry
+
+            registry_abi = abi_registry.get_registry_function_abi(
+                function_selector, function_name=function_name
+            )
+            if registry_abi is not None:
+                try:
+                    return get_function_abi(
+                        function_name=function_name,
+                        contract_abi=[registry_abi],
+                        n_parameters=n_parameters,
+                        parameter_types=parameter_types,
+                        function_selector=function_selector,
+                    )
+                except LookupError:
+                    pass
+
         contract_abi = await contract_abi_utils.async_get_contract_abi(
             contract_address=contract_address,
             context=context,
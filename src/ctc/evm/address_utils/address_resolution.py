@@ -93,18 +93,20 @@ async def async_resolve_address_by_block(
 ) -> typing.Sequence[str]:
     """return resolution history of address over multiple blocks"""
 
-    import asyncio
+    if not (
+        isinstance(name_or_address, str)
+        and len(name_or_address) > 4
+        and name_or_address.endswith('.eth')
+    ):
+        return [name_or_address] * len(blocks)
 
-    coroutines = [
-        async_resolve_address(
-            name_or_address=name_or_address,
-            block=block,
-            context=context,
-        )
-        for block in blocks
-    ]
+    from ctc.protocols import ens_utils
 
-    results = await asyncio.gather(*coroutines)
+    results = await ens_utils.async_resolve_name_by_block(
+        name=name_or_address,
+        blocks=blocks,
+        context=context,
+    )
 
     return [
         (result if result is not None else name_or_address)
@@ -186,15 +186,12 @@ async def _async_get_block_range_transaction_counts(
         min(nary + 1, n_unknown_blocks + 2),
     )[1:-1].astype(int)
 
-    coroutines = [
-        rpc.async_eth_get_transaction_count(
-            from_address=address,
-            block_number=block,
-            context=context,
-        )
-        for block in blocks
-    ]
-    counts = await asyncio.gather(*coroutines)
+    counts = await rpc.async_sample_by_block(
+        'eth_get_transaction_count',
+        [int(block) for block in blocks],
+        from_address=address,
+        context=context,
+    )
     for block, count in zip(blocks, counts):
         block_counts[block] = count
 
@@ -11,7 +11,6 @@ from __future__ import annotations
 import typing
 
 from ctc import spec
-from ... import abi_utils
 from .. import format_utils
 from .. import hash_utils
 from . import signature_creation
@@ -128,6 +127,8 @@ def _encode_struct_data(
 def _encode_datum(value: typing.Any, type: spec.ABIDatatypeStr) -> bytes:
     """encode scalar datum for use with EIP-712"""
 
+    from ... import abi_utils
+
     if '[' in type:
         # array
         scalar_type = type[: type.index('[')]
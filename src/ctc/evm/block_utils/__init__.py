@@ -1,6 +1,7 @@
 from .block_coding import *
 from .block_convert import *
 from .block_crud import *
+from .block_heads import *
 from .block_gas import *
 from .block_hashes import *
 from .block_normalize import *
@@ -6,6 +6,7 @@ import typing
 from ctc import evm
 from ctc import spec
 from . import block_convert
+from . import block_heads
 
 if typing.TYPE_CHECKING:
     import asyncio
@@ -90,8 +91,12 @@ async def async_get_blocks(
 ) -> typing.Sequence[spec.DBBlock]:
     """get blocks from local database or from RPC node"""
 
+    from ctc import config
     from ctc import rpc
 
+    # resolve context once for all downstream config and provider lookups
+    context = config.resolve_context(context)
+
     if all(spec.is_block_number_reference(block) for block in blocks):
         return await _async_get_blocks_by_numbers(
             blocks=blocks,
@@ -176,9 +181,9 @@ async def _async_get_blocks_by_numbers(
 #
 
 _latest_block_cache: typing.MutableMapping[int, LatestBlockCacheEntry] = {}
-_latest_block_lock: typing.MutableMapping[str, asyncio.Lock | None] = {
-    'lock': None
-}
+_latest_block_requests: typing.MutableMapping[
+    int, asyncio.Future[LatestBlockCacheEntry]
+] = {}
 
 
 async def async_get_latest_block_number(
@@ -189,52 +194,67 @@ async def async_get_latest_block_number(
 ) -> int:
     """get latest block number
 
-    uses a per-network in-memory cache with a ttl of cache_time
+    if a head tracker is running for the provider, its head is returned
+    otherwise uses a per-network in-memory cache with a ttl of cache_time,
+    where concurrent cache misses share a single in-flight request
     """
 
+    import asyncio
     from ctc import config
-    from ctc import rpc
 
     if not use_cache:
-        result = await rpc.async_eth_block_number(context=context)
-        if not isinstance(result, int):
-            raise Exception('invalid rpc result')
-        return result
-
-    else:
-
-        # must initialize asyncio.Lock within a running event loop
-        # see https://stackoverflow.com/a/55918049
-        lock = _latest_block_lock['lock']
-        if lock is None:
-            import asyncio
-
-            lock = asyncio.Lock()
-            _latest_block_lock['lock'] = lock
+        return await _async_fetch_latest_block_number(context=context)
+
+    head = block_heads.get_tracked_head(context=context)
+    if head is not None:
+        return head.block_number
+
+    network = config.get_context_chain_id(context)
+    network_cache = _latest_block_cache.get(network)
+    if (
+        network_cache is not None
+        and time.time() - network_cache['request_time'] < cache_time
+    ):
+        return network_cache['block_number']
+
+    # share in-flight request among concurrent callers
+    request = _latest_block_requests.get(network)
+    if request is not None and not request.done():
+        entry = await asyncio.shield(request)
+        return entry['block_number']
+
+    request = asyncio.ensure_future(
+        _async_fetch_latest_block_entry(context=context)
+    )
+    _latest_block_requests[network] = request
+    try:
+        entry = await asyncio.shield(request)
+    finally:
+        if _latest_block_requests.get(network) is request:
+            del _latest_block_requests[network]
+    _latest_block_cache[network] = entry
+    return entry['block_number']
 
-        async with lock:
 
-            network = config.get_context_chain_id(context)
-            request_time = time.time()
-            network_cache = _latest_block_cache.get(network)
-            if (
-                network_cache is not None
-                and request_time - network_cache['request_time'] < cache_time
-            ):
-                return network_cache['block_number']
+async def _async_fetch_latest_block_number(*, context: spec.Context) -> int:
+    from ctc import rpc
 
-            result = await rpc.async_eth_block_number(context=context)
-            if not isinstance(result, int):
-                raise Exception('invalid rpc result')
+    result = await rpc.async_eth_block_number(context=context)
+    if not isinstance(result, int):
+        raise Exception('invalid rpc result')
+    return result
 
-            response_time = time.time()
-            _latest_block_cache[network] = {
-                'request_time': request_time,
-                'response_time': response_time,
-                'block_number': result,
-            }
 
-            return result
+async def _async_fetch_latest_block_entry(
+    *, context: spec.Context
+) -> LatestBlockCacheEntry:
+    request_time = time.time()
+    block_number = await _async_fetch_latest_block_number(context=context)
+    return {
+        'request_time': request_time,
+        'response_time': time.time(),
+        'block_number': block_number,
+    }
 
 
 def sync_get_latest_block_number(
@@ -244,10 +264,32 @@ def sync_get_latest_block_number(
     cache_time: int | float = 1,
 ) -> int:
     """get latest block number"""
+    from ctc import config
     from ctc import rpc
 
+    if use_cache:
+        head = block_heads.get_tracked_head(context=context)
+        if head is not None:
+            return head.block_number
+
+        network = config.get_context_chain_id(context)
+        network_cache = _latest_block_cache.get(network)
+        if (
+            network_cache is not None
+            and time.time() - network_cache['request_time'] < cache_time
+        ):
+            return network_cache['block_number']
+
+    request_time = time.time()
     result = rpc.sync_eth_block_number(context=context)
     if not isinstance(result, int):
         raise Exception('invalid rpc result')
-    return result
 
+    if use_cache:
+        _latest_block_cache[network] = {
+            'request_time': request_time,
+            'response_time': time.time(),
+            'block_number': result,
+        }
+
+    return result
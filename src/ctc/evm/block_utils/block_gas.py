@@ -91,7 +91,7 @@ async def async_get_median_blocks_gas_fees(
 
     from ctc import config
 
-    blocks = await evm.async_block_numbers_to_int(blocks)
+    blocks = await evm.async_block_numbers_to_int(blocks, context=context)
 
     # get data from db
     read_cache, write_cache = config.get_context_cache_read_write(
@@ -115,8 +115,9 @@ async def async_get_median_blocks_gas_fees(
                     missing.append(block)
     else:
         fee_map = {}
+        missing = blocks
 
-    # get data from rpc
+    # compute missing data from node
     if len(missing) > 0:
         if verbose:
             import toolstr
@@ -132,34 +133,18 @@ async def async_get_median_blocks_gas_fees(
             )
             print()
 
-        from ctc import config
-
-        context = config.update_context(
-            context, merge_provider={'chunk_size': 1}
-        )
-
-        # get txs by block
-        txs = await transaction_utils.async_get_blocks_transactions(
+        df = await async_get_blocks_gas_stats(
             blocks=missing,
+            normalize=False,
             context=context,
         )
-        blocks_timestamps = await block_times.async_get_block_timestamps(
-            blocks=blocks, context=context
-        )
-        txs_by_block: dict[int, list[spec.DBTransaction]] = {}
-        for tx in txs:
-            block = tx['block_number']
-            txs_by_block.setdefault(block, [])
-            txs_by_block[block].append(tx)
-
-        for block, timestamp in zip(missing, blocks_timestamps):
-            fee = compute_transactions_median_gas_fee(
-                txs_by_block[block], normalize=normalize
-            )
-            fee_map[block] = {
-                'block_number': block,
-                'median_gas_fee': fee,
-                'timestamp': timestamp,
+        for row in df.select(
+            ['block_number', 'timestamp', 'median_gas_price']
+        ).to_dicts():
+            fee_map[row['block_number']] = {
+                'block_number': row['block_number'],
+                'median_gas_fee': row['median_gas_price'],
+                'timestamp': row['timestamp'],
             }
 
     if normalize:
@@ -200,28 +185,225 @@ async def async_get_gas_stats_by_block(
 ) -> list[BlockGasStats]:
     """get block gas usage statistics of multiple blocks"""
 
-    # get txs of blocks
+    df = await async_get_blocks_gas_stats(
+        blocks=blocks,
+        normalize=normalize,
+        context=context,
+    )
+    stats_by_block = {row['block_number']: row for row in df.to_dicts()}
+
     int_blocks = await block_normalize.async_block_numbers_to_int(
         blocks=blocks, context=context
     )
-    txs = await transaction_utils.async_get_blocks_transactions(
-        blocks=int_blocks, context=context
+    return [
+        {
+            'min_gas_price': stats_by_block[int_block]['min_gas_price'],
+            'median_gas_price': stats_by_block[int_block]['median_gas_price'],
+            'mean_gas_price': stats_by_block[int_block]['mean_gas_price'],
+            'max_gas_price': stats_by_block[int_block]['max_gas_price'],
+            'n_transactions': stats_by_block[int_block]['n_transactions'],
+        }
+        for int_block in int_blocks
+    ]
+
+
+#
+# # bulk gas stats
+#
+
+
+async def async_get_blocks_gas_stats(
+    blocks: typing.Sequence[spec.BlockNumberReference] | None = None,
+    *,
+    start_block: spec.BlockNumberReference | None = None,
+    end_block: spec.BlockNumberReference | None = None,
+    normalize: bool = True,
+    chunk_size: int = 100,
+    context: spec.Context = None,
+) -> spec.DataFrame:
+    """get gas statistics of many blocks as a DataFrame with one row per block
+
+    stats are read from the block_gas schema where available, and only the
+    missing blocks are fetched from node and computed
+    """
+
+    import polars as pl
+    from ctc import config
+    from ctc import db
+    from ctc import rpc
+
+    # get block numbers
+    if blocks is not None:
+        if start_block is not None or end_block is not None:
+            raise Exception('cannot specify both blocks and start/end blocks')
+        block_numbers = await block_normalize.async_block_numbers_to_int(
+            blocks=blocks, context=context
+        )
+    else:
+        if start_block is None or end_block is None:
+            raise Exception('must specify blocks or start_block and end_block')
+        start_and_end = await block_normalize.async_block_numbers_to_int(
+            blocks=[start_block, end_block], context=context
+        )
+        block_numbers = list(range(start_and_end[0], start_and_end[1] + 1))
+    block_numbers = sorted(set(block_numbers))
+
+    # get stats from db
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='block_gas', context=context
     )
+    cached: typing.Sequence[db.BlockGasStatsRow] = []
+    if read_cache and len(block_numbers) > 0:
+        if blocks is None:
+            result = await db.async_query_blocks_gas_stats(
+                start_block=block_numbers[0],
+                end_block=block_numbers[-1],
+                context=context,
+            )
+        else:
+            result = await db.async_query_blocks_gas_stats(
+                block_numbers=block_numbers,
+                context=context,
+            )
+        if result is not None:
+            cached = result
+    cached_blocks = {row['block_number'] for row in cached}
+    missing = [block for block in block_numbers if block not in cached_blocks]
+
+    # compute missing stats from node, one chunk of blocks at a time
+    schema = _get_gas_stats_schema()
+    dfs = []
+    if len(cached) > 0:
+        dfs.append(pl.DataFrame(cached, schema=schema))
+    if len(missing) > 0:
+        if write_cache:
+            latest_block: int | None = await evm.async_get_latest_block_number(
+                context=context
+            )
+        else:
+            latest_block = None
+        block_context = config.update_context(
+            context, merge_provider={'chunk_size': 1}
+        )
+        for c in range(0, len(missing), chunk_size):
+            rpc_blocks = await rpc.async_batch_eth_get_block_by_number(
+                block_numbers=missing[c : c + chunk_size],
+                include_full_transactions=True,
+                context=block_context,
+            )
+            chunk_df = compute_blocks_gas_stats(rpc_blocks)
+            if write_cache:
+                await db.async_intake_blocks_gas_stats(
+                    chunk_df.to_dicts(),  # type: ignore
+                    latest_block=latest_block,
+                    context=context,
+                )
+            dfs.append(chunk_df)
 
-    # sort txs by block
-    txs_by_block: dict[int, list[spec.DBTransaction]] = {}
-    for tx in txs:
-        block = tx['block_number']
-        txs_by_block.setdefault(block, [])
-        txs_by_block[block].append(tx)
+    if len(dfs) == 0:
+        return pl.DataFrame(schema=schema)
+    df = pl.concat(dfs).sort('block_number')
 
-    # compute stats per block
-    return [
-        compute_transactions_gas_stats(
-            txs_by_block[int_block], normalize=normalize
+    if normalize:
+        df = df.with_columns(
+            [
+                pl.col(column) / 1e9
+                for column in schema
+                if column.endswith('_gas_price') or column == 'base_fee'
+            ]
         )
-        for int_block in int_blocks
-    ]
+
+    return df
+
+
+def _get_gas_stats_schema() -> typing.Mapping[str, typing.Any]:
+    import polars as pl
+
+    return {
+        'block_number': pl.Int64,
+        'timestamp': pl.Int64,
+        'base_fee': pl.Float64,
+        'min_gas_price': pl.Float64,
+        'p5_gas_price': pl.Float64,
+        'p25_gas_price': pl.Float64,
+        'median_gas_price': pl.Float64,
+        'p75_gas_price': pl.Float64,
+        'p95_gas_price': pl.Float64,
+        'max_gas_price': pl.Float64,
+        'mean_gas_price': pl.Float64,
+        'gas_used': pl.Int64,
+        'gas_limit': pl.Int64,
+        'n_transactions': pl.Int64,
+    }
+
+
+def compute_blocks_gas_stats(
+    rpc_blocks: typing.Sequence[spec.RPCBlock],
+) -> spec.DataFrame:
+    """compute gas statistics of blocks fetched with full transactions
+
+    gas prices of included transactions are their effective gas prices, so no
+    receipts are needed. all blocks are aggregated at once by a group_by over
+    block_number. blocks without transactions have null price statistics.
+    """
+
+    import polars as pl
+
+    # gather columnar data
+    tx_block_numbers: list[int] = []
+    tx_gas_prices: list[int] = []
+    for rpc_block in rpc_blocks:
+        transactions = rpc_block['transactions']
+        if len(transactions) > 0 and not isinstance(transactions[0], dict):
+            raise Exception(
+                'must use a block with include_full_transactions=True'
+            )
+        tx_block_numbers.extend([rpc_block['number']] * len(transactions))
+        for tx in transactions:
+            tx_gas_prices.append(tx['gas_price'])  # type: ignore
+    txs = pl.DataFrame(
+        {'block_number': tx_block_numbers, 'gas_price': tx_gas_prices},
+        schema={'block_number': pl.Int64, 'gas_price': pl.Float64},
+    )
+    blocks = pl.DataFrame(
+        {
+            'block_number': [block['number'] for block in rpc_blocks],
+            'timestamp': [block['timestamp'] for block in rpc_blocks],
+            'base_fee': [block.get('base_fee_per_gas') for block in rpc_blocks],
+            'gas_used': [block['gas_used'] for block in rpc_blocks],
+            'gas_limit': [block['gas_limit'] for block in rpc_blocks],
+        },
+        schema={
+            'block_number': pl.Int64,
+            'timestamp': pl.Int64,
+            'base_fee': pl.Float64,
+            'gas_used': pl.Int64,
+            'gas_limit': pl.Int64,
+        },
+    )
+
+    # aggregate transactions by block
+    gas_price = pl.col('gas_price')
+    stats = txs.groupby('block_number').agg(
+        [
+            gas_price.min().alias('min_gas_price'),
+            gas_price.quantile(0.05, 'linear').alias('p5_gas_price'),
+            gas_price.quantile(0.25, 'linear').alias('p25_gas_price'),
+            gas_price.median().alias('median_gas_price'),
+            gas_price.quantile(0.75, 'linear').alias('p75_gas_price'),
+            gas_price.quantile(0.95, 'linear').alias('p95_gas_price'),
+            gas_price.max().alias('max_gas_price'),
+            gas_price.mean().alias('mean_gas_price'),
+            pl.count().cast(pl.Int64).alias('n_transactions'),
+        ]
+    )
+
+    return (
+        blocks.join(stats, on='block_number', how='left')
+        .with_columns(pl.col('n_transactions').fill_null(0))
+        .select(list(_get_gas_stats_schema().keys()))
+        .sort('block_number')
+    )
 
 
 #
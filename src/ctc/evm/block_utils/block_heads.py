@@ -0,0 +1,245 @@
+"""track the head of the chain in a background task per provider
+
+the tracker long-polls eth_blockNumber in a single task and publishes each new
+head by replacing an immutable tuple, so readers never need to take a lock
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    import asyncio
+    from typing_extensions import TypedDict
+
+    class HeadTracker(TypedDict):
+        provider_url: str
+        head: BlockHead | None
+        poll_interval: float
+        new_head: asyncio.Event
+        task: asyncio.Task[None] | None
+        loop: asyncio.AbstractEventLoop
+        error: BaseException | None
+
+
+class BlockHead(typing.NamedTuple):
+    block_number: int
+    block_hash: str | None
+    update_time: float
+
+
+_head_trackers: typing.MutableMapping[str, HeadTracker] = {}
+
+# consecutive failed polls after which the tracker stops and raises to waiters
+_max_consecutive_failures = 5
+_max_backoff = 30.0
+
+
+def _get_provider_url(context: spec.Context) -> str:
+    from ctc import config
+
+    provider = config.get_context_provider(context)
+    if provider is None:
+        raise Exception('no provider available for context')
+    return provider['url']
+
+
+def _get_running_tracker(context: spec.Context) -> HeadTracker | None:
+    import asyncio
+
+    tracker = _head_trackers.get(_get_provider_url(context))
+    if tracker is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None and tracker['loop'] is not loop:
+        return None
+    task = tracker['task']
+    if task is None or task.done():
+        return None
+    return tracker
+
+
+def get_tracked_head(*, context: spec.Context = None) -> BlockHead | None:
+    """get most recent head published by the provider's head tracker
+
+    returns None if no head tracker is running for the provider
+    """
+    tracker = _head_trackers.get(_get_provider_url(context))
+    if tracker is None or tracker['loop'].is_closed():
+        return None
+    task = tracker['task']
+    if task is None or task.done():
+        return None
+    return tracker['head']
+
+
+def _publish_head(tracker: HeadTracker, head: BlockHead) -> None:
+    import asyncio
+
+    # swap in a fresh event before waking waiters so that waiters that
+    # re-await after waking block until the following head
+    tracker['head'] = head
+    new_head = tracker['new_head']
+    tracker['new_head'] = asyncio.Event()
+    new_head.set()
+
+
+async def async_start_head_tracker(
+    *,
+    context: spec.Context = None,
+    poll_interval: float = 1.0,
+) -> None:
+    """start background task that tracks the provider's latest block
+
+    does nothing if a tracker is already running for the provider
+    """
+    import asyncio
+
+    tracker = _get_running_tracker(context)
+    if tracker is not None:
+        tracker['poll_interval'] = poll_interval
+        return
+
+    provider_url = _get_provider_url(context)
+    new_tracker: HeadTracker = {
+        'provider_url': provider_url,
+        'head': None,
+        'poll_interval': poll_interval,
+        'new_head': asyncio.Event(),
+        'task': None,
+        'loop': asyncio.get_running_loop(),
+        'error': None,
+    }
+    _head_trackers[provider_url] = new_tracker
+    new_tracker['task'] = asyncio.create_task(
+        _async_run_head_tracker(new_tracker, context=context)
+    )
+
+
+async def async_stop_head_tracker(*, context: spec.Context = None) -> None:
+    """stop the provider's head tracker if it is running"""
+    import asyncio
+
+    tracker = _head_trackers.pop(_get_provider_url(context), None)
+    if tracker is None:
+        return
+    task = tracker['task']
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    tracker['new_head'].set()
+
+
+async def _async_run_head_tracker(
+    tracker: HeadTracker,
+    *,
+    context: spec.Context,
+) -> None:
+    """poll heads until cancelled, retrying failed polls with backoff
+
+    waiters only receive an error after several consecutive failed polls, at
+    which point the tracker stops without raising, since the error is raised
+    to waiters rather than by the task
+    """
+    import asyncio
+
+    failures = 0
+    while True:
+        try:
+            await _async_poll_head(tracker, context=context)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            failures += 1
+            if failures >= _max_consecutive_failures:
+                tracker['error'] = e
+                tracker['new_head'].set()
+                return
+            backoff = tracker['poll_interval'] * 2**failures
+            await asyncio.sleep(min(backoff, _max_backoff))
+        else:
+            failures = 0
+            await asyncio.sleep(tracker['poll_interval'])
+
+
+async def _async_poll_head(
+    tracker: HeadTracker,
+    *,
+    context: spec.Context,
+) -> None:
+    from ctc import rpc
+
+    block_number = await rpc.async_eth_block_number(context=context)
+    if not isinstance(block_number, int):
+        raise Exception('invalid rpc result')
+
+    head = tracker['head']
+    if head is None or block_number > head.block_number:
+        block = await rpc.async_eth_get_block_by_number(
+            block_number=block_number,
+            include_full_transactions=False,
+            context=context,
+        )
+        if block is not None:
+            block_hash = block['hash']
+            block_number = max(block_number, block['number'])
+        else:
+            block_hash = None
+        _publish_head(
+            tracker,
+            BlockHead(
+                block_number=block_number,
+                block_hash=block_hash,
+                update_time=time.time(),
+            ),
+        )
+    else:
+        tracker['head'] = head._replace(update_time=time.time())
+
+
+async def async_wait_for_next_block(
+    after: int | None = None,
+    *,
+    context: spec.Context = None,
+    timeout: float | None = None,
+) -> BlockHead:
+    """wait until the chain reaches a block beyond the given block
+
+    if after is None, waits for the next block beyond the current head
+    """
+    import asyncio
+
+    running_tracker = _get_running_tracker(context)
+    if running_tracker is None:
+        await async_start_head_tracker(context=context)
+        running_tracker = _get_running_tracker(context)
+        if running_tracker is None:
+            raise Exception('could not start head tracker')
+    tracker = running_tracker
+
+    async def wait() -> BlockHead:
+        nonlocal after
+        while True:
+            head = tracker['head']
+            if head is not None:
+                if after is None:
+                    after = head.block_number
+                elif head.block_number > after:
+                    return head
+            await tracker['new_head'].wait()
+            if tracker['error'] is not None:
+                raise tracker['error']
+            task = tracker['task']
+            if task is None or task.done():
+                raise Exception('head tracker stopped')
+
+    return await asyncio.wait_for(wait(), timeout=timeout)
@@ -1,6 +1,8 @@
 from .erc20_events import *
 from .erc20_generic import *
+from .erc20_ledger import *
 from .erc20_metadata import *
+from .erc20_metadata_cache import *
 from .erc20_normalize import *
 from .erc20_spec import *
 from .erc20_state import *
@@ -99,28 +99,33 @@ async def async_get_erc20_balances_from_transfers(
 ) -> spec.DataFrame:
     """compute ERC20 balance of each wallet using Transfer events"""
 
-    import polars as pl
+    from . import erc20_ledger
 
-    # filter block
     if block is not None:
-        transfers = transfers.filter(pl.col('block_number') <= block)
+        from .. import block_utils
+
+        block = await block_utils.async_block_number_to_int(
+            block, context=context
+        )
 
-    amount_key = _get_token_amount_column(transfers)
+    ledger = erc20_ledger.create_erc20_balance_ledger(
+        transfers, end_block=block
+    )
+    balances = erc20_ledger.get_erc20_balances_from_ledger(ledger, block=block)
 
-    # subtract transfers out from transfers in
-    from_transfers = transfers.groupby('arg__from').agg(pl.sum(amount_key))
-    to_transfers = transfers.groupby('arg__to').agg(pl.sum(amount_key))
-    balances: spec.DataFrame = to_transfers.sub(from_transfers, fill_value=0)  # type: ignore
+    if normalize and len(transfers) > 0:
+        import polars as pl
 
-    if normalize:
         decimals = await erc20_metadata.async_get_erc20_decimals(
             typing.cast(str, transfers['contract_address'][0]),
             context=context,
         )
-        balances /= 10**decimals
-
-    # sort
-    balances = balances.sort_values(ascending=False)  # type: ignore
+        balances = balances.with_columns(
+            pl.Series(
+                'balance',
+                [balance / 10**decimals for balance in balances['balance']],
+            )
+        )
 
     return balances
 
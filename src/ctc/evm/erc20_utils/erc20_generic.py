@@ -73,11 +73,13 @@ async def async_erc20_eth_call_by_block(
     address = await erc20_metadata.async_get_erc20_address(
         token, context=context
     )
-    return await rpc.async_batch_eth_call(
+    results: typing.Sequence[typing.Any] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=address,
         function_abi=erc20_spec.erc20_function_abis[function_name],
-        block_numbers=blocks,
         context=context,
         **rpc_kwargs,
     )
+    return results
 
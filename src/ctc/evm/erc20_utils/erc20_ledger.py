@@ -0,0 +1,331 @@
+"""replay ERC20 Transfer events into a per-holder balance ledger
+
+the ledger stores, for each holder, the blocks at which its balance changed
+and its balance after each of those blocks, as flat arrays sorted by
+(holder, block). balances at any block are then found via searchsorted.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+from . import erc20_events
+from . import erc20_metadata
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class ERC20BalanceLedger(TypedDict):
+        holders: spec.NumpyArray
+        offsets: spec.NumpyArray
+        block_numbers: spec.NumpyArray
+        balances: spec.NumpyArray
+        end_block: int
+
+
+_ledger_cache: typing.MutableMapping[
+    typing.Tuple[int, str, bool], ERC20BalanceLedger
+] = {}
+
+
+#
+# # ledger construction
+#
+
+
+def create_erc20_balance_ledger(
+    transfers: spec.DataFrame,
+    *,
+    end_block: int | None = None,
+) -> ERC20BalanceLedger:
+    """create balance ledger by replaying ERC20 Transfer events"""
+
+    import numpy as np
+
+    empty: ERC20BalanceLedger = {
+        'holders': np.array([], dtype=object),
+        'offsets': np.zeros(1, dtype=np.int64),
+        'block_numbers': np.array([], dtype=np.int64),
+        'balances': np.array([], dtype=object),
+        'end_block': -1,
+    }
+    return update_erc20_balance_ledger(empty, transfers, end_block=end_block)
+
+
+def update_erc20_balance_ledger(
+    ledger: ERC20BalanceLedger,
+    transfers: spec.DataFrame,
+    *,
+    end_block: int | None = None,
+) -> ERC20BalanceLedger:
+    """extend balance ledger with Transfer events after its end block
+
+    returns a new ledger, the input ledger is not modified
+    """
+
+    import numpy as np
+    import polars as pl
+
+    # select transfers not yet replayed
+    transfers = transfers.filter(pl.col('block_number') > ledger['end_block'])
+    if end_block is not None:
+        transfers = transfers.filter(pl.col('block_number') <= end_block)
+    if end_block is None:
+        if len(transfers) > 0:
+            end_block = int(transfers['block_number'].max())  # type: ignore
+        else:
+            end_block = ledger['end_block']
+    end_block = max(end_block, ledger['end_block'])
+    if len(transfers) == 0:
+        return dict(ledger, end_block=end_block)  # type: ignore
+
+    # each transfer is a debit of sender and a credit of receiver
+    amount_key = erc20_events._get_token_amount_column(transfers)
+    if transfers[amount_key].dtype in (pl.Float32, pl.Float64):
+        amounts = transfers[amount_key].to_numpy().astype(float)
+    else:
+        amounts = np.array(transfers[amount_key].to_list(), dtype=object)
+        if len(ledger['balances']) > 0 and ledger['balances'].dtype != object:
+            amounts = amounts.astype(float)
+    blocks = transfers['block_number'].to_numpy().astype(np.int64)
+    new_holders = np.array(
+        transfers['arg__from'].to_list() + transfers['arg__to'].to_list(),
+        dtype=object,
+    )
+    new_blocks = np.concatenate([blocks, blocks])
+    new_deltas = np.concatenate([-amounts, amounts])
+
+    # assign codes to holders
+    holders = np.unique(np.concatenate([ledger['holders'], new_holders]))
+    n_holders = len(holders)
+    old_holder_codes = np.searchsorted(holders, ledger['holders'])
+    old_row_codes = np.repeat(old_holder_codes, np.diff(ledger['offsets']))
+    new_row_codes = np.searchsorted(holders, new_holders)
+
+    # accumulate deltas within each holder
+    order = np.lexsort((new_blocks, new_row_codes))
+    new_row_codes = new_row_codes[order]
+    new_blocks = new_blocks[order]
+    new_deltas = new_deltas[order]
+    cumulative = np.cumsum(new_deltas)
+    is_start = np.ones(len(new_row_codes), dtype=bool)
+    is_start[1:] = new_row_codes[1:] != new_row_codes[:-1]
+    starts = np.flatnonzero(is_start)
+    before_start = np.concatenate([[0], cumulative[starts[1:] - 1]])
+    lengths = np.diff(np.concatenate([starts, [len(new_row_codes)]]))
+    new_balances = cumulative - np.repeat(before_start, lengths)
+
+    # start from each holder's previous balance
+    initial = np.zeros(n_holders, dtype=new_balances.dtype)
+    if len(ledger['holders']) > 0:
+        initial[old_holder_codes] = ledger['balances'][
+            ledger['offsets'][1:] - 1
+        ]
+    new_balances = new_balances + initial[new_row_codes]
+
+    # keep only final balance of each holder in each block
+    is_last = np.ones(len(new_row_codes), dtype=bool)
+    is_last[:-1] = (new_row_codes[1:] != new_row_codes[:-1]) | (
+        new_blocks[1:] != new_blocks[:-1]
+    )
+
+    # merge with existing rows, new rows come after old rows of each holder
+    row_codes = np.concatenate([old_row_codes, new_row_codes[is_last]])
+    order = np.argsort(row_codes, kind='stable')
+    counts = np.bincount(row_codes, minlength=n_holders)
+    return {
+        'holders': holders,
+        'offsets': np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+        'block_numbers': np.concatenate(
+            [ledger['block_numbers'], new_blocks[is_last]]
+        )[order],
+        'balances': np.concatenate(
+            [
+                ledger['balances'].astype(new_balances.dtype),
+                new_balances[is_last],
+            ]
+        )[order],
+        'end_block': end_block,
+    }
+
+
+async def async_get_erc20_balance_ledger(
+    token: spec.ERC20Reference,
+    *,
+    end_block: spec.BlockNumberReference | None = None,
+    normalize: bool = False,
+    context: spec.Context = None,
+) -> ERC20BalanceLedger:
+    """get balance ledger of ERC20 token, extending cached ledger as needed
+
+    only events of finalized blocks are retained in the in-memory cache
+    """
+
+    from ctc import config
+    from ctc.db import management
+    from .. import block_utils
+
+    token_address = await erc20_metadata.async_get_erc20_address(
+        token, context=context
+    )
+    latest_block = await block_utils.async_get_latest_block_number(
+        context=context
+    )
+    if end_block is None:
+        end_block = latest_block
+    else:
+        end_block = await block_utils.async_block_number_to_int(
+            end_block, context=context
+        )
+    finalized_block = latest_block - management.get_required_confirmations(
+        context
+    )
+    cache_end_block = min(end_block, finalized_block)
+
+    key = (config.get_context_chain_id(context), token_address, normalize)
+    ledger = _ledger_cache.get(key)
+    if ledger is None:
+        ledger = create_erc20_balance_ledger(
+            await erc20_events.async_get_erc20_transfers(
+                token_address,
+                end_block=cache_end_block,
+                normalize=normalize,
+                context=context,
+            ),
+            end_block=cache_end_block,
+        )
+        _ledger_cache[key] = ledger
+    elif ledger['end_block'] < cache_end_block:
+        ledger = update_erc20_balance_ledger(
+            ledger,
+            await erc20_events.async_get_erc20_transfers(
+                token_address,
+                start_block=ledger['end_block'] + 1,
+                end_block=cache_end_block,
+                normalize=normalize,
+                context=context,
+            ),
+            end_block=cache_end_block,
+        )
+        _ledger_cache[key] = ledger
+
+    # extend unfinalized tail without caching it
+    if end_block > ledger['end_block']:
+        ledger = update_erc20_balance_ledger(
+            ledger,
+            await erc20_events.async_get_erc20_transfers(
+                token_address,
+                start_block=ledger['end_block'] + 1,
+                end_block=end_block,
+                normalize=normalize,
+                context=context,
+            ),
+            end_block=end_block,
+        )
+
+    return ledger
+
+
+#
+# # ledger queries
+#
+
+
+def _get_holder_index(ledger: ERC20BalanceLedger, wallet: typing.Any) -> int:
+    import numpy as np
+
+    if isinstance(wallet, str):
+        wallet = wallet.lower()
+    index = int(np.searchsorted(ledger['holders'], wallet))
+    if index < len(ledger['holders']) and ledger['holders'][index] == wallet:
+        return index
+    else:
+        return -1
+
+
+def get_erc20_balance_from_ledger(
+    ledger: ERC20BalanceLedger,
+    wallet: spec.Address,
+    *,
+    block: int | None = None,
+) -> int | float:
+    """get balance of wallet at block using balance ledger"""
+
+    if block is None:
+        block = ledger['end_block']
+    balances = get_erc20_balance_by_block_from_ledger(
+        ledger, wallet, blocks=[block]
+    )
+    return balances[0]  # type: ignore
+
+
+def get_erc20_balance_by_block_from_ledger(
+    ledger: ERC20BalanceLedger,
+    wallet: spec.Address,
+    *,
+    blocks: typing.Sequence[int],
+) -> spec.NumpyArray:
+    """get balance of wallet at each block using balance ledger"""
+
+    import numpy as np
+
+    if len(blocks) > 0 and max(blocks) > ledger['end_block']:
+        raise Exception('ledger does not extend to requested blocks')
+
+    balances = ledger['balances']
+    index = _get_holder_index(ledger, wallet)
+    if index == -1:
+        return np.zeros(len(blocks), dtype=balances.dtype)
+
+    start = ledger['offsets'][index]
+    end = ledger['offsets'][index + 1]
+    holder_blocks = ledger['block_numbers'][start:end]
+    positions = np.searchsorted(holder_blocks, blocks, side='right') - 1
+    output = np.zeros(len(blocks), dtype=balances.dtype)
+    mask = positions >= 0
+    output[mask] = balances[start + positions[mask]]
+    return output
+
+
+def get_erc20_balances_from_ledger(
+    ledger: ERC20BalanceLedger,
+    *,
+    block: int | None = None,
+) -> spec.DataFrame:
+    """get balance of every holder at block using balance ledger
+
+    output is sorted by balance in descending order
+    """
+
+    import numpy as np
+    import polars as pl
+
+    if block is None:
+        block = ledger['end_block']
+    elif block > ledger['end_block']:
+        raise Exception('ledger does not extend to requested block')
+
+    # find last row of each holder at or before block
+    holders = ledger['holders']
+    offsets = ledger['offsets']
+    block_numbers = ledger['block_numbers']
+    stride = max(int(block_numbers.max(initial=0)), block) + 2
+    row_codes = np.repeat(np.arange(len(holders)), np.diff(offsets))
+    row_keys = row_codes * stride + block_numbers
+    query_keys = np.arange(len(holders)) * stride + block
+    positions = np.searchsorted(row_keys, query_keys, side='right') - 1
+    mask = positions >= offsets[:-1]
+
+    balances = ledger['balances'][positions[mask]]
+    order = np.argsort(-balances.astype(float), kind='stable')
+    addresses = holders[mask][order].tolist()
+    try:
+        return pl.DataFrame(
+            {'address': addresses, 'balance': balances[order].tolist()}
+        )
+    except OverflowError:
+        return pl.DataFrame(
+            {'address': addresses, 'balance': balances[order].astype(float)}
+        )
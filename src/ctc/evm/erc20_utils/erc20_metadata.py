@@ -144,21 +144,17 @@ async def async_get_erc20_decimals(
 
     from ctc import config
 
-    result: spec.ERC20Metadata | None = None
-
     read_cache, write_cache = config.get_context_cache_read_write(
         schema_name='erc20_metadata', context=context
     )
 
     if read_cache:
-        from ctc import db
+        from . import erc20_metadata_cache
 
-        token = await async_get_erc20_address(token, context=context)
-        result = await db.async_query_erc20_metadata(
-            address=token, context=context
+        (cached,) = await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'decimals', [token], block=block, context=context, **rpc_kwargs
         )
-        if result is not None and result['decimals'] is not None:
-            return result['decimals']
+        return cached  # type: ignore
 
     decimals_result = await erc20_generic.async_erc20_eth_call(
         function_name='decimals',
@@ -173,16 +169,13 @@ async def async_get_erc20_decimals(
         raise Exception('invalid rpc result')
     decimals: int = decimals_result
 
-    if write_cache:
-        if result is not None:
-            result['decimals'] = decimals
-        else:
-            data = {'address': token, 'decimals': decimals}
-            if typing.TYPE_CHECKING:
-                result = typing.cast(spec.ERC20Metadata, data)
-            else:
-                result = data
-        await db.async_intake_erc20_metadata(context=context, **result)
+    if write_cache and decimals is not None:
+        from ctc import db
+
+        token = await async_get_erc20_address(token, context=context)
+        await db.async_intake_erc20_metadata(
+            address=token, decimals=decimals, context=context
+        )
 
     return decimals
 
@@ -195,6 +188,19 @@ async def async_get_erc20s_decimals(
     **rpc_kwargs: typing.Any,
 ) -> typing.Sequence[int]:
     """get decimals of multiple erc20s"""
+
+    from ctc import config
+
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='erc20_metadata', context=context
+    )
+    if read_cache:
+        from . import erc20_metadata_cache
+
+        return await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'decimals', tokens, block=block, context=context, **rpc_kwargs
+        )
+
     return await erc20_generic.async_erc20s_eth_calls(
         function_name='decimals',
         tokens=tokens,
@@ -278,39 +284,38 @@ async def async_get_erc20_name(
         schema_name='erc20_metadata', context=context
     )
 
-    result: spec.ERC20Metadata | None = None
     if read_cache:
-        from ctc import db
+        from . import erc20_metadata_cache
 
-        token = await async_get_erc20_address(token, context=context)
-        result = await db.async_query_erc20_metadata(
-            address=token, context=context
+        (cached,) = await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'name',
+            [token],
+            block=block,
+            context=context,
+            convert_reverts_to_none=convert_reverts_to_none,
+            **rpc_kwargs,
         )
-        if result is not None and result['name'] is not None:
-            return result['name']
+        return cached  # type: ignore
 
     rpc_result: str | None = await erc20_generic.async_erc20_eth_call(
         function_name='name',
         token=token,
         block=block,
         context=context,
+        convert_reverts_to_none=convert_reverts_to_none,
         **rpc_kwargs,
     )
     if not isinstance(rpc_result, str) and not convert_reverts_to_none:
         raise Exception('invalid rpc result')
     name = rpc_result
 
-    if write_cache:
-        if result is not None:
-            result['name'] = name
-        else:
-            data = {'address': token, 'name': name}
-            if typing.TYPE_CHECKING:
-                result = typing.cast(spec.ERC20Metadata, data)
-            else:
-                result = data
+    if write_cache and name is not None:
+        from ctc import db
 
-        await db.async_intake_erc20_metadata(context=context, **result)
+        token = await async_get_erc20_address(token, context=context)
+        await db.async_intake_erc20_metadata(
+            address=token, name=name, context=context
+        )
 
     return name
 
@@ -323,6 +328,19 @@ async def async_get_erc20s_names(
     **rpc_kwargs: typing.Any,
 ) -> typing.Sequence[str]:
     """get name of multiple erc20s"""
+
+    from ctc import config
+
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='erc20_metadata', context=context
+    )
+    if read_cache:
+        from . import erc20_metadata_cache
+
+        return await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'name', tokens, block=block, context=context, **rpc_kwargs
+        )
+
     return await erc20_generic.async_erc20s_eth_calls(
         function_name='name',
         tokens=tokens,
@@ -388,14 +406,14 @@ async def async_get_erc20_symbol(
     )
 
     if read_cache:
-        from ctc import db
-
-        token = await async_get_erc20_address(token, context=context)
-        result: spec.ERC20Metadata | None = await db.async_query_erc20_metadata(
-            address=token, context=context
+        (symbol,) = await async_get_erc20s_symbols(
+            [token],
+            block=block,
+            context=context,
+            convert_reverts_to=convert_reverts_to,
+            **rpc_kwargs,
         )
-        if result is not None and result['symbol'] is not None:
-            return result['symbol']
+        return symbol
 
     symbol_raw = await erc20_generic.async_erc20_eth_call(
         function_name='symbol',
@@ -408,17 +426,13 @@ async def async_get_erc20_symbol(
     )
     symbol = _decode_raw_symbol(symbol_raw, none_value=convert_reverts_to)
 
-    if write_cache:
-        if result is not None:
-            result['symbol'] = symbol
-        else:
-            data = {'address': token, 'symbol': symbol}
-            if typing.TYPE_CHECKING:
-                result = typing.cast(spec.ERC20Metadata, data)
-            else:
-                result = data
+    if write_cache and symbol_raw is not None:
+        from ctc import db
 
-        await db.async_intake_erc20_metadata(context=context, **result)
+        token = await async_get_erc20_address(token, context=context)
+        await db.async_intake_erc20_metadata(
+            address=token, symbol=symbol, context=context
+        )
 
     return symbol
 
@@ -432,6 +446,28 @@ async def async_get_erc20s_symbols(
     **rpc_kwargs: typing.Any,
 ) -> typing.Sequence[str]:
     """get symbol of multiple erc20s"""
+
+    from ctc import config
+
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='erc20_metadata', context=context
+    )
+    if read_cache:
+        from . import erc20_metadata_cache
+
+        symbols = await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'symbol',
+            tokens,
+            block=block,
+            context=context,
+            convert_reverts_to_none=(convert_reverts_to is not None),
+            **rpc_kwargs,
+        )
+        return [
+            symbol if symbol is not None else convert_reverts_to
+            for symbol in symbols
+        ]
+
     results = await erc20_generic.async_erc20s_eth_calls(
         function_name='symbol',
         tokens=tokens,
@@ -0,0 +1,354 @@
+"""process-level cache of erc20 metadata
+
+- the cache of each network is warmed upon first use by bulk loading the
+  erc20_metadata db table and the default erc20s
+- lookups that miss the cache are backfilled with a single batch of eth_calls,
+  and concurrent lookups of the same erc20s share that batch
+- backfilled entries are written through to the db in bulk
+
+caches are keyed by network and by the erc20_metadata cache settings of the
+context, and each cache is loaded at most once even under concurrent lookups
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Literal
+
+    ERC20MetadataField = Literal['decimals', 'symbol', 'name']
+
+    # (chain_id, cache backend, whether cache is read)
+    ERC20MetadataCacheKey = tuple[spec.ChainId, typing.Union[str, None], bool]
+
+
+_erc20_metadata_cache: dict[
+    ERC20MetadataCacheKey, dict[spec.Address, spec.ERC20Metadata]
+] = {}
+
+# loads of caches that are in progress
+_erc20_metadata_cache_loads: dict[
+    ERC20MetadataCacheKey,
+    asyncio.Future[dict[spec.Address, spec.ERC20Metadata]],
+] = {}
+
+# backfills of (cache, field, address) that are in progress
+_erc20_metadata_backfills: dict[
+    tuple[ERC20MetadataCacheKey, str, spec.Address],
+    asyncio.Future[typing.Any],
+] = {}
+
+
+def _get_erc20_metadata_cache_key(
+    context: spec.Context,
+) -> ERC20MetadataCacheKey:
+    from ctc import config
+
+    chain_id = config.get_context_chain_id(context)
+    backend = config.get_context_cache_backend(
+        schema_name='erc20_metadata', context=context
+    )
+    read_cache, _write_cache = config.get_context_cache_read_write(
+        schema_name='erc20_metadata', context=context
+    )
+    return (chain_id, backend, read_cache)
+
+
+async def async_load_erc20_metadata_cache(
+    *,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, spec.ERC20Metadata]:
+    """bulk load erc20 metadata from db and default erc20s into cache"""
+
+    from ctc import db
+    from ctc.config.setup_utils.default_data import default_erc20s
+
+    key = _get_erc20_metadata_cache_key(context)
+    _chain_id, _backend, read_cache = key
+    cache: dict[spec.Address, spec.ERC20Metadata] = {}
+
+    # default erc20s take lower precedence than db entries
+    try:
+        defaults = default_erc20s.load_default_erc20s(context=context)
+    except NotImplementedError:
+        defaults = []
+    for metadata in defaults:
+        _merge_cache_entry(cache, metadata)
+
+    if read_cache:
+        stored = await db.async_query_erc20s_metadata(context=context)
+        if stored is not None:
+            for stored_metadata in stored:
+                if stored_metadata is not None:
+                    _merge_cache_entry(cache, stored_metadata)
+
+    # entries added by concurrent backfills take precedence
+    cache.update(_erc20_metadata_cache.get(key, {}))
+    _erc20_metadata_cache[key] = cache
+    return cache
+
+
+def reset_erc20_metadata_cache() -> None:
+    """reset process-level cache of erc20 metadata"""
+    _erc20_metadata_cache.clear()
+    _erc20_metadata_cache_loads.clear()
+
+
+def _merge_cache_entry(
+    cache: dict[spec.Address, spec.ERC20Metadata],
+    metadata: typing.Mapping[str, typing.Any],
+) -> None:
+    address = metadata['address'].lower()
+    entry: spec.ERC20Metadata | None = cache.get(address)
+    if entry is None:
+        entry = {
+            'address': address,
+            'symbol': None,  # type: ignore
+            'decimals': None,  # type: ignore
+            'name': None,
+        }
+        cache[address] = entry
+    for field in ('symbol', 'decimals', 'name'):
+        value = metadata.get(field)
+        if value is not None:
+            entry[field] = value  # type: ignore
+
+
+async def _async_get_erc20_metadata_cache(
+    context: spec.Context,
+) -> dict[spec.Address, spec.ERC20Metadata]:
+    key = _get_erc20_metadata_cache_key(context)
+    cache = _erc20_metadata_cache.get(key)
+    if cache is not None:
+        return cache
+
+    # concurrent lookups wait for a single load
+    load = _erc20_metadata_cache_loads.get(key)
+    if load is None:
+        load = asyncio.ensure_future(_async_load_cache(context))
+        _erc20_metadata_cache_loads[key] = load
+        load.add_done_callback(
+            lambda future: _erc20_metadata_cache_loads.pop(key, None)
+        )
+    return await asyncio.shield(load)
+
+
+async def _async_load_cache(
+    context: spec.Context,
+) -> dict[spec.Address, spec.ERC20Metadata]:
+    await async_load_erc20_metadata_cache(context=context)
+    return _erc20_metadata_cache[_get_erc20_metadata_cache_key(context)]
+
+
+async def _async_get_erc20s_metadata_field(
+    field: ERC20MetadataField,
+    tokens: typing.Iterable[spec.ERC20Reference],
+    *,
+    block: spec.BlockNumberReference | None = None,
+    context: spec.Context,
+    convert_reverts_to_none: bool = False,
+    **rpc_kwargs: typing.Any,
+) -> list[typing.Any]:
+    """get metadata field of erc20s, backfilling cache misses in one batch
+
+    reverted eth_calls of misses produce None and are not cached
+    """
+
+    import asyncio
+
+    from ctc import config
+    from . import erc20_generic
+    from . import erc20_metadata
+
+    addresses = await asyncio.gather(
+        *[
+            erc20_metadata.async_get_erc20_address(token, context=context)
+            for token in tokens
+        ]
+    )
+    addresses = [address.lower() for address in addresses]
+
+    # lookup addresses in cache
+    cache = await _async_get_erc20_metadata_cache(context)
+    results: dict[spec.Address, typing.Any] = {}
+    missing = []
+    for address in addresses:
+        entry = cache.get(address)
+        if entry is not None and entry[field] is not None:
+            results[address] = entry[field]
+        elif address not in missing:
+            missing.append(address)
+
+    # backfill misses in a single batch
+    if len(missing) > 0:
+        results.update(
+            await _async_backfill_erc20s_metadata_field(
+                field,
+                missing,
+                cache=cache,
+                block=block,
+                context=context,
+                rpc_kwargs=rpc_kwargs,
+            )
+        )
+
+    output = [results[address] for address in addresses]
+    if not convert_reverts_to_none and any(value is None for value in output):
+        raise Exception('could not get ' + field + ' of erc20')
+    return output
+
+
+async def _async_backfill_erc20s_metadata_field(
+    field: ERC20MetadataField,
+    addresses: typing.Sequence[spec.Address],
+    *,
+    cache: dict[spec.Address, spec.ERC20Metadata],
+    block: spec.BlockNumberReference | None,
+    context: spec.Context,
+    rpc_kwargs: typing.Mapping[str, typing.Any],
+) -> dict[spec.Address, typing.Any]:
+    """fetch field of addresses missing from cache, merging concurrent calls
+
+    addresses already being fetched by a concurrent call wait for that call
+    """
+
+    from ctc import config
+
+    key = _get_erc20_metadata_cache_key(context)
+    results: dict[spec.Address, typing.Any] = {}
+    remaining = list(addresses)
+    while len(remaining) > 0:
+
+        # claim addresses that are not already being fetched
+        loop = asyncio.get_running_loop()
+        claimed: dict[spec.Address, asyncio.Future[typing.Any]] = {}
+        pending: dict[spec.Address, asyncio.Future[typing.Any]] = {}
+        for address in remaining:
+            backfill_key = (key, field, address)
+            backfill = _erc20_metadata_backfills.get(backfill_key)
+            if backfill is None:
+                backfill = loop.create_future()
+                _erc20_metadata_backfills[backfill_key] = backfill
+                claimed[address] = backfill
+            else:
+                pending[address] = backfill
+        remaining = []
+
+        # fetch claimed addresses in a single batch
+        if len(claimed) > 0:
+            try:
+                fetched = await _async_fetch_erc20s_metadata_field(
+                    field,
+                    list(claimed.keys()),
+                    block=block,
+                    context=context,
+                    rpc_kwargs=rpc_kwargs,
+                )
+            except BaseException as e:
+                for future in claimed.values():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+                        future.exception()
+                raise
+            finally:
+                for address in claimed.keys():
+                    _erc20_metadata_backfills.pop((key, field, address), None)
+
+            new_entries = []
+            for (address, future), value in zip(claimed.items(), fetched):
+                future.set_result(value)
+                results[address] = value
+                if value is not None:
+                    _merge_cache_entry(
+                        cache, {'address': address, field: value}
+                    )
+                    new_entries.append(cache[address])
+
+            # write new entries through to db
+            read_cache, write_cache = config.get_context_cache_read_write(
+                schema_name='erc20_metadata', context=context
+            )
+            if write_cache and len(new_entries) > 0:
+                await _async_write_erc20s_metadata(new_entries, context=context)
+
+        # wait for concurrent fetches, retrying those that were cancelled
+        for address, future in pending.items():
+            try:
+                results[address] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                remaining.append(address)
+
+    return results
+
+
+async def _async_fetch_erc20s_metadata_field(
+    field: ERC20MetadataField,
+    addresses: typing.Sequence[spec.Address],
+    *,
+    block: spec.BlockNumberReference | None,
+    context: spec.Context,
+    rpc_kwargs: typing.Mapping[str, typing.Any],
+) -> list[typing.Any]:
+    from . import erc20_generic
+    from . import erc20_metadata
+
+    if field == 'symbol':
+        raw_symbols = await erc20_generic.async_erc20s_eth_calls(
+            function_name='symbol',
+            tokens=addresses,
+            block=block,
+            decode_response=False,
+            context=context,
+            convert_reverts_to_none=True,
+            **rpc_kwargs,
+        )
+        return [
+            erc20_metadata._decode_raw_symbol(raw_symbol)
+            if raw_symbol is not None
+            else None
+            for raw_symbol in raw_symbols
+        ]
+    else:
+        return list(
+            await erc20_generic.async_erc20s_eth_calls(
+                function_name=field,
+                tokens=addresses,
+                block=block,
+                context=context,
+                convert_reverts_to_none=True,
+                **rpc_kwargs,
+            )
+        )
+
+
+async def _async_write_erc20s_metadata(
+    erc20s_metadata: typing.Sequence[spec.ERC20Metadata],
+    *,
+    context: spec.Context,
+) -> None:
+    import toolsql
+
+    from ctc import config
+    from ctc import db
+
+    db_config = config.get_context_db_config(
+        schema_name='erc20_metadata',
+        context=context,
+    )
+    try:
+        async with toolsql.async_connect(db_config) as conn:
+            await db.async_upsert_erc20s_metadata(
+                erc20s_metadata=erc20s_metadata,
+                conn=conn,
+                context=context,
+            )
+    except (toolsql.CannotConnect, toolsql.TableDoesNotExist):
+        pass
@@ -43,11 +43,12 @@ async def async_convert_to_erc4626_assets_by_block(
     """convert ERC-4626 vault shares to assets"""
     from ctc import rpc
 
-    assets: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    assets: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['convertToAssets'],
         function_parameters=[int(shares)],
-        block_numbers=blocks,
         context=context,
     )
     return assets
@@ -105,11 +106,12 @@ async def async_convert_to_erc4626_shares_by_block(
 
     from ctc import rpc
 
-    shares: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    shares: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['convertToShares'],
         function_parameters=[int(assets)],
-        block_numbers=blocks,
         context=context,
     )
     return shares
@@ -182,11 +184,12 @@ async def async_get_erc4626_max_deposit_by_block(
 
     from ctc import rpc
 
-    max_deposits: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    max_deposits: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['maxDeposit'],
         function_parameters=[receiver],
-        block_numbers=blocks,
         context=context,
     )
     if normalize:
@@ -272,11 +275,12 @@ async def async_get_erc4626_max_mint_by_block(
 
     from ctc import rpc
 
-    max_mints: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    max_mints: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['maxMint'],
         function_parameters=[receiver],
-        block_numbers=blocks,
         context=context,
     )
     if normalize:
@@ -362,11 +366,12 @@ async def async_get_erc4626_max_redeem_by_block(
 
     from ctc import rpc
 
-    max_redeems: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    max_redeems: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['maxRedeem'],
         function_parameters=[owner],
-        block_numbers=blocks,
         context=context,
     )
     if normalize:
@@ -452,11 +457,12 @@ async def async_get_erc4626_max_withdraw_by_block(
 
     from ctc import rpc
 
-    max_withdraws: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    max_withdraws: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['maxWithdraw'],
         function_parameters=[owner],
-        block_numbers=blocks,
         context=context,
     )
     if normalize:
@@ -535,11 +541,12 @@ async def async_preview_erc4626_deposit_by_block(
     """return shares received for assets deposited into ERC-4626 vault"""
     from ctc import rpc
 
-    deposit: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    deposit: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['previewDeposit'],
         function_parameters=[assets],
-        block_numbers=blocks,
         context=context,
     )
     return deposit
@@ -595,11 +602,12 @@ async def async_preview_erc4626_mint_by_block(
     """return assets needed for shared minted from ERC-4626 vault"""
     from ctc import rpc
 
-    mint: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    mint: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['previewMint'],
         function_parameters=[shares],
-        block_numbers=blocks,
         context=context,
     )
     return mint
@@ -655,11 +663,12 @@ async def async_preview_erc4626_redeem_by_block(
     """return assets received for redeeming shares of ERC-4626 vault"""
     from ctc import rpc
 
-    redeem: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    redeem: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['previewRedeem'],
         function_parameters=[shares],
-        block_numbers=blocks,
         context=context,
     )
     return redeem
@@ -715,11 +724,12 @@ async def async_preview_erc4626_withdraw_by_block(
     """return shares needed for redeeming assets from ERC-4626 vault"""
     from ctc import rpc
 
-    withdraw: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    withdraw: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['previewWithdraw'],
         function_parameters=[assets],
-        block_numbers=blocks,
         context=context,
     )
     return withdraw
@@ -786,10 +796,11 @@ async def async_get_erc4626_total_assets_by_block(
     """return total amount of assets in ERC-4626 vault"""
     from ctc import rpc
 
-    assets: typing.Sequence[int] = await rpc.async_batch_eth_call(
+    assets: typing.Sequence[int] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=token,
         function_abi=erc4626_spec.erc4626_function_abis['totalAssets'],
-        block_numbers=blocks,
         context=context,
     )
     if normalize and len(assets) > 0:
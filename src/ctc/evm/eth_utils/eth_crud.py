@@ -106,16 +106,19 @@ async def async_get_eth_balance_by_block(
 ) -> typing.Union[list[int], list[float]]:
     """get historical ETH balance over multiple blocks"""
 
-    coroutines = []
-    for block in blocks:
-        coroutine = async_get_eth_balance(
-            address=address, context=context, block=block, normalize=normalize
-        )
-        coroutines.append(coroutine)
+    from ctc import rpc
 
-    import asyncio
+    balances: list[int] = await rpc.async_sample_by_block(
+        'eth_get_balance',
+        blocks,
+        address=address,
+        context=context,
+    )
 
-    return await asyncio.gather(*coroutines)
+    if normalize:
+        return [balance / 1e18 for balance in balances]
+    else:
+        return balances
 
 
 @typing.overload
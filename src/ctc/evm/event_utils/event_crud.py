@@ -49,8 +49,12 @@ async def async_get_events(
 ) -> spec.DataFrame:
     """get events"""
 
+    from ctc import config
     from . import event_hybrid_queries
 
+    # resolve context once for all downstream config and provider lookups
+    context = config.resolve_context(context)
+
     # get query inputs
     (
         start_block,
@@ -47,6 +47,34 @@ def convert_rpc_transaction_to_db_transaction(
     return tx
 
 
+def convert_rpc_transactions_to_db_transactions(
+    transactions: typing.Sequence[spec.RPCTransaction],
+    receipts: typing.Sequence[spec.RPCTransactionReceipt],
+) -> list[spec.DBTransaction]:
+    """convert many rpc transactions into db transaction format in one pass
+
+    receipts are matched to transactions by transaction hash, so they can be
+    given in any order (e.g. as returned by eth_getBlockReceipts)
+    """
+
+    receipts_by_hash = {
+        receipt['transaction_hash']: receipt for receipt in receipts
+    }
+    db_transactions = []
+    for transaction in transactions:
+        receipt = receipts_by_hash.get(transaction['hash'])
+        if receipt is None:
+            raise Exception(
+                'missing receipt for transaction ' + str(transaction['hash'])
+            )
+        db_transactions.append(
+            convert_rpc_transaction_to_db_transaction(
+                transaction=transaction, receipt=receipt
+            )
+        )
+    return db_transactions
+
+
 #
 # # conversions that require fetching data
 #
@@ -78,18 +106,35 @@ async def async_convert_rpc_transactions_to_db_transactions(
     *,
     context: spec.Context = None,
 ) -> typing.Sequence[spec.DBTransaction]:
-    """convert transactions to standard form, fetching receipts as necessary"""
+    """convert transactions to standard form, fetching receipts as necessary
 
-    import asyncio
+    all missing receipts are fetched in a single batch request
+    """
 
-    coroutines = [
-        async_convert_rpc_transaction_to_db_transaction(
-            transaction=transaction,
-            context=context,
-        )
+    from ctc import rpc
+
+    rpc_transactions: list[spec.RPCTransaction] = [
+        transaction  # type: ignore
+        for transaction in transactions
+        if set(transaction.keys()) != spec.db_transaction_keys
+    ]
+    if len(rpc_transactions) == 0:
+        return transactions  # type: ignore
+
+    receipts = await rpc.async_batch_eth_get_transaction_receipt(
+        transaction_hashes=[tx['hash'] for tx in rpc_transactions],
+        context=context,
+    )
+    converted = convert_rpc_transactions_to_db_transactions(
+        transactions=rpc_transactions,
+        receipts=receipts,
+    )
+    converted_by_hash = {tx['hash']: tx for tx in converted}
+
+    return [
+        converted_by_hash.get(transaction['hash'], transaction)  # type: ignore
         for transaction in transactions
     ]
-    return await asyncio.gather(*coroutines)
 
 
 #
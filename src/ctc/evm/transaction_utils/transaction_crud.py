@@ -65,15 +65,66 @@ async def async_get_transactions(
     *,
     context: spec.Context = None,
 ) -> list[spec.DBTransaction]:
-    """get transactions"""
+    """get transactions
 
-    import asyncio
+    cached transactions are read in a single db query, and the remaining
+    transactions and receipts are fetched from node in batch requests
+    """
+
+    from ctc import config
+    from ctc import db
+    from ctc import rpc
+
+    if len(transaction_hashes) == 0:
+        return []
 
-    coroutines = [
-        async_get_transaction(transaction_hash, context=context)
-        for transaction_hash in transaction_hashes
+    # get from database
+    read_cache, write_cache = config.get_context_cache_read_write(
+        context=context, schema_name='transactions'
+    )
+    db_txs: dict[str, spec.DBTransaction] = {}
+    if read_cache:
+        result = await db.async_query_transactions(
+            hashes=transaction_hashes,
+            context=context,
+        )
+        if result is not None:
+            for db_tx in result:
+                if db_tx is not None:
+                    db_txs[db_tx['hash']] = db_tx
+
+    # get remaining transactions from node
+    missing = [
+        transaction_hash
+        for transaction_hash in dict.fromkeys(transaction_hashes)
+        if transaction_hash not in db_txs
     ]
-    return await asyncio.gather(*coroutines)
+    if len(missing) > 0:
+        raw_txs = await rpc.async_batch_eth_get_transaction_by_hash(
+            transaction_hashes=missing,
+            context=context,
+        )
+        raw_receipts = await rpc.async_batch_eth_get_transaction_receipt(
+            transaction_hashes=missing,
+            context=context,
+        )
+        new_db_txs = (
+            transaction_convert.convert_rpc_transactions_to_db_transactions(
+                transactions=raw_txs,
+                receipts=raw_receipts,
+            )
+        )
+        for db_tx in new_db_txs:
+            db_txs[db_tx['hash']] = db_tx
+
+        if write_cache:
+            await db.async_intake_transactions(
+                transactions=new_db_txs,
+                context=context,
+                already_converted=True,
+            )
+
+    return [db_txs[transaction_hash] for transaction_hash in transaction_hashes]
 
 
 #
@@ -166,17 +217,16 @@ async def async_get_blocks_transactions(
     rpc_transactions = [
         tx for rpc_block in rpc_blocks for tx in rpc_block['transactions']
     ]
-    tx_hashes = [tx['hash'] for tx in rpc_transactions]
-    rpc_receipts = await rpc.async_batch_eth_get_transaction_receipt(
-        transaction_hashes=tx_hashes,
+    rpc_receipts = await async_get_blocks_receipts(
+        rpc_blocks=rpc_blocks,
         context=context,
     )
-    new_db_txs = [
-        transaction_convert.convert_rpc_transaction_to_db_transaction(
-            transaction=rpc_transaction, receipt=rpc_receipt
+    new_db_txs = (
+        transaction_convert.convert_rpc_transactions_to_db_transactions(
+            transactions=rpc_transactions,
+            receipts=rpc_receipts,
         )
-        for rpc_transaction, rpc_receipt in zip(rpc_transactions, rpc_receipts)
-    ]
+    )
     new_db_txs.extend(db_txs)
 
     if write_cache:
@@ -189,6 +239,89 @@ async def async_get_blocks_transactions(
     return new_db_txs
 
 
+#
+# # block receipts
+#
+
+# providers that have rejected eth_getBlockReceipts
+_block_receipts_unsupported: set[str] = set()
+
+
+def _is_unsupported_method_error(exception: spec.RpcException) -> bool:
+    """return whether rpc error indicates provider lacks the method"""
+    if exception.code == -32601:
+        return True
+    message = str(exception).lower()
+    return any(
+        phrase in message
+        for phrase in [
+            'method not found',
+            'does not exist',
+            'not supported',
+            'unsupported',
+            'not available',
+        ]
+    )
+
+
+async def async_get_blocks_receipts(
+    rpc_blocks: typing.Sequence[spec.RPCBlock],
+    *,
+    context: spec.Context = None,
+) -> list[spec.RPCTransactionReceipt]:
+    """get receipts of all transactions in blocks
+
+    uses one eth_getBlockReceipts request per block when provider supports it,
+    otherwise falls back to batched eth_getTransactionReceipt requests
+    """
+
+    from ctc import config
+    from ctc import rpc
+
+    rpc_blocks = [
+        rpc_block
+        for rpc_block in rpc_blocks
+        if len(rpc_block['transactions']) > 0
+    ]
+    if len(rpc_blocks) == 0:
+        return []
+
+    provider = config.get_context_provider(context)
+    if provider is None:
+        raise Exception('no provider available')
+    provider_url = provider['url']
+    if provider_url not in _block_receipts_unsupported:
+        try:
+            blocks_receipts = await rpc.async_batch_eth_get_block_receipts(
+                block_numbers=[rpc_block['number'] for rpc_block in rpc_blocks],
+                context=context,
+            )
+            if all(receipts is not None for receipts in blocks_receipts):
+                return [
+                    receipt
+                    for receipts in blocks_receipts
+                    for receipt in receipts
+                ]
+        except spec.RpcException as e:
+            if _is_unsupported_method_error(e):
+                _block_receipts_unsupported.add(provider_url)
+
+    tx_hashes = []
+    for rpc_block in rpc_blocks:
+        for tx in rpc_block['transactions']:
+            if isinstance(tx, dict):
+                tx_hashes.append(tx['hash'])
+            else:
+                tx_hashes.append(tx)
+    receipts: list[spec.RPCTransactionReceipt] = (
+        await rpc.async_batch_eth_get_transaction_receipt(
+            transaction_hashes=tx_hashes,
+            context=context,
+        )
+    )
+    return receipts
+
+
 #
 # # transaction logs
 #
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import typing
+
+# protocol subpackages are loaded upon first access
+if not typing.TYPE_CHECKING:
+
+    def __getattr__(name: str) -> typing.Any:
+        """load protocol subpackage upon first access"""
+        import importlib
+
+        if name not in __dir__():
+            raise AttributeError(
+                'module ' + repr(__name__) + ' has no attribute ' + repr(name)
+            )
+        return importlib.import_module(__name__ + '.' + name)
+
+    def __dir__() -> list[str]:
+        """list attributes, including protocol subpackages not yet loaded"""
+        import pkgutil
+
+        names = set(globals())
+        for module_info in pkgutil.iter_modules(__path__):
+            if module_info.ispkg:
+                names.add(module_info.name)
+        return sorted(names)
@@ -11,7 +11,6 @@ import typing
 from ctc import evm
 from ctc import rpc
 from ctc import spec
-from ctc.toolbox import nested_utils
 from . import aave_pool_tokens
 
 if typing.TYPE_CHECKING:
@@ -93,13 +92,31 @@ async def async_get_reserve_data_by_block(
     *,
     context: spec.Context = None,
 ) -> AaveV2ReserveListData:
-    coroutines = [
-        async_get_reserve_data(asset, block=block, context=context)
-        for block in blocks
-    ]
+    results = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=aave_lending_pool,
+        function_name='getReserveData',
+        function_parameters=[asset],
+        context=context,
+    )
 
-    results = await asyncio.gather(*coroutines)
-    return nested_utils.list_of_dicts_to_dict_of_lists(results)  # type: ignore
+    return {
+        'configuration': [result[0] for result in results],
+        'liquidity_index': [result[1] for result in results],
+        'variable_borrow_index': [result[2] for result in results],
+        'current_liquidity_rate': [result[3] for result in results],
+        'current_variable_borrow_rate': [result[4] for result in results],
+        'current_stable_borrow_rate': [result[5] for result in results],
+        'last_update_timestamp': [result[6] for result in results],
+        'atoken_address': [result[7] for result in results],
+        'stable_debt_token_address': [result[8] for result in results],
+        'variable_debt_token_address': [result[9] for result in results],
+        'interest_rate_strategy_address': [
+            result[10] for result in results
+        ],
+        'id': [result[11] for result in results],
+    }
 
 
 async def async_get_reserves_data(
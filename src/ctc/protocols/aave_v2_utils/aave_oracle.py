@@ -101,15 +101,40 @@ async def async_get_asset_price_by_block(
     units: typing.Literal['usd', 'eth'] = 'usd',
     context: spec.Context = None,
 ) -> typing.Sequence[int | float]:
-    coroutines = [
-        async_get_asset_price(
-            asset=asset,
-            block=block,
-            normalize=normalize,
-            units=units,
+    oracle = aave_spec.get_aave_address('PriceOracle', context=context)
+    price_coroutine = rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=oracle,
+        function_name='getAssetPrice',
+        function_parameters=[asset],
+        context=context,
+    )
+
+    if units == 'eth':
+        prices = await price_coroutine
+
+    elif units == 'usd':
+        eth_usd_coroutine = chainlink_utils.async_get_eth_price_by_block(
+            blocks,
+            normalize=True,
             context=context,
         )
-        for block in blocks
-    ]
-    return await asyncio.gather(*coroutines)
+        asset_prices, eth_usds = await asyncio.gather(
+            price_coroutine, eth_usd_coroutine
+        )
+        prices = [
+            asset_price * eth_usd
+            for asset_price, eth_usd in zip(
+                asset_prices, eth_usds['answer'].to_list()
+            )
+        ]
+
+    else:
+        raise Exception('unknown units: ' + str(units))
+
+    if normalize:
+        prices = [price / 1e18 for price in prices]
+
+    return prices
 
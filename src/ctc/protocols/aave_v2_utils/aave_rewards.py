@@ -42,15 +42,19 @@ async def async_get_unclaimed_rewards_by_block(
     *,
     context: spec.Context = None,
 ) -> typing.Sequence[int]:
-    coroutines = [
-        async_get_unclaimed_rewards(
-            wallet=wallet,
-            block=block,
-            context=context,
-        )
-        for block in blocks
-    ]
-    return await asyncio.gather(*coroutines)
+    aave_incentives_controller = aave_spec.get_aave_address(
+        'IncentivesController',
+        context=context,
+    )
+
+    return await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=aave_incentives_controller,
+        function_name='getUserUnclaimedRewards',
+        function_parameters=[wallet],
+        context=context,
+    )
 
 
 async def async_compute_wallet_rewards(
@@ -106,14 +106,12 @@ async def async_get_pool_weights_by_block(
     dict[spec.BlockNumberReference, int],
     dict[spec.BlockNumberReference, float],
 ]:
-    from ctc import config
-
-    context = config.update_context(context, merge_provider={'chunk_size': 100})
-
-    weights = await rpc.async_batch_eth_call(
+    weights = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=pool_address,
         function_abi=pool_function_abis['getNormalizedWeights'],
-        block_numbers=blocks,
+        chunk_size=100,
         context=context,
     )
 
@@ -218,20 +216,48 @@ async def async_get_pool_balances_by_block(
     normalize: bool = True,
     context: spec.Context = None,
 ) -> typing.Union[dict[spec.Address, list[int | float]]]:
-    import asyncio
-
-    coroutines = [
-        async_get_pool_balances(
-            pool_address=pool_address,
-            pool_id=pool_id,
-            block=block,
-            vault=vault,
-            normalize=normalize,
+    if vault is None:
+        vault = balancer_spec.vault
+    if pool_id is None:
+        if pool_address is None:
+            raise Exception('must specify pool_id or pool_address')
+        pool_id = await pool_metadata.async_get_pool_id(
+            pool_address,
+            block=blocks[-1],
             context=context,
         )
-        for block in blocks
+
+    pools_tokens = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=vault,
+        function_abi=balancer_spec.vault_function_abis['getPoolTokens'],
+        function_parameters=[pool_id],
+        package_named_outputs=True,
+        context=context,
+    )
+
+    balances_by_block: list[dict[spec.Address, int | float]] = [
+        dict(zip(pool_tokens['tokens'], pool_tokens['balances']))
+        for pool_tokens in pools_tokens
     ]
 
-    balances_by_block = await asyncio.gather(*coroutines)
+    if normalize:
+        tokens = list(
+            dict.fromkeys(
+                token
+                for block_balances in balances_by_block
+                for token in block_balances.keys()
+            )
+        )
+        decimals = await evm.async_get_erc20s_decimals(
+            tokens=tokens,
+            block=blocks[-1],
+            context=context,
+        )
+        token_decimals = dict(zip(tokens, decimals))
+        for block_balances in balances_by_block:
+            for token in block_balances.keys():
+                block_balances[token] /= 10 ** token_decimals[token]
 
     return nested_utils.list_of_dicts_to_dict_of_lists(balances_by_block)
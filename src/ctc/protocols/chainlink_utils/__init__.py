@@ -6,3 +6,4 @@ from .chainlink_feed_metadata import *
 from .chainlink_registry import *
 from .chainlink_spec import *
 from .chainlink_summary import *
+from .chainlink_sync import *
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import typing
 
+from ctc import rpc
 from ctc import spec
 from ctc import evm
 
+from .. import chainlink_feed_metadata
 from .. import chainlink_spec
-from . import feed_datum
 
 
 async def async_get_feed_answer_datum_by_block(
@@ -18,27 +19,36 @@ async def async_get_feed_answer_datum_by_block(
     interpolate: bool = True,
     invert: bool = False,
 ) -> spec.DataFrame:
-    import asyncio
     from ctc.toolbox import pl_utils
     import polars as pl
 
     int_blocks = await evm.async_block_numbers_to_int(
         blocks=blocks, context=context
     )
+    feed = await chainlink_feed_metadata.async_resolve_feed_address(
+        feed, context=context
+    )
 
     # query data
-    coroutines = []
-    for block in int_blocks:
-        coroutine = feed_datum.async_get_feed_datum(
-            feed=feed,
-            fields='answer',
-            normalize=normalize,
-            block=block,
-            invert=invert,
-            context=context,
-        )
-        coroutines.append(coroutine)
-    result = await asyncio.gather(*coroutines)
+    answers: typing.Sequence[typing.Any] = await rpc.async_sample_by_block(
+        'eth_call',
+        int_blocks,
+        to_address=feed,
+        function_abi=chainlink_spec.feed_function_abis['latestAnswer'],
+        fill_empty=True,
+        empty_token=None,
+        context=context,
+    )
+    for answer in answers:
+        if not isinstance(answer, (int, float)):
+            raise Exception('invalid rpc result')
+    result = await _async_normalize_answers(
+        feed,
+        answers,
+        normalize=normalize,
+        invert=invert,
+        context=context,
+    )
 
     # create series
     df = pl.DataFrame({'block_number': int_blocks, 'answer': result})
@@ -59,27 +69,37 @@ async def async_get_feed_full_datum_by_block(
     interpolate: bool = True,
     invert: bool = False,
 ) -> spec.DataFrame:
-    import asyncio
     import polars as pl
     from ctc.toolbox import pl_utils
 
     int_blocks = await evm.async_block_numbers_to_int(
         blocks=blocks, context=context
     )
+    feed = await chainlink_feed_metadata.async_resolve_feed_address(
+        feed, context=context
+    )
 
     # query data
-    coroutines = []
-    for block in int_blocks:
-        coroutine = feed_datum.async_get_feed_datum(
-            feed=feed,
-            block=block,
-            normalize=normalize,
-            fields='full',
-            invert=invert,
-            context=context,
-        )
-        coroutines.append(coroutine)
-    result = await asyncio.gather(*coroutines)
+    round_data: typing.Sequence[typing.Any] = await rpc.async_sample_by_block(
+        'eth_call',
+        int_blocks,
+        to_address=feed,
+        function_abi=chainlink_spec.feed_function_abis['latestRoundData'],
+        fill_empty=True,
+        empty_token=(None, None, None, None, None),
+        context=context,
+    )
+    answers = await _async_normalize_answers(
+        feed,
+        [datum[1] for datum in round_data],
+        normalize=normalize,
+        invert=invert,
+        context=context,
+    )
+    result: list[chainlink_spec.FeedRoundData] = [
+        {'answer': answer, 'timestamp': datum[3], 'round_id': datum[0]}
+        for answer, datum in zip(answers, round_data)
+    ]
 
     # create series
     df = pl.DataFrame({'block_number': int_blocks, 'answer': result})
@@ -90,3 +110,26 @@ async def async_get_feed_full_datum_by_block(
 
     return df
 
+
+async def _async_normalize_answers(
+    feed: spec.Address,
+    answers: typing.Sequence[typing.Any],
+    *,
+    normalize: bool,
+    invert: bool,
+    context: spec.Context,
+) -> list[typing.Any]:
+    if normalize and any(answer is not None for answer in answers):
+        decimals = await chainlink_feed_metadata.async_get_feed_decimals(
+            feed,
+            context=context,
+        )
+        answers = [
+            answer / 10**decimals if answer is not None else None
+            for answer in answers
+        ]
+    if invert:
+        answers = [
+            1 / answer if answer is not None else None for answer in answers
+        ]
+    return list(answers)
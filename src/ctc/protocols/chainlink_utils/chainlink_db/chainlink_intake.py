@@ -315,3 +315,34 @@ async def async_intake_aggregator_updates(
             context=context,
         )
 
+
+async def async_intake_feed_updates(
+    *,
+    feed_updates: typing.Sequence[chainlink_schema_defs.ChainlinkFeedUpdate],
+    feed_syncs: typing.Sequence[chainlink_schema_defs.ChainlinkFeedSync],
+    context: spec.Context,
+) -> None:
+    """intake answer updates of many feeds and their last-synced blocks
+
+    updates of all feeds are written using a single connection, and sync
+    blocks are written after the updates that they cover
+    """
+
+    if len(feed_updates) == 0 and len(feed_syncs) == 0:
+        return
+
+    db_config = config.get_context_db_config(
+        schema_name='chainlink',
+        context=context,
+    )
+    async with toolsql.async_connect(db_config) as conn:
+        await chainlink_statements.async_upsert_feed_updates(
+            feed_updates=feed_updates,
+            conn=conn,
+            context=context,
+        )
+        await chainlink_statements.async_upsert_feed_syncs(
+            feed_syncs=feed_syncs,
+            conn=conn,
+            context=context,
+        )
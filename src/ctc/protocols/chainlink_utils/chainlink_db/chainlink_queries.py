@@ -19,3 +19,13 @@ async_query_aggregator_updates = db.query_utils.wrap_selector_with_connection(
     chainlink_statements.async_select_aggregator_updates,
     'chainlink',
 )
+
+async_query_feed_updates = db.query_utils.wrap_selector_with_connection(
+    chainlink_statements.async_select_feed_updates,
+    'chainlink',
+)
+
+async_query_feed_syncs = db.query_utils.wrap_selector_with_connection(
+    chainlink_statements.async_select_feed_syncs,
+    'chainlink',
+)
@@ -25,6 +25,19 @@ if typing.TYPE_CHECKING:
         aggregator: spec.Address
         block_number: int
 
+    class ChainlinkFeedUpdate(TypedDict):
+        feed: spec.Address
+        aggregator: spec.Address
+        block_number: int
+        log_index: int
+        round_id: int
+        answer: str
+        timestamp: int
+
+    class ChainlinkFeedSync(TypedDict):
+        feed: spec.Address
+        last_synced_block: int
+
 
 chainlink_schema: toolsql.DBSchemaShorthand = {
     'tables': {
@@ -47,5 +60,22 @@ chainlink_schema: toolsql.DBSchemaShorthand = {
                 {'name': 'block_number', 'type': 'Integer', 'primary': True},
             ],
         },
+        'chainlink_feed_updates': {
+            'columns': [
+                {'name': 'feed', 'type': 'Text', 'primary': True},
+                {'name': 'block_number', 'type': 'Integer', 'primary': True},
+                {'name': 'log_index', 'type': 'Integer', 'primary': True},
+                {'name': 'aggregator', 'type': 'Text'},
+                {'name': 'round_id', 'type': 'Integer'},
+                {'name': 'answer', 'type': 'Text'},  # int <-> str
+                {'name': 'timestamp', 'type': 'Integer'},
+            ],
+        },
+        'chainlink_feed_syncs': {
+            'columns': [
+                {'name': 'feed', 'type': 'Text', 'primary': True},
+                {'name': 'last_synced_block', 'type': 'Integer'},
+            ],
+        },
     },
 }
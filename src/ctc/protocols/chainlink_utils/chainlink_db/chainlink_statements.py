@@ -98,6 +98,61 @@ async def async_upsert_aggregator_updates(
     )
 
 
+async def async_upsert_feed_updates(
+    *,
+    feed_updates: typing.Sequence[chainlink_schema_defs.ChainlinkFeedUpdate],
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(feed_updates) == 0:
+        return
+
+    feed_updates = [
+        dict(  # type: ignore
+            feed_update,
+            feed=feed_update['feed'].lower(),
+            aggregator=feed_update['aggregator'].lower(),
+        )
+        for feed_update in feed_updates
+    ]
+
+    table = db.get_table_schema('chainlink_feed_updates', context=context)
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=feed_updates,
+        upsert=True,
+    )
+
+
+async def async_upsert_feed_syncs(
+    *,
+    feed_syncs: typing.Sequence[chainlink_schema_defs.ChainlinkFeedSync],
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(feed_syncs) == 0:
+        return
+
+    feed_syncs = [
+        {
+            'feed': feed_sync['feed'].lower(),
+            'last_synced_block': feed_sync['last_synced_block'],
+        }
+        for feed_sync in feed_syncs
+    ]
+
+    table = db.get_table_schema('chainlink_feed_syncs', context=context)
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=feed_syncs,
+        upsert=True,
+    )
+
+
 async def async_select_feed(
     *,
     conn: toolsql.AsyncConnection,
@@ -197,6 +252,61 @@ async def async_select_aggregator_updates(
     return result  # type: ignore
 
 
+async def async_select_feed_updates(
+    feed: spec.Address,
+    *,
+    start_block: int | None = None,
+    end_block: int | None = None,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> typing.Sequence[chainlink_schema_defs.ChainlinkFeedUpdate] | None:
+
+    table = db.get_table_schema('chainlink_feed_updates', context=context)
+
+    if start_block is not None:
+        where_gte = {'block_number': start_block}
+    else:
+        where_gte = None
+    if end_block is not None:
+        where_lte = {'block_number': end_block}
+    else:
+        where_lte = None
+
+    result = await toolsql.async_select(
+        conn=conn,
+        table=table,
+        where_equals={'feed': feed.lower()},
+        where_gte=where_gte,
+        where_lte=where_lte,
+        order_by=['block_number', 'log_index'],
+    )
+
+    return result  # type: ignore
+
+
+async def async_select_feed_syncs(
+    *,
+    conn: toolsql.AsyncConnection,
+    feeds: typing.Sequence[spec.Address] | None = None,
+    context: spec.Context = None,
+) -> typing.Sequence[chainlink_schema_defs.ChainlinkFeedSync] | None:
+
+    table = db.get_table_schema('chainlink_feed_syncs', context=context)
+
+    if feeds is not None:
+        where_in = {'feed': [feed.lower() for feed in feeds]}
+    else:
+        where_in = None
+
+    result = await toolsql.async_select(
+        conn=conn,
+        table=table,
+        where_in=where_in,
+    )
+
+    return result  # type: ignore
+
+
 async def async_delete_feed(
     conn: toolsql.AsyncConnection,
     *,
@@ -0,0 +1,259 @@
+"""sync answer updates of many chainlink feeds into the chainlink schema
+
+AnswerUpdated logs of the aggregators of all feeds are requested together
+over common block ranges, so the number of requests scales with the block
+range rather than with the number of feeds. each feed has a last-synced
+block, so that subsequent syncs only scan blocks after that block
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from ctc import config
+from ctc import evm
+from ctc import spec
+
+from . import chainlink_aggregators
+from . import chainlink_db
+from . import chainlink_spec
+
+
+async def async_get_feed_sync_blocks(
+    feeds: typing.Sequence[spec.Address] | None = None,
+    *,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, int]:
+    """get last-synced block of each feed, omitting feeds never synced"""
+
+    feed_syncs = await chainlink_db.async_query_feed_syncs(
+        feeds=feeds,
+        context=context,
+    )
+    if feed_syncs is None:
+        return {}
+    return {
+        feed_sync['feed']: feed_sync['last_synced_block']
+        for feed_sync in feed_syncs
+    }
+
+
+async def async_get_feeds_aggregator_histories(
+    feeds: typing.Sequence[spec.Address],
+    *,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, typing.Mapping[spec.Address, int]]:
+    """get start block of each aggregator of each feed"""
+
+    histories = await asyncio.gather(
+        *[
+            chainlink_aggregators.async_get_feed_aggregator_history(
+                feed=feed,
+                context=context,
+            )
+            for feed in feeds
+        ]
+    )
+    return dict(zip(feeds, histories))
+
+
+async def async_sync_feeds(
+    feeds: typing.Sequence[spec.Address] | None = None,
+    *,
+    end_block: spec.BlockNumberReference = 'latest',
+    max_addresses_per_request: int = 1000,
+    max_blocks_per_request: int = 2000,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, int]:
+    """sync answer updates of many feeds into the chainlink schema
+
+    - by default, syncs every feed of network listed in chainlink_feeds table
+    - each feed is synced from its last-synced block, or from its first
+      aggregator if it has never been synced
+    - updates of all feeds and their last-synced blocks are intaken together
+    - only blocks with enough confirmations are synced, so that updates of
+      reorged blocks are never stored
+    - returns last-synced block of each feed
+    """
+
+    from ctc.db import management
+
+    _read, write = config.get_context_cache_read_write(
+        schema_name='chainlink',
+        context=context,
+    )
+    if not write:
+        raise Exception('chainlink schema must be writable to sync feeds')
+
+    # gather feeds
+    if feeds is None:
+        db_feeds = await chainlink_db.async_query_feeds(context=context)
+        if db_feeds is None:
+            raise Exception('no chainlink feeds in db, import them first')
+        feeds = [feed['address'] for feed in db_feeds if feed is not None]
+    feeds = [feed.lower() for feed in feeds]
+    latest_block = await evm.async_get_latest_block_number(context=context)
+    if end_block == 'latest':
+        end_block = latest_block
+    else:
+        end_block = await evm.async_block_number_to_int(
+            end_block, context=context
+        )
+    end_block = min(
+        end_block,
+        latest_block - management.get_required_confirmations(context),
+    )
+
+    # determine block range of each feed
+    sync_blocks, histories = await asyncio.gather(
+        async_get_feed_sync_blocks(feeds, context=context),
+        async_get_feeds_aggregator_histories(feeds, context=context),
+    )
+    start_blocks = {}
+    for feed in feeds:
+        if feed in sync_blocks:
+            start_blocks[feed] = sync_blocks[feed] + 1
+        elif len(histories[feed]) > 0:
+            start_blocks[feed] = min(histories[feed].values())
+        else:
+            raise Exception('no aggregators found for feed ' + str(feed))
+    synced_feeds = [feed for feed in feeds if start_blocks[feed] <= end_block]
+
+    # fetch updates of all feeds together
+    updates = await async_get_feeds_updates(
+        {feed: histories[feed] for feed in synced_feeds},
+        start_blocks=start_blocks,
+        end_block=end_block,
+        max_addresses_per_request=max_addresses_per_request,
+        max_blocks_per_request=max_blocks_per_request,
+        context=context,
+    )
+
+    # intake updates and last-synced blocks
+    feed_updates: typing.Sequence[
+        chainlink_db.chainlink_schema_defs.ChainlinkFeedUpdate
+    ] = updates.to_dicts()  # type: ignore
+    feed_syncs: typing.Sequence[
+        chainlink_db.chainlink_schema_defs.ChainlinkFeedSync
+    ] = [
+        {'feed': feed, 'last_synced_block': end_block} for feed in synced_feeds
+    ]
+    await chainlink_db.async_intake_feed_updates(
+        feed_updates=feed_updates,
+        feed_syncs=feed_syncs,
+        context=context,
+    )
+
+    return dict(sync_blocks, **{feed: end_block for feed in synced_feeds})
+
+
+async def async_get_feeds_updates(
+    feed_aggregators: typing.Mapping[
+        spec.Address, typing.Mapping[spec.Address, int]
+    ],
+    *,
+    start_blocks: typing.Mapping[spec.Address, int],
+    end_block: int,
+    max_addresses_per_request: int = 1000,
+    max_blocks_per_request: int = 2000,
+    context: spec.Context = None,
+) -> spec.DataFrame:
+    """get raw answer updates of many feeds using shared log scans
+
+    - feed_aggregators maps each feed to the start block of each aggregator,
+      as returned by async_get_feed_aggregator_history()
+    - each aggregator is scanned only over blocks in which it is the active
+      aggregator of its feed, starting no earlier than start_blocks[feed]
+    - answers are str, to preserve int256 values
+    """
+
+    import polars as pl
+    from ctc.defi.dex_utils.dexes import dex_log_scans
+
+    # determine block range of each aggregator of each feed
+    ranges = []
+    scan_starts: dict[spec.Address, int] = {}
+    for feed, history in feed_aggregators.items():
+        aggregator_starts = sorted(history.items(), key=lambda item: item[1])
+        for a, (aggregator, aggregator_start) in enumerate(aggregator_starts):
+            if a + 1 < len(aggregator_starts):
+                aggregator_end = aggregator_starts[a + 1][1] - 1
+            else:
+                aggregator_end = end_block
+            range_start = max(aggregator_start, start_blocks[feed])
+            range_end = min(aggregator_end, end_block)
+            if range_start <= range_end:
+                aggregator = aggregator.lower()
+                ranges.append(
+                    {
+                        'feed': feed.lower(),
+                        'aggregator': aggregator,
+                        'range_start': range_start,
+                        'range_end': range_end,
+                    }
+                )
+                scan_starts[aggregator] = min(
+                    range_start, scan_starts.get(aggregator, range_start)
+                )
+    schema = {
+        'feed': pl.Utf8,
+        'aggregator': pl.Utf8,
+        'block_number': pl.Int64,
+        'log_index': pl.Int64,
+        'round_id': pl.Int64,
+        'answer': pl.Utf8,
+        'timestamp': pl.Int64,
+    }
+    if len(ranges) == 0:
+        return pl.DataFrame(schema=schema)
+    ranges_df = pl.DataFrame(
+        ranges,
+        schema={
+            'feed': pl.Utf8,
+            'aggregator': pl.Utf8,
+            'range_start': pl.Int64,
+            'range_end': pl.Int64,
+        },
+    )
+
+    # fetch and decode logs of all aggregators together
+    event_abi = chainlink_spec.aggregator_event_abis['AnswerUpdated']
+    event_hash = evm.get_event_hash(event_abi)
+    events = await dex_log_scans.async_scan_contract_logs(
+        {aggregator: event_hash for aggregator in scan_starts.keys()},
+        start_blocks=scan_starts,
+        end_block=end_block,
+        filter_addresses=(len(scan_starts) <= max_addresses_per_request),
+        max_blocks_per_request=max_blocks_per_request,
+        context=context,
+    )
+    if len(events) == 0:
+        return pl.DataFrame(schema=schema)
+    decoded = await evm.async_decode_events_dataframe(
+        events,
+        event_abis=[event_abi],
+        integer_output_format={
+            'current': object,
+            'roundId': pl.Int64,
+            'updatedAt': pl.Int64,
+        },
+        context=context,
+    )
+    events = events.with_columns(decoded).select(
+        pl.col('contract_address').alias('aggregator'),
+        pl.col('block_number').cast(pl.Int64),
+        pl.col('log_index').cast(pl.Int64),
+        pl.col('arg__roundId').alias('round_id'),
+        pl.col('arg__current').apply(str, return_dtype=pl.Utf8).alias('answer'),
+        pl.col('arg__updatedAt').alias('timestamp'),
+    )
+
+    # assign each update to the feed whose aggregator was active
+    updates = events.join(ranges_df, on='aggregator', how='inner')
+    updates = updates.filter(
+        (pl.col('block_number') >= pl.col('range_start'))
+        & (pl.col('block_number') <= pl.col('range_end'))
+    )
+    updates = updates.select(list(schema.keys()))
+    return updates.sort(['feed', 'block_number', 'log_index'])
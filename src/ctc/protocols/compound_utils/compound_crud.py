@@ -57,10 +57,11 @@ async def async_get_supply_apy_by_block(
 
     import numpy as np
 
-    supply_rate_per_block = await rpc.async_batch_eth_call(
+    supply_rate_per_block = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=ctoken,
         function_name='supplyRatePerBlock',
-        block_numbers=blocks,
         context=context,
     )
     as_array: spec.NumpyArray = np.array(supply_rate_per_block)
@@ -77,10 +78,11 @@ async def async_get_borrow_apy_by_block(
 
     import numpy as np
 
-    borrow_rate_per_block = await rpc.async_batch_eth_call(
+    borrow_rate_per_block = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=ctoken,
         function_name='borrowRatePerBlock',
-        block_numbers=blocks,
         context=context,
     )
     as_array: spec.NumpyArray = np.array(borrow_rate_per_block)
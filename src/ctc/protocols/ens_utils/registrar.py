@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing
+
 from ctc import evm
 from ctc import rpc
 from ctc import spec
@@ -80,6 +82,32 @@ async def async_get_resolver(
     return result
 
 
+async def async_get_resolver_by_block(
+    name: str,
+    *,
+    blocks: typing.Sequence[spec.BlockNumberReference],
+    context: spec.Context = None,
+) -> typing.Sequence[spec.Address]:
+    node = resolver.hash_name(name)
+    function_abi: spec.FunctionABI = {
+        'name': 'resolver',
+        'inputs': [{'type': 'bytes32'}],
+        'outputs': [{'type': 'address'}],
+    }
+    results: typing.Sequence[spec.Address] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=ens_directory.registry,
+        function_abi=function_abi,
+        function_parameters=[node],
+        context=context,
+    )
+    for result in results:
+        if not isinstance(result, str):
+            raise Exception('invalid rpc result')
+    return results
+
+
 async def async_get_registration_block(
     name: str, *, context: spec.Context = None
 ) -> int:
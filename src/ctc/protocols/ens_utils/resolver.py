@@ -69,6 +69,64 @@ async def async_resolve_name(
     return result
 
 
+async def async_resolve_name_by_block(
+    name: str,
+    *,
+    blocks: typing.Sequence[spec.BlockNumberReference],
+    context: spec.Context = None,
+) -> typing.Sequence[spec.Address | None]:
+    """resolve name at each of multiple blocks using batched eth_calls"""
+
+    null_address = '0x0000000000000000000000000000000000000000'
+    name_hash = hash_name(name)
+    function_abi: spec.FunctionABI = {
+        'name': 'addr',
+        'inputs': [{'type': 'bytes32'}],
+        'outputs': [{'type': 'address'}],
+    }
+    results: list[spec.Address | None] = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=ens_directory.resolver,
+        function_abi=function_abi,
+        function_parameters=[name_hash],
+        context=context,
+    )
+
+    # resolve remaining blocks using the resolver registered at each block
+    unresolved = [
+        i for i, result in enumerate(results) if result == null_address
+    ]
+    if len(unresolved) > 0:
+        resolvers = await registrar.async_get_resolver_by_block(
+            name,
+            blocks=[blocks[i] for i in unresolved],
+            context=context,
+        )
+        blocks_of_resolver: dict[spec.Address, list[int]] = {}
+        for i, resolver in zip(unresolved, resolvers):
+            if resolver == null_address:
+                results[i] = None
+            else:
+                blocks_of_resolver.setdefault(resolver, []).append(i)
+        for resolver, indices in blocks_of_resolver.items():
+            resolver_results = await rpc.async_sample_by_block(
+                'eth_call',
+                [blocks[i] for i in indices],
+                to_address=resolver,
+                function_abi=function_abi,
+                function_parameters=[name_hash],
+                context=context,
+            )
+            for i, result in zip(indices, resolver_results):
+                results[i] = result
+
+    for result in results:
+        if result is not None and not isinstance(result, str):
+            raise Exception('invalid rpc result')
+    return results
+
+
 async def async_resolve_names(
     names: typing.Sequence[str],
     *,
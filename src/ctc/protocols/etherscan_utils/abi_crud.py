@@ -16,21 +16,80 @@ if typing.TYPE_CHECKING:
 
     class EtherscanRatelimit(TypedDict):
         requests_per_second: int | float
-        last_request_time: int | float
-        lock: asyncio.Lock | None
-        recent_results: typing.MutableMapping[spec.Address, spec.ContractABI]
+        burst: int
+        max_in_flight: int
+        tokens: float
+        last_refill_time: float
+        semaphore: asyncio.Semaphore | None
+        in_flight: typing.MutableMapping[
+            tuple[int, spec.Address], asyncio.Future[spec.ContractABI]
+        ]
+        recent_results: typing.MutableMapping[
+            tuple[int, spec.Address], spec.ContractABI
+        ]
 
 
 _etherscan_ratelimit: EtherscanRatelimit = {
     'requests_per_second': 0.2,
-    'last_request_time': 0,
-    'lock': None,
+    'burst': 1,
+    'max_in_flight': 8,
+    'tokens': 1,
+    'last_refill_time': 0,
+    'semaphore': None,
+    'in_flight': {},
     'recent_results': {},
 }
 
 
-def set_etherscan_ratelimit(requests_per_second: int | float) -> None:
+def set_etherscan_ratelimit(
+    requests_per_second: int | float,
+    *,
+    burst: int | None = None,
+    max_in_flight: int | None = None,
+) -> None:
+    """set rate limit of etherscan requests
+
+    ## Inputs
+    - requests_per_second: rate at which request tokens are replenished
+    - burst: max number of requests that can be sent at once
+    - max_in_flight: max number of concurrent outstanding requests
+    """
     _etherscan_ratelimit['requests_per_second'] = requests_per_second
+    if burst is not None:
+        _etherscan_ratelimit['burst'] = burst
+    if max_in_flight is not None:
+        _etherscan_ratelimit['max_in_flight'] = max_in_flight
+        _etherscan_ratelimit['semaphore'] = None
+
+
+async def _async_acquire_etherscan_token(verbose: bool) -> None:
+    """wait for token from token bucket of etherscan rate limit"""
+    ratelimit = _etherscan_ratelimit
+    while True:
+        # refill tokens
+        now = time.time()
+        elapsed = now - ratelimit['last_refill_time']
+        ratelimit['tokens'] = min(
+            ratelimit['burst'],
+            ratelimit['tokens'] + elapsed * ratelimit['requests_per_second'],
+        )
+        ratelimit['last_refill_time'] = now
+
+        # take token
+        if ratelimit['tokens'] >= 1:
+            ratelimit['tokens'] -= 1
+            return
+
+        time_to_sleep = (1 - ratelimit['tokens']) / ratelimit[
+            'requests_per_second'
+        ]
+        if verbose:
+            print(
+                'etherscan ratelimit hit, sleeping for '
+                + str(time_to_sleep)
+                + ' seconds'
+            )
+        await asyncio.sleep(time_to_sleep)
 
 
 async def async_get_contract_abi(
@@ -39,9 +98,10 @@ async def async_get_contract_abi(
     context: spec.Context = None,
     verbose: bool = True,
 ) -> spec.ContractABI:
-    """fetch contract abi using etherscan"""
+    """fetch contract abi using etherscan
 
-    import aiohttp
+    concurrent requests for the same address share a single request
+    """
 
     network = config.get_context_chain_id(context)
 
@@ -49,31 +109,45 @@ async def async_get_contract_abi(
     if not evm.is_address_str(contract_address):
         raise Exception('not a valid address: ' + str(contract_address))
 
-    # create lock
-    lock = _etherscan_ratelimit['lock']
-    if lock is None:
-        lock = asyncio.Lock()
-        _etherscan_ratelimit['lock'] = lock
+    key = (network, contract_address)
+    if key in _etherscan_ratelimit['recent_results']:
+        return _etherscan_ratelimit['recent_results'][key]
+
+    # join request already in flight
+    in_flight = _etherscan_ratelimit['in_flight']
+    future = in_flight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(
+            _async_fetch_contract_abi(
+                contract_address, network=network, verbose=verbose
+            )
+        )
+        in_flight[key] = future
+        future.add_done_callback(lambda _: in_flight.pop(key, None))
 
-    # acquire lock
-    async with lock:
+    abi = await asyncio.shield(future)
+    _etherscan_ratelimit['recent_results'][key] = abi
+    return abi
 
-        if contract_address in _etherscan_ratelimit['recent_results']:
-            return _etherscan_ratelimit['recent_results'][contract_address]
+
+async def _async_fetch_contract_abi(
+    contract_address: spec.Address,
+    *,
+    network: int,
+    verbose: bool,
+) -> spec.ContractABI:
+    import aiohttp
+
+    # limit number of concurrent requests
+    semaphore = _etherscan_ratelimit['semaphore']
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_etherscan_ratelimit['max_in_flight'])
+        _etherscan_ratelimit['semaphore'] = semaphore
+
+    async with semaphore:
 
         # ratelimit
-        now = time.time()
-        time_since_last = now - _etherscan_ratelimit['last_request_time']
-        seconds_per_request = 1 / _etherscan_ratelimit['requests_per_second']
-        time_to_sleep = seconds_per_request - time_since_last
-        if time_to_sleep > 0:
-            if verbose:
-                print(
-                    'etherscan ratelimit hit, sleeping for '
-                    + str(time_to_sleep)
-                    + ' seconds'
-                )
-            await asyncio.sleep(time_to_sleep)
+        await _async_acquire_etherscan_token(verbose=verbose)
 
         if verbose:
             network_name = evm.get_network_name(network)
@@ -92,23 +166,47 @@ async def async_get_contract_abi(
         async with aiohttp.ClientSession() as session:
             async with session.get(abi_endpoint) as response:
                 content = await response.text()
-        _etherscan_ratelimit['last_request_time'] = time.time()
-
-        # process request
-        if content == 'Contract source code not verified':
-            raise spec.AbiNotFoundException(
-                'contract not verified on etherscan ' + str(contract_address)
-            )
-        abi = json.loads(content)
-        if isinstance(abi, dict) and abi.get('status') == '0':
-            raise Exception(
-                'could not obtain contract abi from etherscan for '
-                + str(contract_address)
-            )
 
-        _etherscan_ratelimit['recent_results'][contract_address] = abi
+    # process request
+    if content == 'Contract source code not verified':
+        raise spec.AbiNotFoundException(
+            'contract not verified on etherscan ' + str(contract_address)
+        )
+    abi = json.loads(content)
+    if isinstance(abi, dict) and abi.get('status') == '0':
+        raise Exception(
+            'could not obtain contract abi from etherscan for '
+            + str(contract_address)
+        )
 
     if typing.TYPE_CHECKING:
         return typing.cast(spec.ContractABI, abi)
     else:
         return abi
+
+
+async def async_get_contracts_abis(
+    contract_addresses: typing.Sequence[spec.Address],
+    *,
+    context: spec.Context = None,
+    verbose: bool = True,
+) -> typing.Mapping[spec.Address, spec.ContractABI]:
+    """fetch abis of multiple contracts using etherscan
+
+    requests are sent concurrently within rate limit, addresses whose abi
+    cannot be obtained are omitted from output
+    """
+
+    unique_addresses = list(dict.fromkeys(contract_addresses))
+    results = await asyncio.gather(
+        *[
+            async_get_contract_abi(address, context=context, verbose=verbose)
+            for address in unique_addresses
+        ],
+        return_exceptions=True,
+    )
+    return {
+        address: result
+        for address, result in zip(unique_addresses, results)
+        if not isinstance(result, BaseException)
+    }
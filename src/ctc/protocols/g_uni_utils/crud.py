@@ -88,10 +88,11 @@ async def async_get_token_balances_by_block(
     normalize: bool = True,
     context: spec.Context = None,
 ) -> typing.Sequence[typing.Sequence[int | float]]:
-    balances_coroutine = rpc.async_batch_eth_call(
+    balances_coroutine = rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=g_uni_pool,
         function_name='getUnderlyingBalances',
-        block_numbers=blocks,
         context=context,
     )
     balances_task = asyncio.create_task(balances_coroutine)
@@ -117,13 +117,41 @@ async def async_multicall_by_block(
     blocks: typing.Sequence[spec.BlockNumberReference],
     context: spec.Context = None,
 ) -> typing.Sequence[typing.Sequence[typing.Any]]:
+    """perform multicall at each block, returning outputs of each call
+
+    the same aggregate call is sent to each block in batched requests
+    """
+
+    # encode calls
+    coroutines = [
+        call_utils.async_encode_call(call, context=context) for call in calls
+    ]
+    encoded_calls = await asyncio.gather(*coroutines)
+
+    # make calls
+    results = await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
+        to_address=get_multicall_address(context=context),
+        function_abi=function_abis['aggregate'],
+        function_parameters=[encoded_calls],
+        context=context,
+    )
+
+    # decode outputs
     coroutines = [
-        async_multicall(
-            calls=calls,
-            block=block,
+        call_utils.async_decode_call_output(
+            call=call,
+            encoded_output=encoded_output,
             context=context,
         )
-        for block in blocks
+        for _block_number, encoded_outputs in results
+        for call, encoded_output in zip(calls, encoded_outputs)
+    ]
+    decoded_outputs = await asyncio.gather(*coroutines)
+    n_calls = len(calls)
+    blocks_outputs = [
+        decoded_outputs[b * n_calls : (b + 1) * n_calls]
+        for b in range(len(results))
     ]
-    results = asyncio.gather(*coroutines)
-    return list(zip(*results))
+    return list(zip(*blocks_outputs))
@@ -28,10 +28,11 @@ async def async_get_ctoken_exchange_rate_by_block(
     ctoken: spec.Address,
     blocks: typing.Sequence[spec.BlockNumberReference],
 ) -> list[int]:
-    return await rpc.async_batch_eth_call(
+    return await rpc.async_sample_by_block(
+        'eth_call',
+        blocks,
         to_address=ctoken,
         function_abi=rari_abis.ctoken_function_abis['exchangeRateCurrent'],
-        block_numbers=blocks,
         empty_token=None,
     )
 
@@ -1,5 +1,6 @@
 # from .uniswap_v2_deltas import *
 from .uniswap_v2_events import *
 from .uniswap_v2_metadata import *
+from .uniswap_v2_reserves import *
 from .uniswap_v2_spec import *
 from .uniswap_v2_state import *
@@ -0,0 +1,4 @@
+from .uniswap_v2_intake import *
+from .uniswap_v2_queries import *
+from .uniswap_v2_schema_defs import *
+from .uniswap_v2_statements import *
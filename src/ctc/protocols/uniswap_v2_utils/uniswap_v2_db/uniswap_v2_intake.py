@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import typing
+
+import toolsql
+
+from ctc import config
+from ctc import spec
+
+from . import uniswap_v2_schema_defs
+from . import uniswap_v2_statements
+
+
+async def async_intake_pool_reserves(
+    *,
+    pool_reserves: typing.Sequence[
+        uniswap_v2_schema_defs.UniswapV2PoolReserves
+    ],
+    reserve_syncs: typing.Sequence[uniswap_v2_schema_defs.UniswapV2ReserveSync],
+    context: spec.Context,
+) -> None:
+    """intake reserves of many pools and their last-synced blocks
+
+    reserves of all pools are written using a single connection, and sync
+    blocks are written after the reserves that they cover
+    """
+
+    if len(pool_reserves) == 0 and len(reserve_syncs) == 0:
+        return
+
+    db_config = config.get_context_db_config(
+        schema_name='uniswap_v2',
+        context=context,
+    )
+    async with toolsql.async_connect(db_config) as conn:
+        await uniswap_v2_statements.async_upsert_pool_reserves(
+            pool_reserves=pool_reserves,
+            conn=conn,
+            context=context,
+        )
+        await uniswap_v2_statements.async_upsert_reserve_syncs(
+            reserve_syncs=reserve_syncs,
+            conn=conn,
+            context=context,
+        )
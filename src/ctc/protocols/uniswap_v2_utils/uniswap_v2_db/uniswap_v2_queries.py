@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from ctc import db
+
+from . import uniswap_v2_statements
+
+
+async_query_pools_reserves = db.query_utils.wrap_selector_with_connection(
+    uniswap_v2_statements.async_select_pools_reserves,
+    'uniswap_v2',
+)
+
+async_query_reserve_syncs = db.query_utils.wrap_selector_with_connection(
+    uniswap_v2_statements.async_select_reserve_syncs,
+    'uniswap_v2',
+)
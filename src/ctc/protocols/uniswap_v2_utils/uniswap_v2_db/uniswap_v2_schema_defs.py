@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+
+    from typing_extensions import TypedDict
+
+    import toolsql
+
+    class UniswapV2PoolReserves(TypedDict):
+        pool: spec.Address
+        block_number: int
+        reserve0: str
+        reserve1: str
+
+    class UniswapV2ReserveSync(TypedDict):
+        pool: spec.Address
+        last_synced_block: int
+
+
+uniswap_v2_schema: toolsql.DBSchemaShorthand = {
+    'tables': {
+        'uniswap_v2_pool_reserves': {
+            'columns': [
+                {'name': 'pool', 'type': 'Text', 'primary': True},
+                {'name': 'block_number', 'type': 'Integer', 'primary': True},
+                {'name': 'reserve0', 'type': 'Text'},  # int <-> str
+                {'name': 'reserve1', 'type': 'Text'},  # int <-> str
+            ],
+        },
+        'uniswap_v2_reserve_syncs': {
+            'columns': [
+                {'name': 'pool', 'type': 'Text', 'primary': True},
+                {'name': 'last_synced_block', 'type': 'Integer'},
+            ],
+        },
+    },
+}
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import typing
+
+import toolsql
+
+from ctc import spec
+from ctc import db
+from . import uniswap_v2_schema_defs
+
+
+async def async_upsert_pool_reserves(
+    *,
+    pool_reserves: typing.Sequence[
+        uniswap_v2_schema_defs.UniswapV2PoolReserves
+    ],
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(pool_reserves) == 0:
+        return
+
+    pool_reserves = [
+        dict(pool_reserve, pool=pool_reserve['pool'].lower())  # type: ignore
+        for pool_reserve in pool_reserves
+    ]
+
+    table = db.get_table_schema('uniswap_v2_pool_reserves', context=context)
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=pool_reserves,
+        upsert=True,
+    )
+
+
+async def async_upsert_reserve_syncs(
+    *,
+    reserve_syncs: typing.Sequence[uniswap_v2_schema_defs.UniswapV2ReserveSync],
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> None:
+
+    if len(reserve_syncs) == 0:
+        return
+
+    reserve_syncs = [
+        {
+            'pool': reserve_sync['pool'].lower(),
+            'last_synced_block': reserve_sync['last_synced_block'],
+        }
+        for reserve_sync in reserve_syncs
+    ]
+
+    table = db.get_table_schema('uniswap_v2_reserve_syncs', context=context)
+    await toolsql.async_insert(
+        conn=conn,
+        table=table,
+        rows=reserve_syncs,
+        upsert=True,
+    )
+
+
+async def async_select_pools_reserves(
+    pools: typing.Sequence[spec.Address],
+    *,
+    end_block: int | None = None,
+    conn: toolsql.AsyncConnection,
+    context: spec.Context = None,
+) -> spec.DataFrame | None:
+    """select reserves of pools as a dataframe sorted by pool and block"""
+
+    table = db.get_table_schema('uniswap_v2_pool_reserves', context=context)
+
+    if end_block is not None:
+        where_lte = {'block_number': end_block}
+    else:
+        where_lte = None
+
+    result: spec.DataFrame = await toolsql.async_select(  # type: ignore
+        conn=conn,
+        table=table,
+        where_in={'pool': [pool.lower() for pool in pools]},
+        where_lte=where_lte,
+        order_by=['pool', 'block_number'],
+        output_format='polars',
+    )
+    return result
+
+
+async def async_select_reserve_syncs(
+    *,
+    conn: toolsql.AsyncConnection,
+    pools: typing.Sequence[spec.Address] | None = None,
+    context: spec.Context = None,
+) -> typing.Sequence[uniswap_v2_schema_defs.UniswapV2ReserveSync] | None:
+
+    table = db.get_table_schema('uniswap_v2_reserve_syncs', context=context)
+
+    if pools is not None:
+        where_in = {'pool': [pool.lower() for pool in pools]}
+    else:
+        where_in = None
+
+    result = await toolsql.async_select(
+        conn=conn,
+        table=table,
+        where_in=where_in,
+    )
+
+    return result  # type: ignore
@@ -0,0 +1,297 @@
+"""incremental block-indexed reserves of uniswap v2 pools
+
+reserves are replayed from Sync events, which record both reserves after
+every Mint, Burn, and Swap. each pool has a compact table with one row per
+block in which its reserves changed, stored in the uniswap_v2 schema along
+with the last-synced block of the pool. each call only scans blocks after
+that block, and reserves at arbitrary blocks are looked up with searchsorted
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import config
+from ctc import evm
+from ctc import spec
+
+from . import uniswap_v2_db
+from . import uniswap_v2_metadata
+from . import uniswap_v2_spec
+
+
+async def async_get_pools_reserve_tables(
+    pools: typing.Sequence[spec.Address],
+    *,
+    start_block: spec.BlockNumberReference | None = None,
+    end_block: spec.BlockNumberReference = 'latest',
+    max_addresses_per_request: int = 1000,
+    max_blocks_per_request: int = 2000,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, spec.DataFrame]:
+    """get block-indexed reserves of pools, extending stored tables
+
+    - tables have columns block_number, reserve0, and reserve1, with one row
+      per block in which reserves changed, using raw reserves after the last
+      Sync of that block
+    - stored tables are extended by scanning only blocks after the last-synced
+      block of each pool, with Sync logs of all pools fetched together
+    - pools never synced are scanned from start_block, or by default from
+      their creation block
+    - new rows are written back to the uniswap_v2 schema, except for pools
+      scanned from start_block, whose tables may be missing earlier rows
+    - only blocks with enough confirmations are stored, the unconfirmed tail
+      is returned without storing it
+    """
+
+    import asyncio
+    import polars as pl
+    from ctc.defi.dex_utils.dexes import dex_log_scans
+
+    pools = [pool.lower() for pool in pools]
+    end_block = await evm.async_block_number_to_int(end_block, context=context)
+    read_cache, write_cache = config.get_context_cache_read_write(
+        schema_name='uniswap_v2',
+        context=context,
+    )
+
+    # load stored tables and last-synced blocks
+    if read_cache:
+        stored, reserve_syncs = await asyncio.gather(
+            uniswap_v2_db.async_query_pools_reserves(
+                pools,
+                end_block=end_block,
+                context=context,
+            ),
+            uniswap_v2_db.async_query_reserve_syncs(
+                pools=pools,
+                context=context,
+            ),
+        )
+    else:
+        stored = None
+        reserve_syncs = None
+    if reserve_syncs is None:
+        reserve_syncs = []
+    sync_blocks = {
+        reserve_sync['pool']: reserve_sync['last_synced_block']
+        for reserve_sync in reserve_syncs
+    }
+
+    # determine first block to scan for each pool
+    start_blocks = {
+        pool: sync_blocks[pool] + 1 for pool in pools if pool in sync_blocks
+    }
+    unsynced = [pool for pool in pools if pool not in sync_blocks]
+    partial_pools: set[spec.Address] = set()
+    if start_block is not None:
+        start_block = await evm.async_block_number_to_int(
+            start_block, context=context
+        )
+        for pool in unsynced:
+            start_blocks[pool] = start_block
+        partial_pools.update(unsynced)
+    elif len(unsynced) > 0:
+        creation_blocks = await evm.async_get_contracts_creation_blocks(
+            unsynced,
+            context=context,
+        )
+        for pool, creation_block in zip(unsynced, creation_blocks):
+            if creation_block is None:
+                creation_block = 0
+            start_blocks[pool] = creation_block
+    scan_pools = [pool for pool in pools if start_blocks[pool] <= end_block]
+
+    # replay Sync events of new blocks, keeping last Sync of each block
+    new = pl.DataFrame(
+        schema={
+            'pool': pl.Utf8,
+            'block_number': pl.Int64,
+            'reserve0': pl.Utf8,
+            'reserve1': pl.Utf8,
+        }
+    )
+    if len(scan_pools) > 0:
+        event_abi = uniswap_v2_spec.pool_event_abis['Sync']
+        event_hash = evm.get_event_hash(event_abi)
+        events = await dex_log_scans.async_scan_contract_logs(
+            {pool: event_hash for pool in scan_pools},
+            start_blocks={pool: start_blocks[pool] for pool in scan_pools},
+            end_block=end_block,
+            filter_addresses=(len(scan_pools) <= max_addresses_per_request),
+            max_blocks_per_request=max_blocks_per_request,
+            context=context,
+        )
+        if len(events) > 0:
+            decoded = await evm.async_decode_events_dataframe(
+                events,
+                event_abis=[event_abi],
+                integer_output_format=object,
+                context=context,
+            )
+            syncs = events.with_columns(decoded).select(
+                pl.col('contract_address').alias('pool'),
+                pl.col('block_number').cast(pl.Int64),
+                pl.col('arg__reserve0')
+                .apply(str, return_dtype=pl.Utf8)
+                .alias('reserve0'),
+                pl.col('arg__reserve1')
+                .apply(str, return_dtype=pl.Utf8)
+                .alias('reserve1'),
+            )
+            new = syncs.groupby(
+                ['pool', 'block_number'], maintain_order=True
+            ).last()
+
+    # store new rows and last-synced blocks of complete, confirmed tables
+    store_pools = [pool for pool in scan_pools if pool not in partial_pools]
+    if write_cache and len(store_pools) > 0:
+        from ctc.db import management
+
+        latest_block = await evm.async_get_latest_block_number(context=context)
+        confirmed_block = min(
+            end_block,
+            latest_block - management.get_required_confirmations(context),
+        )
+        store_pools = [
+            pool
+            for pool in store_pools
+            if start_blocks[pool] <= confirmed_block
+        ]
+        if len(store_pools) > 0:
+            pool_reserves: typing.Sequence[
+                uniswap_v2_db.uniswap_v2_schema_defs.UniswapV2PoolReserves
+            ] = new.filter(
+                pl.col('pool').is_in(store_pools)
+                & (pl.col('block_number') <= confirmed_block)
+            ).to_dicts()  # type: ignore
+            await uniswap_v2_db.async_intake_pool_reserves(
+                pool_reserves=pool_reserves,
+                reserve_syncs=[
+                    {'pool': pool, 'last_synced_block': confirmed_block}
+                    for pool in store_pools
+                ],
+                context=context,
+            )
+
+    # combine stored and new rows
+    frames = [new]
+    if stored is not None and len(stored) > 0:
+        frames.insert(0, stored.select(new.columns))
+    combined = pl.concat(frames).select(
+        pl.col('pool').alias('contract_address'),
+        pl.col('block_number').cast(pl.Int64),
+        pl.col('reserve0').cast(pl.Float64),
+        pl.col('reserve1').cast(pl.Float64),
+    )
+    partitions = dex_log_scans.partition_contract_events(combined, pools)
+    return {
+        pool: table.drop('contract_address').sort('block_number')
+        for pool, table in partitions.items()
+    }
+
+
+def get_reserves_at_blocks(
+    reserve_table: spec.DataFrame,
+    blocks: typing.Sequence[int],
+) -> spec.DataFrame:
+    """look up reserves of a block-indexed reserve table at given blocks
+
+    - reserves at a block are those after the last Sync at or before it
+    - blocks before the first Sync have null reserves
+    """
+
+    import numpy as np
+    import polars as pl
+
+    query_blocks = np.array(blocks, dtype=np.int64)
+    if len(reserve_table) == 0:
+        return pl.DataFrame(
+            {
+                'block_number': query_blocks,
+                'reserve0': pl.Series([None] * len(blocks), dtype=pl.Float64),
+                'reserve1': pl.Series([None] * len(blocks), dtype=pl.Float64),
+            }
+        )
+
+    table_blocks = reserve_table['block_number'].to_numpy()
+    indices = np.searchsorted(table_blocks, query_blocks, side='right') - 1
+    reserves = reserve_table[np.maximum(indices, 0)]
+    synced = pl.Series(indices >= 0)
+    return pl.DataFrame({'block_number': query_blocks}).with_columns(
+        [
+            pl.when(synced).then(reserves[column]).otherwise(None).alias(column)
+            for column in ['reserve0', 'reserve1']
+        ]
+    )
+
+
+async def async_get_pools_reserves_by_block(
+    pools: typing.Sequence[spec.Address],
+    *,
+    blocks: typing.Sequence[spec.BlockNumberReference],
+    normalize: bool = True,
+    context: spec.Context = None,
+) -> typing.Mapping[spec.Address, spec.DataFrame]:
+    """get reserves and prices of many pools at given blocks
+
+    - output columns are block_number, token0_reserves, token1_reserves,
+      price_0_per_1, and price_1_per_0
+    - reserve tables are extended up to the largest block before lookup
+    """
+
+    import asyncio
+    import polars as pl
+
+    int_blocks = await evm.async_block_numbers_to_int(blocks, context=context)
+    reserve_tables = await async_get_pools_reserve_tables(
+        pools,
+        end_block=max(int_blocks),
+        context=context,
+    )
+    if normalize:
+        pools_decimals = await asyncio.gather(
+            *[
+                uniswap_v2_metadata.async_get_pool_decimals(
+                    pool,
+                    context=context,
+                )
+                for pool in pools
+            ]
+        )
+    else:
+        pools_decimals = [(0, 0) for pool in pools]
+
+    output = {}
+    for pool, (decimals0, decimals1) in zip(pools, pools_decimals):
+        reserves = get_reserves_at_blocks(
+            reserve_tables[pool.lower()], int_blocks
+        )
+        token0_reserves = pl.col('reserve0') / (10**decimals0)
+        token1_reserves = pl.col('reserve1') / (10**decimals1)
+        output[pool] = reserves.select(
+            pl.col('block_number'),
+            token0_reserves.alias('token0_reserves'),
+            token1_reserves.alias('token1_reserves'),
+            (token0_reserves / token1_reserves).alias('price_0_per_1'),
+            (token1_reserves / token0_reserves).alias('price_1_per_0'),
+        )
+    return output
+
+
+async def async_get_pool_reserves_by_block(
+    pool: spec.Address,
+    *,
+    blocks: typing.Sequence[spec.BlockNumberReference],
+    normalize: bool = True,
+    context: spec.Context = None,
+) -> spec.DataFrame:
+    """get reserves and prices of pool at given blocks"""
+
+    pools_reserves = await async_get_pools_reserves_by_block(
+        [pool],
+        blocks=blocks,
+        normalize=normalize,
+        context=context,
+    )
+    return pools_reserves[pool]
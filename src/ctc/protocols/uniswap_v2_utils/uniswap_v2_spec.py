@@ -195,5 +195,24 @@ pool_event_abis: typing.Mapping[str, spec.EventABI] = {
         'name': 'Swap',
         'type': 'event',
     },
+    'Sync': {
+        'anonymous': False,
+        'inputs': [
+            {
+                'indexed': False,
+                'internalType': 'uint112',
+                'name': 'reserve0',
+                'type': 'uint112',
+            },
+            {
+                'indexed': False,
+                'internalType': 'uint112',
+                'name': 'reserve1',
+                'type': 'uint112',
+            },
+        ],
+        'name': 'Sync',
+        'type': 'event',
+    },
 }
 
@@ -4,7 +4,6 @@ import typing
 
 from ctc import evm
 from ctc import spec
-from ctc.toolbox import nested_utils
 
 from . import uniswap_v2_metadata
 from . import uniswap_v2_spec
@@ -110,21 +109,38 @@ async def async_get_pool_state_by_block(
         )
         decimals_task = asyncio.create_task(decimals_coroutine)
 
-    coroutines = [
-        async_get_pool_state(
-            pool=pool,
-            block=block,
+    token_x, token_y = await uniswap_v2_metadata.async_get_pool_tokens(
+        pool=pool, context=context
+    )
+    x_reserves, y_reserves, lp_total_supply = await asyncio.gather(
+        evm.async_get_erc20_balance_by_block(
+            wallet=pool,
+            token=token_x,
+            blocks=blocks,
             normalize=False,
             context=context,
-        )
-        for block in blocks
-    ]
-    results: list[uniswap_v2_spec.PoolState] = await asyncio.gather(*coroutines)
-
-    output: uniswap_v2_spec.PoolStateByBlock = (
-        nested_utils.list_of_dicts_to_dict_of_lists(results)  # type: ignore
+        ),
+        evm.async_get_erc20_balance_by_block(
+            wallet=pool,
+            token=token_y,
+            blocks=blocks,
+            normalize=False,
+            context=context,
+        ),
+        evm.async_get_erc20_total_supply_by_block(
+            token=pool,
+            blocks=blocks,
+            normalize=False,
+            context=context,
+        ),
     )
 
+    output: uniswap_v2_spec.PoolStateByBlock = {
+        'x_reserves': list(x_reserves),
+        'y_reserves': list(y_reserves),
+        'lp_total_supply': list(lp_total_supply),
+    }
+
     if normalize:
 
         x_decimals, y_decimals = await decimals_task
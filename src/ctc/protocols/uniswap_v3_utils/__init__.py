@@ -1,5 +1,7 @@
 from .uniswap_v3_crud import *
 from .uniswap_v3_depth import *
+from .uniswap_v3_math import *
+from .uniswap_v3_simulation import *
 from .uniswap_v3_spec import *
 from .uniswap_v3_swaps import *
 from .contracts import *
@@ -66,6 +66,30 @@ async def async_get_pool_metadata(
     }
 
 
+async def async_get_pool_address(
+    token_a: spec.Address,
+    token_b: spec.Address,
+    *,
+    fee: int,
+    block: spec.BlockNumberReference | None = None,
+    context: spec.Context = None,
+) -> spec.Address:
+    """get address of pool of token pair and fee, from factory"""
+
+    result = await rpc.async_eth_call(
+        to_address=uniswap_v3_spec.factory,
+        function_abi=uniswap_v3_spec.factory_function_abis['getPool'],
+        function_parameters=[token_a, token_b, fee],
+        block_number=block,
+        context=context,
+    )
+    if not isinstance(result, str):
+        raise Exception('invalid rpc result')
+    if result == '0x' + '0' * 40:
+        raise Exception('pool does not exist')
+    return result
+
+
 #
 # # events
 #
@@ -1,16 +1,24 @@
-"""
-the implementations here are stopgap solutions
-- in future will create a more complete internal Uniswap v3 representation
+"""liquidity depth of Uniswap V3 pools, computed by local swap simulation
+
+prices here are marginal amounts of token_out bought per token_in sold, net of
+fees and normalized by token decimals
 """
 from __future__ import annotations
 
 import typing
 
-from ctc.toolbox import optimize_utils
 from ctc import evm
 from ctc import spec
 
-from . import contracts
+from . import uniswap_v3_math
+from . import uniswap_v3_simulation
+
+if typing.TYPE_CHECKING:
+    from .uniswap_v3_simulation import UniswapV3PoolState
+
+
+# largest exact input amount accepted by pools
+_max_amount_specified = 2**255 - 1
 
 
 async def async_get_liquidity_depth(
@@ -19,68 +27,75 @@ async def async_get_liquidity_depth(
     token_in: str,
     token_out: str,
     fee: int,
-    min_search_depth: int = 1,
-    max_search_depth: int = int(10e6 * 1e18),
-    verbose: bool = False,
-    output_tol: int | float | None = None,
-    input_tol: int | float | None = None,
-    max_iterations: int = 50,
+    pool: spec.Address | None = None,
+    pool_state: UniswapV3PoolState | None = None,
+    block: spec.BlockNumberReference | None = None,
     token_in_decimals: int | None = None,
     token_out_decimals: int | None = None,
+    word_range: int | None = None,
     context: spec.Context = None,
-) -> float:
+) -> int:
     """return amount of token sold needed to reach new price"""
 
-    if token_in_decimals is None:
-        token_in_decimals = await evm.async_get_erc20_decimals(
-            token_in, context=context
-        )
-    if token_out_decimals is None:
-        token_out_decimals = await evm.async_get_erc20_decimals(
-            token_out, context=context
-        )
-
-    if input_tol is None:
-        input_tol = 10 ** (token_in_decimals - 2)
-
-    swap_kwargs = {
-        'token_in': token_in,
-        'token_out': token_out,
-        'fee': fee,
-        'token_in_decimals': token_in_decimals,
-        'token_out_decimals': token_out_decimals,
-    }
-    f_kwargs = {
-        'target_new_price': new_price,
-        'swap_kwargs': swap_kwargs,
-    }
-
-    try:
-        return await optimize_utils.async_bisect(
-            async_f=_async_new_price_distance,
-            a=int(min_search_depth),
-            b=int(max_search_depth),
-            max_iterations=max_iterations,
-            output_tol=output_tol,
-            input_tol=input_tol,
-            f_kwargs=f_kwargs,
-            verbose=verbose,
-        )
-    except optimize_utils.BadSearchDomain:
-        return 0
+    (depth,) = await async_get_liquidity_depths(
+        new_prices=[new_price],
+        token_in=token_in,
+        token_out=token_out,
+        fee=fee,
+        pool=pool,
+        pool_state=pool_state,
+        block=block,
+        token_in_decimals=token_in_decimals,
+        token_out_decimals=token_out_decimals,
+        word_range=word_range,
+        context=context,
+    )
+    return depth
 
 
-async def _async_new_price_distance(
-    amount_sold: int | float,
+async def async_get_liquidity_depths(
     *,
-    target_new_price: float,
-    swap_kwargs: typing.Any,
+    new_prices: typing.Sequence[int | float],
+    token_in: str,
+    token_out: str,
+    fee: int,
+    pool: spec.Address | None = None,
+    pool_state: UniswapV3PoolState | None = None,
+    block: spec.BlockNumberReference | None = None,
+    token_in_decimals: int | None = None,
+    token_out_decimals: int | None = None,
+    word_range: int | None = None,
     context: spec.Context = None,
-) -> float:
-    actual_new_price = await async_get_new_price(
-        amount_sold=amount_sold, context=context, **swap_kwargs
+) -> list[int]:
+    """return amounts of token sold needed to reach each new price
+
+    - pool state is loaded once, then each depth is simulated locally
+    - the whole tick bitmap is loaded by default, since depths may reach far
+      from the current tick, pass word_range to load only a window of it
+    """
+
+    pool_state, zero_for_one, decimals = await _async_get_swap_inputs(
+        token_in=token_in,
+        token_out=token_out,
+        fee=fee,
+        pool=pool,
+        pool_state=pool_state,
+        block=block,
+        token_in_decimals=token_in_decimals,
+        token_out_decimals=token_out_decimals,
+        word_range=word_range,
+        context=context,
     )
-    return actual_new_price - target_new_price
+    return [
+        get_liquidity_depth(
+            pool_state,
+            new_price=new_price,
+            zero_for_one=zero_for_one,
+            token_in_decimals=decimals[0],
+            token_out_decimals=decimals[1],
+        )
+        for new_price in new_prices
+    ]
 
 
 async def async_get_new_price(
@@ -89,48 +104,197 @@ async def async_get_new_price(
     token_in: str,
     token_out: str,
     fee: int,
-    token_in_decimals: int,
-    token_out_decimals: int,
-    probe_amount_sold: int | None = None,
+    pool: spec.Address | None = None,
+    pool_state: UniswapV3PoolState | None = None,
+    block: spec.BlockNumberReference | None = None,
+    token_in_decimals: int | None = None,
+    token_out_decimals: int | None = None,
+    word_range: int | None = None,
     context: spec.Context = None,
 ) -> float:
-    """return new price in pool after a given amount of a token is sold
+    """return new price in pool after a given amount of a token is sold"""
 
-    - does this by computing a trade and an additional probe trade
-    """
-    if probe_amount_sold is None:
-        probe_amount_sold = 10**token_in_decimals
-
-    out_to_in = typing.cast(int, 10 ** (token_in_decimals - token_out_decimals))
-
-    amount_sold = int(amount_sold)
-    total_input_probe = int(amount_sold + probe_amount_sold)
-
-    bought_amount = await contracts.async_quote_exact_input_single(
+    pool_state, zero_for_one, decimals = await _async_get_swap_inputs(
         token_in=token_in,
         token_out=token_out,
         fee=fee,
-        amount_in=amount_sold,
-        sqrt_price_limit_x96=0,
+        pool=pool,
+        pool_state=pool_state,
+        block=block,
+        token_in_decimals=token_in_decimals,
+        token_out_decimals=token_out_decimals,
+        word_range=word_range,
         context=context,
     )
-    probe_amount_bought = await contracts.async_quote_exact_input_single(
-        token_in=token_in,
-        token_out=token_out,
-        fee=fee,
-        amount_in=total_input_probe,
-        sqrt_price_limit_x96=0,
-        context=context,
+    return get_new_price(
+        pool_state,
+        amount_sold=amount_sold,
+        zero_for_one=zero_for_one,
+        token_in_decimals=decimals[0],
+        token_out_decimals=decimals[1],
     )
 
-    if not isinstance(bought_amount, int):
-        raise Exception('invalid rpc result')
-    if not isinstance(probe_amount_bought, int):
-        raise Exception('invalid rpc result')
 
-    probe_price = (
-        out_to_in * (probe_amount_bought - bought_amount) / probe_amount_sold
+async def _async_get_swap_inputs(
+    *,
+    token_in: str,
+    token_out: str,
+    fee: int,
+    pool: spec.Address | None,
+    pool_state: UniswapV3PoolState | None,
+    block: spec.BlockNumberReference | None,
+    token_in_decimals: int | None,
+    token_out_decimals: int | None,
+    word_range: int | None,
+    context: spec.Context,
+) -> tuple[UniswapV3PoolState, bool, tuple[int, int]]:
+    import asyncio
+
+    from . import uniswap_v3_crud
+
+    token_in, token_out = await asyncio.gather(
+        evm.async_get_erc20_address(token_in, context=context),
+        evm.async_get_erc20_address(token_out, context=context),
+    )
+
+    if pool_state is None:
+        if pool is None:
+            pool = await uniswap_v3_crud.async_get_pool_address(
+                token_in, token_out, fee=fee, block=block, context=context
+            )
+        pool_state = await uniswap_v3_simulation.async_get_pool_state(
+            pool, block=block, word_range=word_range, context=context
+        )
+
+    tokens = (pool_state['token0'].lower(), pool_state['token1'].lower())
+    if (token_in.lower(), token_out.lower()) == tokens:
+        zero_for_one = True
+    elif (token_out.lower(), token_in.lower()) == tokens:
+        zero_for_one = False
+    else:
+        raise Exception('pool does not trade token_in for token_out')
+
+    if token_in_decimals is None or token_out_decimals is None:
+        token_in_decimals, token_out_decimals = (
+            await evm.async_get_erc20s_decimals(
+                [token_in, token_out], context=context
+            )
+        )
+
+    return pool_state, zero_for_one, (token_in_decimals, token_out_decimals)
+
+
+#
+# # local computation
+#
+
+
+def get_liquidity_depth(
+    pool_state: UniswapV3PoolState,
+    *,
+    new_price: int | float,
+    zero_for_one: bool,
+    token_in_decimals: int,
+    token_out_decimals: int,
+) -> int:
+    """return amount of token sold needed to reach new price
+
+    if liquidity runs out before new price, all liquidity is consumed
+    """
+
+    current_sqrt_price_x96 = pool_state['sqrt_price_x96']
+    if new_price <= 0:
+        sqrt_price_limit_x96 = None
+    else:
+        sqrt_price_limit_x96 = _price_to_sqrt_price_x96(
+            new_price,
+            zero_for_one=zero_for_one,
+            fee=pool_state['fee'],
+            token_in_decimals=token_in_decimals,
+            token_out_decimals=token_out_decimals,
+        )
+        if zero_for_one:
+            if sqrt_price_limit_x96 >= current_sqrt_price_x96:
+                return 0
+            sqrt_price_limit_x96 = max(
+                sqrt_price_limit_x96, uniswap_v3_math.min_sqrt_ratio + 1
+            )
+        else:
+            if sqrt_price_limit_x96 <= current_sqrt_price_x96:
+                return 0
+            sqrt_price_limit_x96 = min(
+                sqrt_price_limit_x96, uniswap_v3_math.max_sqrt_ratio - 1
+            )
+
+    result = uniswap_v3_simulation.simulate_swap(
+        pool_state,
+        zero_for_one=zero_for_one,
+        amount_specified=_max_amount_specified,
+        sqrt_price_limit_x96=sqrt_price_limit_x96,
     )
+    if zero_for_one:
+        return result['amount0']
+    else:
+        return result['amount1']
 
-    return probe_price
 
+def get_new_price(
+    pool_state: UniswapV3PoolState,
+    *,
+    amount_sold: int | float,
+    zero_for_one: bool,
+    token_in_decimals: int,
+    token_out_decimals: int,
+) -> float:
+    """return new price in pool after a given amount of a token is sold"""
+
+    amount_sold = int(amount_sold)
+    if amount_sold > 0:
+        result = uniswap_v3_simulation.simulate_swap(
+            pool_state,
+            zero_for_one=zero_for_one,
+            amount_specified=amount_sold,
+        )
+        sqrt_price_x96 = result['sqrt_price_x96']
+    else:
+        sqrt_price_x96 = pool_state['sqrt_price_x96']
+    return _sqrt_price_x96_to_price(
+        sqrt_price_x96,
+        zero_for_one=zero_for_one,
+        fee=pool_state['fee'],
+        token_in_decimals=token_in_decimals,
+        token_out_decimals=token_out_decimals,
+    )
+
+
+def _sqrt_price_x96_to_price(
+    sqrt_price_x96: int,
+    *,
+    zero_for_one: bool,
+    fee: int,
+    token_in_decimals: int,
+    token_out_decimals: int,
+) -> float:
+    # raw price of token0 in units of token1
+    raw_price = (sqrt_price_x96 / uniswap_v3_math.q96) ** 2
+    if not zero_for_one:
+        raw_price = 1 / raw_price
+    fee_factor = 1 - fee / 1e6
+    decimals_factor: float = 10 ** (token_in_decimals - token_out_decimals)
+    return raw_price * fee_factor * decimals_factor
+
+
+def _price_to_sqrt_price_x96(
+    price: int | float,
+    *,
+    zero_for_one: bool,
+    fee: int,
+    token_in_decimals: int,
+    token_out_decimals: int,
+) -> int:
+    fee_factor = 1 - fee / 1e6
+    decimals_factor: float = 10 ** (token_in_decimals - token_out_decimals)
+    raw_price = price / fee_factor / decimals_factor
+    if not zero_for_one:
+        raw_price = 1 / raw_price
+    return int(raw_price**0.5 * uniswap_v3_math.q96)
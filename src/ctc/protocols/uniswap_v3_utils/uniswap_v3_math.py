@@ -0,0 +1,403 @@
+"""exact integer math of Uniswap V3 pools
+
+ports of the TickMath, SqrtPriceMath, SwapMath, and TickBitmap libraries of
+v3-core, using python integers so that results match the contracts exactly
+"""
+
+from __future__ import annotations
+
+import typing
+
+
+min_tick = -887272
+max_tick = 887272
+min_sqrt_ratio = 4295128739
+max_sqrt_ratio = 1461446703485210103287273052203988822378723970342
+
+q96 = 2**96
+_uint160_max = 2**160 - 1
+_uint256_limit = 2**256
+
+_tick_ratio_factors = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+#
+# # rounding
+#
+
+
+def _div_rounding_up(x: int, y: int) -> int:
+    return -(-x // y)
+
+
+#
+# # tick math
+#
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """get sqrt price as Q64.96 at tick, rounded up"""
+
+    abs_tick = abs(tick)
+    if abs_tick > max_tick:
+        raise Exception('tick out of bounds')
+
+    if abs_tick & 0x1 != 0:
+        ratio = 0xFFFCB933BD6FAD37AA2D162D1A594001
+    else:
+        ratio = 0x100000000000000000000000000000000
+    for bit, factor in _tick_ratio_factors:
+        if abs_tick & bit != 0:
+            ratio = (ratio * factor) >> 128
+
+    if tick > 0:
+        ratio = (_uint256_limit - 1) // ratio
+
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """get greatest tick whose sqrt price is at most the given sqrt price"""
+
+    import math
+
+    if sqrt_price_x96 < min_sqrt_ratio or sqrt_price_x96 >= max_sqrt_ratio:
+        raise Exception('sqrt price out of bounds')
+
+    # estimate from logarithm, then correct rounding error exactly
+    log_price = 2 * (math.log2(sqrt_price_x96) - 96)
+    tick = int(math.floor(log_price / math.log2(1.0001)))
+    tick = min(max(tick, min_tick), max_tick)
+    while tick > min_tick and get_sqrt_ratio_at_tick(tick) > sqrt_price_x96:
+        tick -= 1
+    while (
+        tick < max_tick and get_sqrt_ratio_at_tick(tick + 1) <= sqrt_price_x96
+    ):
+        tick += 1
+    return tick
+
+
+#
+# # sqrt price math
+#
+
+
+def get_next_sqrt_price_from_amount0_rounding_up(
+    sqrt_price_x96: int,
+    liquidity: int,
+    *,
+    amount: int,
+    add: bool,
+) -> int:
+    """get next sqrt price after adding or removing amount of token0"""
+
+    if amount == 0:
+        return sqrt_price_x96
+    numerator1 = liquidity << 96
+
+    if add:
+        product = amount * sqrt_price_x96
+        if product < _uint256_limit:
+            denominator = numerator1 + product
+            if denominator < _uint256_limit:
+                return _div_rounding_up(
+                    numerator1 * sqrt_price_x96, denominator
+                )
+        return _div_rounding_up(
+            numerator1, numerator1 // sqrt_price_x96 + amount
+        )
+    else:
+        product = amount * sqrt_price_x96
+        if product >= _uint256_limit or numerator1 <= product:
+            raise Exception('insufficient liquidity for output amount')
+        denominator = numerator1 - product
+        result = _div_rounding_up(numerator1 * sqrt_price_x96, denominator)
+        if result > _uint160_max:
+            raise Exception('sqrt price overflow')
+        return result
+
+
+def get_next_sqrt_price_from_amount1_rounding_down(
+    sqrt_price_x96: int,
+    liquidity: int,
+    *,
+    amount: int,
+    add: bool,
+) -> int:
+    """get next sqrt price after adding or removing amount of token1"""
+
+    if add:
+        result = sqrt_price_x96 + (amount << 96) // liquidity
+        if result > _uint160_max:
+            raise Exception('sqrt price overflow')
+        return result
+    else:
+        quotient = _div_rounding_up(amount << 96, liquidity)
+        if sqrt_price_x96 <= quotient:
+            raise Exception('insufficient liquidity for output amount')
+        return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int,
+    liquidity: int,
+    *,
+    amount_in: int,
+    zero_for_one: bool,
+) -> int:
+    """get next sqrt price after swapping an input amount"""
+
+    if zero_for_one:
+        return get_next_sqrt_price_from_amount0_rounding_up(
+            sqrt_price_x96, liquidity, amount=amount_in, add=True
+        )
+    else:
+        return get_next_sqrt_price_from_amount1_rounding_down(
+            sqrt_price_x96, liquidity, amount=amount_in, add=True
+        )
+
+
+def get_next_sqrt_price_from_output(
+    sqrt_price_x96: int,
+    liquidity: int,
+    *,
+    amount_out: int,
+    zero_for_one: bool,
+) -> int:
+    """get next sqrt price after swapping for an output amount"""
+
+    if zero_for_one:
+        return get_next_sqrt_price_from_amount1_rounding_down(
+            sqrt_price_x96, liquidity, amount=amount_out, add=False
+        )
+    else:
+        return get_next_sqrt_price_from_amount0_rounding_up(
+            sqrt_price_x96, liquidity, amount=amount_out, add=False
+        )
+
+
+def get_amount0_delta(
+    sqrt_ratio_a_x96: int,
+    sqrt_ratio_b_x96: int,
+    *,
+    liquidity: int,
+    round_up: bool,
+) -> int:
+    """get amount of token0 between two sqrt prices"""
+
+    if sqrt_ratio_a_x96 > sqrt_ratio_b_x96:
+        sqrt_ratio_a_x96, sqrt_ratio_b_x96 = sqrt_ratio_b_x96, sqrt_ratio_a_x96
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_ratio_b_x96 - sqrt_ratio_a_x96
+    if round_up:
+        return _div_rounding_up(
+            _div_rounding_up(numerator1 * numerator2, sqrt_ratio_b_x96),
+            sqrt_ratio_a_x96,
+        )
+    else:
+        return (numerator1 * numerator2 // sqrt_ratio_b_x96) // sqrt_ratio_a_x96
+
+
+def get_amount1_delta(
+    sqrt_ratio_a_x96: int,
+    sqrt_ratio_b_x96: int,
+    *,
+    liquidity: int,
+    round_up: bool,
+) -> int:
+    """get amount of token1 between two sqrt prices"""
+
+    if sqrt_ratio_a_x96 > sqrt_ratio_b_x96:
+        sqrt_ratio_a_x96, sqrt_ratio_b_x96 = sqrt_ratio_b_x96, sqrt_ratio_a_x96
+    numerator = liquidity * (sqrt_ratio_b_x96 - sqrt_ratio_a_x96)
+    if round_up:
+        return _div_rounding_up(numerator, q96)
+    else:
+        return numerator // q96
+
+
+#
+# # swap math
+#
+
+
+def compute_swap_step(
+    sqrt_price_current_x96: int,
+    sqrt_price_target_x96: int,
+    *,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> tuple[int, int, int, int]:
+    """compute swap within a single tick range
+
+    positive amount_remaining is an exact input, negative is an exact output
+
+    returns (sqrt_price_next_x96, amount_in, amount_out, fee_amount)
+    """
+
+    zero_for_one = sqrt_price_current_x96 >= sqrt_price_target_x96
+    exact_in = amount_remaining >= 0
+
+    if exact_in:
+        amount_remaining_less_fee = (
+            amount_remaining * (1000000 - fee_pips) // 1000000
+        )
+        if zero_for_one:
+            amount_in = get_amount0_delta(
+                sqrt_price_target_x96,
+                sqrt_price_current_x96,
+                liquidity=liquidity,
+                round_up=True,
+            )
+        else:
+            amount_in = get_amount1_delta(
+                sqrt_price_current_x96,
+                sqrt_price_target_x96,
+                liquidity=liquidity,
+                round_up=True,
+            )
+        if amount_remaining_less_fee >= amount_in:
+            sqrt_price_next_x96 = sqrt_price_target_x96
+        else:
+            sqrt_price_next_x96 = get_next_sqrt_price_from_input(
+                sqrt_price_current_x96,
+                liquidity,
+                amount_in=amount_remaining_less_fee,
+                zero_for_one=zero_for_one,
+            )
+    else:
+        if zero_for_one:
+            amount_out = get_amount1_delta(
+                sqrt_price_target_x96,
+                sqrt_price_current_x96,
+                liquidity=liquidity,
+                round_up=False,
+            )
+        else:
+            amount_out = get_amount0_delta(
+                sqrt_price_current_x96,
+                sqrt_price_target_x96,
+                liquidity=liquidity,
+                round_up=False,
+            )
+        if -amount_remaining >= amount_out:
+            sqrt_price_next_x96 = sqrt_price_target_x96
+        else:
+            sqrt_price_next_x96 = get_next_sqrt_price_from_output(
+                sqrt_price_current_x96,
+                liquidity,
+                amount_out=-amount_remaining,
+                zero_for_one=zero_for_one,
+            )
+
+    reached_target = sqrt_price_target_x96 == sqrt_price_next_x96
+
+    if zero_for_one:
+        if not (reached_target and exact_in):
+            amount_in = get_amount0_delta(
+                sqrt_price_next_x96,
+                sqrt_price_current_x96,
+                liquidity=liquidity,
+                round_up=True,
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount1_delta(
+                sqrt_price_next_x96,
+                sqrt_price_current_x96,
+                liquidity=liquidity,
+                round_up=False,
+            )
+    else:
+        if not (reached_target and exact_in):
+            amount_in = get_amount1_delta(
+                sqrt_price_current_x96,
+                sqrt_price_next_x96,
+                liquidity=liquidity,
+                round_up=True,
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount0_delta(
+                sqrt_price_current_x96,
+                sqrt_price_next_x96,
+                liquidity=liquidity,
+                round_up=False,
+            )
+
+    # cap output amount to not exceed remaining output amount
+    if not exact_in and amount_out > -amount_remaining:
+        amount_out = -amount_remaining
+
+    if exact_in and not reached_target:
+        # remainder of input is taken as fee
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = _div_rounding_up(amount_in * fee_pips, 1000000 - fee_pips)
+
+    return sqrt_price_next_x96, amount_in, amount_out, fee_amount
+
+
+#
+# # tick bitmap
+#
+
+
+def next_initialized_tick_within_one_word(
+    tick_bitmap: typing.Mapping[int, int],
+    tick: int,
+    *,
+    tick_spacing: int,
+    lte: bool,
+) -> tuple[int, bool]:
+    """get next initialized tick in the bitmap word of tick
+
+    returns (next_tick, initialized), where next_tick is the word boundary if
+    no initialized tick is found within the word
+    """
+
+    compressed = tick // tick_spacing
+
+    if lte:
+        word_position = compressed >> 8
+        bit_position = compressed & 255
+        mask = (1 << bit_position) - 1 + (1 << bit_position)
+        masked = tick_bitmap.get(word_position, 0) & mask
+        initialized = masked != 0
+        if initialized:
+            most_significant_bit = masked.bit_length() - 1
+            offset = bit_position - most_significant_bit
+        else:
+            offset = bit_position
+        return (compressed - offset) * tick_spacing, initialized
+    else:
+        word_position = (compressed + 1) >> 8
+        bit_position = (compressed + 1) & 255
+        mask = ~((1 << bit_position) - 1)
+        masked = tick_bitmap.get(word_position, 0) & mask
+        initialized = masked != 0
+        if initialized:
+            least_significant_bit = (masked & -masked).bit_length() - 1
+            offset = least_significant_bit - bit_position
+        else:
+            offset = 255 - bit_position
+        return (compressed + 1 + offset) * tick_spacing, initialized
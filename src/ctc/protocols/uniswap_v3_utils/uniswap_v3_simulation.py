@@ -0,0 +1,293 @@
+"""simulate Uniswap V3 swaps locally from a snapshot of pool state
+
+a snapshot contains slot0, active liquidity, and the tick bitmap with the net
+liquidity of each initialized tick, loaded in a few batches of eth_calls. swaps
+are then simulated with the exact integer math of the pool contract
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+from . import uniswap_v3_math
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class UniswapV3PoolState(TypedDict):
+        pool: spec.Address
+        block_number: int
+        token0: spec.Address
+        token1: spec.Address
+        fee: int
+        tick_spacing: int
+        sqrt_price_x96: int
+        tick: int
+        liquidity: int
+        tick_bitmap: dict[int, int]
+        liquidity_net: dict[int, int]
+        word_bounds: tuple[int, int]
+
+    class UniswapV3SwapResult(TypedDict):
+        amount0: int
+        amount1: int
+        sqrt_price_x96: int
+        tick: int
+        liquidity: int
+
+
+# number of bitmap words loaded on each side of the current tick by default
+default_word_range = 4
+
+
+async def async_get_pool_state(
+    pool: spec.Address,
+    *,
+    block: spec.BlockNumberReference | None = None,
+    word_range: int | None = default_word_range,
+    context: spec.Context = None,
+) -> UniswapV3PoolState:
+    """load snapshot of pool state for local swap simulation
+
+    - word_range limits the tick bitmap to that many 256-bit words on each
+      side of the current tick, use None to load the whole bitmap
+    - all data is loaded at the same block
+    """
+
+    import asyncio
+
+    from ctc import evm
+    from ctc import rpc
+    from . import contracts
+    from . import uniswap_v3_spec
+
+    if block is None:
+        block = await evm.async_get_latest_block_number(context=context)
+    block_number = await evm.async_block_number_to_int(block, context=context)
+    kwargs: dict[str, typing.Any] = dict(block=block_number, context=context)
+
+    (
+        slot0,
+        liquidity,
+        fee,
+        tick_spacing,
+        token0,
+        token1,
+    ) = await asyncio.gather(
+        contracts.async_pool_slot0(pool, **kwargs),
+        contracts.async_pool_liquidity(pool, **kwargs),
+        contracts.async_pool_fee(pool, **kwargs),
+        contracts.async_pool_tick_spacing(pool, **kwargs),
+        contracts.async_pool_token0(pool, **kwargs),
+        contracts.async_pool_token1(pool, **kwargs),
+    )
+
+    # determine range of bitmap words
+    min_word = (uniswap_v3_math.min_tick // tick_spacing) >> 8
+    max_word = (uniswap_v3_math.max_tick // tick_spacing) >> 8
+    if word_range is not None:
+        current_word = (slot0['tick'] // tick_spacing) >> 8
+        min_word = max(min_word, current_word - word_range)
+        max_word = min(max_word, current_word + word_range)
+    words = list(range(min_word, max_word + 1))
+
+    # load tick bitmap
+    bitmap_abi = await uniswap_v3_spec.async_get_function_abi(
+        'tickBitmap', 'pool'
+    )
+    bitmaps = await rpc.async_batch_eth_call(
+        to_address=pool,
+        function_abi=bitmap_abi,
+        function_parameter_list=[[word] for word in words],
+        block_number=block_number,
+        context=context,
+    )
+    tick_bitmap = {
+        word: bitmap for word, bitmap in zip(words, bitmaps) if bitmap != 0
+    }
+
+    # load net liquidity of initialized ticks
+    ticks = [
+        ((word << 8) + bit) * tick_spacing
+        for word, bitmap in tick_bitmap.items()
+        for bit in range(256)
+        if (bitmap >> bit) & 1
+    ]
+    if len(ticks) > 0:
+        ticks_abi = await uniswap_v3_spec.async_get_function_abi(
+            'ticks', 'pool'
+        )
+        tick_data = await rpc.async_batch_eth_call(
+            to_address=pool,
+            function_abi=ticks_abi,
+            function_parameter_list=[[tick] for tick in ticks],
+            block_number=block_number,
+            context=context,
+        )
+    else:
+        tick_data = []
+    liquidity_net = {tick: datum[1] for tick, datum in zip(ticks, tick_data)}
+
+    return {
+        'pool': pool,
+        'block_number': block_number,
+        'token0': token0,
+        'token1': token1,
+        'fee': fee,
+        'tick_spacing': tick_spacing,
+        'sqrt_price_x96': slot0['sqrt_price_x96'],
+        'tick': slot0['tick'],
+        'liquidity': liquidity,
+        'tick_bitmap': tick_bitmap,
+        'liquidity_net': liquidity_net,
+        'word_bounds': (min_word, max_word),
+    }
+
+
+def simulate_swap(
+    pool_state: UniswapV3PoolState,
+    *,
+    zero_for_one: bool,
+    amount_specified: int,
+    sqrt_price_limit_x96: int | None = None,
+) -> UniswapV3SwapResult:
+    """simulate swap in pool, matching the swap() function of the pool
+
+    - positive amount_specified is an exact input, negative is an exact output
+    - returned amounts are signed deltas of pool balances
+    - pool_state is not modified
+    """
+
+    if amount_specified == 0:
+        raise Exception('amount_specified cannot be zero')
+
+    sqrt_price_x96 = pool_state['sqrt_price_x96']
+    if sqrt_price_limit_x96 is None:
+        if zero_for_one:
+            sqrt_price_limit_x96 = uniswap_v3_math.min_sqrt_ratio + 1
+        else:
+            sqrt_price_limit_x96 = uniswap_v3_math.max_sqrt_ratio - 1
+    if zero_for_one:
+        valid_limit = (
+            uniswap_v3_math.min_sqrt_ratio
+            < sqrt_price_limit_x96
+            < sqrt_price_x96
+        )
+    else:
+        valid_limit = (
+            sqrt_price_x96
+            < sqrt_price_limit_x96
+            < uniswap_v3_math.max_sqrt_ratio
+        )
+    if not valid_limit:
+        raise Exception('invalid sqrt_price_limit_x96')
+
+    tick_bitmap = pool_state['tick_bitmap']
+    tick_spacing = pool_state['tick_spacing']
+    min_word, max_word = pool_state['word_bounds']
+    exact_input = amount_specified > 0
+    amount_remaining = amount_specified
+    amount_calculated = 0
+    tick = pool_state['tick']
+    liquidity = pool_state['liquidity']
+
+    while amount_remaining != 0 and sqrt_price_x96 != sqrt_price_limit_x96:
+        sqrt_price_start_x96 = sqrt_price_x96
+
+        # find next tick, which must be within the loaded bitmap
+        if zero_for_one:
+            word = (tick // tick_spacing) >> 8
+        else:
+            word = (tick // tick_spacing + 1) >> 8
+        if word < min_word or word > max_word:
+            raise Exception(
+                'swap exceeds loaded tick range, increase word_range'
+            )
+        tick_next, initialized = (
+            uniswap_v3_math.next_initialized_tick_within_one_word(
+                tick_bitmap,
+                tick,
+                tick_spacing=tick_spacing,
+                lte=zero_for_one,
+            )
+        )
+        tick_next = min(
+            max(tick_next, uniswap_v3_math.min_tick), uniswap_v3_math.max_tick
+        )
+        sqrt_price_next_x96 = uniswap_v3_math.get_sqrt_ratio_at_tick(
+            tick_next
+        )
+
+        # swap until next tick or price limit
+        if zero_for_one:
+            use_limit = sqrt_price_next_x96 < sqrt_price_limit_x96
+        else:
+            use_limit = sqrt_price_next_x96 > sqrt_price_limit_x96
+        if use_limit:
+            sqrt_price_target_x96 = sqrt_price_limit_x96
+        else:
+            sqrt_price_target_x96 = sqrt_price_next_x96
+        (
+            sqrt_price_x96,
+            amount_in,
+            amount_out,
+            fee_amount,
+        ) = uniswap_v3_math.compute_swap_step(
+            sqrt_price_x96,
+            sqrt_price_target_x96,
+            liquidity=liquidity,
+            amount_remaining=amount_remaining,
+            fee_pips=pool_state['fee'],
+        )
+        if exact_input:
+            amount_remaining -= amount_in + fee_amount
+            amount_calculated -= amount_out
+        else:
+            amount_remaining += amount_out
+            amount_calculated += amount_in + fee_amount
+
+        # cross tick or recompute tick of new price
+        if sqrt_price_x96 == sqrt_price_next_x96:
+            if initialized:
+                liquidity_net = pool_state['liquidity_net'][tick_next]
+                if zero_for_one:
+                    liquidity_net = -liquidity_net
+                liquidity += liquidity_net
+                if liquidity < 0:
+                    raise Exception('negative liquidity')
+            if zero_for_one:
+                tick = tick_next - 1
+            else:
+                tick = tick_next
+        elif sqrt_price_x96 != sqrt_price_start_x96:
+            tick = uniswap_v3_math.get_tick_at_sqrt_ratio(sqrt_price_x96)
+
+    if zero_for_one == exact_input:
+        amount0 = amount_specified - amount_remaining
+        amount1 = amount_calculated
+    else:
+        amount0 = amount_calculated
+        amount1 = amount_specified - amount_remaining
+
+    return {
+        'amount0': amount0,
+        'amount1': amount1,
+        'sqrt_price_x96': sqrt_price_x96,
+        'tick': tick,
+        'liquidity': liquidity,
+    }
+
+
+def apply_swap(
+    pool_state: UniswapV3PoolState,
+    swap_result: UniswapV3SwapResult,
+) -> UniswapV3PoolState:
+    """get pool state after a simulated swap"""
+
+    new_state = dict(pool_state)
+    new_state['sqrt_price_x96'] = swap_result['sqrt_price_x96']
+    new_state['tick'] = swap_result['tick']
+    new_state['liquidity'] = swap_result['liquidity']
+    return new_state  # type: ignore
@@ -130,3 +130,17 @@ factory_event_abis: typing.Mapping[str, spec.EventABI] = {
         'type': 'event',
     },
 }
+
+factory_function_abis: typing.Mapping[str, spec.FunctionABI] = {
+    'getPool': {
+        'inputs': [
+            {'internalType': 'address', 'name': '', 'type': 'address'},
+            {'internalType': 'address', 'name': '', 'type': 'address'},
+            {'internalType': 'uint24', 'name': '', 'type': 'uint24'},
+        ],
+        'name': 'getPool',
+        'outputs': [{'internalType': 'address', 'name': '', 'type': 'address'}],
+        'stateMutability': 'view',
+        'type': 'function',
+    },
+}
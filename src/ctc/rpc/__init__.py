@@ -1,17 +1,554 @@
-from .rpc_batch import *
-from .rpc_constructors import *
-from .rpc_digestors import *
-from .rpc_executors_async import *
-from .rpc_executors_sync import *
-from .rpc_protocols import *
-
-from .rpc_lifecycle import *
-from .rpc_provider import *
-from .rpc_registry import *
-from .rpc_request import *
-from .rpc_spec import *
-
-# do not import
-# - rpc_format
-# - rpc_logging
+from __future__ import annotations
 
+import typing
+
+# attributes are loaded from their submodules upon first access
+if typing.TYPE_CHECKING:
+    from .rpc_batch import *
+    from .rpc_constructors import *
+    from .rpc_digestors import *
+    from .rpc_executors_async import *
+    from .rpc_executors_sync import *
+    from .rpc_protocols import *
+
+    from .rpc_lifecycle import *
+    from .rpc_provider import *
+    from .rpc_registry import *
+    from .rpc_request import *
+    from .rpc_spec import *
+
+    # do not import
+    # - rpc_format
+    # - rpc_logging
+
+else:
+
+    _lazy_exports = {
+        'rpc_batch': (
+            'async_batch_eth_accounts',
+            'async_batch_eth_block_number',
+            'async_batch_eth_call',
+            'async_batch_eth_chain_id',
+            'async_batch_eth_coinbase',
+            'async_batch_eth_compile_lll',
+            'async_batch_eth_compile_serpent',
+            'async_batch_eth_compile_solidity',
+            'async_batch_eth_estimate_gas',
+            'async_batch_eth_gas_price',
+            'async_batch_eth_get_balance',
+            'async_batch_eth_get_block_by_hash',
+            'async_batch_eth_get_block_by_number',
+            'async_batch_eth_get_block_receipts',
+            'async_batch_eth_get_block_transaction_count_by_hash',
+            'async_batch_eth_get_block_transaction_count_by_number',
+            'async_batch_eth_get_code',
+            'async_batch_eth_get_compilers',
+            'async_batch_eth_get_fee_history',
+            'async_batch_eth_get_filter_changes',
+            'async_batch_eth_get_filter_logs',
+            'async_batch_eth_get_logs',
+            'async_batch_eth_get_storage_at',
+            'async_batch_eth_get_transaction_by_block_hash_and_index',
+            'async_batch_eth_get_transaction_by_block_number_and_index',
+            'async_batch_eth_get_transaction_by_hash',
+            'async_batch_eth_get_transaction_count',
+            'async_batch_eth_get_transaction_receipt',
+            'async_batch_eth_get_uncle_by_block_hash_and_index',
+            'async_batch_eth_get_uncle_by_block_number_and_index',
+            'async_batch_eth_get_uncle_count_by_block_hash',
+            'async_batch_eth_get_uncle_count_by_block_number',
+            'async_batch_eth_get_work',
+            'async_batch_eth_hashrate',
+            'async_batch_eth_mining',
+            'async_batch_eth_new_block_filter',
+            'async_batch_eth_new_filter',
+            'async_batch_eth_new_pending_transaction_filter',
+            'async_batch_eth_protocol_version',
+            'async_batch_eth_send_raw_transaction',
+            'async_batch_eth_send_transaction',
+            'async_batch_eth_sign',
+            'async_batch_eth_sign_transaction',
+            'async_batch_eth_submit_hashrate',
+            'async_batch_eth_submit_work',
+            'async_batch_eth_syncing',
+            'async_batch_eth_uninstall_filter',
+            'async_batch_execute',
+            'async_batch_net_listening',
+            'async_batch_net_peer_count',
+            'async_batch_net_version',
+            'async_batch_shh_add_to_group',
+            'async_batch_shh_get_filter_changes',
+            'async_batch_shh_get_messages',
+            'async_batch_shh_has_identity',
+            'async_batch_shh_new_filter',
+            'async_batch_shh_new_group',
+            'async_batch_shh_new_identity',
+            'async_batch_shh_post',
+            'async_batch_shh_uninstall_filter',
+            'async_batch_shh_version',
+            'async_batch_trace_block',
+            'async_batch_web3_client_version',
+            'async_batch_web3_sha3',
+            'async_sample_by_block',
+            'batch_construct',
+            'batch_construct_debug_trace_block_by_hash',
+            'batch_construct_debug_trace_block_by_number',
+            'batch_construct_debug_trace_call',
+            'batch_construct_debug_trace_call_many',
+            'batch_construct_debug_trace_transaction',
+            'batch_construct_eth_accounts',
+            'batch_construct_eth_block_number',
+            'batch_construct_eth_call',
+            'batch_construct_eth_chain_id',
+            'batch_construct_eth_coinbase',
+            'batch_construct_eth_compile_lll',
+            'batch_construct_eth_compile_serpent',
+            'batch_construct_eth_compile_solidity',
+            'batch_construct_eth_estimate_gas',
+            'batch_construct_eth_fee_history',
+            'batch_construct_eth_gas_price',
+            'batch_construct_eth_get_balance',
+            'batch_construct_eth_get_block_by_hash',
+            'batch_construct_eth_get_block_by_number',
+            'batch_construct_eth_get_block_receipts',
+            'batch_construct_eth_get_block_transaction_count_by_hash',
+            'batch_construct_eth_get_block_transaction_count_by_number',
+            'batch_construct_eth_get_code',
+            'batch_construct_eth_get_compilers',
+            'batch_construct_eth_get_filter_changes',
+            'batch_construct_eth_get_filter_logs',
+            'batch_construct_eth_get_logs',
+            'batch_construct_eth_get_storage_at',
+            'batch_construct_eth_get_transaction_by_block_hash_and_index',
+            'batch_construct_eth_get_transaction_by_block_number_and_index',
+            'batch_construct_eth_get_transaction_by_hash',
+            'batch_construct_eth_get_transaction_count',
+            'batch_construct_eth_get_transaction_receipt',
+            'batch_construct_eth_get_uncle_by_block_hash_and_index',
+            'batch_construct_eth_get_uncle_by_block_number_and_index',
+            'batch_construct_eth_get_uncle_count_by_block_hash',
+            'batch_construct_eth_get_uncle_count_by_block_number',
+            'batch_construct_eth_get_work',
+            'batch_construct_eth_hashrate',
+            'batch_construct_eth_mining',
+            'batch_construct_eth_new_block_filter',
+            'batch_construct_eth_new_filter',
+            'batch_construct_eth_new_pending_transaction_filter',
+            'batch_construct_eth_protocol_version',
+            'batch_construct_eth_send_raw_transaction',
+            'batch_construct_eth_send_transaction',
+            'batch_construct_eth_sign',
+            'batch_construct_eth_sign_transaction',
+            'batch_construct_eth_submit_hashrate',
+            'batch_construct_eth_submit_work',
+            'batch_construct_eth_syncing',
+            'batch_construct_eth_uninstall_filter',
+            'batch_construct_net_listening',
+            'batch_construct_net_peer_count',
+            'batch_construct_net_version',
+            'batch_construct_shh_add_to_group',
+            'batch_construct_shh_get_filter_changes',
+            'batch_construct_shh_get_messages',
+            'batch_construct_shh_has_identity',
+            'batch_construct_shh_new_filter',
+            'batch_construct_shh_new_group',
+            'batch_construct_shh_new_identity',
+            'batch_construct_shh_post',
+            'batch_construct_shh_uninstall_filter',
+            'batch_construct_shh_version',
+            'batch_construct_trace_block',
+            'batch_construct_trace_call',
+            'batch_construct_trace_call_many',
+            'batch_construct_trace_filter',
+            'batch_construct_trace_get',
+            'batch_construct_trace_raw_transaction',
+            'batch_construct_trace_replay_block_transactions',
+            'batch_construct_trace_replay_transaction',
+            'batch_construct_trace_transaction',
+            'batch_construct_web3_client_version',
+            'batch_construct_web3_sha3',
+            'batch_digest',
+            'clear_sample_cache',
+        ),
+        'rpc_constructors': (
+            'construct_debug_trace_block_by_hash',
+            'construct_debug_trace_block_by_number',
+            'construct_debug_trace_call',
+            'construct_debug_trace_call_many',
+            'construct_debug_trace_transaction',
+            'construct_eth_accounts',
+            'construct_eth_block_number',
+            'construct_eth_call',
+            'construct_eth_chain_id',
+            'construct_eth_coinbase',
+            'construct_eth_compile_lll',
+            'construct_eth_compile_serpent',
+            'construct_eth_compile_solidity',
+            'construct_eth_estimate_gas',
+            'construct_eth_fee_history',
+            'construct_eth_gas_price',
+            'construct_eth_get_balance',
+            'construct_eth_get_block_by_hash',
+            'construct_eth_get_block_by_number',
+            'construct_eth_get_block_receipts',
+            'construct_eth_get_block_transaction_count_by_hash',
+            'construct_eth_get_block_transaction_count_by_number',
+            'construct_eth_get_code',
+            'construct_eth_get_compilers',
+            'construct_eth_get_filter_changes',
+            'construct_eth_get_filter_logs',
+            'construct_eth_get_logs',
+            'construct_eth_get_storage_at',
+            'construct_eth_get_transaction_by_block_hash_and_index',
+            'construct_eth_get_transaction_by_block_number_and_index',
+            'construct_eth_get_transaction_by_hash',
+            'construct_eth_get_transaction_count',
+            'construct_eth_get_transaction_receipt',
+            'construct_eth_get_uncle_by_block_hash_and_index',
+            'construct_eth_get_uncle_by_block_number_and_index',
+            'construct_eth_get_uncle_count_by_block_hash',
+            'construct_eth_get_uncle_count_by_block_number',
+            'construct_eth_get_work',
+            'construct_eth_hashrate',
+            'construct_eth_mining',
+            'construct_eth_new_block_filter',
+            'construct_eth_new_filter',
+            'construct_eth_new_pending_transaction_filter',
+            'construct_eth_protocol_version',
+            'construct_eth_send_raw_transaction',
+            'construct_eth_send_transaction',
+            'construct_eth_sign',
+            'construct_eth_sign_transaction',
+            'construct_eth_submit_hashrate',
+            'construct_eth_submit_work',
+            'construct_eth_syncing',
+            'construct_eth_uninstall_filter',
+            'construct_net_listening',
+            'construct_net_peer_count',
+            'construct_net_version',
+            'construct_shh_add_to_group',
+            'construct_shh_get_filter_changes',
+            'construct_shh_get_messages',
+            'construct_shh_has_identity',
+            'construct_shh_new_filter',
+            'construct_shh_new_group',
+            'construct_shh_new_identity',
+            'construct_shh_post',
+            'construct_shh_uninstall_filter',
+            'construct_shh_version',
+            'construct_trace_block',
+            'construct_trace_call',
+            'construct_trace_call_many',
+            'construct_trace_filter',
+            'construct_trace_get',
+            'construct_trace_raw_transaction',
+            'construct_trace_replay_block_transactions',
+            'construct_trace_replay_transaction',
+            'construct_trace_transaction',
+            'construct_web3_client_version',
+            'construct_web3_sha3',
+        ),
+        'rpc_digestors': (
+            'digest_debug_trace_block_by_hash',
+            'digest_debug_trace_block_by_number',
+            'digest_debug_trace_call',
+            'digest_debug_trace_call_many',
+            'digest_debug_trace_transaction',
+            'digest_eth_accounts',
+            'digest_eth_block_number',
+            'digest_eth_call',
+            'digest_eth_chain_id',
+            'digest_eth_coinbase',
+            'digest_eth_compile_lll',
+            'digest_eth_compile_serpent',
+            'digest_eth_compile_solidity',
+            'digest_eth_estimate_gas',
+            'digest_eth_fee_history',
+            'digest_eth_gas_price',
+            'digest_eth_get_balance',
+            'digest_eth_get_block_by_hash',
+            'digest_eth_get_block_by_number',
+            'digest_eth_get_block_receipts',
+            'digest_eth_get_block_transaction_count_by_hash',
+            'digest_eth_get_block_transaction_count_by_number',
+            'digest_eth_get_code',
+            'digest_eth_get_compilers',
+            'digest_eth_get_filter_changes',
+            'digest_eth_get_filter_logs',
+            'digest_eth_get_logs',
+            'digest_eth_get_storage_at',
+            'digest_eth_get_transaction_by_block_hash_and_index',
+            'digest_eth_get_transaction_by_block_number_and_index',
+            'digest_eth_get_transaction_by_hash',
+            'digest_eth_get_transaction_count',
+            'digest_eth_get_transaction_receipt',
+            'digest_eth_get_uncle_by_block_hash_and_index',
+            'digest_eth_get_uncle_by_block_number_and_index',
+            'digest_eth_get_uncle_count_by_block_hash',
+            'digest_eth_get_uncle_count_by_block_number',
+            'digest_eth_get_work',
+            'digest_eth_hashrate',
+            'digest_eth_mining',
+            'digest_eth_new_block_filter',
+            'digest_eth_new_filter',
+            'digest_eth_new_pending_transaction_filter',
+            'digest_eth_protocol_version',
+            'digest_eth_send_raw_transaction',
+            'digest_eth_send_transaction',
+            'digest_eth_sign',
+            'digest_eth_sign_transaction',
+            'digest_eth_submit_hashrate',
+            'digest_eth_submit_work',
+            'digest_eth_syncing',
+            'digest_eth_uninstall_filter',
+            'digest_net_listening',
+            'digest_net_peer_count',
+            'digest_net_version',
+            'digest_shh_add_to_group',
+            'digest_shh_get_filter_changes',
+            'digest_shh_get_messages',
+            'digest_shh_has_identity',
+            'digest_shh_new_filter',
+            'digest_shh_new_group',
+            'digest_shh_new_identity',
+            'digest_shh_post',
+            'digest_shh_uninstall_filter',
+            'digest_shh_version',
+            'digest_trace_block',
+            'digest_trace_call',
+            'digest_trace_call_many',
+            'digest_trace_filter',
+            'digest_trace_get',
+            'digest_trace_raw_transaction',
+            'digest_trace_replay_block_transactions',
+            'digest_trace_replay_transaction',
+            'digest_trace_transaction',
+            'digest_web3_client_version',
+            'digest_web3_sha3',
+        ),
+        'rpc_executors_async': (
+            'async_debug_trace_block_by_hash',
+            'async_debug_trace_block_by_number',
+            'async_debug_trace_call',
+            'async_debug_trace_call_many',
+            'async_debug_trace_transaction',
+            'async_eth_accounts',
+            'async_eth_block_number',
+            'async_eth_call',
+            'async_eth_chain_id',
+            'async_eth_coinbase',
+            'async_eth_estimate_gas',
+            'async_eth_fee_history',
+            'async_eth_gas_price',
+            'async_eth_get_balance',
+            'async_eth_get_block_by_hash',
+            'async_eth_get_block_by_number',
+            'async_eth_get_block_receipts',
+            'async_eth_get_block_transaction_count_by_hash',
+            'async_eth_get_block_transaction_count_by_number',
+            'async_eth_get_code',
+            'async_eth_get_filter_changes',
+            'async_eth_get_filter_logs',
+            'async_eth_get_logs',
+            'async_eth_get_storage_at',
+            'async_eth_get_transaction_by_block_hash_and_index',
+            'async_eth_get_transaction_by_block_number_and_index',
+            'async_eth_get_transaction_by_hash',
+            'async_eth_get_transaction_count',
+            'async_eth_get_transaction_receipt',
+            'async_eth_get_uncle_by_block_hash_and_index',
+            'async_eth_get_uncle_by_block_number_and_index',
+            'async_eth_get_uncle_count_by_block_hash',
+            'async_eth_get_uncle_count_by_block_number',
+            'async_eth_get_work',
+            'async_eth_hashrate',
+            'async_eth_mining',
+            'async_eth_new_block_filter',
+            'async_eth_new_filter',
+            'async_eth_new_pending_transaction_filter',
+            'async_eth_protocol_version',
+            'async_eth_send_raw_transaction',
+            'async_eth_send_transaction',
+            'async_eth_sign',
+            'async_eth_sign_transaction',
+            'async_eth_submit_hashrate',
+            'async_eth_submit_work',
+            'async_eth_syncing',
+            'async_eth_uninstall_filter',
+            'async_net_listening',
+            'async_net_peer_count',
+            'async_net_version',
+            'async_shh_add_to_group',
+            'async_shh_get_filter_changes',
+            'async_shh_get_messages',
+            'async_shh_has_identity',
+            'async_shh_new_filter',
+            'async_shh_new_group',
+            'async_shh_new_identity',
+            'async_shh_post',
+            'async_shh_uninstall_filter',
+            'async_shh_version',
+            'async_trace_block',
+            'async_trace_call',
+            'async_trace_call_many',
+            'async_trace_filter',
+            'async_trace_get',
+            'async_trace_raw_transaction',
+            'async_trace_replay_block_transactions',
+            'async_trace_replay_transaction',
+            'async_trace_transaction',
+            'async_web3_client_version',
+            'async_web3_sha3',
+        ),
+        'rpc_executors_sync': (
+            'sync_debug_trace_block_by_hash',
+            'sync_debug_trace_block_by_number',
+            'sync_debug_trace_call',
+            'sync_debug_trace_call_many',
+            'sync_debug_trace_transaction',
+            'sync_eth_accounts',
+            'sync_eth_block_number',
+            'sync_eth_call',
+            'sync_eth_chain_id',
+            'sync_eth_coinbase',
+            'sync_eth_estimate_gas',
+            'sync_eth_fee_history',
+            'sync_eth_gas_price',
+            'sync_eth_get_balance',
+            'sync_eth_get_block_by_hash',
+            'sync_eth_get_block_by_number',
+            'sync_eth_get_block_receipts',
+            'sync_eth_get_block_transaction_count_by_hash',
+            'sync_eth_get_block_transaction_count_by_number',
+            'sync_eth_get_code',
+            'sync_eth_get_filter_changes',
+            'sync_eth_get_filter_logs',
+            'sync_eth_get_logs',
+            'sync_eth_get_storage_at',
+            'sync_eth_get_transaction_by_block_hash_and_index',
+            'sync_eth_get_transaction_by_block_number_and_index',
+            'sync_eth_get_transaction_by_hash',
+            'sync_eth_get_transaction_count',
+            'sync_eth_get_transaction_receipt',
+            'sync_eth_get_uncle_by_block_hash_and_index',
+            'sync_eth_get_uncle_by_block_number_and_index',
+            'sync_eth_get_uncle_count_by_block_hash',
+            'sync_eth_get_uncle_count_by_block_number',
+            'sync_eth_get_work',
+            'sync_eth_hashrate',
+            'sync_eth_mining',
+            'sync_eth_new_block_filter',
+            'sync_eth_new_filter',
+            'sync_eth_new_pending_transaction_filter',
+            'sync_eth_protocol_version',
+            'sync_eth_send_raw_transaction',
+            'sync_eth_send_transaction',
+            'sync_eth_sign',
+            'sync_eth_sign_transaction',
+            'sync_eth_submit_hashrate',
+            'sync_eth_submit_work',
+            'sync_eth_syncing',
+            'sync_eth_uninstall_filter',
+            'sync_net_listening',
+            'sync_net_peer_count',
+            'sync_net_version',
+            'sync_shh_add_to_group',
+            'sync_shh_get_filter_changes',
+            'sync_shh_get_messages',
+            'sync_shh_has_identity',
+            'sync_shh_new_filter',
+            'sync_shh_new_group',
+            'sync_shh_new_identity',
+            'sync_shh_post',
+            'sync_shh_uninstall_filter',
+            'sync_shh_version',
+            'sync_trace_block',
+            'sync_trace_call',
+            'sync_trace_call_many',
+            'sync_trace_filter',
+            'sync_trace_get',
+            'sync_trace_raw_transaction',
+            'sync_trace_replay_block_transactions',
+            'sync_trace_replay_transaction',
+            'sync_trace_transaction',
+            'sync_web3_client_version',
+            'sync_web3_sha3',
+        ),
+        'rpc_protocols': (
+            'async_close_http_session',
+        ),
+        'rpc_lifecycle': (
+            'async_execute',
+            'construct',
+            'digest',
+        ),
+        'rpc_provider': (
+            'create_provider',
+            'find_provider',
+            'resolve_provider',
+        ),
+        'rpc_registry': (
+            'get_constructor',
+            'get_constructors',
+            'get_digestor',
+            'get_digestors',
+        ),
+        'rpc_request': (
+            'async_send',
+            'async_send_raw',
+            'create',
+            'format_rpc_telemetry_prometheus',
+            'get_request_credits',
+            'get_rpc_latency_quantile',
+            'get_rpc_telemetry',
+            'latency_bucket_bounds',
+            'load_rpc_telemetry',
+            'merge_rpc_telemetry',
+            'print_rpc_telemetry_summary',
+            'reset_rate_limits',
+            'reset_rpc_telemetry',
+            'save_rpc_telemetry',
+            'sync_send',
+            'sync_send_raw',
+            'track_rpc_credits',
+        ),
+        'rpc_spec': (
+            'contenttypes',
+            'rpc_block_quantities',
+            'rpc_constructor_batch_inputs',
+            'rpc_log_quantities',
+            'rpc_result_list_map_quantities',
+            'rpc_result_map_quantities',
+            'rpc_result_scalar_quantities',
+            'rpc_transaction_quantities',
+            'rpc_transaction_receipt_quantities',
+        ),
+    }
+
+    _lazy_submodules = {
+        name: submodule
+        for submodule, names in _lazy_exports.items()
+        for name in names
+    }
+
+    def __getattr__(name: str) -> typing.Any:
+        """load attribute from its submodule upon first access"""
+        import importlib
+
+        if name in _lazy_exports:
+            return importlib.import_module(__name__ + '.' + name)
+        submodule = _lazy_submodules.get(name)
+        if submodule is None:
+            raise AttributeError(
+                'module ' + repr(__name__) + ' has no attribute ' + repr(name)
+            )
+        module = importlib.import_module(__name__ + '.' + submodule)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """list attributes, including those not yet loaded"""
+        return sorted(
+            set(globals()) | set(_lazy_exports) | set(_lazy_submodules)
+        )
@@ -1,3 +1,4 @@
 from .rpc_batch_constructors import *
 from .rpc_batch_executors import *
 from .rpc_batch_utils import *
+from .rpc_batch_sampling import *
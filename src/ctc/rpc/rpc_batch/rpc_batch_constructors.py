@@ -102,6 +102,14 @@ def batch_construct_eth_get_block_by_number(
     )
 
 
+def batch_construct_eth_get_block_receipts(
+    **constructor_kwargs: typing.Any,
+) -> spec.RpcPluralRequest:
+    return rpc_batch_utils.batch_construct(
+        method='eth_get_block_receipts', **constructor_kwargs
+    )
+
+
 def batch_construct_eth_get_block_transaction_count_by_hash(
     **constructor_kwargs: typing.Any,
 ) -> spec.RpcPluralRequest:
@@ -129,6 +129,14 @@ async def async_batch_eth_get_block_by_number(
     )
 
 
+async def async_batch_eth_get_block_receipts(
+    **kwargs: typing.Any,
+) -> spec.RpcPluralResponse:
+    return await rpc_batch_utils.async_batch_execute(
+        'eth_get_block_receipts', **kwargs
+    )
+
+
 async def async_batch_eth_get_block_transaction_count_by_hash(
     **kwargs: typing.Any,
 ) -> spec.RpcPluralResponse:
@@ -0,0 +1,214 @@
+"""sample a single rpc call shape across many blocks
+
+- repeated blocks are only requested once
+- responses at finalized blocks are cached in memory by (call, block),
+  excluding reverted calls
+- requests are sent in batches of chunk_size
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+from . import rpc_batch_utils
+from .. import rpc_request
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Literal
+
+    SampleCacheKey = typing.Tuple[str, str, str]
+
+
+_sample_cache: typing.MutableMapping[SampleCacheKey, typing.Any] = {}
+_sample_cache_max_size = 2**17
+
+
+@typing.overload
+async def async_sample_by_block(
+    method: str,
+    blocks: typing.Iterable[spec.BlockNumberReference],
+    *,
+    chunk_size: int | None = None,
+    use_cache: bool = True,
+    output_format: Literal['list'] = 'list',
+    name: str | None = None,
+    context: spec.Context = None,
+    **call_kwargs: typing.Any,
+) -> list[typing.Any]:
+    ...
+
+
+@typing.overload
+async def async_sample_by_block(
+    method: str,
+    blocks: typing.Iterable[spec.BlockNumberReference],
+    *,
+    chunk_size: int | None = None,
+    use_cache: bool = True,
+    output_format: Literal['series'],
+    name: str | None = None,
+    context: spec.Context = None,
+    **call_kwargs: typing.Any,
+) -> spec.Series:
+    ...
+
+
+async def async_sample_by_block(
+    method: str,
+    blocks: typing.Iterable[spec.BlockNumberReference],
+    *,
+    chunk_size: int | None = None,
+    use_cache: bool = True,
+    output_format: Literal['list', 'series'] = 'list',
+    name: str | None = None,
+    context: spec.Context = None,
+    **call_kwargs: typing.Any,
+) -> list[typing.Any] | spec.Series:
+    """perform the same rpc call at each block of a list of blocks
+
+    ## Inputs
+    - method: name of rpc method, e.g. 'eth_call' or 'eth_get_balance'
+    - blocks: blocks at which to perform call, may contain duplicates
+    - chunk_size: number of requests per batch sent to provider
+    - use_cache: whether to use cache of responses at finalized blocks
+    - output_format: 'list' or 'series'
+    - call_kwargs: other kwargs of the method's batch executor
+    """
+
+    import json
+    from ctc import config
+    from ctc import evm
+
+    # dedupe blocks
+    standard_blocks = evm.standardize_block_numbers(blocks)
+    unique_blocks = list(dict.fromkeys(standard_blocks))
+
+    # resolve function abi
+    if method == 'eth_call' and call_kwargs.get('function_abi') is None:
+        to_address = call_kwargs.get('to_address')
+        if to_address is None:
+            raise Exception('must specify to_address')
+        call_kwargs = dict(call_kwargs)
+        call_kwargs['function_abi'] = await evm.async_get_function_abi(
+            contract_address=to_address,
+            function_name=call_kwargs.pop('function_name', None),
+            function_selector=call_kwargs.pop('function_selector', None),
+            context=context,
+        )
+
+    # construct requests
+    constructor_kwargs, digestor_kwargs = (
+        rpc_batch_utils._separate_execution_kwargs(
+            method=method,
+            kwargs=call_kwargs,
+        )
+    )
+    constructor_kwargs = dict(constructor_kwargs)
+    convert_reverts_to = constructor_kwargs.pop('convert_reverts_to', None)
+    convert_reverts_to_none = constructor_kwargs.pop(
+        'convert_reverts_to_none', False
+    )
+    requests = rpc_batch_utils.batch_construct(
+        method=method,
+        block_numbers=unique_blocks,
+        **constructor_kwargs,
+    )
+
+    # gather cached responses
+    network = str(config.get_context_chain_id(context))
+    revert_mode = repr([convert_reverts_to, convert_reverts_to_none])
+    keys: list[SampleCacheKey] = [
+        (
+            network,
+            json.dumps([request['method'], request['params']]),
+            revert_mode,
+        )
+        for request in requests
+    ]
+    responses: list[typing.Any] = [None] * len(requests)
+    missing = []
+    for i, key in enumerate(keys):
+        if use_cache and key in _sample_cache:
+            responses[i] = _sample_cache[key]
+        else:
+            missing.append(i)
+
+    # fetch missing responses
+    if len(missing) > 0:
+        if chunk_size is not None:
+            context = config.update_context(
+                context, merge_provider={'chunk_size': chunk_size}
+            )
+        fetched = await rpc_request.async_send(
+            [requests[i] for i in missing],
+            context=context,
+            convert_reverts_to=convert_reverts_to,
+            convert_reverts_to_none=convert_reverts_to_none,
+        )
+        for i, response in zip(missing, fetched):
+            responses[i] = response
+
+        # cache responses at finalized blocks
+        if use_cache:
+            finalized_block = await _async_get_finalized_block(context=context)
+            for i, response in zip(missing, fetched):
+                block = unique_blocks[i]
+                if (
+                    response is not None
+                    and not _is_converted_revert(response, convert_reverts_to)
+                    and isinstance(block, int)
+                    and block <= finalized_block
+                ):
+                    _set_cached_response(keys[i], response)
+
+    # digest and expand to requested blocks
+    results = rpc_batch_utils.batch_digest(
+        response=responses, method=method, **digestor_kwargs
+    )
+    results_by_block = dict(zip(unique_blocks, results))
+    output = [results_by_block[block] for block in standard_blocks]
+
+    if output_format == 'list':
+        return output
+    elif output_format == 'series':
+        import polars as pl
+
+        try:
+            return pl.Series(name, output)
+        except (OverflowError, TypeError, ValueError):
+            return pl.Series(name, output, dtype=pl.Object)
+    else:
+        raise Exception('unknown output format: ' + str(output_format))
+
+
+def _is_converted_revert(
+    response: typing.Any, convert_reverts_to: typing.Any
+) -> bool:
+    # reverted calls are replaced by the placeholder object itself
+    if convert_reverts_to is None:
+        return False
+    return response is convert_reverts_to or response == convert_reverts_to
+
+
+async def _async_get_finalized_block(*, context: spec.Context) -> int:
+    from ctc import evm
+    from ctc.db import management
+
+    latest_block = await evm.async_get_latest_block_number(context=context)
+    return latest_block - management.get_required_confirmations(context)
+
+
+def _set_cached_response(key: SampleCacheKey, response: typing.Any) -> None:
+    if len(_sample_cache) >= _sample_cache_max_size:
+        # evict oldest quarter of entries
+        for old_key in list(_sample_cache.keys())[
+            : _sample_cache_max_size // 4
+        ]:
+            del _sample_cache[old_key]
+    _sample_cache[key] = response
+
+
+def clear_sample_cache() -> None:
+    """clear cache of responses used by async_sample_by_block"""
+    _sample_cache.clear()
@@ -29,12 +29,62 @@ def batch_construct(
         constructor_kwargs,
         batch_inputs,
     )
+
+    # encode call data of all calls in a single pass
+    if (
+        method in ['eth_call', 'eth_estimate_gas']
+        and parameter == 'function_parameters'
+        and other_constructor_kwargs.get('function_abi') is not None
+        and other_constructor_kwargs.get('call_data') is None
+    ):
+        return _batch_construct_calls(
+            method=method,
+            function_parameter_list=values,
+            constructor_kwargs=other_constructor_kwargs,
+        )
+
     return [
         singular_constructor(**{parameter: value}, **other_constructor_kwargs)
         for value in values
     ]
 
 
+def _batch_construct_calls(
+    *,
+    method: str,
+    function_parameter_list: typing.Sequence[typing.Any],
+    constructor_kwargs: typing.Mapping[str, typing.Any],
+) -> spec.RpcPluralRequest:
+    """construct calls that differ only in their function parameters"""
+
+    from ctc import evm
+
+    other_kwargs = dict(constructor_kwargs)
+    function_abi = other_kwargs.pop('function_abi')
+    call_datas = evm.batch_encode_call_data(
+        function_parameter_list, function_abi=function_abi
+    )
+    if len(call_datas) == 0:
+        return []
+
+    # construct template request once, then substitute call data of each call
+    # requests use consecutive ids so that ids are unique within the batch
+    singular_constructor = rpc_registry.get_constructor(method=method)
+    template = singular_constructor(call_data=call_datas[0], **other_kwargs)
+    call_object, *other_params = template['params']
+    first_id = template['id']
+
+    return [
+        {
+            'jsonrpc': '2.0',
+            'method': template['method'],
+            'params': [dict(call_object, data=call_data), *other_params],
+            'id': first_id + i,
+        }
+        for i, call_data in enumerate(call_datas)
+    ]
+
+
 def _get_batch_parameter(
     kwargs: typing.Mapping[str, typing.Any],
     batch_inputs: typing.Mapping[str, str],
@@ -58,8 +58,11 @@ def construct_eth_get_filter_logs(
 
 
 def construct_eth_get_logs(
-    address: spec.BinaryData | None = None,
-    topics: typing.Sequence[spec.BinaryData | None] | None = None,
+    address: spec.BinaryData | typing.Sequence[spec.BinaryData] | None = None,
+    topics: typing.Sequence[
+        spec.BinaryData | typing.Sequence[spec.BinaryData] | None
+    ]
+    | None = None,
     *,
     start_block: spec.BlockNumberReference | None = None,
     end_block: spec.BlockNumberReference | None = None,
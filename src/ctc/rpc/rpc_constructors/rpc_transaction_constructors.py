@@ -57,6 +57,16 @@ def construct_eth_get_transaction_receipt(
     )
 
 
+def construct_eth_get_block_receipts(
+    block_number: spec.BlockNumberReference,
+) -> spec.RpcSingularRequest:
+    block_number = evm.encode_block_number(block_number)
+    return rpc_request.create(
+        'eth_getBlockReceipts',
+        [block_number],
+    )
+
+
 def construct_eth_get_block_transaction_count_by_hash(
     block_hash: spec.BinaryData,
 ) -> spec.RpcSingularRequest:
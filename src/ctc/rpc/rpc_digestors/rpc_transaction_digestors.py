@@ -70,6 +70,27 @@ def digest_eth_get_transaction_receipt(
     return response
 
 
+def digest_eth_get_block_receipts(
+    response: spec.RpcSingularResponse,
+    *,
+    decode_response: bool = True,
+    snake_case_response: bool = True,
+) -> spec.RpcSingularResponse:
+    if response is None:
+        return None
+    if decode_response:
+        quantities = rpc_spec.rpc_transaction_receipt_quantities
+        response = [
+            rpc_format.decode_response(receipt, quantities)
+            for receipt in response
+        ]
+    if snake_case_response:
+        response = [
+            rpc_format.keys_to_snake_case(receipt) for receipt in response
+        ]
+    return response
+
+
 def digest_eth_get_block_transaction_count_by_hash(
     response: spec.RpcSingularResponse,
     *,
@@ -105,6 +105,24 @@ async def async_eth_get_transaction_receipt(
     )
 
 
+async def async_eth_get_block_receipts(
+    block_number: spec.BlockNumberReference,
+    *,
+    context: spec.Context = None,
+    decode_response: bool = True,
+    snake_case_response: bool = True,
+) -> spec.RpcSingularResponse:
+    request = rpc_constructors.construct_eth_get_block_receipts(
+        block_number=block_number,
+    )
+    response = await rpc_request.async_send(request, context=context)
+    return rpc_digestors.digest_eth_get_block_receipts(
+        response=response,
+        decode_response=decode_response,
+        snake_case_response=snake_case_response,
+    )
+
+
 async def async_eth_get_block_transaction_count_by_hash(
     block_hash: str,
     *,
@@ -4,6 +4,8 @@ import typing
 import warnings
 
 if typing.TYPE_CHECKING:
+    import asyncio
+
     import aiohttp
 
 from ctc import config
@@ -11,7 +13,12 @@ from ctc import spec
 from .. import rpc_provider
 
 
-_http_sessions: dict[spec.ProviderId, aiohttp.ClientSession] = {}
+# sessions are bound to the event loop that created them, so they are keyed
+# by loop as well as by provider
+_http_sessions: dict[
+    typing.Tuple[spec.ProviderId, asyncio.AbstractEventLoop],
+    aiohttp.ClientSession,
+] = {}
 
 
 def sync_send_http(
@@ -21,11 +28,19 @@ def sync_send_http(
     n_attempts: int = 8,
 ) -> str:
     import requests
-    import json
+    import orjson
+    from ..rpc_request import request_rate_limits
+    from ..rpc_request import request_telemetry
 
     headers = {'Content-Type': 'application/json', 'User-Agent': 'ctc'}
-    data = json.dumps(request)
+    data = orjson.dumps(request)
     for attempt in range(n_attempts):
+        if attempt > 0:
+            request_telemetry._record_retry(request, provider)
+            request_rate_limits._sync_acquire_credits(request, provider)
+        request_telemetry._record_request_bytes(
+            request, provider, n_bytes=len(data)
+        )
         try:
             response = requests.post(
                 provider['url'],
@@ -57,14 +72,25 @@ async def async_send_http(
     *,
     n_attempts: int = 8,
 ) -> str:
+    import orjson
+    from ..rpc_request import request_rate_limits
+    from ..rpc_request import request_telemetry
+
     session = get_async_http_session(provider=provider)
 
-    headers = {'User-Agent': 'ctc'}
+    headers = {'Content-Type': 'application/json', 'User-Agent': 'ctc'}
+    data = orjson.dumps(request)
     response = None
     for attempt in range(n_attempts):
+        if attempt > 0:
+            request_telemetry._record_retry(request, provider)
+            await request_rate_limits._async_acquire_credits(request, provider)
+        request_telemetry._record_request_bytes(
+            request, provider, n_bytes=len(data)
+        )
         try:
             async with session.post(
-                provider['url'], json=request, headers=headers
+                provider['url'], data=data, headers=headers
             ) as response:
                 if response.status != 200:
                     import random
@@ -106,53 +132,57 @@ async def async_send_http(
 def get_async_http_session(
     provider: spec.Provider, create: bool = True
 ) -> aiohttp.ClientSession:
+    import asyncio
+
     provider_id = rpc_provider._get_provider_id(provider)
-    if provider_id not in _http_sessions:
+    key = (provider_id, asyncio.get_running_loop())
+    if key not in _http_sessions:
         if create:
             import aiohttp
 
+            # sessions of closed event loops can no longer be used
+            for other_key in list(_http_sessions.keys()):
+                if other_key[1].is_closed():
+                    del _http_sessions[other_key]
+
             kwargs = provider['session_kwargs']
             if kwargs is None:
                 kwargs = {}
             kwargs = dict(kwargs)
             kwargs.setdefault('timeout', aiohttp.ClientTimeout(300))
-            _http_sessions[provider_id] = aiohttp.ClientSession(
+            _http_sessions[key] = aiohttp.ClientSession(
                 trust_env=True, **kwargs
             )
         else:
             raise Exception('no session, must create')
-    return _http_sessions[provider_id]
+    return _http_sessions[key]
 
 
 async def async_close_http_session(
     context: spec.Context = None,
 ) -> None:
+    """close http sessions of the running event loop"""
+
     import asyncio
 
     if len(_http_sessions) == 0:
         return
 
+    loop = asyncio.get_running_loop()
     if context is None:
         for key, session in list(_http_sessions.items()):
-            await asyncio.sleep(0)
-            await session.close()
-            del _http_sessions[key]
+            if key[1] is loop:
+                await asyncio.sleep(0)
+                await session.close()
+                del _http_sessions[key]
 
     else:
         provider = config.get_context_provider(context)
         if provider is None:
             raise Exception('no provider available')
-        session = get_async_http_session(provider=provider)
-        session_keys = [
-            key
-            for key, value in _http_sessions.items()
-            if id(session) == id(value)
-        ]
-        if len(session_keys) != 1:
-            raise Exception('unknown session')
-        else:
-            session_key = session_keys[0]
+        session_key = (rpc_provider._get_provider_id(provider), loop)
+        if session_key not in _http_sessions:
+            return
         await asyncio.sleep(0)
-        await session.close()
+        await _http_sessions[session_key].close()
         del _http_sessions[session_key]
-
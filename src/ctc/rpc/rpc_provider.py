@@ -12,6 +12,10 @@ if typing.TYPE_CHECKING:
     from typing_extensions import Literal
 
 
+# chain id of each provider url, as reported by the provider
+_validated_chain_ids: typing.MutableMapping[str, int] = {}
+
+
 def resolve_provider(
     provider: spec.ProviderReference,
     other_providers: typing.Mapping[str, spec.Provider] | None = None,
@@ -51,6 +55,7 @@ def create_provider(
     convert_reverts_to_none: bool = True,
     validate_chain_id: bool = True,
     disable_batch_requests: bool = False,
+    rate_limit: spec.ProviderRateLimit | None = None,
     other_providers: typing.Mapping[str, spec.Provider] | None = None,
 ) -> spec.Provider:
     """create provider"""
@@ -85,14 +90,20 @@ def create_provider(
                 )
 
     # network
-    if network is None or validate_chain_id:
+    check_chain_id = validate_chain_id
+    if network is not None:
+        network = evm.get_network_chain_id(network)
+        if _validated_chain_ids.get(url) == network:
+            # already validated, e.g. when a provider of a normalized context
+            # is resolved again
+            check_chain_id = False
+    if network is None or check_chain_id:
         actual_chain_id = _sync_get_chain_id(url)
+        _validated_chain_ids[url] = actual_chain_id
     if network is None:
         network = actual_chain_id
-    else:
-        network = evm.get_network_chain_id(network)
-        if validate_chain_id and network != actual_chain_id:
-            raise Exception('provider network does not match given network')
+    elif check_chain_id and network != actual_chain_id:
+        raise Exception('provider network does not match given network')
 
     # name
     if other_providers is None:
@@ -138,6 +149,11 @@ def create_provider(
         'convert_reverts_to_none': convert_reverts_to_none,
         'disable_batch_requests': disable_batch_requests,
     }
+    if rate_limit is not None:
+        provider['rate_limit'] = rate_limit
+    if not validate_chain_id:
+        # keep skipping validation when the provider is resolved again
+        provider['validate_chain_id'] = False
 
     return provider
 
@@ -1,3 +1,5 @@
 from .request_async import *
+from .request_rate_limits import *
 from .request_sync import *
+from .request_telemetry import *
 from .request_utils import *
@@ -4,6 +4,7 @@ import typing
 
 from ctc import spec
 from .. import rpc_logging
+from . import request_telemetry
 from . import request_utils
 
 
@@ -64,6 +65,8 @@ async def async_send(
         logging_rpc_calls = config.get_log_rpc_calls()
     except Exception:
         logging_rpc_calls = False
+    if logging_rpc_calls:
+        request_telemetry._register_telemetry_persistence()
 
     if isinstance(request, dict):
 
@@ -147,24 +150,39 @@ async def async_send_raw(
 ) -> str:
     """route RPC request to provider according to specified protocol"""
 
-    if provider['protocol'] == 'http':
-        from ..rpc_protocols import rpc_http
+    from . import request_rate_limits
 
-        return await rpc_http.async_send_http(
-            request=request,
-            provider=provider,
-        )
-
-    elif provider['protocol'] == 'wss':
-        from ..rpc_protocols import rpc_websocket
-
-        return await rpc_websocket.async_send_websocket(
-            request=request,
-            provider=provider,
+    # latency and in-flight counts start once the credit budget admits the
+    # request, retries are throttled again by the transport
+    await request_rate_limits._async_acquire_credits(request, provider)
+    key = request_telemetry._get_telemetry_key(request, provider)
+    start_time = request_telemetry._record_request_start(key)
+    raw_response = None
+    try:
+        if provider['protocol'] == 'http':
+            from ..rpc_protocols import rpc_http
+
+            raw_response = await rpc_http.async_send_http(
+                request=request,
+                provider=provider,
+            )
+
+        elif provider['protocol'] == 'wss':
+            from ..rpc_protocols import rpc_websocket
+
+            raw_response = await rpc_websocket.async_send_websocket(
+                request=request,
+                provider=provider,
+            )
+
+        else:
+            raise Exception(
+                'unknown provider protocol: ' + str(provider['protocol'])
+            )
+    finally:
+        request_telemetry._record_request_end(
+            key, start_time, request=request, raw_response=raw_response
         )
 
-    else:
-        raise Exception(
-            'unknown provider protocol: ' + str(provider['protocol'])
-        )
+    return raw_response
 
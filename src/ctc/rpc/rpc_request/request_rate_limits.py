@@ -0,0 +1,175 @@
+"""pace rpc requests to stay within the credit budgets of providers
+
+providers can specify a `rate_limit` with a budget of credits per second
+- each call of a request costs `method_credits[method]` credits, or
+  `default_credits` credits for methods not listed (default 1)
+- credits accrue at `credits_per_second`, up to `burst_credits` (default one
+  second of budget)
+- each request reserves its credits before being dispatched, waiting until
+  its reservation is covered, so concurrent requests are dispatched in order
+  at the budgeted rate instead of bursting into 429 responses
+
+credits are counted for every provider, using one credit per call for
+providers without a `rate_limit`. use `track_rpc_credits()` to report the
+credits consumed by a particular job
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class RateLimitState(TypedDict):
+        credits: float
+        last_update: float
+
+
+_rate_limit_states: dict[spec.ProviderId, RateLimitState] = {}
+_rate_limit_lock = threading.Lock()
+_credit_trackers: contextvars.ContextVar[
+    tuple[dict[str, float], ...]
+] = contextvars.ContextVar('_credit_trackers', default=())
+
+
+def get_request_credits(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+) -> dict[str, float]:
+    """get credits that request costs at provider, by method"""
+
+    rate_limit = provider.get('rate_limit')
+    if rate_limit is None:
+        method_credits: typing.Mapping[str, float] = {}
+        default_credits: float = 1
+    else:
+        method_credits = rate_limit.get('method_credits', {})
+        default_credits = rate_limit.get('default_credits', 1)
+
+    if isinstance(request, dict):
+        method = request['method']
+        return {method: method_credits.get(method, default_credits)}
+    else:
+        credits: dict[str, float] = {}
+        for subrequest in request:
+            method = subrequest['method']
+            credits[method] = credits.get(method, 0) + method_credits.get(
+                method, default_credits
+            )
+        return credits
+
+
+def _reserve_credits(provider: spec.Provider, n_credits: float) -> float:
+    """reserve credits from provider budget, returning seconds to wait"""
+
+    import time
+
+    from .. import rpc_provider
+
+    rate_limit = provider.get('rate_limit')
+    if rate_limit is None:
+        return 0.0
+    rate = rate_limit['credits_per_second']
+    burst = rate_limit.get('burst_credits')
+    if burst is None:
+        burst = rate
+
+    provider_id = rpc_provider._get_provider_id(provider)
+    with _rate_limit_lock:
+        now = time.monotonic()
+        state = _rate_limit_states.get(provider_id)
+        if state is None:
+            state = {'credits': burst, 'last_update': now}
+            _rate_limit_states[provider_id] = state
+        balance = state['credits'] + (now - state['last_update']) * rate
+        balance = min(balance, burst) - n_credits
+        state['credits'] = balance
+        state['last_update'] = now
+
+    # a negative balance is repaid before the request can be dispatched
+    if balance < 0:
+        return -balance / rate
+    else:
+        return 0.0
+
+
+def _consume_credits(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+) -> tuple[float, float]:
+    """record credits of request, returning credits and seconds to wait"""
+
+    credits = get_request_credits(request, provider)
+    n_credits = sum(credits.values())
+    for tracker in _credit_trackers.get():
+        for method, method_credits in credits.items():
+            tracker[method] = tracker.get(method, 0) + method_credits
+    return n_credits, _reserve_credits(provider, n_credits)
+
+
+async def _async_acquire_credits(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+) -> None:
+    """wait until provider budget allows request to be dispatched"""
+
+    from . import request_telemetry
+
+    n_credits, delay = _consume_credits(request, provider)
+    if delay > 0:
+        import asyncio
+
+        await asyncio.sleep(delay)
+    request_telemetry._record_request_credits(
+        request, provider, n_credits=n_credits, throttle_time=delay
+    )
+
+
+def _sync_acquire_credits(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+) -> None:
+    """wait until provider budget allows request to be dispatched"""
+
+    from . import request_telemetry
+
+    n_credits, delay = _consume_credits(request, provider)
+    if delay > 0:
+        import time
+
+        time.sleep(delay)
+    request_telemetry._record_request_credits(
+        request, provider, n_credits=n_credits, throttle_time=delay
+    )
+
+
+@contextlib.contextmanager
+def track_rpc_credits() -> typing.Iterator[dict[str, float]]:
+    """track credits of rpc requests sent within block, by method
+
+    requests of tasks created within the block are also tracked
+
+    ## Example
+        with rpc.track_rpc_credits() as credits:
+            await evm.async_get_events(...)
+        print(sum(credits.values()))
+    """
+
+    tracker: dict[str, float] = {}
+    token = _credit_trackers.set(_credit_trackers.get() + (tracker,))
+    try:
+        yield tracker
+    finally:
+        _credit_trackers.reset(token)
+
+
+def reset_rate_limits() -> None:
+    """reset credit balances of providers to their full burst"""
+    with _rate_limit_lock:
+        _rate_limit_states.clear()
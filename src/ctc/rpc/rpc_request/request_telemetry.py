@@ -0,0 +1,447 @@
+"""record telemetry of rpc requests by provider and method
+
+recording only updates in-memory counters, so it is cheap enough to always be
+enabled. each http request is keyed by its provider and by its method, where
+batch requests of a single method use that method and mixed batches use
+'batch'.
+
+if rpc logging is enabled in config, telemetry is accumulated into a file in
+the log directory upon exit, which is summarized by `ctc log --summary`
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ctc import spec
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict
+
+    class RpcTelemetry(TypedDict):
+        provider: str
+        method: str
+        n_requests: int
+        n_calls: int
+        n_failures: int
+        n_errors: int
+        n_retries: int
+        request_bytes: int
+        response_bytes: int
+        credits: float
+        throttle_time: float
+        latency_sum: float
+        latency_buckets: list[int]
+        in_flight: int
+
+    RpcTelemetryKey = typing.Tuple[str, str]
+
+
+# upper bounds of latency histogram buckets, in seconds
+latency_bucket_bounds = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float('inf'),
+)
+
+_rpc_telemetry: dict[RpcTelemetryKey, RpcTelemetry] = {}
+_telemetry_persistence = {'registered': False}
+
+
+#
+# # recording
+#
+
+
+def _get_telemetry_key(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+) -> RpcTelemetryKey:
+    provider_name = provider.get('name') or provider['url']
+    if isinstance(request, dict):
+        return (provider_name, request['method'])
+    elif len(request) == 0:
+        return (provider_name, 'batch')
+    else:
+        method = request[0]['method']
+        for subrequest in request:
+            if subrequest['method'] != method:
+                return (provider_name, 'batch')
+        return (provider_name, method)
+
+
+def _get_telemetry_entry(key: RpcTelemetryKey) -> RpcTelemetry:
+    entry = _rpc_telemetry.get(key)
+    if entry is None:
+        entry = {
+            'provider': key[0],
+            'method': key[1],
+            'n_requests': 0,
+            'n_calls': 0,
+            'n_failures': 0,
+            'n_errors': 0,
+            'n_retries': 0,
+            'request_bytes': 0,
+            'response_bytes': 0,
+            'credits': 0.0,
+            'throttle_time': 0.0,
+            'latency_sum': 0.0,
+            'latency_buckets': [0] * len(latency_bucket_bounds),
+            'in_flight': 0,
+        }
+        _rpc_telemetry[key] = entry
+    return entry
+
+
+def _record_request_start(key: RpcTelemetryKey) -> float:
+    import time
+
+    _get_telemetry_entry(key)['in_flight'] += 1
+    return time.perf_counter()
+
+
+def _record_request_end(
+    key: RpcTelemetryKey,
+    start_time: float,
+    *,
+    request: spec.RpcRequest,
+    raw_response: str | None,
+) -> None:
+    import bisect
+    import time
+
+    latency = time.perf_counter() - start_time
+    entry = _get_telemetry_entry(key)
+    entry['in_flight'] -= 1
+    entry['n_requests'] += 1
+    if isinstance(request, dict):
+        entry['n_calls'] += 1
+    else:
+        entry['n_calls'] += len(request)
+    entry['latency_sum'] += latency
+    entry['latency_buckets'][
+        bisect.bisect_left(latency_bucket_bounds, latency)
+    ] += 1
+    if raw_response is None:
+        entry['n_failures'] += 1
+    else:
+        entry['response_bytes'] += len(raw_response)
+
+
+def _record_response_errors(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+    *,
+    response: typing.Any,
+) -> None:
+    """count error objects of parsed response"""
+
+    if isinstance(response, list):
+        n_errors = sum('error' in subresponse for subresponse in response)
+    else:
+        n_errors = int('error' in response)
+    if n_errors > 0:
+        key = _get_telemetry_key(request, provider)
+        _get_telemetry_entry(key)['n_errors'] += n_errors
+
+
+def _record_request_bytes(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+    *,
+    n_bytes: int,
+) -> None:
+    key = _get_telemetry_key(request, provider)
+    _get_telemetry_entry(key)['request_bytes'] += n_bytes
+
+
+def _record_request_credits(
+    request: spec.RpcRequest,
+    provider: spec.Provider,
+    *,
+    n_credits: float,
+    throttle_time: float,
+) -> None:
+    key = _get_telemetry_key(request, provider)
+    entry = _get_telemetry_entry(key)
+    entry['credits'] += n_credits
+    entry['throttle_time'] += throttle_time
+
+
+def _record_retry(request: spec.RpcRequest, provider: spec.Provider) -> None:
+    key = _get_telemetry_key(request, provider)
+    _get_telemetry_entry(key)['n_retries'] += 1
+
+
+#
+# # access
+#
+
+
+def get_rpc_telemetry() -> list[RpcTelemetry]:
+    """get telemetry of rpc requests for each provider and method"""
+    import copy
+
+    return [copy.deepcopy(entry) for entry in _rpc_telemetry.values()]
+
+
+def reset_rpc_telemetry() -> None:
+    """reset telemetry of rpc requests"""
+    _rpc_telemetry.clear()
+
+
+def merge_rpc_telemetry(
+    telemetries: typing.Sequence[typing.Sequence[RpcTelemetry]],
+) -> list[RpcTelemetry]:
+    """merge telemetry entries of the same provider and method"""
+
+    import copy
+
+    merged: dict[RpcTelemetryKey, RpcTelemetry] = {}
+    for telemetry in telemetries:
+        for entry in telemetry:
+            key = (entry['provider'], entry['method'])
+            if key not in merged:
+                merged[key] = copy.deepcopy(entry)
+                continue
+            target = merged[key]
+            for field in [
+                'n_requests',
+                'n_calls',
+                'n_failures',
+                'n_errors',
+                'n_retries',
+                'request_bytes',
+                'response_bytes',
+                'credits',
+                'throttle_time',
+                'latency_sum',
+                'in_flight',
+            ]:
+                # files saved by older versions lack some fields
+                value: typing.Any = target.get(field, 0)
+                target[field] = value + entry.get(field, 0)  # type: ignore
+            target['latency_buckets'] = [
+                a + b
+                for a, b in zip(
+                    target['latency_buckets'], entry['latency_buckets']
+                )
+            ]
+    return list(merged.values())
+
+
+def get_rpc_latency_quantile(entry: RpcTelemetry, quantile: float) -> float:
+    """estimate latency quantile from histogram, as bucket upper bound"""
+
+    n_requests = sum(entry['latency_buckets'])
+    if n_requests == 0:
+        return float('nan')
+    threshold = quantile * n_requests
+    cumulative = 0
+    for bound, count in zip(latency_bucket_bounds, entry['latency_buckets']):
+        cumulative += count
+        if cumulative >= threshold:
+            return bound
+    return latency_bucket_bounds[-1]
+
+
+#
+# # formatting
+#
+
+
+def format_rpc_telemetry_prometheus(
+    telemetry: typing.Sequence[RpcTelemetry] | None = None,
+) -> str:
+    """format telemetry of rpc requests as prometheus text exposition"""
+
+    if telemetry is None:
+        telemetry = get_rpc_telemetry()
+
+    counters = [
+        ('n_requests', 'ctc_rpc_requests_total', 'http requests sent'),
+        ('n_calls', 'ctc_rpc_calls_total', 'rpc calls, counting batch items'),
+        ('n_failures', 'ctc_rpc_failures_total', 'requests that failed'),
+        ('n_errors', 'ctc_rpc_errors_total', 'rpc error responses'),
+        ('n_retries', 'ctc_rpc_retries_total', 'http request retries'),
+        ('request_bytes', 'ctc_rpc_request_bytes_total', 'bytes sent'),
+        ('response_bytes', 'ctc_rpc_response_bytes_total', 'bytes received'),
+        ('credits', 'ctc_rpc_credits_total', 'provider credits consumed'),
+        (
+            'throttle_time',
+            'ctc_rpc_throttle_seconds_total',
+            'seconds waited for provider credit budget',
+        ),
+    ]
+
+    lines = []
+    for field, name, description in counters:
+        lines.append('# HELP ' + name + ' ' + description)
+        lines.append('# TYPE ' + name + ' counter')
+        for entry in telemetry:
+            value = entry.get(field, 0)
+            lines.append(name + _format_labels(entry) + ' ' + str(value))
+
+    name = 'ctc_rpc_in_flight_requests'
+    lines.append('# HELP ' + name + ' http requests awaiting response')
+    lines.append('# TYPE ' + name + ' gauge')
+    for entry in telemetry:
+        value = entry['in_flight']
+        lines.append(name + _format_labels(entry) + ' ' + str(value))
+
+    name = 'ctc_rpc_request_duration_seconds'
+    lines.append('# HELP ' + name + ' latency of http requests')
+    lines.append('# TYPE ' + name + ' histogram')
+    for entry in telemetry:
+        cumulative = 0
+        for bound, count in zip(
+            latency_bucket_bounds, entry['latency_buckets']
+        ):
+            cumulative += count
+            if bound == float('inf'):
+                le = '+Inf'
+            else:
+                le = str(bound)
+            labels = _format_labels(entry, le=le)
+            lines.append(name + '_bucket' + labels + ' ' + str(cumulative))
+        labels = _format_labels(entry)
+        lines.append(name + '_sum' + labels + ' ' + repr(entry['latency_sum']))
+        lines.append(name + '_count' + labels + ' ' + str(cumulative))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _format_labels(entry: RpcTelemetry, le: str | None = None) -> str:
+    labels = [('provider', entry['provider']), ('method', entry['method'])]
+    if le is not None:
+        labels.append(('le', le))
+    formatted = []
+    for key, value in labels:
+        value = value.replace('\\', '\\\\').replace('"', '\\"')
+        value = value.replace('\n', '\\n')
+        formatted.append(key + '="' + value + '"')
+    return '{' + ','.join(formatted) + '}'
+
+
+def print_rpc_telemetry_summary(
+    telemetry: typing.Sequence[RpcTelemetry] | None = None,
+) -> None:
+    """print table summarizing telemetry of rpc requests"""
+
+    import toolstr
+
+    if telemetry is None:
+        telemetry = get_rpc_telemetry()
+
+    rows = []
+    for entry in sorted(telemetry, key=lambda entry: -entry['latency_sum']):
+        if entry['n_requests'] > 0:
+            mean_latency = entry['latency_sum'] / entry['n_requests']
+        else:
+            mean_latency = float('nan')
+        rows.append(
+            [
+                entry['provider'],
+                entry['method'],
+                entry['n_requests'],
+                entry['n_calls'],
+                entry['n_retries'],
+                entry['n_errors'] + entry['n_failures'],
+                entry.get('credits', 0),
+                entry.get('throttle_time', 0),
+                entry['response_bytes'] / 1e6,
+                entry['latency_sum'],
+                mean_latency,
+                get_rpc_latency_quantile(entry, 0.99),
+            ]
+        )
+    labels = [
+        'provider',
+        'method',
+        'requests',
+        'calls',
+        'retries',
+        'errors',
+        'credits',
+        'throttled s',
+        'MB recv',
+        'total s',
+        'mean s',
+        'p99 s',
+    ]
+    toolstr.print_table(rows, labels=labels)
+
+
+#
+# # persistence
+#
+
+
+def save_rpc_telemetry(path: str | None = None) -> None:
+    """accumulate telemetry of rpc requests into file"""
+
+    import json
+    import os
+    import tempfile
+    from ctc import config
+
+    if path is None:
+        path = config.get_rpc_telemetry_path()
+    merged = merge_rpc_telemetry(
+        [load_rpc_telemetry(path), get_rpc_telemetry()]
+    )
+    for entry in merged:
+        entry['in_flight'] = 0
+
+    # replace file atomically so that readers never see a partial write
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(merged, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_rpc_telemetry(path: str | None = None) -> list[RpcTelemetry]:
+    """load telemetry of rpc requests accumulated into file"""
+
+    import json
+    import os
+    from ctc import config
+
+    if path is None:
+        path = config.get_rpc_telemetry_path()
+    if not os.path.isfile(path):
+        return []
+    with open(path, 'r') as f:
+        telemetry: list[RpcTelemetry] = json.load(f)
+    return telemetry
+
+
+def _register_telemetry_persistence() -> None:
+    if not _telemetry_persistence['registered']:
+        import atexit
+
+        atexit.register(_save_rpc_telemetry_at_exit)
+        _telemetry_persistence['registered'] = True
+
+
+def _save_rpc_telemetry_at_exit() -> None:
+    if len(_rpc_telemetry) > 0:
+        try:
+            save_rpc_telemetry()
+        except Exception:
+            pass
@@ -4,6 +4,7 @@ import typing
 
 from ctc import spec
 from .. import rpc_logging
+from . import request_telemetry
 
 
 def create(
@@ -38,6 +39,9 @@ def _postprocess_response(
         import orjson
 
         response = orjson.loads(raw_response)
+    request_telemetry._record_response_errors(
+        request, provider, response=response
+    )
 
     if 'result' not in response and 'error' in response:
         if provider['convert_reverts_to_none'] or convert_reverts_to_none:
@@ -50,7 +54,8 @@ def _postprocess_response(
                     spec.RpcSingularResponseFailure, response
                 )
             raise spec.RpcException(
-                'RPC ERROR: ' + response['error']['message']
+                'RPC ERROR: ' + response['error']['message'],
+                code=response['error'].get('code'),
             )
     else:
         if typing.TYPE_CHECKING:
@@ -90,6 +95,10 @@ def _postprocess_plural_response(
             orjson.loads(raw_response_chunk)
             for raw_response_chunk in raw_response_chunks
         ]
+    for request_chunk, response_chunk in zip(request_chunks, response_chunks):
+        request_telemetry._record_response_errors(
+            request_chunk, provider, response=response_chunk
+        )
 
     if logging_rpc_calls:
         for request_chunk, response_chunk in zip(
@@ -123,7 +132,18 @@ def _postprocess_plural_response(
             else:
                 raise Exception('could not process response')
     else:
-        output = [subresponse['result'] for subresponse in plural_response]
+        output = []
+        for subresponse in plural_response:
+            if 'result' in subresponse:
+                output.append(subresponse['result'])
+            elif 'error' in subresponse:
+                error = subresponse['error']
+                raise spec.RpcException(
+                    'RPC ERROR: ' + error['message'],
+                    code=error.get('code'),
+                )
+            else:
+                raise Exception('could not process response')
 
     return output
 
@@ -128,6 +128,7 @@ rpc_constructor_batch_inputs = {
         'indices': 'index',
     },
     'eth_get_transaction_receipt': {'transaction_hashes': 'transaction_hash'},
+    'eth_get_block_receipts': {'block_numbers': 'block_number'},
     'eth_get_block_transaction_count_by_hash': {'block_hashes': 'block_hash'},
     'eth_get_block_transaction_count_by_number': {
         'block_numbers': 'block_number'
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 
 class RpcException(Exception):
-    pass
+    def __init__(self, message: str = '', code: int | None = None) -> None:
+        super().__init__(message)
+        self.code = code
 
 
 class CouldNotDetermineNetwork(Exception):
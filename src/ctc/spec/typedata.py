@@ -51,8 +51,10 @@ schema_names = (
     'dex_pools',
     'erc20_metadata',
     'events',
+    'metric_bars',
     'transactions',
     'chainlink',
+    'uniswap_v2',
 )
 
 network_schema_names = (
@@ -64,8 +66,10 @@ network_schema_names = (
     'dex_pools',
     'erc20_metadata',
     'events',
+    'metric_bars',
     'transactions',
     'chainlink',
+    'uniswap_v2',
 )
 
 # context_cache_keys: tuple[Literal['backend', 'read', 'write'], ...] = (
@@ -256,6 +260,11 @@ provider_keys = [
     'disable_batch_requests',
 ]
 
+optional_provider_keys = [
+    'rate_limit',
+    'validate_chain_id',
+]
+
 default_provider_settings = {
     # these must be particularly specified
     # 'url',
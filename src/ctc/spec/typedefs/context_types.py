@@ -7,9 +7,14 @@ from . import db_types
 from . import rpc_types
 from . import network_types
 
+if typing.TYPE_CHECKING:
+    from ctc.config.context_utils.context_resolution import ResolvedContext
 
-# Context can be any of the context types, either short-hand or full
-Context = typing.Union[None, int, str, 'ShorthandContext', 'NormalizedContext']
+
+# Context can be any of the context types, either short-hand, full, or resolved
+Context = typing.Union[
+    None, int, str, 'ShorthandContext', 'NormalizedContext', 'ResolvedContext'
+]
 
 
 # ShorthandContext is maximally flexible, allowing many nested data types
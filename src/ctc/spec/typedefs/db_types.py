@@ -24,12 +24,14 @@ NetworkSchemaName = Literal[
     'dex_pools',
     'erc20_metadata',
     'events',
+    'metric_bars',
     'transactions',
     # 'erc20_state',
     # 'events',
     #
     # protocols
     'chainlink',
+    'uniswap_v2',
 ]
 
 SchemaName = typing.Union[NetworkSchemaName, GenericSchemaName, AdminSchemaName]
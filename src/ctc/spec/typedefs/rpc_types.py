@@ -8,7 +8,7 @@
 from __future__ import annotations
 
 import typing
-from typing_extensions import TypedDict, Literal
+from typing_extensions import TypedDict, Literal, NotRequired
 
 from . import network_types
 
@@ -54,6 +54,14 @@ RpcDigestor = typing.Callable[..., RpcResponse]
 ProviderShortcut = str
 
 
+# ProviderRateLimit paces requests to stay within a provider's credit budget
+class ProviderRateLimit(TypedDict, total=False):
+    credits_per_second: float
+    burst_credits: float | None
+    method_credits: typing.Mapping[str, float]
+    default_credits: float
+
+
 class PartialProvider(TypedDict, total=False):
     url: str
     name: str | None
@@ -65,6 +73,8 @@ class PartialProvider(TypedDict, total=False):
     chunk_size: int | None
     convert_reverts_to_none: bool
     disable_batch_requests: bool
+    rate_limit: ProviderRateLimit | None
+    validate_chain_id: bool
 
 
 class Provider(TypedDict, total=True):
@@ -78,6 +88,8 @@ class Provider(TypedDict, total=True):
     chunk_size: int | None
     convert_reverts_to_none: bool
     disable_batch_requests: bool
+    rate_limit: NotRequired[ProviderRateLimit | None]
+    validate_chain_id: NotRequired[bool]
 
 
 ProviderReference = typing.Union[ProviderShortcut, PartialProvider, Provider]
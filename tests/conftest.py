@@ -38,3 +38,96 @@ def get_test_db_config():
         'path': os.path.join(tempdir, 'example.db'),
     }
 
+
+#
+# # mock nodes
+#
+
+
+def encode_word(value):
+    """encode int or address as 32-byte hex word, without 0x prefix"""
+    if isinstance(value, str):
+        return value[2:].zfill(64)
+    else:
+        return hex(value % 2**256)[2:].zfill(64)
+
+
+def create_log(address, block_number, *, topics, data_words, log_index=0):
+    """create raw log, as returned by eth_getLogs"""
+    return {
+        'blockNumber': hex(block_number),
+        'transactionIndex': hex(log_index),
+        'logIndex': hex(log_index),
+        'transactionHash': '0x' + encode_word(block_number * 10 + log_index),
+        'address': address,
+        'topics': ['0x' + encode_word(topic) for topic in topics],
+        'data': '0x' + ''.join(encode_word(word) for word in data_words),
+        'removed': False,
+        'blockHash': '0x' + encode_word(block_number),
+    }
+
+
+async def async_start_mock_node(get_response):
+    """start local json-rpc node, returning its runner and url
+
+    get_response maps each request to a dict containing a result or an error
+    """
+    from aiohttp import web
+
+    def create_response(item):
+        return dict({'jsonrpc': '2.0', 'id': item['id']}, **get_response(item))
+
+    async def handle(request):
+        data = await request.json()
+        if isinstance(data, list):
+            response = [create_response(item) for item in data]
+        else:
+            response = create_response(data)
+        return web.json_response(response)
+
+    app = web.Application()
+    app.router.add_post('/', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    return runner, 'http://127.0.0.1:' + str(port)
+
+
+async def async_start_mock_log_node(logs, log_queries):
+    """start local json-rpc node that serves eth_getLogs from given logs
+
+    the params of each eth_getLogs call are appended to log_queries
+    """
+
+    def get_response(item):
+        if item['method'] != 'eth_getLogs':
+            raise Exception('unknown method: ' + str(item['method']))
+        params = item['params'][0]
+        log_queries.append(params)
+        result = [
+            log
+            for log in logs
+            if int(params['fromBlock'], 16)
+            <= int(log['blockNumber'], 16)
+            <= int(params['toBlock'], 16)
+            and log['address'] in params.get('address', [log['address']])
+            and log['topics'][0] in params['topics'][0]
+        ]
+        return {'result': result}
+
+    return await async_start_mock_node(get_response)
+
+
+def create_mock_node_context(url, name):
+    """create uncached context that uses mock node as provider"""
+    return {
+        'provider': {
+            'url': url,
+            'name': name,
+            'network': 1,
+            'validate_chain_id': False,
+        },
+        'cache': False,
+    }
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from ctc.cli import cli_daemon
+
+
+async def _async_send(request, socket_path):
+    return await asyncio.to_thread(
+        cli_daemon.send_daemon_request, request, socket_path=socket_path
+    )
+
+
+async def _async_start_daemon(socket_path):
+    task = asyncio.create_task(
+        cli_daemon.async_run_daemon(socket_path=socket_path)
+    )
+    for i in range(100):
+        if os.path.exists(socket_path):
+            break
+        await asyncio.sleep(0.01)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_cli_daemon_runs_commands():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+    task = await _async_start_daemon(socket_path)
+    try:
+        request = {'action': 'run', 'command': ['hex', 'abc'], 'cwd': '/'}
+        response = await _async_send(request, socket_path)
+        assert response['exit_code'] == 0
+        assert response['stdout'] == '0x616263\n'
+
+        # repeated commands are served by the same process
+        request['command'] = ['keccak', 'abc']
+        response = await _async_send(request, socket_path)
+        assert response['exit_code'] == 0
+        assert response['stdout'] == (
+            '0x4e03657aea45a94fc7d47ba826c8d667'
+            'c0d1e6e33a64a036ec44f58fa12d6c45\n'
+        )
+
+        # argument errors produce nonzero exit codes
+        request['command'] = ['keccak']
+        response = await _async_send(request, socket_path)
+        assert response['exit_code'] != 0
+        assert 'required' in response['stderr']
+
+        # interactive commands are run by the client
+        request['command'] = ['setup']
+        response = await _async_send(request, socket_path)
+        assert response.get('run_locally')
+
+        assert await _async_send({'action': 'stop'}, socket_path) is not None
+        await asyncio.wait_for(task, 5)
+    finally:
+        if not task.done():
+            task.cancel()
+    assert not os.path.exists(socket_path)
+
+
+@pytest.mark.asyncio
+async def test_cli_daemon_runs_sync_commands_in_thread(monkeypatch):
+    from ctc.cli.commands.compute import hex_command
+
+    def run_own_loop(text, raw):
+        async def async_upper():
+            return text.upper()
+
+        print(asyncio.run(async_upper()))
+
+    monkeypatch.setattr(hex_command, 'hex_command', run_own_loop)
+    socket_path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+    task = await _async_start_daemon(socket_path)
+    try:
+        request = {'action': 'run', 'command': ['hex', 'abc'], 'cwd': '/'}
+        response = await _async_send(request, socket_path)
+        assert response['exit_code'] == 0
+        assert response['stdout'] == 'ABC\n'
+        assert await _async_send({'action': 'stop'}, socket_path) is not None
+        await asyncio.wait_for(task, 5)
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cli_daemon_applies_client_environment(monkeypatch):
+    from ctc.cli.commands.compute import hex_command
+
+    def print_config_path(text, raw):
+        print(os.environ.get('CTC_CONFIG_PATH'))
+
+    monkeypatch.setattr(hex_command, 'hex_command', print_config_path)
+    config_dir = tempfile.mkdtemp()
+    config_path = os.path.join(config_dir, 'config.json')
+    client_config_path = os.path.join(config_dir, 'client_config.json')
+    monkeypatch.setenv('CTC_CONFIG_PATH', config_path)
+    socket_path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+    task = await _async_start_daemon(socket_path)
+    try:
+        request = {
+            'action': 'run',
+            'command': ['hex', 'abc'],
+            'cwd': '/',
+            'environment': {'CTC_CONFIG_PATH': client_config_path},
+        }
+        response = await _async_send(request, socket_path)
+        assert response['stdout'] == client_config_path + '\n'
+        assert os.environ.get('CTC_CONFIG_PATH') == config_path
+
+        # unset variables of the client are unset within the command
+        request['environment'] = {'CTC_CONFIG_PATH': None}
+        response = await _async_send(request, socket_path)
+        assert response['stdout'] == 'None\n'
+        assert os.environ.get('CTC_CONFIG_PATH') == config_path
+
+        assert await _async_send({'action': 'stop'}, socket_path) is not None
+        await asyncio.wait_for(task, 5)
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_http_sessions_are_per_event_loop():
+    from ctc.rpc.rpc_protocols import rpc_http
+
+    provider = {'url': 'http://localhost:1', 'session_kwargs': None}
+
+    async def async_get_session():
+        return rpc_http.get_async_http_session(provider=provider)
+
+    def get_thread_session():
+        session = asyncio.run(async_get_session())
+        asyncio.run(session.close())
+        return session
+
+    session = await async_get_session()
+    try:
+        assert await async_get_session() is session
+        thread_session = await asyncio.to_thread(get_thread_session)
+        assert thread_session is not session
+        assert await async_get_session() is session
+    finally:
+        await session.close()
+        rpc_http._http_sessions.clear()
+
+
+def test_cli_daemon_socket_dir(monkeypatch):
+    import stat
+
+    runtime_dir = tempfile.mkdtemp()
+    monkeypatch.delenv('CTC_DAEMON_SOCKET', raising=False)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', runtime_dir)
+    socket_path = cli_daemon.get_daemon_socket_path()
+    assert socket_path == os.path.join(runtime_dir, 'ctc', 'daemon.sock')
+
+    # socket directory is private to the user
+    socket_dir = os.path.dirname(socket_path)
+    os.makedirs(socket_dir, mode=0o777)
+    os.chmod(socket_dir, 0o777)
+    cli_daemon._create_socket_dir(socket_dir)
+    assert stat.S_IMODE(os.stat(socket_dir).st_mode) == 0o700
+
+
+@pytest.mark.asyncio
+async def test_cli_daemon_unreachable():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+    response = await _async_send({'action': 'ping'}, socket_path)
+    assert response is None
+    exit_code = cli_daemon.forward_command(
+        ['hex', 'abc'], socket_path=socket_path
+    )
+    assert exit_code is None
@@ -55,6 +55,22 @@ valid_values = {
                 'disable_batch_requests': True,
             },
         },
+        {
+            'test_provider': {
+                'name': 'test_provider',
+                'url': 'https://some_url.com',
+                'network': 1,
+                'protocol': 'http',
+                'session_kwargs': {},
+                'chunk_size': None,
+                'convert_reverts_to_none': False,
+                'disable_batch_requests': True,
+                'rate_limit': {
+                    'credits_per_second': 300,
+                    'method_credits': {'eth_getLogs': 75, 'eth_call': 26},
+                },
+            },
+        },
     ],
     'default_network': [1],
     'default_providers': [{}],
@@ -108,6 +124,19 @@ invalid_values = {
                 'disable_batch_requests': True,
             },
         },
+        {
+            'test_provider': {
+                'name': 'test_provider',
+                'url': 'https://some_url.com',
+                'network': 1,
+                'protocol': 'http',
+                'session_kwargs': {},
+                'chunk_size': None,
+                'convert_reverts_to_none': False,
+                'disable_batch_requests': True,
+                'rate_limit': {'method_credits': {'eth_getLogs': 75}},
+            },
+        },
     ],
     'default_network': [888, 'mainnet'],
     'default_providers': [{888: None}, {'mainnet': None}],
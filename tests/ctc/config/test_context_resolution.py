@@ -0,0 +1,84 @@
+import pytest
+
+from ctc import config
+
+
+provider = {
+    'url': 'http://localhost:1',
+    'network': 1,
+    'validate_chain_id': False,
+}
+
+
+@pytest.mark.asyncio
+async def test_resolve_context():
+    context = {'provider': dict(provider), 'cache': False}
+    resolved = config.resolve_context(context)
+    assert config.resolve_context(context) is resolved
+    assert config.resolve_context(resolved) is resolved
+    assert config.resolve_context(dict(context)) == resolved
+    assert hash(config.resolve_context(dict(context))) == hash(resolved)
+
+    assert config.get_context_chain_id(resolved) == 1
+    assert config.get_context_provider(resolved) == config.get_context_provider(
+        context
+    )
+    assert config.get_context_cache_read_write(
+        schema_name='events', context=resolved
+    ) == (False, False)
+
+    with pytest.raises(AttributeError):
+        resolved.chain_id = 5  # type: ignore
+
+    # mutated contexts are resolved again
+    context['cache'] = True
+    assert config.resolve_context(context) != resolved
+
+
+@pytest.mark.asyncio
+async def test_resolved_context_invalidation():
+    resolved = config.resolve_context({'provider': dict(provider)})
+    config.reset_config_cache()
+    assert resolved.config_generation != config.resolve_context(
+        resolved
+    ).config_generation
+    assert config.get_context_chain_id(resolved) == 1
+
+
+@pytest.mark.asyncio
+async def test_updated_context_keeps_provider():
+    # updating context must not re-create and re-validate its provider
+    context = {'provider': dict(provider), 'cache': False}
+    updated = config.update_context(context=context, cache=False)
+    assert config.get_context_provider(updated) == config.get_context_provider(
+        context
+    )
+    assert config.get_context_chain_id(updated) == 1
+
+
+def test_unvalidated_chain_ids_are_not_trusted(monkeypatch):
+    from ctc.rpc import rpc_provider
+
+    chain_id_requests = []
+
+    def sync_get_chain_id(provider_url):
+        chain_id_requests.append(provider_url)
+        return 5
+
+    monkeypatch.setattr(rpc_provider, '_sync_get_chain_id', sync_get_chain_id)
+    monkeypatch.setattr(rpc_provider, '_validated_chain_ids', {})
+    url = 'http://localhost:3'
+
+    # providers that skip validation do not vouch for later providers
+    rpc_provider.create_provider(
+        url=url, network=1, validate_chain_id=False, other_providers={}
+    )
+    assert chain_id_requests == []
+    with pytest.raises(Exception, match='does not match'):
+        rpc_provider.create_provider(url=url, network=1, other_providers={})
+    assert chain_id_requests == [url]
+
+    # validated chain ids are reused
+    rpc_provider.create_provider(url=url, network=5, other_providers={})
+    rpc_provider.create_provider(url=url, network=5, other_providers={})
+    assert chain_id_requests == [url]
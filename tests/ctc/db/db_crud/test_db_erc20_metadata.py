@@ -106,3 +106,47 @@ async def test_erc20_metadata_crud():
         )
         assert all(item is None for item in actual_metadatas)
 
+
+async def test_erc20_metadata_partial_upsert():
+    db_config = conftest.get_test_db_config()
+    db_schema = db.get_prepared_schema(
+        schema_name='erc20_metadata',
+        context=dict(network='ethereum'),
+    )
+    toolsql.create_db(
+        db_config=db_config,
+        db_schema=db_schema,
+        if_not_exists=True,
+        confirm=True,
+    )
+
+    # rows with missing fields should not overwrite stored values
+    partial_data = [
+        {'address': datum['address'], 'symbol': None, 'decimals': 6}
+        for datum in example_data
+    ]
+    async with toolsql.async_connect(db_config) as conn:
+        await db.async_upsert_erc20s_metadata(
+            conn=conn,
+            erc20s_metadata=example_data,
+            context=dict(network=1),
+        )
+        await db.async_upsert_erc20s_metadata(
+            conn=conn,
+            erc20s_metadata=partial_data,
+            context=dict(network=1),
+        )
+
+    async with toolsql.async_connect(db_config) as conn:
+        actual_metadatas = await db.async_select_erc20s_metadata(
+            conn=conn,
+            context=dict(network=1),
+        )
+    assert len(actual_metadatas) == len(example_data)
+    for actual in actual_metadatas:
+        target = [
+            datum
+            for datum in example_data
+            if datum['address'] == actual['address']
+        ][0]
+        assert actual == dict(target, decimals=6)
@@ -0,0 +1,79 @@
+import toolsql
+
+from ctc import db
+from ctc.defi.metric_utils import metric_bars
+
+import conftest
+
+
+async def test_metric_bars_crud():
+    db_config = conftest.get_test_db_config()
+    db_schema = db.get_prepared_schema(
+        schema_name='metric_bars',
+        context=dict(network='ethereum'),
+    )
+    toolsql.create_db(
+        db_config=db_config,
+        db_schema=db_schema,
+        if_not_exists=True,
+        confirm=True,
+    )
+
+    aggregator = metric_bars.create_metric_aggregator([10])
+    metric_bars.append_metric_values(
+        aggregator, 'eth_usd', timestamps=[0, 5, 27], values=[1.0, 3.0, 2.0]
+    )
+    bars = metric_bars.finalize_metric_bars(
+        aggregator['feeds']['eth_usd']['bars'][10]
+    )
+    rows = [dict(row, feed='eth_usd', bin_size=10) for row in bars.to_dicts()]
+
+    async with toolsql.async_connect(db_config) as conn:
+        await db.async_upsert_metric_bars(
+            metric_bars=rows,
+            conn=conn,
+            context=dict(network=1),
+        )
+        await db.async_upsert_metric_feed_cursors(
+            metric_feed_cursors=[
+                {'feed': 'eth_usd', 'last_timestamp': 27, 'last_value': 2.0}
+            ],
+            conn=conn,
+            context=dict(network=1),
+        )
+
+    async with toolsql.async_connect(db_config) as conn:
+        stored = await db.async_select_metric_bars(
+            'eth_usd',
+            bin_size=10,
+            start_bin=10,
+            conn=conn,
+            context=dict(network=1),
+        )
+        assert [row['bin'] for row in stored] == [10, 20]
+        assert stored[0]['open'] == 3.0
+        assert stored[0]['twap'] == 3.0
+
+        last_bar = await db.async_select_last_metric_bar(
+            'eth_usd',
+            bin_size=10,
+            conn=conn,
+            context=dict(network=1),
+        )
+        assert last_bar['bin'] == 20
+        assert last_bar['close'] == 2.0
+
+        cursor = await db.async_select_metric_feed_cursor(
+            'eth_usd',
+            conn=conn,
+            context=dict(network=1),
+        )
+        assert cursor['last_timestamp'] == 27
+
+        await db.async_delete_metric_bars(
+            'eth_usd', conn=conn, context=dict(network=1)
+        )
+        stored = await db.async_select_metric_bars(
+            'eth_usd', bin_size=10, conn=conn, context=dict(network=1)
+        )
+        assert len(stored) == 0
@@ -8,6 +8,7 @@ from ctc import db
 from ctc.protocols.chainlink_utils import chainlink_db
 from ctc.protocols import fourbyte_utils
 from ctc.protocols.coingecko_utils import coingecko_db
+from ctc.protocols.uniswap_v2_utils import uniswap_v2_db
 
 import conftest
 
@@ -100,6 +101,20 @@ schema_datas = [
             'addresses': ['0x31e0a88fecb6ec0a411dbe0e9e76391498296ee9'],
         },
     },
+    {
+        'schema_name': 'chainlink',
+        'plural_selector': chainlink_db.async_select_feed_updates,
+        'plural_queryer': chainlink_db.async_query_feed_updates,
+        'plural_query': {'feed': '0x31e0a88fecb6ec0a411dbe0e9e76391498296ee9'},
+    },
+    {
+        'schema_name': 'chainlink',
+        'plural_selector': chainlink_db.async_select_feed_syncs,
+        'plural_queryer': chainlink_db.async_query_feed_syncs,
+        'plural_query': {
+            'feeds': ['0x31e0a88fecb6ec0a411dbe0e9e76391498296ee9'],
+        },
+    },
     {
         'schema_name': '4byte',
         # 'selector': fourbyte_utils.async_select_function_entries,
@@ -131,6 +146,12 @@ schema_datas = [
         'plural_queryer': db.async_query_median_blocks_gas_fees,
         'plural_query': {'block_numbers': [14000000, 14000001, 14000002]},
     },
+    {
+        'schema_name': 'block_gas',
+        'plural_selector': db.async_select_blocks_gas_stats,
+        'plural_queryer': db.async_query_blocks_gas_stats,
+        'plural_query': {'block_numbers': [14000000, 14000001, 14000002]},
+    },
     {
         'schema_name': 'events',
         'plural_selector': db.async_select_event_queries,
@@ -142,6 +163,31 @@ schema_datas = [
             'end_block': 14000000,
         },
     },
+    {
+        'schema_name': 'metric_bars',
+        'selector': db.async_select_metric_feed_cursor,
+        'queryer': db.async_query_metric_feed_cursor,
+        'query': {'feed': 'eth_usd'},
+        'plural_selector': db.async_select_metric_bars,
+        'plural_queryer': db.async_query_metric_bars,
+        'plural_query': {'feed': 'eth_usd', 'bin_size': 3600},
+    },
+    {
+        'schema_name': 'uniswap_v2',
+        'plural_selector': uniswap_v2_db.async_select_pools_reserves,
+        'plural_queryer': uniswap_v2_db.async_query_pools_reserves,
+        'plural_query': {
+            'pools': ['0xb4e16d0168e52d35cacd2c6185b44281ec28c9dc'],
+        },
+    },
+    {
+        'schema_name': 'uniswap_v2',
+        'plural_selector': uniswap_v2_db.async_select_reserve_syncs,
+        'plural_queryer': uniswap_v2_db.async_query_reserve_syncs,
+        'plural_query': {
+            'pools': ['0xb4e16d0168e52d35cacd2c6185b44281ec28c9dc'],
+        },
+    },
     {
         'schema_name': 'transactions',
         'selector': db.async_select_transaction,
@@ -0,0 +1,57 @@
+import copy
+
+import eth_abi_lite
+import pytest
+
+from ctc import evm
+from ctc.evm.erc20_utils import erc20_spec
+
+
+@pytest.mark.asyncio
+async def test_compile_event_abi():
+    event_abi = copy.deepcopy(erc20_spec.erc20_event_abis['Transfer'])
+    compiled = evm.compile_event_abi(event_abi)
+    assert compiled['event_hash'] == (
+        '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+    )
+    assert evm.compile_event_abi(event_abi) is compiled
+    assert compiled['schema']['indexed_types'] == ['address', 'address']
+
+    # mutated abis are recompiled
+    event_abi['name'] = 'Approval'
+    recompiled = evm.compile_event_abi(event_abi)
+    assert recompiled is not compiled
+    assert recompiled['event_hash'] == evm.get_event_hash(
+        'Approval(address,address,uint256)'
+    )
+
+
+@pytest.mark.asyncio
+async def test_compile_function_abi():
+    function_abi = erc20_spec.erc20_function_abis['transfer']
+    compiled = evm.compile_function_abi(function_abi)
+    assert compiled['selector'] == 'a9059cbb'
+    assert evm.get_function_selector(function_abi) == 'a9059cbb'
+    assert evm.get_function_selector('transfer(address,uint256)') == 'a9059cbb'
+
+    parameters = ['0x' + '11' * 20, 10**18]
+    encoded = compiled['input_encoder'](parameters)
+    types = ['address', 'uint256']
+    assert encoded == eth_abi_lite.encode_abi(types, parameters)
+    assert list(compiled['input_decoder'](encoded)) == parameters
+
+
+@pytest.mark.asyncio
+async def test_abi_decoder_static_types():
+    types = ['address', 'uint8', 'int16', 'bool', 'bytes4']
+    values = ('0x' + '22' * 20, 255, -300, True, b'\x01\x02\x03\x04')
+    data = eth_abi_lite.encode_abi(types, values)
+    assert evm.abi_decode(data, types) == values
+    assert evm.abi_decode(data, '(' + ','.join(types) + ')') == values
+    assert evm.abi_decode(data[32:64], 'uint8') == 255
+
+    # malformed padding raises the same errors as eth_abi_lite
+    with pytest.raises(eth_abi_lite.exceptions.DecodingError):
+        evm.abi_decode(b'\x01' * 32, 'bool')
+    with pytest.raises(eth_abi_lite.exceptions.DecodingError):
+        evm.abi_decode(b'\x01' * 64, ['uint8', 'uint256'])
@@ -0,0 +1,216 @@
+import json
+
+import pytest
+
+from ctc import evm
+from ctc.evm.abi_utils import abi_registry
+from ctc.evm.erc20_utils import erc20_spec
+
+
+@pytest.mark.asyncio
+async def test_abi_registry(tmp_path):
+    path = str(tmp_path)
+    transfer_function = erc20_spec.erc20_function_abis['transfer']
+    transfer_event = erc20_spec.erc20_event_abis['Transfer']
+    approve_selector = evm.get_function_selector(
+        erc20_spec.erc20_function_abis['approve']
+    )
+    selector = evm.get_function_selector(transfer_function)
+    event_hash = evm.get_event_hash(transfer_event)
+
+    functions = {
+        selector: {json.dumps(transfer_function): None},
+        approve_selector: {json.dumps('approve(address,uint256)'): None},
+    }
+    events = {
+        event_hash: {
+            json.dumps(transfer_event): None,
+            json.dumps('Transfer(address,address,uint256)'): None,
+        },
+    }
+    abi_registry._write_abi_registry_index(
+        functions, path=path, datatype='functions'
+    )
+    abi_registry._write_abi_registry_index(events, path=path, datatype='events')
+
+    assert evm.get_function_abi_candidates(selector, path=path) == [
+        transfer_function
+    ]
+    approve_candidates = evm.get_function_abi_candidates(
+        approve_selector, path=path
+    )
+    assert len(approve_candidates) == 1
+    assert approve_candidates[0]['name'] == 'approve'
+    assert evm.get_function_selector(approve_candidates[0]) == approve_selector
+    assert evm.get_function_abi_candidates('0x00000000', path=path) == []
+
+    assert evm.get_event_abi_candidates(event_hash, path=path) == [
+        transfer_event
+    ]
+    candidates = evm.get_event_abi_candidates(
+        event_hash, n_indexed=2, path=path
+    )
+    assert len(candidates) == 2
+    assert candidates[0] == transfer_event
+    assert evm.get_event_hash(candidates[1]) == event_hash
+    assert [arg['indexed'] for arg in candidates[1]['inputs']] == [
+        True,
+        True,
+        False,
+    ]
+    candidates = evm.get_event_abi_candidates(
+        event_hash, n_indexed=3, path=path
+    )
+    assert len(candidates) == 1
+    assert all(arg['indexed'] for arg in candidates[0]['inputs'])
+
+
+@pytest.mark.asyncio
+async def test_abi_registry_checked_before_fetch(tmp_path, monkeypatch):
+    from ctc.evm.abi_utils import contract_abi_utils
+
+    path = str(tmp_path / 'abi_registry')
+    monkeypatch.setattr(abi_registry, 'get_abi_registry_path', lambda: path)
+
+    # missing registries are not cached
+    assert abi_registry.load_abi_registry() is None
+    assert path not in abi_registry._abi_registries
+
+    transfer_function = erc20_spec.erc20_function_abis['transfer']
+    transfer_event = erc20_spec.erc20_event_abis['Transfer']
+    selector = evm.get_function_selector(transfer_function)
+    event_hash = evm.get_event_hash(transfer_event)
+    abi_registry._write_abi_registry_index(
+        {selector: {json.dumps(transfer_function): None}},
+        path=path,
+        datatype='functions',
+    )
+    abi_registry._write_abi_registry_index(
+        {event_hash: {json.dumps(transfer_event): None}},
+        path=path,
+        datatype='events',
+    )
+
+    async def async_get_contract_abi(**kwargs):
+        raise Exception('contract abi should not be fetched')
+
+    monkeypatch.setattr(
+        contract_abi_utils, 'async_get_contract_abi', async_get_contract_abi
+    )
+    contract_address = '0x6b175474e89094c44da98b954eedeac495271d0f'
+    try:
+        function_abi = await evm.async_get_function_abi(
+            contract_address=contract_address,
+            function_selector=selector,
+        )
+        assert function_abi == transfer_function
+        event_abi = await evm.async_get_event_abi(
+            contract_address=contract_address,
+            event_hash=event_hash,
+        )
+        assert event_abi == transfer_event
+    finally:
+        abi_registry._abi_registries.pop(path, None)
+
+
+def test_registry_abis_must_be_unambiguous(tmp_path):
+    path = str(tmp_path)
+    transfer_event = erc20_spec.erc20_event_abis['Transfer']
+    event_hash = evm.get_event_hash(transfer_event)
+    unindexed_event = dict(
+        transfer_event,
+        inputs=[dict(arg, indexed=False) for arg in transfer_event['inputs']],
+    )
+    abi_registry._write_abi_registry_index({}, path=path, datatype='functions')
+    abi_registry._write_abi_registry_index(
+        {
+            event_hash: {
+                json.dumps(transfer_event): None,
+                json.dumps(unindexed_event): None,
+            }
+        },
+        path=path,
+        datatype='events',
+    )
+    try:
+        assert (
+            abi_registry.get_registry_event_abi(event_hash, path=path) is None
+        )
+        assert (
+            abi_registry.get_registry_function_abi('0xa9059cbb', path=path)
+            is None
+        )
+    finally:
+        abi_registry._abi_registries.pop(path, None)
+
+
+@pytest.mark.asyncio
+async def test_registry_fallback_after_failed_fetch(tmp_path, monkeypatch):
+    from ctc.evm.abi_utils import contract_abi_utils
+
+    path = str(tmp_path / 'abi_registry')
+    monkeypatch.setattr(abi_registry, 'get_abi_registry_path', lambda: path)
+    transfer_event = erc20_spec.erc20_event_abis['Transfer']
+    event_hash = evm.get_event_hash(transfer_event)
+    unindexed_event = dict(
+        transfer_event,
+        inputs=[dict(arg, indexed=False) for arg in transfer_event['inputs']],
+    )
+    approve_selector = evm.get_function_selector(
+        erc20_spec.erc20_function_abis['approve']
+    )
+    abi_registry._write_abi_registry_index(
+        {approve_selector: {json.dumps('approve(address,uint256)'): None}},
+        path=path,
+        datatype='functions',
+    )
+    abi_registry._write_abi_registry_index(
+        {
+            event_hash: {
+                json.dumps(transfer_event): None,
+                json.dumps(unindexed_event): None,
+            }
+        },
+        path=path,
+        datatype='events',
+    )
+
+    async def async_get_contract_abi(**kwargs):
+        raise Exception('contract abi unavailable')
+
+    monkeypatch.setattr(
+        contract_abi_utils, 'async_get_contract_abi', async_get_contract_abi
+    )
+    contract_addresses = ['0x6b175474e89094c44da98b954eedeac495271d0f']
+    try:
+        # candidates are selected by their number of indexed inputs
+        event_abi = await evm.async_get_event_abi(
+            contract_addresses=contract_addresses,
+            event_hash=event_hash,
+            n_indexed=2,
+        )
+        assert event_abi == transfer_event
+        event_abi = await evm.async_get_event_abi(
+            contract_addresses=contract_addresses,
+            event_hash=event_hash,
+            n_indexed=0,
+        )
+        assert event_abi == unindexed_event
+
+        # ambiguous or unmatched candidates are not used
+        for n_indexed in [None, 3]:
+            with pytest.raises(Exception, match='could not find event abi'):
+                await evm.async_get_event_abi(
+                    contract_addresses=contract_addresses,
+                    event_hash=event_hash,
+                    n_indexed=n_indexed,
+                )
+
+        # 4byte signatures lack outputs needed to decode results
+        with pytest.raises(Exception, match='contract abi unavailable'):
+            await evm.async_get_function_abi(
+                contract_address=contract_addresses[0],
+                function_selector=approve_selector,
+            )
+    finally:
+        abi_registry._abi_registries.pop(path, None)
@@ -1,6 +1,7 @@
 import pytest
 
 from ctc import evm
+from ctc import spec
 
 
 @pytest.mark.asyncio
@@ -15,6 +16,111 @@ async def test_fetch_latest_block_number():
     assert isinstance(latest_block_number, int)
 
 
+@pytest.mark.asyncio
+async def test_wait_for_next_block():
+    import asyncio
+    from ctc.evm.block_utils import block_heads
+
+    context: spec.Context = {
+        'provider': {
+            'url': 'http://localhost:1',
+            'network': 1,
+            'validate_chain_id': False,
+        }
+    }
+    provider_url = block_heads._get_provider_url(context)
+    task = asyncio.create_task(asyncio.sleep(60))
+    tracker: block_heads.HeadTracker = {
+        'provider_url': provider_url,
+        'head': block_heads.BlockHead(100, None, 0),
+        'poll_interval': 1.0,
+        'new_head': asyncio.Event(),
+        'task': task,
+        'loop': asyncio.get_running_loop(),
+        'error': None,
+    }
+    block_heads._head_trackers[provider_url] = tracker
+    try:
+        waiter = asyncio.create_task(
+            evm.async_wait_for_next_block(context=context)
+        )
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        block_heads._publish_head(tracker, block_heads.BlockHead(101, None, 0))
+        head = await asyncio.wait_for(waiter, timeout=1)
+        assert head.block_number == 101
+        assert evm.get_tracked_head(context=context) == head
+        assert await evm.async_get_latest_block_number(context=context) == 101
+    finally:
+        await evm.async_stop_head_tracker(context=context)
+    assert task.cancelled()
+    assert evm.get_tracked_head(context=context) is None
+
+
+@pytest.mark.asyncio
+async def test_head_tracker_retries_failed_polls(monkeypatch):
+    from ctc import rpc
+    from ctc.evm.block_utils import block_heads
+
+    context: spec.Context = {
+        'provider': {
+            'url': 'http://localhost:2',
+            'network': 1,
+            'validate_chain_id': False,
+        }
+    }
+    polls = []
+
+    async def async_eth_block_number(*, context):
+        polls.append(None)
+        if len(polls) <= 2:
+            raise Exception('connection reset')
+        return 200
+
+    async def async_eth_get_block_by_number(**kwargs):
+        return None
+
+    monkeypatch.setattr(rpc, 'async_eth_block_number', async_eth_block_number)
+    monkeypatch.setattr(
+        rpc, 'async_eth_get_block_by_number', async_eth_get_block_by_number
+    )
+    monkeypatch.setattr(block_heads, '_max_consecutive_failures', 3)
+    try:
+        await evm.async_start_head_tracker(context=context, poll_interval=0.01)
+        head = await evm.async_wait_for_next_block(
+            after=100, context=context, timeout=5
+        )
+        assert head.block_number == 200
+        assert len(polls) == 3
+    finally:
+        await evm.async_stop_head_tracker(context=context)
+
+    # waiters only receive an error after repeated failures
+    polls.clear()
+
+    async def async_eth_block_number_down(*, context):
+        polls.append(None)
+        raise Exception('connection reset')
+
+    monkeypatch.setattr(
+        rpc, 'async_eth_block_number', async_eth_block_number_down
+    )
+    try:
+        await evm.async_start_head_tracker(context=context, poll_interval=0.01)
+        with pytest.raises(Exception, match='connection reset'):
+            await evm.async_wait_for_next_block(
+                after=100, context=context, timeout=5
+            )
+        assert len(polls) == 3
+
+        # the error is raised to waiters rather than left on the task
+        task = block_heads._head_trackers['http://localhost:2']['task']
+        assert task is not None and task.done()
+        assert task.exception() is None
+    finally:
+        await evm.async_stop_head_tracker(context=context)
+
+
 @pytest.mark.asyncio
 async def test_get_contract_creation_block():
     contract = '0x6B175474E89094C44Da98b954EedeAC495271d0F'
@@ -95,3 +201,32 @@ async def test_block_of_timestamp_modes(block_timestamp, db_settings):
         timestamp_after, mode='>=', context=context
     )
     assert obtained_block == block + 1
+
+
+def test_compute_blocks_gas_stats():
+    def make_block(number, gas_prices):
+        return {
+            'number': number,
+            'timestamp': 1600000000 + number,
+            'base_fee_per_gas': 10**9,
+            'gas_used': 21000 * len(gas_prices),
+            'gas_limit': 30000000,
+            'transactions': [
+                {'gas_price': gas_price} for gas_price in gas_prices
+            ],
+        }
+
+    rpc_blocks = [
+        make_block(2, []),
+        make_block(1, [5, 1, 3, 2, 4]),
+    ]
+    df = evm.compute_blocks_gas_stats(rpc_blocks)
+
+    assert df['block_number'].to_list() == [1, 2]
+    assert df['n_transactions'].to_list() == [5, 0]
+    assert df['min_gas_price'].to_list() == [1, None]
+    assert df['median_gas_price'].to_list() == [3, None]
+    assert df['p25_gas_price'].to_list() == [2, None]
+    assert df['max_gas_price'].to_list() == [5, None]
+    assert df['mean_gas_price'].to_list() == [3, None]
+    assert df['base_fee'].to_list() == [10**9, 10**9]
@@ -0,0 +1,51 @@
+import polars as pl
+import pytest
+
+from ctc import evm
+
+
+transfers = pl.DataFrame(
+    {
+        'block_number': [10, 10, 12, 15, 15, 20],
+        'transaction_index': [0, 1, 0, 0, 1, 0],
+        'log_index': [0, 1, 0, 0, 1, 0],
+        'arg__from': ['0x0', 'a', 'b', 'a', 'c', 'b'],
+        'arg__to': ['a', 'b', 'c', 'c', 'a', 'a'],
+        'arg__amount': [100, 30, 10, 20, 5, 7],
+    }
+)
+
+
+def test_erc20_balance_ledger():
+    ledger = evm.create_erc20_balance_ledger(transfers)
+    assert ledger['end_block'] == 20
+
+    blocks = [9, 10, 11, 12, 15, 19, 20]
+    a = evm.get_erc20_balance_by_block_from_ledger(ledger, 'a', blocks=blocks)
+    assert a.tolist() == [0, 70, 70, 70, 55, 55, 62]
+    b = evm.get_erc20_balance_by_block_from_ledger(ledger, 'b', blocks=blocks)
+    assert b.tolist() == [0, 30, 30, 20, 20, 20, 13]
+    assert evm.get_erc20_balance_from_ledger(ledger, 'c', block=15) == 25
+    assert evm.get_erc20_balance_from_ledger(ledger, 'd', block=15) == 0
+
+    with pytest.raises(Exception):
+        evm.get_erc20_balance_from_ledger(ledger, 'a', block=21)
+
+
+def test_erc20_balance_ledger_incremental():
+    full = evm.create_erc20_balance_ledger(transfers)
+    partial = evm.create_erc20_balance_ledger(transfers, end_block=12)
+    assert partial['end_block'] == 12
+    updated = evm.update_erc20_balance_ledger(partial, transfers)
+    for key in ['holders', 'offsets', 'block_numbers', 'balances']:
+        assert updated[key].tolist() == full[key].tolist()
+    assert updated['end_block'] == full['end_block']
+
+
+@pytest.mark.asyncio
+async def test_erc20_balances_from_transfers():
+    balances = await evm.async_get_erc20_balances_from_transfers(
+        transfers, block=15
+    )
+    assert balances['address'].to_list() == ['a', 'c', 'b', '0x0']
+    assert balances['balance'].to_list() == [55, 25, 20, -100]
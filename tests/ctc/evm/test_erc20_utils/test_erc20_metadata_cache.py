@@ -0,0 +1,144 @@
+import pytest
+
+import conftest
+from ctc import evm
+from ctc import rpc
+from ctc.evm.erc20_utils import erc20_metadata_cache
+
+
+reverting_token = '0x' + 'ab' * 20
+uncached_tokens = ['0x' + '01' * 20, '0x' + '02' * 20]
+
+
+def _get_response(item):
+    if item['params'][0]['to'] == reverting_token:
+        return {'error': {'code': 3, 'message': 'execution reverted'}}
+    else:
+        return {'result': '0x' + conftest.encode_word(6)}
+
+
+@pytest.mark.asyncio
+async def test_load_erc20_metadata_cache():
+    erc20_metadata_cache.reset_erc20_metadata_cache()
+    context = {'network': 1, 'cache': False}
+    cache = await evm.async_load_erc20_metadata_cache(context=context)
+    fei = cache['0x956f47f50a910163d8bf957cf5846d573e7f87ca']
+    assert fei['symbol'] == 'FEI'
+    assert fei['decimals'] == 18
+    erc20_metadata_cache.reset_erc20_metadata_cache()
+
+
+@pytest.mark.asyncio
+async def test_erc20_metadata_cache_backfills_in_one_batch():
+    runner, url = await conftest.async_start_mock_node(_get_response)
+    context = conftest.create_mock_node_context(url, 'erc20_metadata_cache')
+    erc20_metadata_cache.reset_erc20_metadata_cache()
+    rpc.reset_rpc_telemetry()
+    try:
+        decimals = await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'decimals',
+            uncached_tokens + uncached_tokens[:1],
+            context=context,
+        )
+        assert decimals == [6, 6, 6]
+        telemetry = rpc.get_rpc_telemetry()
+        assert sum(entry['n_requests'] for entry in telemetry) == 1
+        assert sum(entry['n_calls'] for entry in telemetry) == 2
+
+        # cached entries need no further requests
+        rpc.reset_rpc_telemetry()
+        decimals = await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'decimals',
+            uncached_tokens[::-1],
+            context=context,
+        )
+        assert decimals == [6, 6]
+        assert rpc.get_rpc_telemetry() == []
+
+        # reverts are not cached
+        decimals = await erc20_metadata_cache._async_get_erc20s_metadata_field(
+            'decimals',
+            [reverting_token, uncached_tokens[0]],
+            context=context,
+            convert_reverts_to_none=True,
+        )
+        assert decimals == [None, 6]
+        cache = await erc20_metadata_cache._async_get_erc20_metadata_cache(
+            context
+        )
+        assert reverting_token not in cache
+        with pytest.raises(Exception):
+            await erc20_metadata_cache._async_get_erc20s_metadata_field(
+                'decimals', [reverting_token], context=context
+            )
+    finally:
+        await runner.cleanup()
+        erc20_metadata_cache.reset_erc20_metadata_cache()
+        rpc.reset_rpc_telemetry()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_load_cache_once(monkeypatch):
+    import asyncio
+
+    from ctc import db
+
+    n_selects = []
+
+    async def async_query_erc20s_metadata(context):
+        n_selects.append(context)
+        await asyncio.sleep(0.01)
+        return []
+
+    monkeypatch.setattr(
+        db, 'async_query_erc20s_metadata', async_query_erc20s_metadata
+    )
+    erc20_metadata_cache.reset_erc20_metadata_cache()
+    context = {'network': 1, 'cache': {'read': True, 'write': False}}
+    fei = '0x956f47f50a910163d8bf957cf5846d573e7f87ca'
+    try:
+        decimals = await asyncio.gather(
+            *[
+                evm.async_get_erc20_decimals(fei, context=context)
+                for i in range(20)
+            ]
+        )
+        assert decimals == [18] * 20
+        assert len(n_selects) == 1
+
+        # contexts that do not read db use a separate cache
+        uncached_context = {'network': 1, 'cache': False}
+        await erc20_metadata_cache._async_get_erc20_metadata_cache(
+            uncached_context
+        )
+        assert len(n_selects) == 1
+        assert len(erc20_metadata_cache._erc20_metadata_cache) == 2
+    finally:
+        erc20_metadata_cache.reset_erc20_metadata_cache()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_backfill():
+    import asyncio
+
+    runner, url = await conftest.async_start_mock_node(_get_response)
+    context = conftest.create_mock_node_context(url, 'erc20_metadata_cache')
+    erc20_metadata_cache.reset_erc20_metadata_cache()
+    rpc.reset_rpc_telemetry()
+    try:
+        results = await asyncio.gather(
+            *[
+                erc20_metadata_cache._async_get_erc20s_metadata_field(
+                    'decimals', uncached_tokens, context=context
+                )
+                for i in range(10)
+            ]
+        )
+        assert results == [[6, 6]] * 10
+        telemetry = rpc.get_rpc_telemetry()
+        assert sum(entry['n_calls'] for entry in telemetry) == 2
+        assert erc20_metadata_cache._erc20_metadata_backfills == {}
+    finally:
+        await runner.cleanup()
+        erc20_metadata_cache.reset_erc20_metadata_cache()
+        rpc.reset_rpc_telemetry()
@@ -259,3 +259,61 @@ async def test_get_events_and_decode_empty(test):
     assert (
         len(set(actual_result['event_hash'])) == target_result['n_event_types']
     )
+
+
+@pytest.mark.asyncio
+async def test_decode_only_fetches_missing_event_abis(monkeypatch):
+    import polars as pl
+    from ctc import evm
+    from ctc.evm.abi_utils import contract_abi_utils
+    from ctc.evm.abi_utils.event_abi_utils import event_abi_coding_polars
+    from ctc.evm.abi_utils.event_abi_utils import event_abi_queries
+    from ctc.evm.erc20_utils import erc20_spec
+
+    transfer_abi = erc20_spec.erc20_event_abis['Transfer']
+    approval_abi = erc20_spec.erc20_event_abis['Approval']
+    transfer_hash = evm.get_event_hash(transfer_abi)
+    approval_hash = evm.get_event_hash(approval_abi)
+    other_address = '0x' + 'ab' * 20
+    events = pl.DataFrame(
+        {
+            'event_hash': [transfer_hash, approval_hash],
+            'contract_address': [contract_address, other_address],
+        }
+    )
+
+    prefetched = []
+    fetched = []
+
+    async def async_get_contracts_abis(contract_addresses, **kwargs):
+        prefetched.extend(contract_addresses)
+        return {}
+
+    async def async_get_event_abi(*, event_hash, **kwargs):
+        fetched.append(event_hash)
+        return approval_abi
+
+    monkeypatch.setattr(
+        contract_abi_utils, 'async_get_contracts_abis', async_get_contracts_abis
+    )
+    monkeypatch.setattr(
+        event_abi_queries, 'async_get_event_abi', async_get_event_abi
+    )
+
+    given = {transfer_hash: transfer_abi}
+    abis = await event_abi_coding_polars._async_get_events_abis(
+        events, event_abis=given, context=None
+    )
+    assert abis == {transfer_hash: transfer_abi, approval_hash: approval_abi}
+    assert prefetched == [other_address]
+    assert fetched == [approval_hash]
+    assert given == {transfer_hash: transfer_abi}
+
+    # nothing is fetched when all abis are given
+    prefetched.clear()
+    fetched.clear()
+    await event_abi_coding_polars._async_get_events_abis(
+        events, event_abis=[transfer_abi, approval_abi], context=None
+    )
+    assert prefetched == []
+    assert fetched == []
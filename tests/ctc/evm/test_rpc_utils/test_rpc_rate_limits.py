@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+
+import conftest
+from ctc import rpc
+
+
+def test_get_request_credits():
+    provider = {
+        'url': 'http://localhost:1',
+        'rate_limit': {
+            'credits_per_second': 100,
+            'method_credits': {'eth_getLogs': 75, 'eth_call': 26},
+            'default_credits': 10,
+        },
+    }
+    request = rpc.construct_eth_get_logs(start_block=1, end_block=2)
+    assert rpc.get_request_credits(request, provider) == {'eth_getLogs': 75}
+    batch = [
+        rpc.construct_eth_get_logs(start_block=1, end_block=2),
+        rpc.construct_eth_block_number(),
+        rpc.construct_eth_get_logs(start_block=3, end_block=4),
+    ]
+    assert rpc.get_request_credits(batch, provider) == {
+        'eth_getLogs': 150,
+        'eth_blockNumber': 10,
+    }
+
+    # providers without rate limits cost one credit per call
+    del provider['rate_limit']
+    assert rpc.get_request_credits(batch, provider) == {
+        'eth_getLogs': 2,
+        'eth_blockNumber': 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paces_requests():
+    runner, url = await conftest.async_start_mock_node(
+        lambda item: {'result': []}
+    )
+    context = {
+        'provider': {
+            'url': url,
+            'name': 'rate_limited',
+            'network': 1,
+            'validate_chain_id': False,
+            'rate_limit': {
+                'credits_per_second': 100,
+                'burst_credits': 10,
+                'method_credits': {'eth_getLogs': 10},
+            },
+        }
+    }
+    rpc.reset_rate_limits()
+    rpc.reset_rpc_telemetry()
+    try:
+        with rpc.track_rpc_credits() as job_credits:
+            start = time.time()
+            coroutines = [
+                rpc.async_send(
+                    rpc.construct_eth_get_logs(start_block=i, end_block=i),
+                    context=context,
+                )
+                for i in range(4)
+            ]
+            await asyncio.gather(*coroutines)
+            await rpc.async_send(
+                rpc.construct_eth_block_number(), context=context
+            )
+            elapsed = time.time() - start
+    finally:
+        await rpc.async_close_http_session(context=context)
+        await runner.cleanup()
+
+    # burst covers first request, each later request waits 0.1s
+    assert elapsed >= 0.3
+    assert job_credits == {'eth_getLogs': 40, 'eth_blockNumber': 1}
+
+    telemetry = {entry['method']: entry for entry in rpc.get_rpc_telemetry()}
+    assert telemetry['eth_getLogs']['credits'] == 40
+    assert telemetry['eth_getLogs']['throttle_time'] >= 0.5
+
+    # latency starts once the credit budget admits each request
+    assert telemetry['eth_getLogs']['latency_sum'] < 0.5
+    rpc.reset_rpc_telemetry()
+    rpc.reset_rate_limits()
@@ -51,3 +51,141 @@ async def test_get_code():
     """.strip()
     code = await rpc.async_eth_get_code(address=address)
     assert code == target
+
+
+@pytest.mark.asyncio
+async def test_sample_by_block():
+    address = '0x00192Fb10dF37c9FB26829eb2CC623cd1BF599E8'
+    blocks = [13437523, 13437522, 13437523]
+    result = await rpc.async_sample_by_block(
+        'eth_get_balance',
+        blocks,
+        address=address,
+    )
+    assert len(result) == 3
+    assert result[0] == 3463747527330489047936
+    assert result[0] == result[2]
+
+    series = await rpc.async_sample_by_block(
+        'eth_get_balance',
+        blocks,
+        address=address,
+        output_format='series',
+        name='balance',
+    )
+    assert series.to_list() == result
+
+
+@pytest.mark.asyncio
+async def test_batch_construct_eth_call():
+    from ctc import evm
+    from ctc.evm.erc20_utils import erc20_spec
+    from ctc.rpc.rpc_batch import rpc_batch_utils
+
+    token = '0x6b175474e89094c44da98b954eedeac495271d0f'
+    holders = ['0x' + format(i, '040x') for i in range(1, 6)]
+    function_abi = erc20_spec.erc20_function_abis['allowance']
+    parameter_list = [[holder, holders[0]] for holder in holders]
+
+    call_datas = evm.batch_encode_call_data(
+        parameter_list, function_abi=function_abi
+    )
+    assert call_datas == [
+        evm.encode_call_data(parameters=parameters, function_abi=function_abi)
+        for parameters in parameter_list
+    ]
+
+    requests = rpc_batch_utils.batch_construct(
+        method='eth_call',
+        to_address=token,
+        function_abi=function_abi,
+        function_parameter_list=parameter_list,
+        block_number=15000000,
+    )
+    assert len({request['id'] for request in requests}) == len(holders)
+    for request, parameters in zip(requests, parameter_list):
+        target = rpc.construct_eth_call(
+            to_address=token,
+            function_abi=function_abi,
+            function_parameters=parameters,
+            block_number=15000000,
+        )
+        assert request['method'] == target['method']
+        assert request['params'] == target['params']
+
+
+
+def test_batch_encode_call_data_checks_address_lengths():
+    from ctc import evm
+    from ctc.evm.erc20_utils import erc20_spec
+
+    function_abi = erc20_spec.erc20_function_abis['balanceOf']
+
+    # lengths that only sum to a valid total are still rejected
+    parameter_list = [['0x' + 'a' * 39], ['0x' + 'b' * 41]]
+    for parameters in parameter_list:
+        with pytest.raises(Exception):
+            evm.encode_call_data(
+                parameters=parameters, function_abi=function_abi
+            )
+    with pytest.raises(Exception, match='invalid address length'):
+        evm.batch_encode_call_data(parameter_list, function_abi=function_abi)
+
+@pytest.mark.asyncio
+async def test_sample_by_block_cache_skips_reverts(monkeypatch):
+    from ctc.rpc.rpc_batch import rpc_batch_sampling
+
+    sent = []
+
+    async def async_send(requests, **kwargs):
+        sent.append(len(requests))
+        output = []
+        for request in requests:
+            if request['params'][1] == hex(100):
+                output.append(kwargs['convert_reverts_to'])
+            else:
+                output.append(hex(7))
+        return output
+
+    async def async_get_finalized_block(*, context):
+        return 10**9
+
+    monkeypatch.setattr(
+        rpc_batch_sampling.rpc_request, 'async_send', async_send
+    )
+    monkeypatch.setattr(
+        rpc_batch_sampling,
+        '_async_get_finalized_block',
+        async_get_finalized_block,
+    )
+    rpc_batch_sampling.clear_sample_cache()
+    context = {
+        'provider': {
+            'url': 'http://localhost:3',
+            'network': 1,
+            'validate_chain_id': False,
+        }
+    }
+
+    def sample(**kwargs):
+        return rpc.async_sample_by_block(
+            'eth_get_balance',
+            [100, 200, 300],
+            address='0x' + 'ab' * 20,
+            context=context,
+            **kwargs,
+        )
+
+    try:
+        assert await sample(convert_reverts_to='0x0') == [0, 7, 7]
+        assert sent == [3]
+
+        # converted reverts are not cached
+        assert await sample(convert_reverts_to='0x0') == [0, 7, 7]
+        assert sent == [3, 1]
+
+        # other revert conversions do not share cache entries
+        assert await sample(convert_reverts_to='0x1') == [1, 7, 7]
+        assert sent == [3, 1, 3]
+    finally:
+        rpc_batch_sampling.clear_sample_cache()
@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+import conftest
+from ctc import rpc
+from ctc.rpc.rpc_request import request_telemetry
+
+
+def _get_response(item):
+    if item['method'] == 'eth_call':
+        return {'error': {'code': 3, 'message': 'execution reverted'}}
+    elif item['method'] == 'eth_getLogs':
+        # error keys within results are not rpc errors
+        return {'result': [{'error': 'not an rpc error'}]}
+    else:
+        return {'result': '0x1'}
+
+
+@pytest.mark.asyncio
+async def test_rpc_telemetry_records_requests():
+    runner, url = await conftest.async_start_mock_node(_get_response)
+    context = {
+        'provider': {
+            'url': url,
+            'name': 'mock',
+            'network': 1,
+            'validate_chain_id': False,
+        }
+    }
+    rpc.reset_rpc_telemetry()
+    try:
+        await rpc.async_send(rpc.construct_eth_block_number(), context=context)
+        await rpc.async_send(
+            [rpc.construct_eth_chain_id() for i in range(3)], context=context
+        )
+        await rpc.async_send(
+            rpc.construct_eth_call(to_address='0x' + '0' * 40, call_data='0x'),
+            context=context,
+            convert_reverts_to_none=True,
+        )
+        await rpc.async_send(
+            rpc.construct_eth_get_logs(start_block=1, end_block=2),
+            context=context,
+        )
+    finally:
+        await rpc.async_close_http_session(context=context)
+        await runner.cleanup()
+
+    telemetry = {entry['method']: entry for entry in rpc.get_rpc_telemetry()}
+    assert set(telemetry.keys()) == {
+        'eth_blockNumber',
+        'eth_chainId',
+        'eth_call',
+        'eth_getLogs',
+    }
+    for entry in telemetry.values():
+        assert entry['provider'] == 'mock'
+        assert entry['n_requests'] == 1
+        assert entry['in_flight'] == 0
+        assert entry['n_failures'] == 0
+        assert entry['request_bytes'] > 0
+        assert entry['response_bytes'] > 0
+        assert sum(entry['latency_buckets']) == 1
+        assert entry['latency_sum'] > 0
+    assert telemetry['eth_chainId']['n_calls'] == 3
+    assert telemetry['eth_call']['n_errors'] == 1
+    assert telemetry['eth_blockNumber']['n_errors'] == 0
+    assert telemetry['eth_getLogs']['n_errors'] == 0
+
+    text = rpc.format_rpc_telemetry_prometheus()
+    assert 'ctc_rpc_calls_total{provider="mock",method="eth_chainId"} 3' in text
+    assert (
+        'ctc_rpc_request_duration_seconds_count'
+        '{provider="mock",method="eth_call"} 1'
+    ) in text
+    assert '# TYPE ctc_rpc_request_duration_seconds histogram' in text
+    rpc.reset_rpc_telemetry()
+
+
+@pytest.mark.asyncio
+async def test_rpc_telemetry_persistence(tmp_path):
+    rpc.reset_rpc_telemetry()
+    request = rpc.construct_eth_block_number()
+    provider = {'name': 'mock', 'url': 'http://localhost:1'}
+    key = request_telemetry._get_telemetry_key(request, provider)
+    for raw_response in [None, '{"result": "0x1"}']:
+        start_time = request_telemetry._record_request_start(key)
+        request_telemetry._record_request_end(
+            key,
+            start_time,
+            request=request,
+            raw_response=raw_response,
+        )
+
+    path = str(tmp_path / 'rpc_telemetry.json')
+    rpc.save_rpc_telemetry(path)
+    rpc.save_rpc_telemetry(path)
+    rpc.reset_rpc_telemetry()
+
+    with open(path) as f:
+        assert len(json.load(f)) == 1
+    assert os.listdir(tmp_path) == ['rpc_telemetry.json']
+    (entry,) = rpc.load_rpc_telemetry(path)
+    assert entry['n_requests'] == 4
+    assert entry['n_failures'] == 2
+    assert sum(entry['latency_buckets']) == 4
+    assert rpc.get_rpc_latency_quantile(entry, 0.5) <= 0.005
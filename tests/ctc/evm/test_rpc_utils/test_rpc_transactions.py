@@ -71,3 +71,14 @@ async def test_eth_get_block_transaction_count_by_number():
         block_number=12345678
     )
     assert result == 174
+
+
+@pytest.mark.asyncio
+async def test_eth_get_block_receipts():
+    result = await rpc.async_eth_get_block_receipts(block_number=12345678)
+    assert len(result) == 174
+    assert all(
+        receipt['block_hash']
+        == '0xb2a8b39935a5eb4b7c9b0117bca06c8d2c0629e0937d20e62c44aace6f05bda3'
+        for receipt in result
+    )
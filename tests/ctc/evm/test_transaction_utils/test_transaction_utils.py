@@ -109,3 +109,73 @@ def test_sign_transaction(test):
     )
 
     assert actual_signature == target_signature
+
+
+def test_convert_rpc_transactions_to_db_transactions():
+
+    transactions = [
+        {
+            'hash': '0x' + str(i) * 64,
+            'block_number': 100,
+            'transaction_index': i,
+            'to': None if i == 0 else '0x' + 'a' * 40,
+            'from': '0x' + 'b' * 40,
+            'value': i * 10**18,
+            'input': '0x',
+            'nonce': i,
+            'type': 2,
+            'gas': 21000,
+            'max_priority_fee_per_gas': 10**9,
+            'max_fee_per_gas': 10**11,
+        }
+        for i in range(3)
+    ]
+
+    # receipts are matched by hash rather than by position
+    receipts = [
+        {
+            'transaction_hash': '0x' + str(i) * 64,
+            'gas_used': 21000,
+            'effective_gas_price': 2 * 10**10,
+            'status': 1,
+        }
+        for i in reversed(range(3))
+    ]
+
+    db_transactions = evm.convert_rpc_transactions_to_db_transactions(
+        transactions=transactions,
+        receipts=receipts,
+    )
+    assert [tx['hash'] for tx in db_transactions] == [
+        tx['hash'] for tx in transactions
+    ]
+    assert db_transactions[0]['to_address'] == '0x' + '0' * 40
+    assert db_transactions[2]['value'] == 2 * 10**18
+    assert all(tx['gas_price'] == 2 * 10**10 for tx in db_transactions)
+    assert all(tx['status'] for tx in db_transactions)
+
+    with pytest.raises(Exception):
+        evm.convert_rpc_transactions_to_db_transactions(
+            transactions=transactions,
+            receipts=receipts[:1],
+        )
+
+
+def test_block_receipts_unsupported_errors():
+    from ctc import spec
+    from ctc.evm.transaction_utils import transaction_crud
+
+    unsupported = [
+        spec.RpcException('RPC ERROR: the method does not exist', code=-32601),
+        spec.RpcException('RPC ERROR: eth_getBlockReceipts is not supported'),
+    ]
+    transient = [
+        spec.RpcException('RPC ERROR: header not found', code=-32000),
+        spec.RpcException('RPC ERROR: request timed out', code=-32603),
+    ]
+    for exception in unsupported:
+        assert transaction_crud._is_unsupported_method_error(exception)
+    for exception in transient:
+        assert not transaction_crud._is_unsupported_method_error(exception)
+
+    assert rpc.digest_eth_get_block_receipts(None) is None
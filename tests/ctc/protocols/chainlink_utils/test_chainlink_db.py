@@ -115,3 +115,79 @@ async def test_chainlink_crud():
         )
         assert all(item is None for item in db_feeds)
 
+
+async def test_chainlink_feed_updates_crud():
+
+    db_config = conftest.get_test_db_config()
+    db_schema = db.get_prepared_schema(
+        schema_name='chainlink',
+        context=dict(network='ethereum'),
+    )
+    toolsql.create_db(
+        db_config=db_config,
+        db_schema=db_schema,
+        if_not_exists=True,
+        confirm=True,
+    )
+
+    network = 1
+    feed = example_data[1]['address']
+    aggregator = '0x37bc7498f4ff12c19678ee8fe19d713b87f6a9e6'
+    feed_updates = [
+        {
+            'feed': feed,
+            'aggregator': aggregator,
+            'block_number': block_number,
+            'log_index': 3,
+            'round_id': r,
+            'answer': str(answer),
+            'timestamp': 1600000000 + block_number,
+        }
+        for r, (block_number, answer) in enumerate(
+            [(100, 10**30), (300, -5), (200, 7)]
+        )
+    ]
+
+    # insert data
+    async with toolsql.async_connect(db_config) as conn:
+        await chainlink_db.async_upsert_feed_updates(
+            feed_updates=feed_updates,
+            conn=conn,
+            context=dict(network=network),
+        )
+        await chainlink_db.async_upsert_feed_syncs(
+            feed_syncs=[{'feed': feed, 'last_synced_block': 300}],
+            conn=conn,
+            context=dict(network=network),
+        )
+
+    # get data
+    async with toolsql.async_connect(db_config) as conn:
+        db_updates = await chainlink_db.async_select_feed_updates(
+            feed,
+            start_block=150,
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert [update['block_number'] for update in db_updates] == [200, 300]
+        assert [update['answer'] for update in db_updates] == ['7', '-5']
+
+        db_syncs = await chainlink_db.async_select_feed_syncs(
+            feeds=[feed],
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert db_syncs == [{'feed': feed, 'last_synced_block': 300}]
+
+    # last-synced blocks are replaced on subsequent syncs
+    async with toolsql.async_connect(db_config) as conn:
+        await chainlink_db.async_upsert_feed_syncs(
+            feed_syncs=[{'feed': feed, 'last_synced_block': 400}],
+            conn=conn,
+            context=dict(network=network),
+        )
+        db_syncs = await chainlink_db.async_select_feed_syncs(
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert db_syncs == [{'feed': feed, 'last_synced_block': 400}]
@@ -0,0 +1,176 @@
+import pytest
+
+import conftest
+from ctc import evm
+from ctc.protocols import chainlink_utils
+
+
+answer_hash = evm.get_event_hash(
+    chainlink_utils.aggregator_event_abis['AnswerUpdated']
+)
+feed_a = '0x' + 'aa' * 20
+feed_b = '0x' + 'bb' * 20
+aggregator_a1 = '0x' + 'a1' * 20
+aggregator_a2 = '0x' + 'a2' * 20
+aggregator_b1 = '0x' + 'b1' * 20
+feed_aggregators = {
+    feed_a: {aggregator_a1: 100, aggregator_a2: 1000},
+    feed_b: {aggregator_b1: 500},
+}
+
+
+def _create_log(aggregator, block_number, answer, round_id):
+    return conftest.create_log(
+        aggregator,
+        block_number,
+        topics=[answer_hash, answer, round_id],
+        data_words=[1600000000 + block_number],
+    )
+
+
+example_logs = [
+    _create_log(aggregator_a1, 200, 10**30, 1),
+    # emitted after aggregator was replaced, so not an update of feed
+    _create_log(aggregator_a1, 1200, 7, 2),
+    _create_log(aggregator_a2, 1500, -5, 1),
+    _create_log(aggregator_b1, 600, 3, 1),
+    _create_log(aggregator_b1, 3000, 4, 2),
+]
+
+
+async def _async_get_feeds_updates(start_blocks):
+    log_queries = []
+    runner, url = await conftest.async_start_mock_log_node(
+        example_logs, log_queries
+    )
+    context = conftest.create_mock_node_context(url, 'chainlink_sync')
+    try:
+        updates = await chainlink_utils.async_get_feeds_updates(
+            feed_aggregators,
+            start_blocks=start_blocks,
+            end_block=4999,
+            context=context,
+        )
+    finally:
+        await runner.cleanup()
+    return updates, log_queries
+
+
+@pytest.mark.asyncio
+async def test_feeds_updates_of_full_history():
+    updates, log_queries = await _async_get_feeds_updates(
+        {feed_a: 0, feed_b: 0}
+    )
+
+    # ranges split at 100, 500, and 1000, with 2000 blocks per request
+    assert len(log_queries) == 4
+    assert updates['feed'].to_list() == [feed_a, feed_a, feed_b, feed_b]
+    assert updates['aggregator'].to_list() == [
+        aggregator_a1,
+        aggregator_a2,
+        aggregator_b1,
+        aggregator_b1,
+    ]
+    assert updates['block_number'].to_list() == [200, 1500, 600, 3000]
+    assert updates['answer'].to_list() == [str(10**30), '-5', '3', '4']
+    assert updates['round_id'].to_list() == [1, 1, 1, 2]
+    assert updates['timestamp'].to_list() == [
+        1600000200,
+        1600001500,
+        1600000600,
+        1600003000,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_feeds_updates_after_last_synced_blocks():
+    updates, log_queries = await _async_get_feeds_updates(
+        {feed_a: 1300, feed_b: 1300}
+    )
+
+    # replaced aggregators are not scanned, active ones share requests
+    assert len(log_queries) == 2
+    assert all(
+        query['address'] == sorted([aggregator_a2, aggregator_b1])
+        for query in log_queries
+    )
+    assert updates['block_number'].to_list() == [1500, 3000]
+    assert updates['answer'].to_list() == ['-5', '4']
+
+    updates, log_queries = await _async_get_feeds_updates(
+        {feed_a: 5000, feed_b: 5000}
+    )
+    assert len(log_queries) == 0
+    assert len(updates) == 0
+
+
+@pytest.fixture
+def mock_sync_sources(monkeypatch):
+    from ctc.protocols.chainlink_utils import chainlink_aggregators
+    from ctc.protocols.chainlink_utils import chainlink_db
+
+    intakes = []
+
+    async def async_intake_feed_updates(**kwargs):
+        intakes.append(kwargs)
+
+    async def async_query_feed_syncs(feeds, context):
+        return [{'feed': feed_b, 'last_synced_block': 1300}]
+
+    async def async_get_feed_aggregator_history(feed, context):
+        return feed_aggregators.get(feed, {})
+
+    async def async_get_latest_block_number(context):
+        return 5000
+
+    monkeypatch.setattr(
+        chainlink_db, 'async_intake_feed_updates', async_intake_feed_updates
+    )
+    monkeypatch.setattr(
+        chainlink_db, 'async_query_feed_syncs', async_query_feed_syncs
+    )
+    monkeypatch.setattr(
+        chainlink_aggregators,
+        'async_get_feed_aggregator_history',
+        async_get_feed_aggregator_history,
+    )
+    monkeypatch.setattr(
+        evm, 'async_get_latest_block_number', async_get_latest_block_number
+    )
+    return intakes
+
+
+async def _async_sync_feeds(feeds):
+    log_queries = []
+    runner, url = await conftest.async_start_mock_log_node(
+        example_logs, log_queries
+    )
+    context = conftest.create_mock_node_context(url, 'chainlink_sync')
+    context['cache'] = {'read': False, 'write': True}
+    try:
+        return await chainlink_utils.async_sync_feeds(feeds, context=context)
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_sync_feeds_through_confirmed_block(mock_sync_sources):
+    sync_blocks = await _async_sync_feeds([feed_a, feed_b])
+
+    # feeds are synced through latest block minus required confirmations
+    assert sync_blocks == {feed_a: 4872, feed_b: 4872}
+    (intake,) = mock_sync_sources
+    assert [
+        (update['feed'], update['block_number'])
+        for update in intake['feed_updates']
+    ] == [(feed_a, 200), (feed_a, 1500), (feed_b, 3000)]
+    assert intake['feed_syncs'] == [
+        {'feed': feed_a, 'last_synced_block': 4872},
+        {'feed': feed_b, 'last_synced_block': 4872},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_feeds_without_aggregators(mock_sync_sources):
+    with pytest.raises(Exception, match='no aggregators found'):
+        await _async_sync_feeds(['0x' + 'cc' * 20])
@@ -0,0 +1,34 @@
+import asyncio
+import time
+
+import pytest
+
+from ctc.protocols.etherscan_utils import abi_crud
+
+
+@pytest.mark.asyncio
+async def test_etherscan_ratelimit_token_bucket():
+    old_ratelimit = dict(abi_crud._etherscan_ratelimit)
+    try:
+        abi_crud.set_etherscan_ratelimit(20, burst=3)
+        abi_crud._etherscan_ratelimit['tokens'] = 3
+        abi_crud._etherscan_ratelimit['last_refill_time'] = time.time()
+
+        # burst is granted immediately, later tokens are paced
+        start = time.time()
+        await asyncio.gather(
+            *[
+                abi_crud._async_acquire_etherscan_token(verbose=False)
+                for i in range(3)
+            ]
+        )
+        assert time.time() - start < 0.04
+        await asyncio.gather(
+            *[
+                abi_crud._async_acquire_etherscan_token(verbose=False)
+                for i in range(2)
+            ]
+        )
+        assert time.time() - start >= 0.09
+    finally:
+        abi_crud._etherscan_ratelimit.update(old_ratelimit)  # type: ignore
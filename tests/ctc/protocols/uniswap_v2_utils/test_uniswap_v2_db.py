@@ -0,0 +1,91 @@
+import toolsql
+
+from ctc import db
+from ctc.protocols.uniswap_v2_utils import uniswap_v2_db
+
+import conftest
+
+
+pool = '0xb4e16d0168e52d35cacd2c6185b44281ec28c9dc'
+other_pool = '0xa478c2975ab1ea89e8196811f51a7b7ade33eb11'
+
+
+async def test_uniswap_v2_reserves_crud():
+
+    db_config = conftest.get_test_db_config()
+    db_schema = db.get_prepared_schema(
+        schema_name='uniswap_v2',
+        context=dict(network='ethereum'),
+    )
+    toolsql.create_db(
+        db_config=db_config,
+        db_schema=db_schema,
+        if_not_exists=True,
+        confirm=True,
+    )
+
+    network = 1
+    pool_reserves = [
+        {
+            'pool': reserve_pool,
+            'block_number': block_number,
+            'reserve0': str(reserve0),
+            'reserve1': '1000',
+        }
+        for reserve_pool, block_number, reserve0 in [
+            (pool, 300, 5 * 10**30),
+            (pool, 100, 7),
+            (other_pool, 200, 9),
+        ]
+    ]
+
+    # insert data
+    async with toolsql.async_connect(db_config) as conn:
+        await uniswap_v2_db.async_upsert_pool_reserves(
+            pool_reserves=pool_reserves,
+            conn=conn,
+            context=dict(network=network),
+        )
+        await uniswap_v2_db.async_upsert_reserve_syncs(
+            reserve_syncs=[{'pool': pool, 'last_synced_block': 300}],
+            conn=conn,
+            context=dict(network=network),
+        )
+
+    # get data
+    async with toolsql.async_connect(db_config) as conn:
+        db_reserves = await uniswap_v2_db.async_select_pools_reserves(
+            [pool, other_pool],
+            end_block=250,
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert db_reserves['pool'].to_list() == [other_pool, pool]
+        assert db_reserves['block_number'].to_list() == [200, 100]
+
+        db_reserves = await uniswap_v2_db.async_select_pools_reserves(
+            [pool],
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert db_reserves['reserve0'].to_list() == ['7', str(5 * 10**30)]
+
+        db_syncs = await uniswap_v2_db.async_select_reserve_syncs(
+            pools=[pool, other_pool],
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert db_syncs == [{'pool': pool, 'last_synced_block': 300}]
+
+    # last-synced blocks are replaced on subsequent syncs
+    async with toolsql.async_connect(db_config) as conn:
+        await uniswap_v2_db.async_upsert_reserve_syncs(
+            reserve_syncs=[{'pool': pool, 'last_synced_block': 400}],
+            conn=conn,
+            context=dict(network=network),
+        )
+        db_syncs = await uniswap_v2_db.async_select_reserve_syncs(
+            conn=conn,
+            context=dict(network=network),
+        )
+        assert db_syncs == [{'pool': pool, 'last_synced_block': 400}]
@@ -0,0 +1,153 @@
+import pytest
+
+import conftest
+from ctc import evm
+from ctc.protocols import uniswap_v2_utils
+from ctc.protocols.uniswap_v2_utils import uniswap_v2_db
+
+
+sync_hash = evm.get_event_hash(uniswap_v2_utils.pool_event_abis['Sync'])
+pool_a = '0x' + 'aa' * 20
+pool_b = '0x' + 'bb' * 20
+
+
+def _create_log(pool, block_number, log_index, reserve0, reserve1):
+    return conftest.create_log(
+        pool,
+        block_number,
+        topics=[sync_hash],
+        data_words=[reserve0, reserve1],
+        log_index=log_index,
+    )
+
+
+example_logs = [
+    _create_log(pool_a, 100, 0, 1000, 2000),
+    # several syncs in one block, only the last is kept
+    _create_log(pool_a, 300, 0, 1100, 1900),
+    _create_log(pool_b, 300, 1, 5 * 10**30, 10**18),
+    _create_log(pool_a, 300, 2, 1200, 1800),
+    _create_log(pool_b, 2500, 0, 6 * 10**30, 10**18),
+]
+
+
+async def _async_get_reserve_tables(
+    pools, cache=False, end_block=3999, **kwargs
+):
+    log_queries = []
+    runner, url = await conftest.async_start_mock_log_node(
+        example_logs, log_queries
+    )
+    context = conftest.create_mock_node_context(url, 'uniswap_v2_reserves')
+    context['cache'] = cache
+    try:
+        reserve_tables = await uniswap_v2_utils.async_get_pools_reserve_tables(
+            pools,
+            end_block=end_block,
+            context=context,
+            **kwargs,
+        )
+    finally:
+        await runner.cleanup()
+    return reserve_tables, log_queries
+
+
+@pytest.mark.asyncio
+async def test_pools_reserve_tables_from_sync_events():
+    reserve_tables, log_queries = await _async_get_reserve_tables(
+        [pool_a, pool_b], start_block=0
+    )
+
+    # logs of both pools are requested together
+    assert len(log_queries) == 2
+    assert all(query['address'] == [pool_a, pool_b] for query in log_queries)
+
+    table_a = reserve_tables[pool_a]
+    assert table_a['block_number'].to_list() == [100, 300]
+    assert table_a['reserve0'].to_list() == [1000.0, 1200.0]
+    assert table_a['reserve1'].to_list() == [2000.0, 1800.0]
+    table_b = reserve_tables[pool_b]
+    assert table_b['block_number'].to_list() == [300, 2500]
+    assert table_b['reserve0'].to_list() == [5e30, 6e30]
+
+    # pools not yet scanned start from their given start block
+    reserve_tables, log_queries = await _async_get_reserve_tables(
+        [pool_a, pool_b], start_block=1000
+    )
+    assert reserve_tables[pool_a]['block_number'].to_list() == []
+    assert reserve_tables[pool_b]['block_number'].to_list() == [2500]
+
+
+@pytest.mark.asyncio
+async def test_reserves_at_blocks():
+    reserve_tables, _ = await _async_get_reserve_tables([pool_a], start_block=0)
+    reserves = uniswap_v2_utils.get_reserves_at_blocks(
+        reserve_tables[pool_a],
+        [50, 100, 299, 300, 3000],
+    )
+    assert reserves['block_number'].to_list() == [50, 100, 299, 300, 3000]
+    assert reserves['reserve0'].to_list() == [None, 1000, 1000, 1200, 1200]
+    assert reserves['reserve1'].to_list() == [None, 2000, 2000, 1800, 1800]
+
+
+@pytest.mark.asyncio
+async def test_reserve_tables_from_start_block_are_not_stored(monkeypatch):
+    intakes = []
+
+    async def async_intake_pool_reserves(**kwargs):
+        intakes.append(kwargs)
+
+    monkeypatch.setattr(
+        uniswap_v2_db, 'async_intake_pool_reserves', async_intake_pool_reserves
+    )
+
+    # scans that may miss earlier syncs do not mark pools as synced
+    reserve_tables, _ = await _async_get_reserve_tables(
+        [pool_a, pool_b],
+        cache={'read': False, 'write': True},
+        start_block=1000,
+    )
+    assert reserve_tables[pool_b]['block_number'].to_list() == [2500]
+    assert intakes == []
+
+
+@pytest.mark.asyncio
+async def test_reserve_tables_store_only_confirmed_blocks(monkeypatch):
+    intakes = []
+
+    async def async_intake_pool_reserves(**kwargs):
+        intakes.append(kwargs)
+
+    async def async_get_latest_block_number(context):
+        return 2600
+
+    async def async_get_contracts_creation_blocks(contracts, context):
+        return [0 for contract in contracts]
+
+    monkeypatch.setattr(
+        uniswap_v2_db, 'async_intake_pool_reserves', async_intake_pool_reserves
+    )
+    monkeypatch.setattr(
+        evm, 'async_get_latest_block_number', async_get_latest_block_number
+    )
+    monkeypatch.setattr(
+        evm,
+        'async_get_contracts_creation_blocks',
+        async_get_contracts_creation_blocks,
+    )
+
+    # the unconfirmed tail is returned but not stored
+    reserve_tables, _ = await _async_get_reserve_tables(
+        [pool_a, pool_b],
+        cache={'read': False, 'write': True},
+        end_block=2600,
+    )
+    assert reserve_tables[pool_b]['block_number'].to_list() == [300, 2500]
+    (intake,) = intakes
+    assert [
+        (row['pool'], row['block_number']) for row in intake['pool_reserves']
+    ] == [(pool_a, 100), (pool_a, 300), (pool_b, 300)]
+    assert intake['reserve_syncs'] == [
+        {'pool': pool_a, 'last_synced_block': 2472},
+        {'pool': pool_b, 'last_synced_block': 2472},
+    ]
@@ -0,0 +1,256 @@
+import pytest
+
+from ctc.protocols import uniswap_v3_utils
+from ctc.protocols.uniswap_v3_utils import uniswap_v3_math
+
+
+# test vectors from the SwapMath tests of v3-core
+# (sqrt_price, target, liquidity, amount_remaining, fee, expected output)
+swap_step_examples = [
+    (
+        2**96,
+        79623317895830914510639640423,
+        2 * 10**18,
+        10**18,
+        600,
+        (
+            79623317895830914510639640423,
+            9975124224178055,
+            9925619580021728,
+            5988667735148,
+        ),
+    ),
+    (
+        2**96,
+        79623317895830914510639640423,
+        2 * 10**18,
+        -(10**18),
+        600,
+        (
+            79623317895830914510639640423,
+            9975124224178055,
+            9925619580021728,
+            5988667735148,
+        ),
+    ),
+    (
+        2**96,
+        250541448375047931186413801569,
+        2 * 10**18,
+        10**18,
+        600,
+        (
+            118818475322642227089037862318,
+            999400000000000000,
+            666399946655997866,
+            600000000000000,
+        ),
+    ),
+    (
+        417332158212080721273783715441582,
+        1452870262520218020823638996,
+        159344665391607089467575320103,
+        -1,
+        1,
+        (417332158212080721273783715441581, 1, 1, 1),
+    ),
+    (
+        2413,
+        79887613182836312,
+        1985041575832132834610021537970,
+        10,
+        1872,
+        (2413, 0, 0, 10),
+    ),
+]
+
+
+@pytest.mark.parametrize('example', swap_step_examples)
+def test_compute_swap_step(example):
+    sqrt_price, target, liquidity, amount_remaining, fee, expected = example
+    actual = uniswap_v3_math.compute_swap_step(
+        sqrt_price,
+        target,
+        liquidity=liquidity,
+        amount_remaining=amount_remaining,
+        fee_pips=fee,
+    )
+    assert actual == expected
+
+
+def test_tick_math():
+    get_sqrt_ratio = uniswap_v3_math.get_sqrt_ratio_at_tick
+    get_tick = uniswap_v3_math.get_tick_at_sqrt_ratio
+    assert get_sqrt_ratio(uniswap_v3_math.min_tick) == (
+        uniswap_v3_math.min_sqrt_ratio
+    )
+    assert get_sqrt_ratio(uniswap_v3_math.max_tick) == (
+        uniswap_v3_math.max_sqrt_ratio
+    )
+    assert get_sqrt_ratio(0) == 2**96
+    for power in range(20):
+        for tick in [2**power, -(2**power)]:
+            sqrt_price = get_sqrt_ratio(tick)
+            expected = 1.0001 ** (tick / 2) * 2**96
+            assert abs(sqrt_price / expected - 1) < 1e-9
+            assert get_tick(sqrt_price) == tick
+            assert get_tick(sqrt_price - 1) == tick - 1
+
+
+def _create_pool_state(liquidity):
+    # a single position from tick -600 to tick 600, with tick spacing 60
+    return {
+        'pool': '0x' + '00' * 20,
+        'block_number': 0,
+        'token0': '0x' + '01' * 20,
+        'token1': '0x' + '02' * 20,
+        'fee': 3000,
+        'tick_spacing': 60,
+        'sqrt_price_x96': 2**96,
+        'tick': 0,
+        'liquidity': liquidity,
+        'tick_bitmap': {-1: 1 << 246, 0: 1 << 10},
+        'liquidity_net': {-600: liquidity, 600: -liquidity},
+        'word_bounds': (-58, 57),
+    }
+
+
+def test_simulate_swap():
+    liquidity = 10**24
+    pool_state = _create_pool_state(liquidity)
+
+    # exact input and exact output swaps agree
+    exact_in = uniswap_v3_utils.simulate_swap(
+        pool_state, zero_for_one=True, amount_specified=10**18
+    )
+    assert exact_in['amount0'] == 10**18
+    assert exact_in['amount1'] < 0
+    assert exact_in['sqrt_price_x96'] < 2**96
+    assert exact_in['tick'] == -1
+    exact_out = uniswap_v3_utils.simulate_swap(
+        pool_state, zero_for_one=True, amount_specified=exact_in['amount1']
+    )
+    assert exact_out['amount1'] == exact_in['amount1']
+    assert 0 <= exact_in['amount0'] - exact_out['amount0'] <= 1
+
+    # swapping through the position consumes all of its token1
+    sqrt_price_lower = uniswap_v3_math.get_sqrt_ratio_at_tick(-600)
+    sqrt_price_upper = uniswap_v3_math.get_sqrt_ratio_at_tick(600)
+    swept = uniswap_v3_utils.simulate_swap(
+        pool_state,
+        zero_for_one=False,
+        amount_specified=-(10**30),
+        sqrt_price_limit_x96=sqrt_price_upper + 1,
+    )
+    assert swept['liquidity'] == 0
+    assert swept['tick'] == 600
+    assert -swept['amount0'] == uniswap_v3_math.get_amount0_delta(
+        2**96, sqrt_price_upper, liquidity=liquidity, round_up=False
+    )
+    swept = uniswap_v3_utils.simulate_swap(
+        pool_state,
+        zero_for_one=True,
+        amount_specified=10**30,
+        sqrt_price_limit_x96=sqrt_price_lower - 1,
+    )
+    assert swept['liquidity'] == 0
+    assert swept['tick'] == -601
+    assert -swept['amount1'] == uniswap_v3_math.get_amount1_delta(
+        sqrt_price_lower, 2**96, liquidity=liquidity, round_up=False
+    )
+
+    # swaps beyond the loaded tick bitmap are rejected
+    pool_state['word_bounds'] = (-1, 0)
+    with pytest.raises(Exception):
+        uniswap_v3_utils.simulate_swap(
+            pool_state, zero_for_one=True, amount_specified=10**30
+        )
+
+
+def test_liquidity_depth():
+    pool_state = _create_pool_state(10**24)
+    kwargs = {'token_in_decimals': 18, 'token_out_decimals': 6}
+
+    for zero_for_one in [True, False]:
+        amount_sold = 10**20
+        new_price = uniswap_v3_utils.get_new_price(
+            pool_state,
+            amount_sold=amount_sold,
+            zero_for_one=zero_for_one,
+            **kwargs,
+        )
+        depth = uniswap_v3_utils.get_liquidity_depth(
+            pool_state,
+            new_price=new_price,
+            zero_for_one=zero_for_one,
+            **kwargs,
+        )
+        assert abs(depth / amount_sold - 1) < 1e-6
+
+        # prices that cannot be reached by selling need no depth
+        current_price = uniswap_v3_utils.get_new_price(
+            pool_state, amount_sold=0, zero_for_one=zero_for_one, **kwargs
+        )
+        assert new_price < current_price
+        depth = uniswap_v3_utils.get_liquidity_depth(
+            pool_state,
+            new_price=current_price * 1.01,
+            zero_for_one=zero_for_one,
+            **kwargs,
+        )
+        assert depth == 0
+
+
+@pytest.mark.asyncio
+async def test_liquidity_depth_beyond_default_window(monkeypatch):
+    from ctc.protocols.uniswap_v3_utils import uniswap_v3_simulation
+
+    # a single position from tick -3000 to tick 3000, with tick spacing 1
+    liquidity = 10**24
+    full_state = dict(
+        _create_pool_state(liquidity),
+        fee=500,
+        tick_spacing=1,
+        tick_bitmap={-12: 1 << 72, 11: 1 << 184},
+        liquidity_net={-3000: liquidity, 3000: -liquidity},
+        word_bounds=(-3466, 3465),
+    )
+
+    async def async_get_pool_state(pool, *, block, word_range, context):
+        if word_range is None:
+            return full_state
+        return dict(
+            full_state,
+            tick_bitmap={},
+            liquidity_net={},
+            word_bounds=(-word_range, word_range),
+        )
+
+    monkeypatch.setattr(
+        uniswap_v3_simulation, 'async_get_pool_state', async_get_pool_state
+    )
+    kwargs = {
+        'new_prices': [0],
+        'token_in': full_state['token0'],
+        'token_out': full_state['token1'],
+        'fee': 500,
+        'pool': full_state['pool'],
+        'token_in_decimals': 18,
+        'token_out_decimals': 18,
+    }
+
+    # by default the whole bitmap is loaded, so all liquidity is consumed
+    (depth,) = await uniswap_v3_utils.async_get_liquidity_depths(**kwargs)
+    assert depth == uniswap_v3_utils.get_liquidity_depth(
+        full_state,
+        new_price=0,
+        zero_for_one=True,
+        token_in_decimals=18,
+        token_out_decimals=18,
+    )
+    assert depth > 0
+
+    with pytest.raises(Exception):
+        await uniswap_v3_utils.async_get_liquidity_depths(
+            word_range=uniswap_v3_simulation.default_word_range, **kwargs
+        )
@@ -0,0 +1,78 @@
+import os
+import sys
+
+import pytest
+
+benchmarks_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'benchmarks'
+)
+sys.path.insert(0, os.path.abspath(benchmarks_dir))
+
+import mock_node  # noqa: E402
+import run_benchmarks  # noqa: E402
+import scenarios  # noqa: E402
+
+
+def test_mock_node_is_deterministic():
+    config = mock_node.create_mock_node_config({'logs_per_block': 3})
+    log_filter = {'fromBlock': hex(100), 'toBlock': hex(109)}
+    logs = mock_node.get_logs(log_filter, config)
+    assert len(logs) == 30
+    assert logs == mock_node.get_logs(log_filter, config)
+    assert mock_node.get_block(100, config) == mock_node.get_block(100, config)
+    assert mock_node.get_block(100, config)['parentHash'] == (
+        mock_node.get_block(99, config)['hash']
+    )
+    assert mock_node.get_block(config['latest_block'] + 1, config) is None
+
+    # topic filters
+    other_topic = '0x' + '0' * 64
+    other_filter = dict(log_filter, topics=[other_topic])
+    assert mock_node.get_logs(other_filter, config) == []
+    sender_topic = logs[0]['topics'][1]
+    sender_filter = dict(log_filter, topics=[None, sender_topic])
+    filtered = mock_node.get_logs(sender_filter, config)
+    assert filtered == [logs[0]]
+
+
+@pytest.mark.asyncio
+async def test_mock_node_rate_limit():
+    import aiohttp
+
+    runner, url = await mock_node.async_start_mock_node({'rate_limit': 2})
+    try:
+        request = {'jsonrpc': '2.0', 'id': 1, 'method': 'eth_chainId'}
+        async with aiohttp.ClientSession() as session:
+            statuses = []
+            for i in range(3):
+                async with session.post(url, json=request) as response:
+                    statuses.append(response.status)
+    finally:
+        await runner.cleanup()
+    assert statuses == [200, 200, 429]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_scenarios(tmp_path):
+    results = await run_benchmarks.async_run_benchmarks(
+        scale=0.01,
+        n_repeats=1,
+        in_process=True,
+    )
+    assert [result['scenario'] for result in results] == list(
+        scenarios.scenarios.keys()
+    )
+    for result in results:
+        assert result['n_items'] > 0
+        assert result['n_rpc_requests'] > 0
+        assert result['median_duration'] > 0
+
+    path = str(tmp_path / 'results.jsonl')
+    run_benchmarks.save_results(results, path)
+    loaded = run_benchmarks.load_results(path)
+    assert [result['scenario'] for result in loaded] == [
+        result['scenario'] for result in results
+    ]
+    slower = [dict(result, median_duration=10.0) for result in loaded]
+    assert run_benchmarks.compare_results(loaded, loaded) == []
+    assert len(run_benchmarks.compare_results(slower, loaded)) == len(loaded)
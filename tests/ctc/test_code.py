@@ -12,7 +12,7 @@ def test_ctc_functions_have_docstrings():
     functiontype = type(test_ctc_functions_have_docstrings)
 
     functions_without_docstrings = []
-    for key, value in vars(ctc).items():
+    for key, value in _get_module_items(ctc):
         if isinstance(value, functiontype):
             docstring = value.__doc__
             missing = False
@@ -322,6 +322,11 @@ def iterate_package_classes(prefix, include_methods=True):
     return classes
 
 
+def _get_module_items(module):
+    # lazily loaded attributes are listed by dir() but not by vars()
+    return [(name, getattr(module, name)) for name in dir(module)]
+
+
 def _get_tested_modules():
     from ctc.protocols import (
         aave_v2_utils,
@@ -386,7 +391,7 @@ def test_async_functions_take_context():
 
     failures = []
     for module in modules:
-        for name, value in vars(module).items():
+        for name, value in _get_module_items(module):
             if name.startswith('async_') and isinstance(
                 value, types.FunctionType
             ):
@@ -433,7 +438,7 @@ def test_async_functions_take_kw_only_context():
 
     failures = []
     for module in modules:
-        for name, value in vars(module).items():
+        for name, value in _get_module_items(module):
 
             if name.startswith('async_') and isinstance(
                 value, types.FunctionType
@@ -0,0 +1,109 @@
+import importlib
+import subprocess
+import sys
+import types
+
+import pytest
+
+
+lazy_packages = ['ctc.evm', 'ctc.rpc']
+
+# modules that short cli commands should not need to import
+heavy_modules = [
+    'ctc.db',
+    'ctc.evm.abi_utils',
+    'ctc.rpc.rpc_request',
+    'aiohttp',
+    'numpy',
+    'polars',
+    'toolsql',
+]
+
+# generous budgets of cumulative import time, in microseconds
+import_time_budgets = {
+    'ctc': 10000,
+    'ctc.evm': 10000,
+    'ctc.rpc': 10000,
+    'ctc.protocols': 10000,
+}
+
+
+def _get_cold_import_times(statement):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.split('\n'):
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:') :].split('|')
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize('package_name', lazy_packages)
+async def test_lazy_exports_match_submodules(package_name):
+    package = importlib.import_module(package_name)
+    for submodule_name, names in package._lazy_exports.items():
+        submodule = importlib.import_module(
+            package_name + '.' + submodule_name
+        )
+        public_names = {
+            name
+            for name, value in vars(submodule).items()
+            if not name.startswith('_')
+            and name != 'annotations'
+            and not isinstance(value, types.ModuleType)
+        }
+        assert set(names) == public_names, submodule.__name__
+
+
+@pytest.mark.parametrize('package_name', lazy_packages)
+async def test_lazy_attributes_resolve(package_name):
+    package = importlib.import_module(package_name)
+    for submodule_name, names in package._lazy_exports.items():
+        submodule = importlib.import_module(
+            package_name + '.' + submodule_name
+        )
+        for name in names:
+            assert getattr(package, name) is getattr(submodule, name)
+        assert submodule_name in dir(package)
+
+
+async def test_ctc_namespace():
+    import ctc
+    import ctc.evm
+
+    assert ctc.keccak_text is ctc.evm.keccak_text
+    assert 'keccak_text' in dir(ctc)
+    assert ctc.config is importlib.import_module('ctc.config')
+    assert 'chainlink_utils' in dir(ctc.protocols)
+    with pytest.raises(AttributeError):
+        ctc.not_a_ctc_function
+    with pytest.raises(AttributeError):
+        ctc.evm.not_a_ctc_function
+    with pytest.raises(AttributeError):
+        ctc.protocols.not_a_protocol
+
+
+async def test_import_ctc_is_lazy():
+    import_times = _get_cold_import_times(
+        'import ctc, ctc.evm, ctc.rpc, ctc.protocols'
+    )
+    loaded = [name for name in heavy_modules if name in import_times]
+    assert loaded == []
+    for module_name, budget in import_time_budgets.items():
+        assert import_times[module_name] < budget, module_name
+
+
+async def test_cli_command_import_is_lazy():
+    import_times = _get_cold_import_times(
+        'import ctc.cli.cli_run;'
+        'import ctc.cli.commands.compute.keccak_command;'
+        'import ctc.cli.commands.compute.hex_command'
+    )
+    loaded = [name for name in heavy_modules if name in import_times]
+    assert loaded == []
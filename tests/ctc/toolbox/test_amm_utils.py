@@ -5,6 +5,7 @@ import math
 import numpy as np
 
 from ctc.defi.dex_utils.amm_utils import cpmm
+from ctc.defi.dex_utils.amm_utils import stableswap
 
 
 x_reserves = 1e6
@@ -177,3 +178,85 @@ def test_reject_negative_values():
                 x_reserves=x_reserves, y_reserves=y_reserves, **{arg: -1}
             )
 
+
+@pytest.mark.parametrize(
+    'size_arg', ['x_sold', 'y_sold', 'x_bought', 'y_bought']
+)
+def test_trade_grid(size_arg):
+    states_x = np.array([1e6, 2e6, 5e5])
+    states_y = np.array([1e3, 1e3, 2e3])
+    sizes = np.array([0, 1e0, 1e1, 1e2])
+    grid = cpmm.trade_grid(states_x, states_y, **{size_arg: sizes})
+    assert grid['x_sold'].shape == (len(states_x), len(sizes))
+
+    for s, (state_x, state_y) in enumerate(zip(states_x, states_y)):
+        for t, size in enumerate(sizes):
+            result = cpmm.trade(
+                x_reserves=state_x,
+                y_reserves=state_y,
+                **{size_arg: size},
+            )
+            for key in ['x_sold', 'x_bought', 'y_sold', 'y_bought']:
+                assert math.isclose(grid[key][s, t], result[key])
+            assert math.isclose(
+                grid['new_x_reserves'][s, t], result['new_pool']['x_reserves']
+            )
+            summary = cpmm.summarize_trade(
+                x_reserves=state_x,
+                y_reserves=state_y,
+                **{size_arg: size if size != 0 else 1e-9},
+            )
+            assert math.isclose(
+                grid['x_per_y_end'][s, t], summary['x_per_y_end'], rel_tol=1e-6
+            )
+
+    # buying entire reserves is not possible
+    grid = cpmm.trade_grid(states_x, states_y, y_bought=[1e3])
+    assert np.isnan(grid['x_sold'][0, 0])
+    assert not np.isnan(grid['x_sold'][2, 0])
+
+
+def test_stableswap_invariant():
+    balances = np.array([[1e6, 1.2e6], [5e5, 1.5e6], [1e6, 1e6]])
+    A = 100
+    D = stableswap.compute_stableswap_d(balances, A=A)
+    Ann = A * 4
+    for state, state_D in zip(balances, D):
+        invariant = Ann * state.sum() + state_D
+        target = Ann * state_D + state_D**3 / (4 * state.prod())
+        assert math.isclose(invariant, target)
+
+    # solving for a balance recovers that balance
+    y = stableswap.compute_stableswap_y(balances, j=1, D=D, A=A)
+    assert np.allclose(y, balances[:, 1])
+
+    # vectorized prices match scalar prices for two coins
+    prices = stableswap.get_stableswap_prices(balances, i=0, j=1, A=A)
+    for state, price in zip(balances, prices):
+        scalar = stableswap.get_stableswap_price(state[0], state[1], A=A)
+        assert math.isclose(price, scalar, rel_tol=1e-3)
+
+
+def test_stableswap_trade_grid():
+    rng = np.random.default_rng(0)
+    balances = rng.uniform(1e5, 1e6, size=(20, 3))
+    amounts = np.array([0, 1e0, 1e3, 1e5])
+    A = 200
+    grid = stableswap.stableswap_trade_grid(
+        balances, i=0, j=2, amounts_in=amounts, A=A, fee_rate=0
+    )
+    assert grid['amount_out'].shape == (20, 4)
+    assert np.all(grid['amount_out'][:, 0] == 0)
+    assert np.all(np.diff(grid['amount_out'], axis=1) > 0)
+    assert np.all(grid['mean_slippage'][:, 1:] < 0)
+    assert np.all(grid['price_end'] <= grid['mean_price'] * (1 + 1e-9))
+
+    # trades preserve the invariant when there are no fees
+    D = stableswap.compute_stableswap_d(balances, A=A)
+    new_D = stableswap.compute_stableswap_d(grid['new_balances'], A=A)
+    assert np.allclose(new_D, D[:, np.newaxis])
+
+    # small trades execute at the marginal price
+    assert np.allclose(
+        grid['mean_price'][:, 1], grid['price_start'][:, 1], rtol=1e-5
+    )
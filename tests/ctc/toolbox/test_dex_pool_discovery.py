@@ -0,0 +1,152 @@
+import pytest
+
+import conftest
+from ctc import evm
+from ctc.defi import dex_utils
+from ctc.protocols import uniswap_v2_utils
+from ctc.protocols import uniswap_v3_utils
+
+
+uniswap_v2_factory = '0x5c69bee701ef814a2b6a3edd4b1652cb9cc5aa6f'
+sushi_factory = '0xc0aee478e3658e2610c5f7a4a2e1777ce9e4f2ac'
+uniswap_v3_factory = '0x1f98431c8ad98523631ae4a59f267346ea31f984'
+token0 = '0x' + '0a' * 20
+token1 = '0x' + '0b' * 20
+
+pair_created_hash = evm.get_event_hash(
+    uniswap_v2_utils.factory_event_abis['PairCreated']
+)
+pool_created_hash = evm.get_event_hash(
+    uniswap_v3_utils.factory_event_abis['PoolCreated']
+)
+
+
+def _create_log(factory, block_number, pool):
+    if factory == uniswap_v3_factory:
+        topics = [pool_created_hash, token0, token1, 500]
+        data_words = [10, pool]
+    else:
+        topics = [pair_created_hash, token0, token1]
+        data_words = [pool, 1]
+    return conftest.create_log(
+        factory, block_number, topics=topics, data_words=data_words
+    )
+
+
+example_logs = [
+    _create_log(uniswap_v2_factory, 120, '0x' + '01' * 20),
+    _create_log(uniswap_v3_factory, 130, '0x' + '02' * 20),
+    _create_log(sushi_factory, 140, '0x' + '03' * 20),
+    _create_log(uniswap_v2_factory, 200, '0x' + '04' * 20),
+    _create_log(sushi_factory, 250, '0x' + '05' * 20),
+]
+
+
+@pytest.mark.asyncio
+async def test_scan_new_pools_shares_log_queries():
+    log_queries = []
+    runner, url = await conftest.async_start_mock_log_node(
+        example_logs, log_queries
+    )
+    context = conftest.create_mock_node_context(url, 'dex_pool_discovery')
+    try:
+        new_pools = await dex_utils.async_update_dex_pools(
+            {
+                dex_utils.UniswapV2DEX: [uniswap_v2_factory],
+                dex_utils.SushiDEX: [sushi_factory],
+                dex_utils.UniswapV3DEX: [uniswap_v3_factory],
+            },
+            start_blocks={
+                uniswap_v2_factory: 100,
+                sushi_factory: 150,
+                uniswap_v3_factory: 100,
+            },
+            end_block=300,
+            context=context,
+        )
+    finally:
+        await runner.cleanup()
+
+    # one query per common block range, sushi joins once its scan begins
+    assert len(log_queries) == 2
+    query_ranges = sorted(
+        (
+            int(query['fromBlock'], 16),
+            int(query['toBlock'], 16),
+            len(query['address']),
+        )
+        for query in log_queries
+    )
+    assert query_ranges == [(100, 149, 2), (150, 300, 3)]
+
+    # decoding is dispatched to the dex of each factory
+    assert [pool['address'] for pool in new_pools[uniswap_v2_factory]] == [
+        '0x' + '01' * 20,
+        '0x' + '04' * 20,
+    ]
+    assert [pool['address'] for pool in new_pools[sushi_factory]] == [
+        '0x' + '05' * 20,
+    ]
+    (v3_pool,) = new_pools[uniswap_v3_factory]
+    assert v3_pool['address'] == '0x' + '02' * 20
+    assert v3_pool['fee'] == 500 * 100
+    assert v3_pool['creation_block'] == 130
+    for factory, pools in new_pools.items():
+        for pool in pools:
+            assert pool['factory'] == factory
+            assert (pool['asset0'], pool['asset1']) == (token0, token1)
+
+
+@pytest.mark.asyncio
+async def test_pool_refresh_survives_failed_head_waits(monkeypatch):
+    import asyncio
+
+    from ctc.defi.dex_utils.dexes import dex_pool_discovery
+
+    scanned_blocks = []
+    heads = iter([Exception('head tracker failed'), 101])
+
+    async def async_get_latest_block_number(context):
+        return 100
+
+    async def async_wait_for_next_block(block_number, context):
+        head = next(heads)
+        if isinstance(head, Exception):
+            raise head
+        return evm.BlockHead(
+            block_number=head, block_hash=None, update_time=0.0
+        )
+
+    async def async_update_dex_pools(
+        dex_factories, start_blocks, end_block, context
+    ):
+        scanned_blocks.append(end_block)
+        return {}
+
+    monkeypatch.setattr(
+        evm, 'async_get_latest_block_number', async_get_latest_block_number
+    )
+    monkeypatch.setattr(
+        evm, 'async_wait_for_next_block', async_wait_for_next_block
+    )
+    monkeypatch.setattr(
+        dex_pool_discovery, 'async_update_dex_pools', async_update_dex_pools
+    )
+    monkeypatch.setattr(dex_pool_discovery, '_refresh_retry_interval', 0.0)
+
+    context = conftest.create_mock_node_context(
+        'http://127.0.0.1:1', 'dex_pool_refresh'
+    )
+    await dex_utils.async_start_pool_refresh(
+        {dex_utils.UniswapV2DEX: [uniswap_v2_factory]}, context=context
+    )
+    try:
+        for _ in range(100):
+            if len(scanned_blocks) >= 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await dex_utils.async_stop_pool_refresh(context=context)
+
+    # a failed wait for the next block does not stop the refresh
+    assert scanned_blocks[:2] == [100, 101]
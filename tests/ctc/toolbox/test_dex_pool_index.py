@@ -0,0 +1,141 @@
+import pytest
+
+from ctc.defi import dex_utils
+from ctc.defi.dex_utils.dexes import dex_pool_index
+
+
+weth = '0x' + 'ee' * 20
+usdc = '0x' + 'cc' * 20
+dai = '0x' + 'dd' * 20
+fei = '0x' + 'ff' * 20
+factory_a = '0x' + 'a0' * 20
+factory_b = '0x' + 'b0' * 20
+
+
+def _create_pool(address, factory, assets, creation_block):
+    assets = list(assets) + [None] * (4 - len(assets))
+    return {
+        'address': address,
+        'factory': factory,
+        'asset0': assets[0],
+        'asset1': assets[1],
+        'asset2': assets[2],
+        'asset3': assets[3],
+        'fee': None,
+        'creation_block': creation_block,
+        'additional_data': {},
+    }
+
+
+example_pools = [
+    _create_pool('0x' + '01' * 20, factory_a, [weth, usdc], 100),
+    _create_pool('0x' + '02' * 20, factory_b, [weth, usdc], 200),
+    _create_pool('0x' + '03' * 20, factory_a, [weth, dai], 300),
+    _create_pool('0x' + '04' * 20, factory_b, [usdc, dai, fei], 400),
+]
+context = {'network': 1}
+
+
+@pytest.fixture
+def loaded_index():
+    dex_pool_index.reset_dex_pool_index()
+    index = dex_pool_index._create_dex_pool_index()
+    dex_pool_index._add_to_index(index, example_pools[:-1])
+    key = dex_pool_index._get_dex_pool_index_key(context)
+    dex_pool_index._dex_pool_indices[key] = index
+    yield index
+    dex_pool_index.reset_dex_pool_index()
+
+
+@pytest.mark.asyncio
+async def test_get_indexed_dex_pools(loaded_index):
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[weth], context=context
+    )
+    assert [pool['address'] for pool in pools] == [
+        '0x' + '01' * 20,
+        '0x' + '02' * 20,
+        '0x' + '03' * 20,
+    ]
+
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[usdc.upper().replace('0X', '0x'), weth],
+        factory=factory_b,
+        context=context,
+    )
+    assert [pool['address'] for pool in pools] == ['0x' + '02' * 20]
+
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[weth], start_block=150, end_block=300, context=context
+    )
+    assert [pool['address'] for pool in pools] == [
+        '0x' + '02' * 20,
+        '0x' + '03' * 20,
+    ]
+
+    # incremental updates are visible to later queries
+    dex_utils.update_dex_pool_index(example_pools[-1:], context=context)
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[dai, fei], context=context
+    )
+    assert [pool['address'] for pool in pools] == ['0x' + '04' * 20]
+
+
+@pytest.mark.asyncio
+async def test_get_dex_pool_paths(loaded_index):
+    dex_utils.update_dex_pool_index(example_pools[-1:], context=context)
+
+    paths = await dex_utils.async_get_dex_pool_paths(
+        weth, fei, max_hops=1, context=context
+    )
+    assert paths == []
+
+    paths = await dex_utils.async_get_dex_pool_paths(
+        weth, fei, max_hops=2, context=context
+    )
+    assert [path['assets'] for path in paths] == [
+        [weth, usdc, fei],
+        [weth, dai, fei],
+    ]
+    assert paths[0]['hop_pools'] == [
+        ['0x' + '01' * 20, '0x' + '02' * 20],
+        ['0x' + '04' * 20],
+    ]
+
+    paths = await dex_utils.async_get_dex_pool_paths(
+        weth, fei, max_hops=3, context=context
+    )
+    assert [path['assets'] for path in paths] == [
+        [weth, usdc, fei],
+        [weth, dai, fei],
+        [weth, usdc, dai, fei],
+        [weth, dai, usdc, fei],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_index_keyed_by_cache_settings(loaded_index):
+    uncached_context = {'network': 1, 'cache': False}
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[weth], context=uncached_context
+    )
+    assert pools == []
+
+    # pools written to db reach indices that read db, and the writer's index
+    dex_utils.update_dex_pool_index(example_pools[-1:], context=context)
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[fei], context=uncached_context
+    )
+    assert pools == []
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[fei], context=context
+    )
+    assert [pool['address'] for pool in pools] == ['0x' + '04' * 20]
+
+    dex_utils.update_dex_pool_index(
+        example_pools[-1:], context=uncached_context
+    )
+    pools = await dex_utils.async_get_indexed_dex_pools(
+        assets=[fei], context=uncached_context
+    )
+    assert [pool['address'] for pool in pools] == ['0x' + '04' * 20]
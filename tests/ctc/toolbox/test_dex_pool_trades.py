@@ -0,0 +1,120 @@
+import polars as pl
+import pytest
+
+import conftest
+from ctc import evm
+from ctc.defi import dex_utils
+from ctc.protocols import uniswap_v2_utils
+
+
+v2_swap_hash = evm.get_event_hash(uniswap_v2_utils.pool_event_abis['Swap'])
+trader = '0x' + '0e' * 20
+v2_pools = ['0x' + ('%02x' % i) * 20 for i in range(1, 31)]
+other_pool = '0x' + 'ff' * 20
+
+
+def _create_log(pool, block_number, event_hash, data_words):
+    return conftest.create_log(
+        pool,
+        block_number,
+        topics=[event_hash, trader, trader],
+        data_words=data_words,
+    )
+
+
+def _create_example_logs():
+    logs = []
+    for p, pool in enumerate(v2_pools):
+        # sell 100 token0 for 50 token1, then 20 token1 for 40 token0
+        logs.append(_create_log(pool, 100 + p, v2_swap_hash, [100, 0, 0, 50]))
+        logs.append(_create_log(pool, 1000 + p, v2_swap_hash, [0, 20, 40, 0]))
+    logs.append(_create_log(other_pool, 500, v2_swap_hash, [1, 0, 0, 1]))
+    return logs
+
+
+@pytest.mark.asyncio
+async def test_pools_trades_requests_scale_with_block_range():
+    example_logs = _create_example_logs()
+
+    n_queries = {}
+    for n_pools in [3, 30]:
+        log_queries = []
+        runner, url = await conftest.async_start_mock_log_node(
+            example_logs, log_queries
+        )
+        try:
+            df = await dex_utils.async_get_pools_trades(
+                v2_pools[:n_pools],
+                dex=dex_utils.UniswapV2DEX,
+                start_block=0,
+                end_block=4999,
+                context=conftest.create_mock_node_context(
+                    url, 'dex_pool_trades'
+                ),
+            )
+        finally:
+            await runner.cleanup()
+        n_queries[n_pools] = len(log_queries)
+        assert all(len(query['address']) == n_pools for query in log_queries)
+
+        assert len(df) == 2 * n_pools
+        assert set(df['pool'].to_list()) == set(v2_pools[:n_pools])
+        first = df.filter(df['block_number'] == 100)
+        assert first['sold_id'].to_list() == [0]
+        assert first['bought_id'].to_list() == [1]
+        assert first['sold_amount'].to_list() == [100.0]
+        assert first['bought_amount'].to_list() == [50.0]
+        second = df.filter(df['block_number'] == 1000)
+        assert second['sold_id'].to_list() == [1]
+        assert second['sold_amount'].to_list() == [20.0]
+        assert second['bought_amount'].to_list() == [40.0]
+
+    # one request per block chunk, regardless of number of pools
+    assert n_queries[3] == n_queries[30] == 3
+
+
+@pytest.mark.asyncio
+async def test_pools_raw_trades_without_address_filter():
+    example_logs = _create_example_logs()
+    pools = v2_pools[:2] + [v2_pools[2].upper().replace('0X', '0x')]
+
+    log_queries = []
+    runner, url = await conftest.async_start_mock_log_node(
+        example_logs, log_queries
+    )
+    context = conftest.create_mock_node_context(url, 'dex_pool_trades')
+    try:
+        dex = dex_utils.UniswapV2DEX
+        pools_trades = await dex._async_get_pools_raw_trades(
+            pools,
+            start_block=0,
+            end_block=4999,
+            max_addresses_per_request=2,
+            context=context,
+        )
+    finally:
+        await runner.cleanup()
+
+    # logs of other pools are discarded locally
+    assert len(log_queries) == 3
+    assert all('address' not in query for query in log_queries)
+    assert list(pools_trades.keys()) == pools
+    for pool in pools:
+        assert pools_trades[pool]['block_number'].to_list()[1] >= 1000
+        assert len(pools_trades[pool]['sold_id']) == 2
+
+
+def test_uniswap_v3_raw_trade_exprs():
+    swaps = pl.DataFrame(
+        {
+            'arg__recipient': [trader, trader],
+            'arg__amount0': [-300.0, 2e20],
+            'arg__amount1': [600.0, -1e20],
+        }
+    )
+    exprs = dex_utils.UniswapV3DEX._get_raw_trade_exprs(swaps)
+    trades = swaps.select(exprs)
+    assert trades['sold_id'].to_list() == [1, 0]
+    assert trades['bought_id'].to_list() == [0, 1]
+    assert trades['sold_amount'].to_list() == [600.0, 2e20]
+    assert trades['bought_amount'].to_list() == [300.0, 1e20]
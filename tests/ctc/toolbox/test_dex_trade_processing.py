@@ -0,0 +1,106 @@
+import math
+
+import polars as pl
+
+from ctc.defi import dex_utils
+
+
+pool_a = '0x' + 'aa' * 20
+pool_b = '0x' + 'bb' * 20
+weth = '0x' + 'ee' * 20
+usdc = '0x' + 'cc' * 20
+dai = '0x' + 'dd' * 20
+
+asset_table = pl.DataFrame(
+    {
+        'pool': [pool_a, pool_a, pool_b, pool_b],
+        'asset_id': [0, 1, 0, 1],
+        'address': [usdc, weth, dai, usdc],
+        'decimals': [6, 18, 18, 6],
+        'symbol': ['USDC', 'WETH', 'DAI', 'USDC'],
+    }
+)
+
+pools_trades = {
+    pool_a: {
+        'block_number': pl.Series([3, 5]),
+        'transaction_hash': pl.Series(['0x03', '0x05']),
+        'recipient': None,
+        'sold_id': pl.Series([0, 1], dtype=pl.Int32),
+        'bought_id': pl.Series([1, 0], dtype=pl.Int32),
+        'sold_amount': pl.Series([2000 * 10**6, 2 * 10**18], dtype=pl.Object),
+        'bought_amount': pl.Series([10**18, 4000 * 10**6], dtype=pl.Object),
+    },
+    pool_b: {
+        'block_number': pl.Series([4]),
+        'transaction_hash': pl.Series(['0x04']),
+        'recipient': None,
+        'sold_id': pl.Series([1]),
+        'bought_id': pl.Series([0]),
+        'sold_amount': pl.Series([100e6]),
+        'bought_amount': pl.Series([99e18]),
+    },
+}
+
+
+def test_process_trades_of_many_pools():
+    df = dex_utils.concat_pool_trades(pools_trades)
+    assert df.columns == [
+        'pool',
+        'block_number',
+        'transaction_hash',
+        'sold_id',
+        'bought_id',
+        'sold_amount',
+        'bought_amount',
+    ]
+    assert df['block_number'].to_list() == [3, 4, 5]
+    assert df['pool'].to_list() == [pool_a, pool_b, pool_a]
+
+    processed = dex_utils.process_trades(
+        df, asset_table, normalize=True, label='symbol'
+    )
+    assert processed.columns == df.columns
+    assert processed['sold_id'].to_list() == ['USDC', 'USDC', 'WETH']
+    assert processed['bought_id'].to_list() == ['WETH', 'DAI', 'USDC']
+    assert processed['sold_amount'].to_list() == [2000.0, 100.0, 2.0]
+    assert processed['bought_amount'].to_list() == [1.0, 99.0, 4000.0]
+
+    prices = processed.select(dex_utils.get_long_trade_price_exprs(processed))
+    assert prices['sold_per_bought'].to_list() == [2000.0, 100 / 99, 0.0005]
+
+    relabeled = dex_utils.process_trades(
+        df, asset_table, normalize=False, label='address'
+    )
+    assert relabeled['sold_id'].to_list() == [usdc, usdc, weth]
+    assert relabeled['sold_amount'].to_list() == [2000e6, 100e6, 2e18]
+
+
+def test_trade_prices_and_volumes():
+    df = dex_utils.concat_pool_trades({pool_a: pools_trades[pool_a]})
+    df = dex_utils.process_trades(
+        df, asset_table, normalize=True, label='symbol'
+    )
+    prices = dex_utils.DEX.compute_trade_prices(df, normalized=True)
+    assert list(prices.keys()) == [
+        'price__USDC__per__WETH',
+        'price__WETH__per__USDC',
+    ]
+    assert prices['price__USDC__per__WETH'].to_list() == [2000.0, 2000.0]
+    assert prices['price__WETH__per__USDC'].to_list() == [0.0005, 0.0005]
+
+    volumes = dex_utils.DEX.compute_trade_volumes(df)
+    assert volumes['volume__USDC'].to_list() == [2000.0, 4000.0]
+    assert volumes['volume__WETH'].to_list() == [1.0, 2.0]
+
+    # trades of other pairs have nan prices
+    df = dex_utils.process_trades(
+        dex_utils.concat_pool_trades(pools_trades),
+        asset_table,
+        normalize=True,
+        label='symbol',
+    )
+    prices = dex_utils.DEX.compute_trade_prices(df, normalized=True)
+    assert len(prices) == 6
+    assert prices['price__DAI__per__USDC'][1] == 0.99
+    assert math.isnan(prices['price__DAI__per__USDC'][0])
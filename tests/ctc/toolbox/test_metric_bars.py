@@ -0,0 +1,135 @@
+import math
+
+import numpy as np
+import pytest
+
+from ctc.defi.metric_utils import metric_bars
+from ctc.defi.metric_utils import ohlc_utils
+from ctc.defi.metric_utils.twap_utils import twap_filter
+
+
+timestamps = [0, 5, 12, 15, 47]
+values = [1.0, 3.0, 2.0, 4.0, 5.0]
+volumes = [1.0, 1.0, 1.0, 2.0, 3.0]
+
+
+def test_metric_bars_of_single_append():
+    aggregator = metric_bars.create_metric_aggregator([60, 10])
+    metric_bars.append_metric_values(
+        aggregator,
+        'eth_usd',
+        timestamps=timestamps,
+        values=values,
+        volumes=volumes,
+    )
+
+    bars = metric_bars.get_metric_bars(aggregator, 'eth_usd', bin_size=10)
+    assert bars.columns == [
+        'bin',
+        'open',
+        'high',
+        'low',
+        'close',
+        'count',
+        'volume',
+        'twap',
+    ]
+    assert bars['bin'].to_list() == [0, 10, 20, 30, 40]
+    assert bars['open'].to_list() == [1.0, 2.0, 4.0, 4.0, 5.0]
+    assert bars['high'].to_list() == [3.0, 4.0, None, None, 5.0]
+    assert bars['close'].to_list() == [3.0, 4.0, 4.0, 4.0, 5.0]
+    assert bars['count'].to_list() == [2, 2, 0, 0, 1]
+    assert bars['volume'].to_list() == [2.0, 3.0, 0.0, 0.0, 3.0]
+
+    # value is held until next sample, time after last sample is not counted
+    assert bars['twap'].to_list() == [2.0, 3.2, 4.0, 4.0, 4.0]
+
+    (hour_bar,) = metric_bars.get_metric_bars(
+        aggregator, 'eth_usd', bin_size=60
+    ).to_dicts()
+    assert hour_bar['open'] == 1.0
+    assert hour_bar['high'] == 5.0
+    assert hour_bar['close'] == 5.0
+    assert math.isclose(hour_bar['twap'], 160 / 47)
+
+
+@pytest.mark.parametrize('split', [1, 2, 3, 4])
+def test_metric_bars_incremental_appends_match_batch(split):
+    batch = metric_bars.create_metric_aggregator([10, 60])
+    metric_bars.append_metric_values(
+        batch, 'feed', timestamps=timestamps, values=values, volumes=volumes
+    )
+    incremental = metric_bars.create_metric_aggregator([10, 60])
+    for start, end in [(0, split), (split, len(timestamps))]:
+        metric_bars.append_metric_values(
+            incremental,
+            'feed',
+            timestamps=timestamps[start:end],
+            values=values[start:end],
+            volumes=volumes[start:end],
+        )
+
+    for bin_size in [10, 60]:
+        expected = metric_bars.get_metric_bars(
+            batch, 'feed', bin_size=bin_size
+        )
+        actual = metric_bars.get_metric_bars(
+            incremental, 'feed', bin_size=bin_size
+        )
+        assert actual.frame_equal(expected, null_equal=True)
+
+
+def test_metric_bars_reject_out_of_order_samples():
+    aggregator = metric_bars.create_metric_aggregator([10])
+    metric_bars.append_metric_values(
+        aggregator, 'a', timestamps=[10, 20], values=[1.0, 2.0]
+    )
+    with pytest.raises(Exception):
+        metric_bars.append_metric_values(
+            aggregator, 'a', timestamps=[15], values=[1.0]
+        )
+    with pytest.raises(Exception):
+        metric_bars.append_metric_values(
+            aggregator, 'b', timestamps=[30, 25], values=[1.0, 2.0]
+        )
+
+    # feeds are aggregated independently
+    metric_bars.append_metric_values(
+        aggregator, 'b', timestamps=[0], values=[7.0]
+    )
+    bars = metric_bars.get_metric_bars(aggregator, 'b', bin_size=10)
+    assert bars['close'].to_list() == [7.0]
+
+
+def test_compute_ohlc_fills_missing_bins():
+    df = ohlc_utils.compute_ohlc(
+        values=[1, 3, 2, 5],
+        indices=[0, 5, 12, 47],
+        bin_size=10,
+        volumes=[1, 1, 1, 1],
+    )
+    assert df['bin'].to_list() == [0, 10, 20, 30, 40]
+    assert df['open'].to_list() == [1, 2, 2, 2, 5]
+    assert df['close'].to_list() == [3, 2, 2, 2, 5]
+    assert df['high'].to_list() == [3, 2, None, None, 5]
+    assert df['count'].to_list() == [2, 1, 0, 0, 1]
+    assert df['volume'].to_list() == [2, 1, 0, 0, 1]
+
+
+def test_filter_twap_matches_windowed_means():
+    rng = np.random.default_rng(0)
+    block_timestamps = np.cumsum(rng.integers(1, 20, 300))
+    raw_values = rng.random(300)
+    df = twap_filter.filter_twap(
+        raw_values=raw_values,
+        timestamps=block_timestamps,
+        filter_duration=120,
+    )
+    expected = [
+        raw_values[
+            (block_timestamps > timestamp - 120)
+            & (block_timestamps <= timestamp)
+        ].mean()
+        for timestamp in df['timestamp']
+    ]
+    assert np.allclose(df['value'].to_numpy(), expected)